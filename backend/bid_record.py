@@ -0,0 +1,215 @@
+"""
+Compact bid record for the search pipeline.
+
+Bids travel fetch → consolidation → filter → viability → generate in the
+legacy flat format (``UnifiedProcurement.to_legacy_format`` /
+``datalake_query._row_to_normalized``). As plain dicts every bid owns a
+40+ entry hash table once the filter stages add their ``_``-prefixed
+annotations, which adds up on 20k-bid searches with several searches per
+worker.
+
+BidRecord keeps the legacy core fields in ``__slots__`` and the annotations
+in a slotted BidAnnotations sub-record; keys outside both lists go to small
+overflow dicts. It is a MutableMapping, so ``bid.get(...)``, ``bid[k] = v``,
+``k in bid``, ``dict(bid)`` and ``{**bid}`` keep working in filter,
+viability and excel code.
+
+It is *not* a dict subclass: ``json.dumps`` needs ``default=json_default``
+(or ``as_dicts``) at the serialization boundaries — the search cache,
+progress partial items and the ARQ result store. Gated by
+``BID_RECORD_SLOTS_ENABLED`` (default off); see scripts/bench_bid_record.py
+for the memory / GC pause comparison.
+"""
+
+from collections.abc import Iterable, Mapping, MutableMapping
+from typing import Any, Iterator, Optional
+
+# Legacy flat keys present on (almost) every bid, across consolidation
+# (clients.base.UnifiedProcurement.to_legacy_format), the datalake RPC
+# (datalake_query._row_to_normalized) and the PNCP client.
+CORE_FIELDS: tuple[str, ...] = (
+    "numeroControlePNCP",
+    "codigoCompra",
+    "objetoCompra",
+    "valorTotalEstimado",
+    "nomeOrgao",
+    "cnpjOrgao",
+    "orgaoCnpj",
+    "uf",
+    "municipio",
+    "dataPublicacaoPncp",
+    "dataPublicacaoFormatted",
+    "dataAberturaProposta",
+    "dataEncerramentoProposta",
+    "modalidadeId",
+    "codigoModalidadeContratacao",
+    "modalidadeNome",
+    "situacaoCompraNome",
+    "situacaoCompraId",
+    "linkSistemaOrigem",
+    "linkProcessoEletronico",
+    "esferaId",
+    "numeroEdital",
+    "anoCompra",
+    "poder",
+)
+
+# Annotations written by consolidation, status inference, the filter stages
+# and viability on most bids. Rarer ones (_llm_prompt_level, _qa_audit, ...)
+# go to BidAnnotations.other.
+ANNOTATION_FIELDS: tuple[str, ...] = (
+    "_source",
+    "_dedup_key",
+    "_status_inferido",
+    "_term_density",
+    "_matched_terms",
+    "_synonym_matches",
+    "_relevance_source",
+    "_relevance_score",
+    "_confidence_score",
+    "_llm_evidence",
+    "_org_context_stripped",
+    "_trace_id",
+    "_combined_score",
+    "_viability_score",
+    "_viability_level",
+    "_viability_factors",
+    "_value_source",
+    "_pending_review",
+    "_rejection_reason",
+)
+
+_CORE_SET = frozenset(CORE_FIELDS)
+_ANNOTATION_SET = frozenset(ANNOTATION_FIELDS)
+_MISSING = object()
+
+
+class BidAnnotations:
+    """Slotted ``_``-prefixed annotations of one bid (pipeline-internal metadata)."""
+
+    __slots__ = ANNOTATION_FIELDS + ("other",)
+
+    def __init__(self) -> None:
+        self.other: Optional[dict[str, Any]] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _ANNOTATION_SET:
+            return getattr(self, key, default)
+        return self.other.get(key, default) if self.other else default
+
+    def set(self, key: str, value: Any) -> None:
+        if key in _ANNOTATION_SET:
+            setattr(self, key, value)
+        else:
+            if self.other is None:
+                self.other = {}
+            self.other[key] = value
+
+    def delete(self, key: str) -> None:
+        if key in _ANNOTATION_SET:
+            if not hasattr(self, key):
+                raise KeyError(key)
+            delattr(self, key)
+        elif self.other and key in self.other:
+            del self.other[key]
+        else:
+            raise KeyError(key)
+
+    def keys(self) -> Iterator[str]:
+        for key in ANNOTATION_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self.other:
+            yield from self.other
+
+
+class BidRecord(MutableMapping):
+    """Dict-compatible bid: slotted core fields plus a BidAnnotations sub-record."""
+
+    __slots__ = CORE_FIELDS + ("annotations", "extra")
+
+    def __init__(self, data: Optional[Mapping] = None, /, **kwargs: Any) -> None:
+        self.annotations = BidAnnotations()
+        self.extra: Optional[dict[str, Any]] = None
+        if data:
+            for key, value in data.items():
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "BidRecord":
+        return data if isinstance(data, cls) else cls(data)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _CORE_SET:
+            return getattr(self, key, default)
+        if key[:1] == "_":
+            return self.annotations.get(key, default)
+        return self.extra.get(key, default) if self.extra else default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _CORE_SET:
+            setattr(self, key, value)
+        elif key[:1] == "_":
+            self.annotations.set(key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _CORE_SET:
+            if not hasattr(self, key):
+                raise KeyError(key)
+            delattr(self, key)
+        elif key[:1] == "_":
+            self.annotations.delete(key)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        for key in CORE_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self.extra:
+            yield from self.extra
+        yield from self.annotations.keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"BidRecord({self.to_dict()!r})"
+
+    def copy(self) -> "BidRecord":
+        return BidRecord(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict in the legacy key order (core, extra, annotations)."""
+        return {key: self.get(key) for key in self}
+
+
+def json_default(obj: Any) -> Any:
+    """``json.dumps(default=...)`` hook: BidRecord (any Mapping) as a dict, else ``str``."""
+    if isinstance(obj, BidRecord):
+        return obj.to_dict()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def as_dicts(records: Iterable[Mapping]) -> list:
+    """Records as plain dicts for serializers without a ``default`` hook (postgrest, httpx)."""
+    return [r.to_dict() if isinstance(r, BidRecord) else r for r in records]
@@ -15,6 +15,7 @@ import time
 from datetime import datetime, timezone
 from typing import Optional
 
+from bid_record import as_dicts
 from utils.error_reporting import report_error
 from metrics import CACHE_HITS as METRICS_CACHE_HITS, CACHE_MISSES as METRICS_CACHE_MISSES
 
@@ -68,6 +69,7 @@ async def save_to_cache(
     coverage: Optional[dict] = None,
 ) -> dict:
     """Save results to cache with 3-level fallback (AC2)."""
+    results = as_dicts(results)  # BidRecord → dict for postgrest/redis/file JSON
     params_hash = compute_search_hash(params)
     start = time.monotonic()
 
@@ -138,6 +140,7 @@ async def save_to_cache_per_uf(
     coverage: Optional[dict] = None,
 ) -> dict:
     """CRIT-051 AC1: Save results grouped by UF — one cache entry per UF."""
+    results = as_dicts(results)
     results_by_uf: dict = {}
     no_uf_results = []
     for r in results:
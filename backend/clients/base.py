@@ -8,10 +8,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Optional, Set
 import hashlib
 import re
 
+if TYPE_CHECKING:
+    from bid_record import BidRecord
+
 
 class SourceStatus(Enum):
     """Health status of a procurement source."""
@@ -312,6 +315,12 @@ class UnifiedProcurement:
             **{f"_{k}_source": v for k, v in self.merged_from.items()},
         }
 
+    def to_bid_record(self) -> "BidRecord":
+        """Legacy format as a slotted BidRecord (BID_RECORD_SLOTS_ENABLED)."""
+        from bid_record import BidRecord
+
+        return BidRecord(self.to_legacy_format())
+
 
 # ============ Abstract Base Class ============
 
@@ -38,6 +38,17 @@ def _pncp_modality_retry_backoff() -> float:
     return getattr(m, "PNCP_MODALITY_RETRY_BACKOFF", _config.PNCP_MODALITY_RETRY_BACKOFF)
 
 
+def _page_fanout_mode() -> str:
+    """Metric label comparing sequential vs concurrent pagination (PNCP_PAGE_CONCURRENCY)."""
+    return "parallel" if _config.PNCP_PAGE_CONCURRENCY > 1 else "sequential"
+
+
+def _record_modality_outcome(outcome: str) -> None:
+    from metrics import PNCP_MODALITY_FETCHES
+
+    PNCP_MODALITY_FETCHES.labels(outcome=outcome, fanout=_page_fanout_mode()).inc()
+
+
 def _pncp_timeout_per_uf() -> float:
     m = sys.modules.get("pncp_client")
     return getattr(m, "PNCP_TIMEOUT_PER_UF", _config.PNCP_TIMEOUT_PER_UF)
@@ -63,6 +74,7 @@ class _PNCPParallelMixin:
         modalidade: int,
         status: str | None = None,
         max_pages: int | None = None,
+        timeout: float | None = None,
     ) -> tuple[List[Dict[str, Any]], bool]:
         """Fetch a single modality with per-modality timeout and partial accumulation.
 
@@ -74,12 +86,14 @@ class _PNCPParallelMixin:
         useful data). If timeout fires with 0 items, a retry is attempted
         (STORY-252 AC9) since page 1 may have been transiently slow.
 
+        ``timeout`` overrides PNCP_TIMEOUT_PER_MODALITY (fetch planner budget).
+
         Returns:
             Tuple of (items, was_truncated). Partial items + True if timed out
             with accumulated data; empty list + False only if both attempts
             yielded nothing.
         """
-        per_modality_timeout = _pncp_timeout_per_modality()
+        per_modality_timeout = timeout or _pncp_timeout_per_modality()
         retry_backoff = _pncp_modality_retry_backoff()
 
         state = ModalityFetchState()
@@ -98,6 +112,7 @@ class _PNCPParallelMixin:
                     ),
                     timeout=per_modality_timeout,
                 )
+                _record_modality_outcome("truncated" if result[1] else "complete")
                 return result
             except asyncio.TimeoutError:
                 state.timed_out = True
@@ -113,6 +128,7 @@ class _PNCPParallelMixin:
                         f"returning {partial_count} partial items "
                         f"({state.pages_fetched} pages fetched)"
                     )
+                    _record_modality_outcome("timeout_partial")
                     return state.items, True
 
                 # Zero items: worth retrying (could be transient slowness on page 1)
@@ -130,6 +146,7 @@ class _PNCPParallelMixin:
                         f"UF={uf} modalidade={modalidade} timed out after retry "
                         f"with 0 items — skipping this modality"
                     )
+        _record_modality_outcome("timeout_empty")
         return [], False
 
     async def _fetch_uf_all_pages(
@@ -140,6 +157,8 @@ class _PNCPParallelMixin:
         modalidades: List[int],
         status: str | None = None,
         max_pages: int | None = None,  # STORY-282 AC2: Defaults to PNCP_MAX_PAGES (5)
+        page_budgets: Dict[int, int] | None = None,
+        modality_timeouts: Dict[int, float] | None = None,
     ) -> tuple[List[Dict[str, Any]], bool]:
         """Fetch all pages for a single UF across all modalities in parallel.
 
@@ -153,24 +172,31 @@ class _PNCPParallelMixin:
             modalidades: List of modality codes.
             status: Optional status filter.
             max_pages: Maximum pages to fetch per modality.
+            page_budgets: Per-modality page limit overriding max_pages (fetch planner).
+            modality_timeouts: Per-modality timeout overriding
+                PNCP_TIMEOUT_PER_MODALITY (fetch planner).
 
         Returns:
             Tuple of (items, was_truncated). was_truncated is True when any
             modality hit max_pages (GTM-FIX-004).
         """
         async with self._semaphore:  # type: ignore[attr-defined]
+            uf_start = sync_time.monotonic()
             # Launch all modalities in parallel with individual timeouts (AC6)
-            modality_tasks = [
-                self._fetch_modality_with_timeout(
+            modality_tasks = []
+            for mod in modalidades:
+                planned = {}
+                if modality_timeouts and mod in modality_timeouts:
+                    planned["timeout"] = modality_timeouts[mod]
+                modality_tasks.append(self._fetch_modality_with_timeout(
                     uf=uf,
                     data_inicial=data_inicial,
                     data_final=data_final,
                     modalidade=mod,
                     status=status,
-                    max_pages=max_pages,
-                )
-                for mod in modalidades
-            ]
+                    max_pages=(page_budgets or {}).get(mod, max_pages),
+                    **planned,
+                ))
 
             modality_results = await asyncio.gather(
                 *modality_tasks, return_exceptions=True
@@ -199,6 +225,10 @@ class _PNCPParallelMixin:
                         seen_ids.add(item_id)
                         all_items.append(item)
 
+            from metrics import PNCP_UF_FETCH_DURATION
+            PNCP_UF_FETCH_DURATION.labels(uf=uf, fanout=_page_fanout_mode()).observe(
+                sync_time.monotonic() - uf_start
+            )
             logger.debug(f"Fetched {len(all_items)} items for UF={uf} (truncated={uf_was_truncated})")
             return all_items, uf_was_truncated
 
@@ -245,6 +275,7 @@ class _PNCPParallelMixin:
         from clients.pncp.async_client import STATUS_PNCP_MAP
 
         start_time = sync_time.time()
+        fetch_plan = None
 
         # STORY-282 AC2: Resolve default page limit
         if max_pages_per_uf is None:
@@ -293,6 +324,19 @@ class _PNCPParallelMixin:
             # Calculation: 4 mods × ~15s/mod (with retry) = ~60s + 30s margin = 90s
             PER_UF_TIMEOUT = _pncp_timeout_per_uf()
 
+            # Per-UF page budgets/timeouts from history, largest UFs first
+            from config import get_feature_flag
+            if get_feature_flag("PNCP_FETCH_PLANNER_ENABLED"):
+                from clients.pncp.fetch_planner import plan_parallel_fetch
+                try:
+                    fetch_plan = await plan_parallel_fetch(
+                        ufs, modalidades, data_inicial, data_final, max_pages_per_uf,
+                        batch_size=PNCP_BATCH_SIZE, batch_delay_s=PNCP_BATCH_DELAY_S,
+                    )
+                    ufs_ordered = fetch_plan.uf_order
+                except Exception as e:
+                    logger.warning(f"PNCP fetch planner failed, using static budgets: {e}")
+
         # Helper to safely call async/sync callbacks
         async def _safe_callback(cb, *args, **kwargs):
             if cb is None:
@@ -309,6 +353,8 @@ class _PNCPParallelMixin:
         async def _fetch_with_callback(uf: str) -> tuple[List[Dict[str, Any]], bool]:
             # STORY-257A AC6: Emit "fetching" status when UF starts
             await _safe_callback(on_uf_status, uf, "fetching")
+            uf_timeout = fetch_plan.uf_timeouts[uf] if fetch_plan else PER_UF_TIMEOUT
+            planned = fetch_plan.uf_kwargs(uf) if fetch_plan else {}
             try:
                 items, was_truncated = await asyncio.wait_for(
                     self._fetch_uf_all_pages(
@@ -318,12 +364,13 @@ class _PNCPParallelMixin:
                         modalidades=modalidades,
                         status=pncp_status,
                         max_pages=max_pages_per_uf,
+                        **planned,
                     ),
-                    timeout=PER_UF_TIMEOUT,
+                    timeout=uf_timeout,
                 )
             except asyncio.TimeoutError:
                 await _circuit_breaker.record_failure()
-                logger.warning(f"UF={uf} timed out after {PER_UF_TIMEOUT}s — skipping")
+                logger.warning(f"UF={uf} timed out after {uf_timeout}s — skipping")
                 # AC6: Emit "failed" status
                 await _safe_callback(on_uf_status, uf, "failed", reason="timeout")
                 items, was_truncated = [], False
@@ -461,4 +508,5 @@ class _PNCPParallelMixin:
             succeeded_ufs=succeeded_ufs,
             failed_ufs=failed_ufs,
             truncated_ufs=truncated_ufs,
+            fetch_plan=fetch_plan.to_trace() if fetch_plan else None,
         )
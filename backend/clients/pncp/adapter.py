@@ -44,6 +44,8 @@ class PNCPLegacyAdapter:
         # GTM-FIX-004: Truncation detection for PNCP in multi-source mode
         self.was_truncated: bool = False
         self.truncated_ufs: List[str] = []
+        # Per-UF page budget / timeout plan (PNCP_FETCH_PLANNER_ENABLED), for the search trace
+        self.fetch_plan: dict | None = None
 
     @property
     def metadata(self):
@@ -83,6 +85,7 @@ class PNCPLegacyAdapter:
             )
             if isinstance(fetch_result, ParallelFetchResult):
                 results = fetch_result.items
+                self.fetch_plan = fetch_result.fetch_plan
                 # GTM-FIX-004: Capture truncation state for multi-source propagation
                 if fetch_result.truncated_ufs:
                     self.was_truncated = True
@@ -103,6 +106,7 @@ class PNCPLegacyAdapter:
             )
             if isinstance(fetch_result, ParallelFetchResult):
                 results = fetch_result.items
+                self.fetch_plan = fetch_result.fetch_plan
                 if fetch_result.truncated_ufs:
                     self.was_truncated = True
                     self.truncated_ufs = fetch_result.truncated_ufs
@@ -30,6 +30,7 @@ from config import (
 )
 from exceptions import PNCPAPIError
 from middleware import request_id_var
+from pncp_resilience import get_page_latency_tracker
 
 from clients.pncp.circuit_breaker import _circuit_breaker  # noqa: F401
 from clients.pncp.retry import (
@@ -115,6 +116,20 @@ def _normalize_item(item: Dict[str, Any], uf_hint: str | None = None) -> Dict[st
     return item
 
 
+async def _feed_rate_controller(
+    status_code: int, latency_s: float, retryable_status_codes: tuple,
+) -> None:
+    """Report a PNCP response to the adaptive (AIMD) rate controller."""
+    from rate_limiter import pncp_rate_controller
+
+    if status_code == 429:
+        await pncp_rate_controller.record_throttle("429")
+    elif status_code >= 500 and status_code in retryable_status_codes:
+        await pncp_rate_controller.record_throttle("5xx")
+    elif status_code in (200, 204):
+        await pncp_rate_controller.record_success(latency_s)
+
+
 class AsyncPNCPClient(_PNCPParallelMixin):
     """
     Async HTTP client for PNCP API with parallel UF fetching.
@@ -152,6 +167,9 @@ class AsyncPNCPClient(_PNCPParallelMixin):
         self._client: httpx.AsyncClient | None = None
         self._request_count = 0  # Per-session counter; reset not needed as each client instance is short-lived
         self._last_request_time = 0.0
+        # Next free local request slot (loop time) — reserved before sleeping so
+        # concurrent page/modality tasks are spaced instead of bursting together
+        self._next_request_time = 0.0
 
     async def __aenter__(self) -> "AsyncPNCPClient":
         """Async context manager entry.
@@ -282,6 +300,8 @@ class AsyncPNCPClient(_PNCPParallelMixin):
         url = f"{self.BASE_URL}/orgaos/{cnpj_clean}/compras/{ano}/{sequencial}/itens"
 
         for attempt in range(2):  # 1 initial + 1 retry
+            # Item fetches share the PNCP request budget with page fetches
+            await self._rate_limit()
             try:
                 response = await asyncio.wait_for(
                     self._client.get(url),
@@ -345,22 +365,26 @@ class AsyncPNCPClient(_PNCPParallelMixin):
         """Enforce rate limiting — shared Redis when available, local fallback.
 
         B-06 AC7: Uses RedisRateLimiter for cross-worker coordination.
-        Local sleep-based limiter always runs as baseline.
+        Local pacing always runs as baseline, at the interval implied by the
+        adaptive (AIMD) allowed rate instead of a fixed 100ms.
         """
         # Shared rate limiter (Redis-backed, cross-worker) — AC7
-        from rate_limiter import pncp_rate_limiter
+        from rate_limiter import pncp_rate_limiter, pncp_rate_controller
         await pncp_rate_limiter.acquire(timeout=5.0)
 
         # Local rate limiter (per-worker baseline, always active)
-        MIN_INTERVAL = 0.1  # 100ms
+        min_interval = 1.0 / pncp_rate_controller.current_rate
 
-        current_time = asyncio.get_running_loop().time()
-        elapsed = current_time - self._last_request_time
-        if elapsed < MIN_INTERVAL:
-            await asyncio.sleep(MIN_INTERVAL - elapsed)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_request_time)
+        self._next_request_time = slot + min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
-        self._last_request_time = asyncio.get_running_loop().time()
+        self._last_request_time = loop.time()
         self._request_count += 1
+        pncp_rate_controller.note_request()
 
     async def _fetch_page_async(
         self,
@@ -444,9 +468,17 @@ class AsyncPNCPClient(_PNCPParallelMixin):
                 if req_id and req_id != "-":
                     extra_headers["X-Request-ID"] = req_id
 
+                request_started = time.monotonic()
                 response = await self._client.get(
                     url, params=params, headers=extra_headers
                 )
+                request_latency_s = time.monotonic() - request_started
+                await _feed_rate_controller(
+                    response.status_code, request_latency_s,
+                    self.config.retryable_status_codes,
+                )
+                if uf and response.status_code == 200:
+                    get_page_latency_tracker().record_request(uf, request_latency_s * 1000, success=True)
 
                 # Handle rate limiting
                 if response.status_code == 429:
@@ -599,6 +631,8 @@ class AsyncPNCPClient(_PNCPParallelMixin):
                     )
 
             except httpx.TimeoutException as e:
+                from rate_limiter import pncp_rate_controller
+                await pncp_rate_controller.record_throttle("timeout")
                 if attempt < self.config.max_retries:
                     delay = min(
                         self.config.base_delay * (self.config.exponential_base ** attempt),
@@ -637,6 +671,12 @@ class AsyncPNCPClient(_PNCPParallelMixin):
         This is the inner loop extracted from ``_fetch_uf_all_pages`` so that
         each modality can be wrapped with its own timeout (STORY-252 AC6).
 
+        Page 1 is fetched first to learn how many pages remain
+        (``paginasRestantes``, falling back to ``totalPaginas``); pages
+        2..min(total, max_pages) are then fetched concurrently, at most
+        ``PNCP_PAGE_CONCURRENCY`` at a time. Every request still goes through
+        ``_rate_limit``, so the fan-out only removes idle round-trip time.
+
         Uses a shared ``ModalityFetchState`` when provided so that items
         accumulated before a timeout cancellation are preserved (partial
         accumulation pattern).
@@ -655,7 +695,7 @@ class AsyncPNCPClient(_PNCPParallelMixin):
             max_pages was hit while more pages remained (GTM-FIX-004),
             or when the fetch was interrupted by timeout with partial data.
         """
-        from config import PNCP_MAX_PAGES
+        from config import PNCP_MAX_PAGES, PNCP_PAGE_CONCURRENCY
         if max_pages is None:
             max_pages = PNCP_MAX_PAGES
 
@@ -664,9 +704,8 @@ class AsyncPNCPClient(_PNCPParallelMixin):
         if state is None:
             state = ModalityFetchState()
 
-        pagina = state.pages_fetched + 1
-
-        while pagina <= max_pages:
+        async def _fetch_into_state(pagina: int) -> Dict[str, Any] | None:
+            """Fetch one page and merge its items; None when the page failed."""
             try:
                 response = await self._fetch_page_async(
                     data_inicial=data_inicial,
@@ -677,37 +716,6 @@ class AsyncPNCPClient(_PNCPParallelMixin):
                     tamanho=50,  # PNCP API max reduced from 500→50 (~Feb 2026)
                     status=status,
                 )
-
-                await _circuit_breaker.record_success()
-
-                data = response.get("data", [])
-                paginas_restantes = response.get("paginasRestantes", 0)
-
-                for item in data:
-                    item_id = item.get("numeroControlePNCP", "")
-                    if item_id and item_id not in state.seen_ids:
-                        state.seen_ids.add(item_id)
-                        normalized = _normalize_item(item, uf_hint=uf)
-                        state.items.append(normalized)
-
-                state.pages_fetched = pagina
-
-                if paginas_restantes <= 0:
-                    break
-
-                # STORY-282 AC2 + GTM-FIX-004: Detect truncation when max_pages reached
-                total_records = response.get("totalRegistros", 0)
-                if pagina >= max_pages and paginas_restantes > 0:
-                    state.was_truncated = True
-                    logger.warning(
-                        f"STORY-282: MAX_PAGES ({max_pages}) reached for UF={uf}, "
-                        f"modalidade={modalidade}. Fetched {len(state.items)}/{total_records} items. "
-                        f"Remaining pages: {paginas_restantes}. "
-                        f"Truncating to cap latency (set PNCP_MAX_PAGES to increase)."
-                    )
-
-                pagina += 1
-
             except PNCPAPIError as e:
                 # CRIT-043 AC1+AC4: Distinguish expected 400 (page>1) from real errors (page 1)
                 error_str = str(e)
@@ -725,6 +733,55 @@ class AsyncPNCPClient(_PNCPParallelMixin):
                         f"Error fetching UF={uf}, modalidade={modalidade}, "
                         f"page={pagina}: {e}"
                     )
-                break
+                return None
+
+            await _circuit_breaker.record_success()
+
+            for item in response.get("data", []):
+                item_id = item.get("numeroControlePNCP", "")
+                if item_id and item_id not in state.seen_ids:
+                    state.seen_ids.add(item_id)
+                    normalized = _normalize_item(item, uf_hint=uf)
+                    state.items.append(normalized)
+
+            state.fetched_pages.add(pagina)
+            state.pages_fetched = len(state.fetched_pages)
+            return response
+
+        if not state.last_page:
+            first = await _fetch_into_state(1)
+            if first is None:
+                return state.items, state.was_truncated
+
+            paginas_restantes = first.get("paginasRestantes")
+            if paginas_restantes is None:
+                state.last_page = max(1, first.get("totalPaginas", 1) or 1)
+            else:
+                state.last_page = 1 + max(0, paginas_restantes)
+
+            # STORY-282 AC2 + GTM-FIX-004: Detect truncation when max_pages reached
+            if state.last_page > max_pages:
+                state.was_truncated = True
+                logger.warning(
+                    f"STORY-282: MAX_PAGES ({max_pages}) reached for UF={uf}, "
+                    f"modalidade={modalidade}. Fetching {max_pages}/{state.last_page} pages "
+                    f"({first.get('totalRegistros', 0)} records). "
+                    f"Truncating to cap latency (set PNCP_MAX_PAGES to increase)."
+                )
+
+        pending = [
+            p for p in range(2, min(state.last_page, max_pages) + 1)
+            if p not in state.fetched_pages
+        ]
+        if pending:
+            page_slots = asyncio.Semaphore(max(1, PNCP_PAGE_CONCURRENCY))
+
+            async def _bounded(pagina: int) -> None:
+                async with page_slots:
+                    await _fetch_into_state(pagina)
+
+            # On timeout the caller cancels this coroutine; gather cancels the
+            # in-flight pages and state keeps whatever already completed.
+            await asyncio.gather(*(_bounded(p) for p in pending))
 
         return state.items, state.was_truncated
@@ -0,0 +1,314 @@
+"""PNCP fetch planner — per-(UF, modalidade) page budgets and timeouts.
+
+buscar_todas_ufs_paralelo used the same PNCP_MAX_PAGES and the same
+per-UF/per-modality timeouts for every UF, in request order. SP and AC get
+identical budgets, so large UFs time out with partial data while small UFs
+hold batch slots they never need.
+
+When PNCP_FETCH_PLANNER_ENABLED is on, the parallel fetch is planned first:
+  1. Expected pages per (UF, modalidade) come from datalake publication
+     volume (count_recent_bids_by_uf_modalidade RPC, cached in-process for
+     PNCP_PLANNER_HISTORY_TTL_S); UF-size heuristics fill any gaps.
+  2. Per-page latency p95 per UF comes from the page latency tracker
+     (pncp_resilience.get_page_latency_tracker), fed by every successful
+     page request.
+  3. Each task gets a page budget (<= max_pages) and a timeout covering its
+     page-1 round trip plus the concurrent rounds for the remaining pages.
+  4. UFs are ordered by expected work, largest first, and the batch schedule
+     is scaled down if it would overrun PNCP_TIMEOUT_PER_SOURCE.
+
+The plan is attached to the current span (``pncp.fetch_plan``) and returned
+on ParallelFetchResult.fetch_plan for the search trace.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+
+import config as _config
+from pncp_resilience import AdaptiveTimeoutManager, get_page_latency_tracker
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 50  # tamanhoPagina (PNCP API max)
+
+# Baseline publications/day per modalidade when the datalake has no history
+_HEURISTIC_ROWS_PER_DAY = {"large": 30.0, "medium": 10.0, "small": 4.0}
+
+_PAGE_SLACK = 1.25             # Headroom over the historical page count
+_TIMEOUT_SAFETY = 1.5          # Multiplier over p95 page latency
+_UF_TIMEOUT_MARGIN_S = 5.0     # Per-UF margin over its slowest modality
+_MIN_LATENCY_SAMPLES = 3       # Same threshold as AdaptiveTimeoutManager.get_timeout
+_HISTORY_QUERY_TIMEOUT_S = 2.0
+_HISTORY_RETRY_AFTER_S = 60.0  # Backoff after a failed history query
+
+# (uf, modalidade) -> rows/day, shared by all searches in this worker
+_history_cache: Dict[Tuple[str, int], float] = {}
+_history_loaded_at: float = 0.0
+_history_retry_at: float = 0.0
+
+
+@dataclass
+class FetchTask:
+    """Budget for one (UF, modalidade) fetch."""
+    uf: str
+    modalidade: int
+    expected_pages: int
+    max_pages: int
+    timeout_s: float
+    source: str  # "history" | "heuristic"
+
+
+@dataclass
+class FetchPlan:
+    """Ordered per-UF schedule for buscar_todas_ufs_paralelo."""
+    tasks: List[FetchTask]
+    uf_order: List[str]
+    uf_timeouts: Dict[str, float]
+    deadline_s: float
+    estimated_s: float
+    scaled: bool = False
+    sources: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def source(self) -> str:
+        if not self.sources.get("heuristic"):
+            return "history"
+        return "mixed" if self.sources.get("history") else "heuristic"
+
+    def uf_kwargs(self, uf: str) -> Dict[str, Any]:
+        """Extra _fetch_uf_all_pages kwargs for one UF."""
+        tasks = [t for t in self.tasks if t.uf == uf]
+        return {
+            "page_budgets": {t.modalidade: t.max_pages for t in tasks},
+            "modality_timeouts": {t.modalidade: t.timeout_s for t in tasks},
+        }
+
+    def to_trace(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "scaled": self.scaled,
+            "deadline_s": self.deadline_s,
+            "estimated_s": round(self.estimated_s, 1),
+            "uf_order": list(self.uf_order),
+            "ufs": {
+                uf: {
+                    "timeout_s": round(self.uf_timeouts[uf], 1),
+                    "pages": {
+                        str(t.modalidade): t.max_pages for t in self.tasks if t.uf == uf
+                    },
+                }
+                for uf in self.uf_order
+            },
+        }
+
+
+def _heuristic_rows_per_day(uf: str) -> float:
+    if uf in AdaptiveTimeoutManager.LARGE_UFS:
+        return _HEURISTIC_ROWS_PER_DAY["large"]
+    if uf in AdaptiveTimeoutManager.MEDIUM_UFS:
+        return _HEURISTIC_ROWS_PER_DAY["medium"]
+    return _HEURISTIC_ROWS_PER_DAY["small"]
+
+
+def _span_days(data_inicial: str, data_final: str) -> int:
+    try:
+        start = date.fromisoformat(data_inicial[:10])
+        end = date.fromisoformat(data_final[:10])
+    except ValueError:
+        return 1
+    return max(1, abs((end - start).days) + 1)
+
+
+def build_fetch_plan(
+    ufs: List[str],
+    modalidades: List[int],
+    span_days: int,
+    *,
+    history: Dict[Tuple[str, int], float],
+    page_latency_s: Dict[str, float],
+    default_latency_s: float,
+    max_pages: int,
+    page_concurrency: int,
+    deadline_s: float,
+    batch_size: int,
+    batch_delay_s: float,
+    min_timeout_s: float,
+) -> FetchPlan:
+    """Build the page budget / timeout schedule for one parallel fetch.
+
+    Pure function — all inputs are passed in so the plan is reproducible.
+
+    Args:
+        history: Historical publications/day per (uf, modalidade). Missing
+            combinations fall back to UF-size heuristics.
+        page_latency_s: p95 latency of one page request per UF.
+        deadline_s: Wall-clock budget for all batches.
+    """
+    concurrency = max(1, page_concurrency)
+    tasks: List[FetchTask] = []
+    sources = {"history": 0, "heuristic": 0}
+
+    for uf in ufs:
+        latency = page_latency_s.get(uf, default_latency_s)
+        for mod in modalidades:
+            rows_per_day = history.get((uf, mod))
+            source = "history"
+            if not rows_per_day:
+                rows_per_day = _heuristic_rows_per_day(uf)
+                source = "heuristic"
+            sources[source] += 1
+
+            expected = max(1, math.ceil(rows_per_day * span_days / PAGE_SIZE))
+            budget = max(1, min(max_pages, math.ceil(expected * _PAGE_SLACK)))
+            # Page 1 alone, then the rest fanned out PNCP_PAGE_CONCURRENCY at a time
+            rounds = 1 + math.ceil((budget - 1) / concurrency)
+            timeout = max(min_timeout_s, rounds * latency * _TIMEOUT_SAFETY)
+            tasks.append(FetchTask(uf, mod, expected, budget, timeout, source))
+
+    def _uf_timeouts() -> Dict[str, float]:
+        return {
+            uf: max(t.timeout_s for t in tasks if t.uf == uf) + _UF_TIMEOUT_MARGIN_S
+            for uf in ufs
+        } if modalidades else {uf: min_timeout_s for uf in ufs}
+
+    def _work(uf: str) -> int:
+        return sum(t.expected_pages for t in tasks if t.uf == uf)
+
+    # Largest UFs first: they get the early batches and the full deadline
+    uf_order = sorted(ufs, key=_work, reverse=True)
+    uf_timeouts = _uf_timeouts()
+
+    # Worst case: every batch waits for its slowest UF timeout
+    def _estimate(timeouts: Dict[str, float]) -> Tuple[float, float]:
+        size = max(1, batch_size)
+        batches = [uf_order[i:i + size] for i in range(0, len(uf_order), size)]
+        fetch_s = sum(max(timeouts[uf] for uf in batch) for batch in batches)
+        return fetch_s, batch_delay_s * max(0, len(batches) - 1)
+
+    fetch_s, delay_s = _estimate(uf_timeouts)
+    scaled = False
+    if fetch_s + delay_s > deadline_s and fetch_s > 0:
+        scaled = True
+        factor = max(0.0, deadline_s - delay_s) / fetch_s
+        for t in tasks:
+            t.timeout_s = max(min_timeout_s, t.timeout_s * factor)
+            t.max_pages = max(1, math.floor(t.max_pages * factor))
+        uf_timeouts = _uf_timeouts()
+        fetch_s, delay_s = _estimate(uf_timeouts)
+
+    return FetchPlan(
+        tasks=tasks,
+        uf_order=uf_order,
+        uf_timeouts=uf_timeouts,
+        deadline_s=deadline_s,
+        estimated_s=fetch_s + delay_s,
+        scaled=scaled,
+        sources=sources,
+    )
+
+
+async def load_page_history(ufs: List[str], modalidades: List[int]) -> Dict[Tuple[str, int], float]:
+    """Historical publications/day per (uf, modalidade) from the datalake.
+
+    Fail-open: returns whatever is cached (possibly {}) when the RPC is slow
+    or unavailable — the planner then falls back to heuristics and the query
+    is not retried for _HISTORY_RETRY_AFTER_S.
+    """
+    global _history_loaded_at, _history_retry_at
+
+    now = time.monotonic()
+    if now - _history_loaded_at > _config.PNCP_PLANNER_HISTORY_TTL_S:
+        _history_cache.clear()
+        _history_loaded_at = 0.0
+
+    wanted = {(uf, mod) for uf in ufs for mod in modalidades}
+    if (_history_loaded_at and wanted <= _history_cache.keys()) or now < _history_retry_at:
+        return {k: _history_cache[k] for k in wanted if k in _history_cache}
+
+    days = _config.PNCP_PLANNER_HISTORY_DAYS
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    try:
+        from supabase_client import get_supabase, sb_execute
+
+        resp = await asyncio.wait_for(
+            sb_execute(
+                get_supabase().rpc(
+                    "count_recent_bids_by_uf_modalidade",
+                    {"p_since": since, "p_ufs": sorted(ufs), "p_modalidades": sorted(modalidades)},
+                ),
+                category="rpc",
+            ),
+            timeout=_HISTORY_QUERY_TIMEOUT_S,
+        )
+    except Exception as e:
+        logger.debug("fetch_planner: page history unavailable — %s: %s", type(e).__name__, e)
+        _history_retry_at = now + _HISTORY_RETRY_AFTER_S
+        return {k: _history_cache[k] for k in wanted if k in _history_cache}
+
+    # Combinations with no rows are cached as 0.0 (= no history, use heuristics)
+    for key in wanted:
+        _history_cache[key] = 0.0
+    for row in resp.data or []:
+        key = (row["uf"], int(row["modalidade_id"]))
+        _history_cache[key] = int(row["bid_count"] or 0) / days
+    if not _history_loaded_at:
+        _history_loaded_at = now
+    return {k: _history_cache[k] for k in wanted}
+
+
+def page_latencies(ufs: List[str]) -> Dict[str, float]:
+    """p95 page latency (seconds) for UFs with enough recent samples."""
+    tracker = get_page_latency_tracker()
+    latencies = {}
+    for uf in ufs:
+        m = tracker.metrics.get(uf)
+        if m and m.successful_requests >= _MIN_LATENCY_SAMPLES:
+            latencies[uf] = m.p95_duration_ms / 1000
+    return latencies
+
+
+async def plan_parallel_fetch(
+    ufs: List[str],
+    modalidades: List[int],
+    data_inicial: str,
+    data_final: str,
+    max_pages: int,
+    *,
+    batch_size: int,
+    batch_delay_s: float,
+) -> FetchPlan:
+    """Load history + latency and build the plan for buscar_todas_ufs_paralelo."""
+    history = await load_page_history(ufs, modalidades)
+    plan = build_fetch_plan(
+        ufs,
+        modalidades,
+        _span_days(data_inicial, data_final),
+        history=history,
+        page_latency_s=page_latencies(ufs),
+        default_latency_s=_config.PNCP_PLANNER_PAGE_LATENCY_S,
+        max_pages=max_pages,
+        page_concurrency=_config.PNCP_PAGE_CONCURRENCY,
+        deadline_s=float(_config.PNCP_TIMEOUT_PER_SOURCE),
+        batch_size=batch_size,
+        batch_delay_s=batch_delay_s,
+        min_timeout_s=_config.PNCP_PLANNER_MIN_TIMEOUT_S,
+    )
+
+    from metrics import PNCP_FETCH_PLANS, PNCP_FETCH_PLAN_ESTIMATED_SECONDS
+    from telemetry import get_current_span
+
+    PNCP_FETCH_PLANS.labels(source=plan.source, scaled=str(plan.scaled).lower()).inc()
+    PNCP_FETCH_PLAN_ESTIMATED_SECONDS.observe(plan.estimated_s)
+    trace = plan.to_trace()
+    get_current_span().set_attribute("pncp.fetch_plan", json.dumps(trace, separators=(",", ":")))
+    logger.info(
+        "PNCP fetch plan: source=%s scaled=%s estimated=%.1fs deadline=%.0fs order=%s",
+        plan.source, plan.scaled, plan.estimated_s, plan.deadline_s, plan.uf_order,
+    )
+    return plan
@@ -81,6 +81,7 @@ class ParallelFetchResult:
     succeeded_ufs: List[str]
     failed_ufs: List[str]
     truncated_ufs: List[str] = field(default_factory=list)  # GTM-FIX-004: UFs that hit max_pages limit
+    fetch_plan: Optional[Dict[str, Any]] = None  # FetchPlan.to_trace() when PNCP_FETCH_PLANNER_ENABLED
 
 
 @dataclass
@@ -90,12 +91,18 @@ class ModalityFetchState:
     Passed into _fetch_single_modality so that items accumulated before a
     timeout cancellation are preserved. Thread-safe in asyncio (single-threaded
     event loop — no locks needed).
+
+    Pages 2..N are fetched concurrently and may complete out of order, so
+    ``fetched_pages`` records which pages are in ``items`` and ``last_page``
+    the page count announced by page 1 (0 = not known yet).
     """
     items: List[Dict[str, Any]] = field(default_factory=list)
     seen_ids: set = field(default_factory=set)
     pages_fetched: int = 0
     was_truncated: bool = False
     timed_out: bool = False
+    fetched_pages: set = field(default_factory=set)
+    last_page: int = 0
 
 
 # ============================================================================
@@ -67,6 +67,8 @@ class SanctionsResult:
     ceis_count: int
     cnep_count: int
     cache_hit: bool = False
+    from_mirror: bool = False  # answered by the local CEIS/CNEP mirror
+    complete: bool = True  # False when CEIS or CNEP could not be queried
 
 
 # ---------------------------------------------------------------------------
@@ -453,28 +455,7 @@ class SanctionsChecker:
             logger.warning("[SANCTIONS] Empty CNPJ provided to check_ceis")
             return []
 
-        try:
-            raw_records = await self._fetch_all_pages("/ceis", cnpj_digits)
-            records = []
-            for raw in raw_records:
-                try:
-                    record = self._parse_ceis_record(raw)
-                    records.append(record)
-                except Exception as exc:
-                    logger.warning(
-                        "[SANCTIONS] Failed to parse CEIS record: %s", exc,
-                    )
-            logger.info(
-                "[SANCTIONS] CEIS check for %s: %d record(s) found",
-                cnpj_digits, len(records),
-            )
-            return records
-
-        except Exception as exc:
-            logger.warning(
-                "[SANCTIONS] CEIS query failed for %s: %s", cnpj_digits, exc,
-            )
-            return []
+        return await self._query_source("CEIS", cnpj_digits) or []
 
     async def check_cnep(self, cnpj: str) -> List[SanctionRecord]:
         """
@@ -495,28 +476,38 @@ class SanctionsChecker:
             logger.warning("[SANCTIONS] Empty CNPJ provided to check_cnep")
             return []
 
-        try:
-            raw_records = await self._fetch_all_pages("/cnep", cnpj_digits)
-            records = []
-            for raw in raw_records:
-                try:
-                    record = self._parse_cnep_record(raw)
-                    records.append(record)
-                except Exception as exc:
-                    logger.warning(
-                        "[SANCTIONS] Failed to parse CNEP record: %s", exc,
-                    )
-            logger.info(
-                "[SANCTIONS] CNEP check for %s: %d record(s) found",
-                cnpj_digits, len(records),
-            )
-            return records
+        return await self._query_source("CNEP", cnpj_digits) or []
+
+    async def _query_source(
+        self, source: str, cnpj_digits: str,
+    ) -> Optional[List[SanctionRecord]]:
+        """Records of *source* ("CEIS" | "CNEP") for a CNPJ; None if the query failed."""
+        if source == "CEIS":
+            path, parse = "/ceis", self._parse_ceis_record
+        else:
+            path, parse = "/cnep", self._parse_cnep_record
 
+        try:
+            raw_records = await self._fetch_all_pages(path, cnpj_digits)
         except Exception as exc:
             logger.warning(
-                "[SANCTIONS] CNEP query failed for %s: %s", cnpj_digits, exc,
+                "[SANCTIONS] %s query failed for %s: %s", source, cnpj_digits, exc,
             )
-            return []
+            return None
+
+        records = []
+        for raw in raw_records:
+            try:
+                records.append(parse(raw))
+            except Exception as exc:
+                logger.warning(
+                    "[SANCTIONS] Failed to parse %s record: %s", source, exc,
+                )
+        logger.info(
+            "[SANCTIONS] %s check for %s: %d record(s) found",
+            source, cnpj_digits, len(records),
+        )
+        return records
 
     async def check_sanctions(self, cnpj: str) -> SanctionsResult:
         """
@@ -560,10 +551,12 @@ class SanctionsChecker:
                 del self._cache[cnpj_digits]
 
         # --- Fetch from both APIs concurrently ---
-        ceis_records, cnep_records = await asyncio.gather(
-            self.check_ceis(cnpj_digits),
-            self.check_cnep(cnpj_digits),
+        ceis_found, cnep_found = await asyncio.gather(
+            self._query_source("CEIS", cnpj_digits),
+            self._query_source("CNEP", cnpj_digits),
         )
+        complete = ceis_found is not None and cnep_found is not None
+        ceis_records, cnep_records = ceis_found or [], cnep_found or []
 
         all_sanctions = ceis_records + cnep_records
         has_active = any(s.is_active for s in all_sanctions)
@@ -576,10 +569,12 @@ class SanctionsChecker:
             ceis_count=len(ceis_records),
             cnep_count=len(cnep_records),
             cache_hit=False,
+            complete=complete,
         )
 
-        # --- AC11: Store in cache ---
-        self._cache[cnpj_digits] = (result, time.monotonic())
+        # --- AC11: Store in cache (a failed query is retried, not cached) ---
+        if complete:
+            self._cache[cnpj_digits] = (result, time.monotonic())
 
         logger.info(
             "[SANCTIONS] Sanctions check for %s: sanctioned=%s "
@@ -23,6 +23,17 @@ from config.pncp import (
     PNCP_READ_TIMEOUT,  # noqa: F401
     PNCP_MAX_RETRIES,  # noqa: F401
     PNCP_MAX_PAGES,  # noqa: F401
+    PNCP_PAGE_CONCURRENCY,  # noqa: F401
+    PNCP_AIMD_ENABLED,  # noqa: F401
+    PNCP_RATE_MIN,  # noqa: F401
+    PNCP_RATE_MAX,  # noqa: F401
+    PNCP_RATE_INITIAL,  # noqa: F401
+    PNCP_AIMD_INCREASE,  # noqa: F401
+    PNCP_AIMD_DECREASE_FACTOR,  # noqa: F401
+    PNCP_AIMD_LATENCY_THRESHOLD_S,  # noqa: F401
+    PNCP_AIMD_COOLDOWN_S,  # noqa: F401
+    PNCP_TOKEN_LEASE_SIZE,  # noqa: F401
+    PNCP_TOKEN_LEASE_TTL_S,  # noqa: F401
     PNCP_MAX_PAGE_SIZE,  # noqa: F401
     CACHE_FIRST_FRESH_TIMEOUT,  # noqa: F401
     PNCP_CANARY_TIMEOUT_S,  # noqa: F401
@@ -60,6 +71,10 @@ from config.pncp import (
     PNCP_MODALITY_RETRY_BACKOFF,  # noqa: F401
     PNCP_BATCH_SIZE,  # noqa: F401
     PNCP_BATCH_DELAY_S,  # noqa: F401
+    PNCP_PLANNER_HISTORY_DAYS,  # noqa: F401
+    PNCP_PLANNER_HISTORY_TTL_S,  # noqa: F401
+    PNCP_PLANNER_PAGE_LATENCY_S,  # noqa: F401
+    PNCP_PLANNER_MIN_TIMEOUT_S,  # noqa: F401
     USE_REDIS_CIRCUIT_BREAKER,  # noqa: F401
     CB_REDIS_TTL,  # noqa: F401
 )
@@ -93,10 +108,14 @@ from config.features import (
     ZERO_MATCH_JOB_TIMEOUT_S,  # noqa: F401
     LLM_FALLBACK_PENDING_ENABLED,  # noqa: F401
     PARTIAL_DATA_SSE_ENABLED,  # noqa: F401
+    SSE_MULTIPLEXER_ENABLED,  # noqa: F401
+    BID_RECORD_SLOTS_ENABLED,  # noqa: F401
+    SSE_MUX_BLOCK_MS,  # noqa: F401
     PENDING_REVIEW_TTL_SECONDS,  # noqa: F401
     PENDING_REVIEW_MAX_RETRIES,  # noqa: F401
     PENDING_REVIEW_RETRY_DELAY,  # noqa: F401
     ITEM_INSPECTION_ENABLED,  # noqa: F401
+    ITEM_INSPECTION_ASYNC_ENABLED,  # noqa: F401
     MAX_ITEM_INSPECTIONS,  # noqa: F401
     ITEM_INSPECTION_TIMEOUT,  # noqa: F401
     ITEM_INSPECTION_PHASE_TIMEOUT,  # noqa: F401
@@ -159,6 +178,18 @@ from config.pipeline import (
     RESULTS_SUPABASE_TTL_HOURS,  # noqa: F401
     ARBITER_REDIS_TTL,  # noqa: F401
     STATE_STORE_REDIS_PREFIX,  # noqa: F401
+    SEARCH_PROFILE_SAMPLE_RATE,  # noqa: F401
+    SEARCH_PROFILE_TRACEMALLOC,  # noqa: F401
+    SEARCH_PROFILE_TTL_S,  # noqa: F401
+    LOOP_LAG_MONITOR_ENABLED,  # noqa: F401
+    LOOP_LAG_INTERVAL_S,  # noqa: F401
+    LOOP_LAG_WINDOW_S,  # noqa: F401
+    LOOP_BLOCKING_THRESHOLD_MS,  # noqa: F401
+    LOOP_BLOCKING_DETECTOR_ENABLED,  # noqa: F401
+    SANCTIONS_CACHE_TTL_S,  # noqa: F401
+    SANCTIONS_NEGATIVE_CACHE_TTL_S,  # noqa: F401
+    SANCTIONS_BATCH_CONCURRENCY,  # noqa: F401
+    SANCTIONS_BATCH_BUDGET_S,  # noqa: F401
     ALL_BRAZILIAN_UFS,  # noqa: F401
     DEFAULT_UF_PRIORITY,  # noqa: F401
     CACHE_LEGACY_KEY_FALLBACK,  # noqa: F401
@@ -187,4 +218,9 @@ from config.pipeline import (
     SUPPORT_SLA_ALERT_THRESHOLD_HOURS,  # noqa: F401
     GRACEFUL_SHUTDOWN_TIMEOUT,  # noqa: F401
     REQUEST_SLOW_THRESHOLD_S,  # noqa: F401
+    EXCEL_STREAMING_ENABLED,  # noqa: F401
+    EXCEL_STREAMING_MIN_ROWS,  # noqa: F401
+    EXPORT_ARTIFACT_CACHE_ENABLED,  # noqa: F401
+    EXPORT_ARTIFACT_TTL_S,  # noqa: F401
+    PROGRESS_COALESCE_WINDOW_MS,  # noqa: F401
 )
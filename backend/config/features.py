@@ -76,12 +76,18 @@ ASYNC_ZERO_MATCH_ENABLED: bool = str_to_bool(os.getenv("ASYNC_ZERO_MATCH_ENABLED
 ZERO_MATCH_JOB_TIMEOUT_S: int = int(os.getenv("ZERO_MATCH_JOB_TIMEOUT_S", "120"))
 LLM_FALLBACK_PENDING_ENABLED: bool = str_to_bool(os.getenv("LLM_FALLBACK_PENDING_ENABLED", "true"))
 PARTIAL_DATA_SSE_ENABLED: bool = str_to_bool(os.getenv("PARTIAL_DATA_SSE_ENABLED", "true"))
+# SSE fan-out: one blocking XREAD per worker over all active progress streams
+SSE_MULTIPLEXER_ENABLED: bool = str_to_bool(os.getenv("SSE_MULTIPLEXER_ENABLED", "true"))
+SSE_MUX_BLOCK_MS: int = int(os.getenv("SSE_MUX_BLOCK_MS", "1000"))
+# Slotted BidRecord (bid_record.py) instead of per-bid dicts from consolidation/datalake
+BID_RECORD_SLOTS_ENABLED: bool = str_to_bool(os.getenv("BID_RECORD_SLOTS_ENABLED", "false"))
 PENDING_REVIEW_TTL_SECONDS: int = int(os.getenv("PENDING_REVIEW_TTL_SECONDS", "86400"))
 PENDING_REVIEW_MAX_RETRIES: int = int(os.getenv("PENDING_REVIEW_MAX_RETRIES", "3"))
 PENDING_REVIEW_RETRY_DELAY: int = int(os.getenv("PENDING_REVIEW_RETRY_DELAY", "300"))
 
 # D-01: Item Inspection (Gray Zone)
 ITEM_INSPECTION_ENABLED: bool = str_to_bool(os.getenv("ITEM_INSPECTION_ENABLED", "true"))
+ITEM_INSPECTION_ASYNC_ENABLED: bool = str_to_bool(os.getenv("ITEM_INSPECTION_ASYNC_ENABLED", "true"))
 _MAX_ITEM_RAW = int(os.getenv("MAX_ITEM_INSPECTIONS", "20"))
 MAX_ITEM_INSPECTIONS: int = max(5, _MAX_ITEM_RAW)
 ITEM_INSPECTION_TIMEOUT: float = float(os.getenv("ITEM_INSPECTION_TIMEOUT", "5"))
@@ -218,6 +224,7 @@ _FEATURE_FLAG_REGISTRY: dict[str, tuple[str, str]] = {
     "SECTOR_RED_FLAGS_ENABLED": ("SECTOR_RED_FLAGS_ENABLED", "true"),
     "PROXIMITY_CONTEXT_ENABLED": ("PROXIMITY_CONTEXT_ENABLED", "true"),
     "ITEM_INSPECTION_ENABLED": ("ITEM_INSPECTION_ENABLED", "true"),
+    "ITEM_INSPECTION_ASYNC_ENABLED": ("ITEM_INSPECTION_ASYNC_ENABLED", "true"),
     # --- Term Search Quality ---
     "TERM_SEARCH_LLM_AWARE": ("TERM_SEARCH_LLM_AWARE", "false"),
     "TERM_SEARCH_SYNONYMS": ("TERM_SEARCH_SYNONYMS", "false"),
@@ -228,6 +235,7 @@ _FEATURE_FLAG_REGISTRY: dict[str, tuple[str, str]] = {
     "PCP_V2_ENABLED": ("PCP_ENABLED", "true"),
     "DATALAKE_ENABLED": ("DATALAKE_ENABLED", "true"),
     "DATALAKE_QUERY_ENABLED": ("DATALAKE_QUERY_ENABLED", "true"),
+    "DATALAKE_HYBRID_ENABLED": ("DATALAKE_HYBRID_ENABLED", "false"),
     # --- Cache ---
     # Note: CACHE_WARMING_ENABLED, CACHE_REFRESH_ENABLED, CACHE_WARMING_POST_DEPLOY_ENABLED,
     # WARMUP_ENABLED removed 2026-04-18 (STORY-CIG-BE-cache-warming-deprecate).
@@ -237,6 +245,9 @@ _FEATURE_FLAG_REGISTRY: dict[str, tuple[str, str]] = {
     # --- Search Pipeline ---
     "SEARCH_ASYNC_ENABLED": ("SEARCH_ASYNC_ENABLED", "false"),
     "PARTIAL_DATA_SSE_ENABLED": ("PARTIAL_DATA_SSE_ENABLED", "true"),
+    "SSE_MULTIPLEXER_ENABLED": ("SSE_MULTIPLEXER_ENABLED", "true"),
+    "PNCP_FETCH_PLANNER_ENABLED": ("PNCP_FETCH_PLANNER_ENABLED", "false"),
+    "BID_RECORD_SLOTS_ENABLED": ("BID_RECORD_SLOTS_ENABLED", "false"),
     # --- Cron & Operations ---
     "HEALTH_CANARY_ENABLED": ("HEALTH_CANARY_ENABLED", "true"),
     "DIGEST_ENABLED": ("DIGEST_ENABLED", "false"),
@@ -364,6 +375,21 @@ def validate_feature_flags() -> None:
     # --- Filter QA ---
     _check_float("QA_AUDIT_SAMPLE_RATE", "0.10", min_val=0.0, max_val=1.0)
 
+    # --- Search profiling ---
+    _check_float("SEARCH_PROFILE_SAMPLE_RATE", "0", min_val=0.0, max_val=1.0)
+    _check_int("SEARCH_PROFILE_TTL_S", "86400", min_val=60)
+
+    # --- Event-loop lag monitor ---
+    _check_float("LOOP_LAG_INTERVAL_S", "0.5", min_val=0.05, max_val=60.0)
+    _check_int("LOOP_LAG_WINDOW_S", "300", min_val=10)
+    _check_int("LOOP_BLOCKING_THRESHOLD_MS", "250", min_val=10)
+
+    # --- Batched sanctions checks ---
+    _check_int("SANCTIONS_CACHE_TTL_S", "86400", min_val=60)
+    _check_int("SANCTIONS_NEGATIVE_CACHE_TTL_S", "43200", min_val=60)
+    _check_int("SANCTIONS_BATCH_CONCURRENCY", "5", min_val=1, max_val=20)
+    _check_float("SANCTIONS_BATCH_BUDGET_S", "20", min_val=1.0, max_val=300.0)
+
     # --- Zero-match config ---
     _check_int("LLM_ZERO_MATCH_BATCH_SIZE", "20", min_val=1, max_val=500)
     _check_float("LLM_ZERO_MATCH_BATCH_TIMEOUT", "5.0", min_val=0.1, max_val=300.0)
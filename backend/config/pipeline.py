@@ -30,6 +30,15 @@ RESULTS_SUPABASE_TTL_HOURS: int = int(os.getenv("RESULTS_SUPABASE_TTL_HOURS", "2
 ARBITER_REDIS_TTL: int = int(os.getenv("ARBITER_REDIS_TTL", "3600"))
 STATE_STORE_REDIS_PREFIX: str = os.getenv("STATE_STORE_REDIS_PREFIX", "smartlic:")
 
+# ============================================
+# Search profiling (pipeline/profiling.py): per-stage CPU time, event-loop
+# lag, tracemalloc peak and aplicar_todos_filtros phase timings. Opt-in per
+# request (BuscaRequest.profile, admin/master only) or sampled.
+# ============================================
+SEARCH_PROFILE_SAMPLE_RATE: float = float(os.getenv("SEARCH_PROFILE_SAMPLE_RATE", "0"))
+SEARCH_PROFILE_TRACEMALLOC: bool = str_to_bool(os.getenv("SEARCH_PROFILE_TRACEMALLOC", "true"))
+SEARCH_PROFILE_TTL_S: int = int(os.getenv("SEARCH_PROFILE_TTL_S", "86400"))
+
 # ============================================
 # UF Brazilian list (used across cache + filters)
 # ============================================
@@ -109,3 +118,54 @@ GRACEFUL_SHUTDOWN_TIMEOUT: int = int(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", "30"
 # Set to 0 to disable detection.
 # ============================================
 REQUEST_SLOW_THRESHOLD_S: float = float(os.getenv("REQUEST_SLOW_THRESHOLD_S", "100"))
+
+# ============================================
+# Excel export: write-only streaming generation
+# Exports with at least EXCEL_STREAMING_MIN_ROWS rows are generated by
+# excel.write_excel_stream into a temp file and streamed to storage instead of
+# building the whole workbook in memory. Set EXCEL_STREAMING_ENABLED=false to
+# always use the in-memory create_excel path.
+# ============================================
+EXCEL_STREAMING_ENABLED: bool = str_to_bool(os.getenv("EXCEL_STREAMING_ENABLED", "true"))
+EXCEL_STREAMING_MIN_ROWS: int = int(os.getenv("EXCEL_STREAMING_MIN_ROWS", "1000"))
+
+# Content-addressed export artifact cache (export_cache.py). Artifacts are
+# keyed by hash(ordered result IDs + options) and reused for this long.
+EXPORT_ARTIFACT_CACHE_ENABLED: bool = str_to_bool(os.getenv("EXPORT_ARTIFACT_CACHE_ENABLED", "true"))
+EXPORT_ARTIFACT_TTL_S: int = int(os.getenv("EXPORT_ARTIFACT_TTL_S", "86400"))
+
+# ============================================
+# SSE progress emission (progress.ProgressTracker)
+# High-frequency events (filtering_progress, uf_status, batch_progress) are
+# coalesced on this window: the first update goes out immediately, later ones
+# within the window replace each other and only the latest is emitted.
+# Set to 0 to emit every update.
+# ============================================
+PROGRESS_COALESCE_WINDOW_MS: int = int(os.getenv("PROGRESS_COALESCE_WINDOW_MS", "250"))
+
+# ============================================
+# Event-loop lag monitor (loop_monitor.py)
+# A ticker on each API worker measures how late the loop wakes it up and
+# exports smartlic_event_loop_lag_seconds; /health reports a rolling summary.
+# The blocking-call detector (watchdog thread that logs the loop thread's
+# stack while it is stalled) runs when LOOP_BLOCKING_DETECTOR_ENABLED=true or
+# asyncio debug mode is on (PYTHONASYNCIODEBUG=1 / python -X dev).
+# ============================================
+LOOP_LAG_MONITOR_ENABLED: bool = str_to_bool(os.getenv("LOOP_LAG_MONITOR_ENABLED", "true"))
+LOOP_LAG_INTERVAL_S: float = float(os.getenv("LOOP_LAG_INTERVAL_S", "0.5"))
+LOOP_LAG_WINDOW_S: int = int(os.getenv("LOOP_LAG_WINDOW_S", "300"))
+LOOP_BLOCKING_THRESHOLD_MS: int = int(os.getenv("LOOP_BLOCKING_THRESHOLD_MS", "250"))
+LOOP_BLOCKING_DETECTOR_ENABLED: bool = str_to_bool(os.getenv("LOOP_BLOCKING_DETECTOR_ENABLED", "false"))
+
+# ============================================
+# Batched sanctions checks (services/sanctions_service.check_batch)
+# CNPJs of a result set are de-duplicated, answered from the local mirror or
+# the shared Redis tier first, and only the rest hit the Portal da
+# Transparência API — SANCTIONS_BATCH_CONCURRENCY at a time, within
+# SANCTIONS_BATCH_BUDGET_S. Clean results are cached too (negative caching),
+# with their own, shorter TTL so a new sanction is picked up sooner.
+# ============================================
+SANCTIONS_CACHE_TTL_S: int = int(os.getenv("SANCTIONS_CACHE_TTL_S", "86400"))
+SANCTIONS_NEGATIVE_CACHE_TTL_S: int = int(os.getenv("SANCTIONS_NEGATIVE_CACHE_TTL_S", "43200"))
+SANCTIONS_BATCH_CONCURRENCY: int = int(os.getenv("SANCTIONS_BATCH_CONCURRENCY", "5"))
+SANCTIONS_BATCH_BUDGET_S: float = float(os.getenv("SANCTIONS_BATCH_BUDGET_S", "20"))
@@ -70,6 +70,25 @@ PNCP_CONNECT_TIMEOUT: float = float(os.getenv("PNCP_CONNECT_TIMEOUT", "10"))
 PNCP_READ_TIMEOUT: float = float(os.getenv("PNCP_READ_TIMEOUT", "15"))
 PNCP_MAX_RETRIES: int = int(os.getenv("PNCP_MAX_RETRIES", "1"))
 PNCP_MAX_PAGES: int = int(os.getenv("PNCP_MAX_PAGES", "20"))
+# Concurrent page requests per (UF, modalidade) once page 1 reports the page count.
+# 1 = sequential pagination (previous behavior).
+PNCP_PAGE_CONCURRENCY: int = int(os.getenv("PNCP_PAGE_CONCURRENCY", "4"))
+# Adaptive PNCP request rate (AIMD), shared across workers via Redis.
+# The allowed rate grows by PNCP_AIMD_INCREASE req/s per healthy interval and is
+# multiplied by PNCP_AIMD_DECREASE_FACTOR on 429/5xx/timeouts/slow responses.
+# Disabled = fixed PNCP_RATE_INITIAL req/s (previous 100ms interval).
+PNCP_AIMD_ENABLED: bool = str_to_bool(os.getenv("PNCP_AIMD_ENABLED", "true"))
+PNCP_RATE_MIN: float = float(os.getenv("PNCP_RATE_MIN", "2"))
+PNCP_RATE_MAX: float = float(os.getenv("PNCP_RATE_MAX", "30"))
+PNCP_RATE_INITIAL: float = float(os.getenv("PNCP_RATE_INITIAL", "10"))
+PNCP_AIMD_INCREASE: float = float(os.getenv("PNCP_AIMD_INCREASE", "1.0"))
+PNCP_AIMD_DECREASE_FACTOR: float = float(os.getenv("PNCP_AIMD_DECREASE_FACTOR", "0.5"))
+PNCP_AIMD_LATENCY_THRESHOLD_S: float = float(os.getenv("PNCP_AIMD_LATENCY_THRESHOLD_S", "8.0"))
+PNCP_AIMD_COOLDOWN_S: float = float(os.getenv("PNCP_AIMD_COOLDOWN_S", "2.0"))
+# Shared PNCP token bucket: tokens claimed per Redis call and how long a worker
+# may hold unused ones before handing them back. <= 1 = one EVAL per request.
+PNCP_TOKEN_LEASE_SIZE: int = int(os.getenv("PNCP_TOKEN_LEASE_SIZE", "4"))
+PNCP_TOKEN_LEASE_TTL_S: float = float(os.getenv("PNCP_TOKEN_LEASE_TTL_S", "1.0"))
 # DEBT-102 AC6: PNCP API max page size (reduced from 500 to 50 by PNCP ~Feb 2026)
 PNCP_MAX_PAGE_SIZE: int = 50
 CACHE_FIRST_FRESH_TIMEOUT: int = int(os.getenv("CACHE_FIRST_FRESH_TIMEOUT", "60"))
@@ -169,6 +188,14 @@ PNCP_MODALITY_RETRY_BACKOFF: float = float(
 PNCP_BATCH_SIZE: int = int(os.getenv("PNCP_BATCH_SIZE", "5"))
 PNCP_BATCH_DELAY_S: float = float(os.getenv("PNCP_BATCH_DELAY_S", "2.0"))
 
+# PNCP fetch planner (PNCP_FETCH_PLANNER_ENABLED): per-(UF, modalidade) page
+# budgets and timeouts sized from datalake publication volume and observed
+# per-page latency, fitted into PNCP_TIMEOUT_PER_SOURCE.
+PNCP_PLANNER_HISTORY_DAYS: int = int(os.getenv("PNCP_PLANNER_HISTORY_DAYS", "14"))
+PNCP_PLANNER_HISTORY_TTL_S: int = int(os.getenv("PNCP_PLANNER_HISTORY_TTL_S", "3600"))
+PNCP_PLANNER_PAGE_LATENCY_S: float = float(os.getenv("PNCP_PLANNER_PAGE_LATENCY_S", "2.0"))
+PNCP_PLANNER_MIN_TIMEOUT_S: float = float(os.getenv("PNCP_PLANNER_MIN_TIMEOUT_S", "10"))
+
 # B-06: Redis-backed circuit breaker toggle (rollback: set to "false")
 USE_REDIS_CIRCUIT_BREAKER: bool = os.getenv(
     "USE_REDIS_CIRCUIT_BREAKER", "true"
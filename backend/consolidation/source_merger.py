@@ -449,8 +449,12 @@ class ConsolidationService:
         deduped = dedup_engine.run(all_records)
         total_after = len(deduped)
 
-        # Convert to legacy format
-        legacy_records = [r.to_legacy_format() for r in deduped]
+        # Convert to legacy format (slotted BidRecord when enabled)
+        from config import get_feature_flag
+        if get_feature_flag("BID_RECORD_SLOTS_ENABLED"):
+            legacy_records = [r.to_bid_record() for r in deduped]
+        else:
+            legacy_records = [r.to_legacy_format() for r in deduped]
 
         elapsed = int((time.time() - start_time) * 1000)
 
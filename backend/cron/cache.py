@@ -17,7 +17,7 @@ CLEANUP_INTERVAL_SECONDS = 6 * 60 * 60
 
 
 async def _do_cache_cleanup() -> dict:
-    """Run local cache + filter stats cleanup."""
+    """Run local cache, filter stats and expired export artifact cleanup."""
     from cache.local_file import cleanup_local_cache
     deleted = cleanup_local_cache()
     try:
@@ -28,6 +28,11 @@ async def _do_cache_cleanup() -> dict:
             logger.info("Filter stats cleanup: %d filter, %d discard entries removed", fs, dr)
     except Exception as e:
         logger.warning("Filter stats cleanup failed: %s", e)
+    try:
+        from export_cache import cleanup_expired_artifacts
+        await cleanup_expired_artifacts()
+    except Exception as e:
+        logger.warning("Export artifact cleanup failed: %s", e)
     return {"deleted": deleted}
 
 
@@ -206,7 +206,7 @@ async def query_datalake(
             if trigram_term:
                 rows = _query_trigram_fallback(sb, trigram_term, ufs, limit)
                 if rows:
-                    normalized = [_row_to_normalized(row) for row in rows]
+                    normalized = _compact_records([_row_to_normalized(row) for row in rows])
                     for r in normalized:
                         r["_source"] = "trigram_fallback"
                     logger.info(
@@ -219,7 +219,7 @@ async def query_datalake(
         logger.warning("[DatalakeQuery] All UF queries returned 0 rows")
         return []
 
-    normalized = [_row_to_normalized(row) for row in rows]
+    normalized = _compact_records([_row_to_normalized(row) for row in rows])
 
     logger.info(f"[DatalakeQuery] Returned {len(normalized)} records from local DB ({len(ufs)} UFs)")
 
@@ -439,6 +439,17 @@ def _keyword_to_tstoken(keyword: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _compact_records(records: list[dict]) -> list[dict]:
+    """Slotted BidRecords instead of dicts when BID_RECORD_SLOTS_ENABLED (cached and filtered in place)."""
+    from config import get_feature_flag
+
+    if not get_feature_flag("BID_RECORD_SLOTS_ENABLED"):
+        return records
+    from bid_record import BidRecord
+
+    return [BidRecord(r) for r in records]
+
+
 def _row_to_normalized(row: dict) -> dict:
     """Map a search_datalake RPC row to the flat dict produced by _normalize_item().
 
@@ -9,6 +9,10 @@ com as licitações filtradas, incluindo:
 - Linha de totais com fórmula SUM
 - Aba de metadados com estatísticas da busca
 
+Para exportações grandes, ``write_excel_stream`` gera o mesmo layout em modo
+write-only (estilos nomeados, linhas serializadas à medida que são produzidas)
+diretamente para um arquivo, sem montar a planilha inteira em memória.
+
 Exemplo de uso:
     >>> from excel import create_excel
     >>> licitacoes = [{"codigoCompra": "123", "objetoCompra": "Uniformes", ...}]
@@ -17,16 +21,20 @@ Exemplo de uso:
     ...     f.write(buffer.getvalue())
 """
 
+import os
 import re
+import tempfile
 from datetime import datetime, timezone
 from io import BytesIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
+from typing import TYPE_CHECKING, BinaryIO, Iterable
 
 from utils.value_sanitizer import sanitize_valor, compute_robust_total
 
+# openpyxl (~0.2s) is imported inside the generators: ``parse_datetime`` and
+# ``resolve_link`` are used on the search path, which must not pay for it.
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
 # Regex matching illegal XML characters that openpyxl rejects
 # Includes: \x00-\x08, \x0b-\x0c, \x0e-\x1f (control chars except tab, LF, CR)
 ILLEGAL_CHARACTERS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
@@ -80,6 +88,10 @@ def create_excel(licitacoes: list[dict], paywall_preview: bool = False, total_be
     if not isinstance(licitacoes, list):
         raise ValueError("licitacoes deve ser uma lista")
 
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+
     wb = Workbook()
     ws = wb.active
     ws.title = "Licitações Uniformes"
@@ -169,41 +181,10 @@ def create_excel(licitacoes: list[dict], paywall_preview: bool = False, total_be
         ws.cell(row=row_idx, column=10, value=sanitize_for_excel(lic.get("situacaoCompraNome")))
 
         # K: Link (hyperlink)
-        # CRIT-FLT-008: linkSistemaOrigem (86% populated) > linkProcessoEletronico (0% — dead field) > fallback PNCP
-        link = lic.get("linkSistemaOrigem") or lic.get("linkProcessoEletronico")
-
-        # Fallback: construir URL do PNCP a partir do numeroControlePNCP
-        # Formato numeroControlePNCP: {CNPJ}-{TIPO}-{SEQUENCIAL}/{ANO}
-        # Formato URL PNCP: /editais/{CNPJ}/{ANO}/{SEQUENCIAL_SEM_ZEROS}
-        if not link:
-            numero_controle = lic.get("numeroControlePNCP", "")
-            if numero_controle:
-                try:
-                    # Parse: "67366310000103-1-000189/2025" -> cnpj=67366310000103, ano=2025, seq=189
-                    partes = numero_controle.split("/")
-                    if len(partes) != 2:
-                        raise ValueError("Formato inválido: esperado 'xxx/ano'")
-
-                    ano = partes[1]
-                    cnpj_tipo_seq = partes[0].split("-")
-
-                    if len(cnpj_tipo_seq) < 3:
-                        raise ValueError("Formato inválido: esperado 'cnpj-tipo-seq'")
-
-                    cnpj = cnpj_tipo_seq[0]
-                    sequencial = cnpj_tipo_seq[2].lstrip("0")
-
-                    if cnpj and ano and sequencial:
-                        link = f"https://pncp.gov.br/app/editais/{cnpj}/{ano}/{sequencial}"
-                    else:
-                        raise ValueError("Componentes vazios após parsing")
-
-                except (IndexError, AttributeError, ValueError):
-                    # Se parsing falhar, usar busca genérica
-                    link = f"https://pncp.gov.br/app/editais?q={numero_controle}"
+        link = resolve_link(lic)
 
         link_cell = ws.cell(row=row_idx, column=11, value="Abrir")
-        link_cell.hyperlink = link or "https://pncp.gov.br/app/editais"
+        link_cell.hyperlink = link
         link_cell.font = Font(color="0563C1", underline="single")
 
         # Aplicar bordas e alinhamento em todas as células da linha
@@ -265,6 +246,217 @@ def create_excel(licitacoes: list[dict], paywall_preview: bool = False, total_be
     return buffer
 
 
+def resolve_link(lic: dict) -> str:
+    """
+    Resolve a URL de acesso ao edital para a coluna "Link".
+
+    CRIT-FLT-008: linkSistemaOrigem (86% populated) > linkProcessoEletronico
+    (0% — dead field) > URL do PNCP construída a partir do numeroControlePNCP.
+
+    Args:
+        lic: Dicionário da licitação
+
+    Returns:
+        URL do edital (nunca vazia — cai para a listagem do PNCP)
+    """
+    link = lic.get("linkSistemaOrigem") or lic.get("linkProcessoEletronico")
+    if link:
+        return link
+
+    # Fallback: construir URL do PNCP a partir do numeroControlePNCP
+    # Formato numeroControlePNCP: {CNPJ}-{TIPO}-{SEQUENCIAL}/{ANO}
+    # Formato URL PNCP: /editais/{CNPJ}/{ANO}/{SEQUENCIAL_SEM_ZEROS}
+    numero_controle = lic.get("numeroControlePNCP", "")
+    if not numero_controle:
+        return "https://pncp.gov.br/app/editais"
+
+    try:
+        # Parse: "67366310000103-1-000189/2025" -> cnpj=67366310000103, ano=2025, seq=189
+        partes = numero_controle.split("/")
+        if len(partes) != 2:
+            raise ValueError("Formato inválido: esperado 'xxx/ano'")
+
+        ano = partes[1]
+        cnpj_tipo_seq = partes[0].split("-")
+
+        if len(cnpj_tipo_seq) < 3:
+            raise ValueError("Formato inválido: esperado 'cnpj-tipo-seq'")
+
+        cnpj = cnpj_tipo_seq[0]
+        sequencial = cnpj_tipo_seq[2].lstrip("0")
+
+        if cnpj and ano and sequencial:
+            return f"https://pncp.gov.br/app/editais/{cnpj}/{ano}/{sequencial}"
+        raise ValueError("Componentes vazios após parsing")
+
+    except (IndexError, AttributeError, ValueError):
+        # Se parsing falhar, usar busca genérica
+        return f"https://pncp.gov.br/app/editais?q={numero_controle}"
+
+
+# ============================================================================
+# Streaming write-only generation (large exports)
+# ============================================================================
+
+# Estilos nomeados compartilhados: cada célula referencia o estilo pelo nome em
+# vez de carregar seus próprios objetos Font/Border/Alignment.
+_STREAM_STYLE_SPECS: dict[str, dict] = {
+    "sl_header": {
+        "font": {"bold": True, "color": "FFFFFF", "size": 11},
+        "fill": "2E7D32",
+        "alignment": {"horizontal": "center", "vertical": "center", "wrap_text": True},
+    },
+    "sl_text": {},
+    "sl_currency": {"number_format": '[$R$-416] #.##0,00'},
+    "sl_date": {"number_format": "DD/MM/YYYY"},
+    "sl_datetime": {"number_format": "DD/MM/YYYY HH:MM"},
+    "sl_link": {"font": {"color": "0563C1", "underline": "single"}},
+}
+
+_HEADERS: list[tuple[str, int]] = [
+    ("Código PNCP", 25),
+    ("Objeto", 60),
+    ("Órgão", 40),
+    ("UF", 6),
+    ("Município", 20),
+    ("Valor Estimado", 18),
+    ("Modalidade", 20),
+    ("Publicação", 12),
+    ("Início", 16),
+    ("Situação", 15),
+    ("Link", 15),
+]
+
+
+def _register_stream_styles(wb: "Workbook") -> None:
+    """Registra os NamedStyles usados pelo gerador streaming no workbook."""
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+    thin = Side(style="thin")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    for name, spec in _STREAM_STYLE_SPECS.items():
+        style = NamedStyle(name=name)
+        style.border = border
+        style.alignment = Alignment(**spec.get("alignment", {"vertical": "top", "wrap_text": True}))
+        if "font" in spec:
+            style.font = Font(**spec["font"])
+        if "fill" in spec:
+            style.fill = PatternFill(start_color=spec["fill"], end_color=spec["fill"], fill_type="solid")
+        if "number_format" in spec:
+            style.number_format = spec["number_format"]
+        wb.add_named_style(style)
+
+
+def write_excel_stream(
+    licitacoes: Iterable[dict],
+    dest: str | os.PathLike | BinaryIO,
+    org_name: str | None = None,
+) -> int:
+    """
+    Gera a planilha em modo write-only, escrevendo linha a linha em ``dest``.
+
+    Produz o mesmo layout de ``create_excel`` (colunas, formatos, hyperlinks,
+    linha de totais e aba Metadata), mas sem manter a árvore de células em
+    memória: cada linha é serializada assim que é produzida e a formatação
+    vem de NamedStyles compartilhados. Aceita qualquer iterável, inclusive
+    geradores.
+
+    Args:
+        licitacoes: Iterável de dicionários de licitações
+        dest: Caminho ou arquivo binário de destino
+        org_name: Nome da organização para a aba Metadata (STORY-322 AC23)
+
+    Returns:
+        Número de linhas de dados escritas
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    def _styled(ws, value, style: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    wb = Workbook(write_only=True)
+    _register_stream_styles(wb)
+
+    ws = wb.create_sheet("Licitações Uniformes")
+    for col, (_name, width) in enumerate(_HEADERS, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+    ws.freeze_panes = "A2"
+    ws.append([_styled(ws, name, "sl_header") for name, _width in _HEADERS])
+
+    rows = 0
+    raw_values: list[float] = []
+    for lic in licitacoes:
+        rows += 1
+        valor = lic.get("valorTotalEstimado")
+        raw_values.append(sanitize_valor(valor or 0))
+        data_pub = parse_datetime(lic.get("dataPublicacaoPncp"))
+        data_abertura = parse_datetime(lic.get("dataAberturaProposta"))
+
+        link_cell = _styled(ws, "Abrir", "sl_link")
+        link_cell.hyperlink = resolve_link(lic)
+
+        ws.append([
+            _styled(ws, sanitize_for_excel(lic.get("codigoCompra")), "sl_text"),
+            _styled(ws, sanitize_for_excel(lic.get("objetoCompra")), "sl_text"),
+            _styled(ws, sanitize_for_excel(lic.get("nomeOrgao")), "sl_text"),
+            _styled(ws, sanitize_for_excel(lic.get("uf")), "sl_text"),
+            _styled(ws, sanitize_for_excel(lic.get("municipio")), "sl_text"),
+            _styled(ws, valor, "sl_currency"),
+            _styled(ws, sanitize_for_excel(lic.get("modalidadeNome")), "sl_text"),
+            _styled(ws, data_pub, "sl_date" if data_pub else "sl_text"),
+            _styled(ws, data_abertura, "sl_datetime" if data_abertura else "sl_text"),
+            _styled(ws, sanitize_for_excel(lic.get("situacaoCompraNome")), "sl_text"),
+            link_cell,
+        ])
+
+    # === LINHA DE TOTAIS ===
+    if rows:
+        total_label = WriteOnlyCell(ws, value="TOTAL:")
+        total_label.font = Font(bold=True)
+        total_cell = WriteOnlyCell(ws, value=f"=SUM(F2:F{rows + 1})")
+        total_cell.number_format = _STREAM_STYLE_SPECS["sl_currency"]["number_format"]
+        total_cell.font = Font(bold=True)
+        ws.append([None, None, None, None, total_label, total_cell])
+
+    # === METADATA (aba separada) ===
+    ws_meta = wb.create_sheet("Metadata")
+    if org_name:
+        org_cell = WriteOnlyCell(ws_meta, value=org_name)
+        org_cell.font = Font(bold=True, size=12)
+        ws_meta.append(["Organização:", org_cell])
+    ws_meta.append(["Gerado em:", datetime.now(timezone.utc).strftime("%d/%m/%Y %H:%M:%S")])
+    ws_meta.append(["Total de licitações:", rows])
+    valor_total, _median, _outlier_count, _used_sanitized = compute_robust_total(raw_values)
+    ws_meta.append(["Valor total estimado:", _styled(ws_meta, valor_total, "sl_currency")])
+
+    wb.save(dest)
+    return rows
+
+
+def stream_excel_to_tempfile(licitacoes: Iterable[dict], org_name: str | None = None) -> str:
+    """
+    Gera a planilha via ``write_excel_stream`` em um arquivo temporário.
+
+    O chamador é responsável por remover o arquivo após o upload.
+
+    Returns:
+        Caminho do arquivo .xlsx gerado
+    """
+    fd, path = tempfile.mkstemp(prefix="smartlic_", suffix=".xlsx")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            write_excel_stream(licitacoes, fh, org_name=org_name)
+    except Exception:
+        os.unlink(path)
+        raise
+    return path
+
+
 def parse_datetime(value: str | None) -> datetime | None:
     """
     Parse datetime string do formato PNCP para objeto datetime.
@@ -0,0 +1,283 @@
+"""Content-addressed cache for export artifacts (Excel, PDF).
+
+The same result set is frequently exported more than once: several users of
+an organization, re-downloads, and ``excel_generation_job`` re-running for a
+cached search. Instead of regenerating and re-uploading every time, artifacts
+are addressed by a hash of the ordered result IDs plus the export options:
+
+    sha256(kind | layout version | options | id_1 | id_2 | ...)
+
+Architecture:
+- Index: Redis ``export_artifact:{kind}:{hash}`` -> {file_path, generation_s, created_at}
+  (InMemoryCache fallback), TTL = EXPORT_ARTIFACT_TTL_S. A hit only needs a
+  fresh signed URL (Excel) or a download (PDF) — no generation, no upload.
+- Storage: Excel keeps its regular ``upload_excel`` object; PDFs, which are
+  streamed inline, are stored at ``artifacts/pdf/{hash}.pdf``.
+- Cleanup: ``cleanup_expired_artifacts`` (6h cache cleanup cron) removes
+  objects under ``artifacts/`` once no signed URL handed out for them can
+  still be valid (TTL + SIGNED_URL_TTL). Per-search Excel uploads at the
+  bucket root are not owned by this cache and are left alone.
+- Observability: smartlic_export_artifact_requests_total{kind,outcome} gives the
+  reuse rate; smartlic_export_artifact_time_saved_seconds_total{kind} adds the
+  recorded generation time of every reused artifact.
+
+Graceful degradation: any cache failure falls through to a normal generate +
+upload, so exports never fail because of the cache.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Optional
+
+from config import EXPORT_ARTIFACT_CACHE_ENABLED, EXPORT_ARTIFACT_TTL_S
+
+logger = logging.getLogger(__name__)
+
+# Bump when the Excel/PDF layout changes so stale artifacts are not reused.
+ARTIFACT_LAYOUT_VERSION = "1"
+ARTIFACT_PREFIX = "artifacts"
+
+_KIND_META: dict[str, tuple[str, str]] = {
+    "excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "pdf": ("pdf", "application/pdf"),
+}
+
+# Ordered by preference: normalized items, raw PNCP records, other sources.
+_ID_FIELDS = ("pncp_id", "numeroControlePNCP", "codigoCompra", "id")
+
+# Background artifact uploads — referenced until done so they are not GC'd mid-run
+_store_tasks: set[asyncio.Task] = set()
+
+
+def _result_id(lic: Any) -> str:
+    if hasattr(lic, "model_dump"):
+        lic = lic.model_dump()
+    for field in _ID_FIELDS:
+        value = lic.get(field)
+        if value:
+            return str(value)
+    # No stable ID — fall back to the record content itself.
+    return hashlib.sha256(
+        json.dumps(lic, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def artifact_key(kind: str, licitacoes: Iterable[dict], options: Optional[dict] = None) -> str:
+    """Return the content address for an export of ``licitacoes``.
+
+    Order matters (exports preserve result ordering), so the same set in a
+    different order yields a different artifact.
+    """
+    h = hashlib.sha256()
+    h.update(f"{kind}|v{ARTIFACT_LAYOUT_VERSION}|".encode("utf-8"))
+    h.update(json.dumps(options or {}, sort_keys=True, default=str).encode("utf-8"))
+    for lic in licitacoes:
+        h.update(b"|")
+        h.update(_result_id(lic).encode("utf-8"))
+    return h.hexdigest()
+
+
+def artifact_path(kind: str, key: str) -> str:
+    """Storage path for a content-addressed artifact."""
+    ext, _content_type = _KIND_META[kind]
+    return f"{ARTIFACT_PREFIX}/{kind}/{key}.{ext}"
+
+
+def _index_key(kind: str, key: str) -> str:
+    return f"export_artifact:{kind}:{key}"
+
+
+async def _get_index(kind: str, key: str) -> Optional[dict]:
+    from redis_pool import get_redis_pool, get_fallback_cache
+
+    try:
+        redis = await get_redis_pool()
+        raw = await redis.get(_index_key(kind, key)) if redis else get_fallback_cache().get(_index_key(kind, key))
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"Export artifact index read failed ({kind}): {e}")
+        return None
+
+
+async def _set_index(kind: str, key: str, entry: dict) -> None:
+    from redis_pool import get_redis_pool, get_fallback_cache
+
+    try:
+        payload = json.dumps(entry)
+        redis = await get_redis_pool()
+        if redis:
+            await redis.setex(_index_key(kind, key), EXPORT_ARTIFACT_TTL_S, payload)
+        else:
+            get_fallback_cache().setex(_index_key(kind, key), EXPORT_ARTIFACT_TTL_S, payload)
+    except Exception as e:
+        logger.warning(f"Export artifact index write failed ({kind}): {e}")
+
+
+async def lookup_artifact(kind: str, key: str) -> Optional[dict]:
+    """Return the index entry plus a fresh signed URL for a cached artifact.
+
+    Returns None on miss, when the cache is disabled, or when the stored
+    object can no longer be signed (treated as a miss).
+    """
+    if not EXPORT_ARTIFACT_CACHE_ENABLED:
+        return None
+    entry = await _get_index(kind, key)
+    if not entry:
+        return None
+
+    from storage import create_signed_url, SIGNED_URL_TTL
+
+    signed_url = await asyncio.to_thread(create_signed_url, entry["file_path"])
+    if not signed_url:
+        # Object vanished (cleanup, bucket reset) — treat as a miss.
+        return None
+    return {
+        "file_id": key,
+        "file_path": entry["file_path"],
+        "signed_url": signed_url,
+        "expires_in": SIGNED_URL_TTL,
+        "generation_s": float(entry.get("generation_s", 0.0)),
+    }
+
+
+def _record_hit(kind: str, key: str, generation_s: float) -> None:
+    from metrics import EXPORT_ARTIFACT_REQUESTS, EXPORT_ARTIFACT_TIME_SAVED
+
+    EXPORT_ARTIFACT_REQUESTS.labels(kind=kind, outcome="hit").inc()
+    EXPORT_ARTIFACT_TIME_SAVED.labels(kind=kind).inc(generation_s)
+    logger.info(f"Export artifact reused: kind={kind} key={key[:12]} (saved ~{generation_s:.2f}s)")
+
+
+def _record_miss(kind: str) -> None:
+    from metrics import EXPORT_ARTIFACT_REQUESTS
+
+    EXPORT_ARTIFACT_REQUESTS.labels(kind=kind, outcome="miss").inc()
+
+
+async def get_or_create_artifact(
+    kind: str,
+    licitacoes: list[dict],
+    produce: Callable[[], Optional[dict]],
+    options: Optional[dict] = None,
+) -> Optional[dict]:
+    """Return a storage result for the export, producing it only on a miss.
+
+    Args:
+        kind: "excel" or "pdf"
+        licitacoes: Ordered result set being exported (only IDs are hashed)
+        produce: Sync callable that generates and uploads the artifact and
+            returns the ``upload_excel`` result dict (or None on failure).
+            Runs in a worker thread.
+        options: Export options that change the artifact content
+
+    Returns:
+        The ``upload_excel``-shaped dict plus ``reused`` (bool) and
+        ``generation_s`` (seconds spent, or saved on a hit), or None.
+    """
+    key = artifact_key(kind, licitacoes, options)
+    cached = await lookup_artifact(kind, key)
+    if cached:
+        _record_hit(kind, key, cached["generation_s"])
+        return {**cached, "reused": True}
+
+    _record_miss(kind)
+    start = time.monotonic()
+    result = await asyncio.to_thread(produce)
+    generation_s = time.monotonic() - start
+    if not result:
+        return None
+
+    if result.get("file_path"):
+        await _set_index(kind, key, {
+            "file_path": result["file_path"],
+            "generation_s": round(generation_s, 3),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        })
+    return {**result, "reused": False, "generation_s": generation_s}
+
+
+async def get_or_create_artifact_bytes(
+    kind: str,
+    licitacoes: list[dict],
+    build: Callable[[], bytes],
+    options: Optional[dict] = None,
+) -> tuple[bytes, bool]:
+    """Byte-returning variant for endpoints that stream the file inline (PDF).
+
+    On a hit the stored object is downloaded instead of regenerated. On a
+    miss the artifact is built, returned immediately and uploaded in the
+    background under its content address.
+
+    Returns:
+        (artifact bytes, reused)
+    """
+    key = artifact_key(kind, licitacoes, options)
+    entry = await _get_index(kind, key) if EXPORT_ARTIFACT_CACHE_ENABLED else None
+    if entry:
+        from storage import download_object
+
+        data = await asyncio.to_thread(download_object, entry["file_path"])
+        if data:
+            _record_hit(kind, key, float(entry.get("generation_s", 0.0)))
+            return data, True
+
+    _record_miss(kind)
+    start = time.monotonic()
+    data = await asyncio.to_thread(build)
+    generation_s = time.monotonic() - start
+
+    if EXPORT_ARTIFACT_CACHE_ENABLED:
+        task = asyncio.create_task(_store_artifact(kind, key, data, generation_s))
+        _store_tasks.add(task)
+        task.add_done_callback(_store_tasks.discard)
+    return data, False
+
+
+async def _store_artifact(kind: str, key: str, data: bytes, generation_s: float) -> None:
+    from storage import upload_object
+
+    _ext, content_type = _KIND_META[kind]
+    result = await asyncio.to_thread(upload_object, data, artifact_path(kind, key), content_type, True)
+    if result:
+        await _set_index(kind, key, {
+            "file_path": result["file_path"],
+            "generation_s": round(generation_s, 3),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+
+async def cleanup_expired_artifacts(now: Optional[datetime] = None) -> dict:
+    """Remove content-addressed artifacts no signed URL can still reach.
+
+    Only folders under ``artifacts/`` are touched. An index entry lives for
+    EXPORT_ARTIFACT_TTL_S and a hit just before it expires hands out a URL
+    valid for SIGNED_URL_TTL, so objects are kept for the sum of both.
+    """
+    from storage import SIGNED_URL_TTL, list_objects, remove_objects
+
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(
+        seconds=EXPORT_ARTIFACT_TTL_S + SIGNED_URL_TTL
+    )
+    removed = 0
+    for folder in (f"{ARTIFACT_PREFIX}/{kind}" for kind in _KIND_META):
+        objects = await asyncio.to_thread(list_objects, folder)
+        expired = []
+        for obj in objects:
+            # Folder placeholders have no id/created_at
+            created = obj.get("created_at")
+            if not obj.get("id") or not created:
+                continue
+            try:
+                created_dt = datetime.fromisoformat(str(created).replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            if created_dt < cutoff:
+                expired.append(f"{folder}/{obj['name']}")
+        removed += await asyncio.to_thread(remove_objects, expired)
+    if removed:
+        logger.info(f"Export artifact cleanup: removed {removed} expired file(s)")
+    return {"artifacts_removed": removed}
@@ -583,6 +583,34 @@ def normalize_text(text: str) -> str:
     return text.strip()
 
 
+# Compiled word-boundary pattern per keyword, shared by every batch. Sector
+# keywords are compiled once by startup.warmup (before fork under Gunicorn);
+# custom terms are added up to the cap, then compiled per call.
+_KEYWORD_PATTERNS: Dict[str, re.Pattern] = {}
+_KEYWORD_PATTERNS_MAX = 20_000
+
+
+def keyword_patterns(keywords: Set[str]) -> Dict[str, re.Pattern]:
+    """Return {keyword: compiled \\b<normalized keyword>\\b pattern} for match_keywords()."""
+    patterns: Dict[str, re.Pattern] = {}
+    for keyword in keywords:
+        pattern = _KEYWORD_PATTERNS.get(keyword)
+        if pattern is None:
+            try:
+                # ISSUE-017: Normalize keyword before compiling regex.
+                # match_keywords() searches against normalize_text(objeto) which strips
+                # accents, so the compiled pattern must also be accent-free.
+                escaped = re.escape(normalize_text(keyword))
+                pattern = re.compile(rf'\b{escaped}\b', re.IGNORECASE | re.UNICODE)
+            except re.error:
+                logger.warning(f"Failed to compile regex for keyword: {keyword}")
+                continue
+            if len(_KEYWORD_PATTERNS) < _KEYWORD_PATTERNS_MAX:
+                _KEYWORD_PATTERNS[keyword] = pattern
+        patterns[keyword] = pattern
+    return patterns
+
+
 # =============================================================================
 # STORY-328: Strip org context clauses from objetoCompra
 # =============================================================================
@@ -4,6 +4,7 @@ Extraído de filter/core.py (linhas 2256-4105).
 Orquestra todos os filtros em sequência otimizada (fail-fast).
 """
 
+import asyncio
 import logging
 import random
 import re
@@ -25,6 +26,7 @@ from filter.keywords import (
     _strip_org_context,
     has_red_flags,
     has_sector_red_flags,
+    keyword_patterns,
     match_keywords,
     normalize_text,
 )
@@ -52,6 +54,7 @@ def aplicar_todos_filtros(
     custom_terms: Optional[List[str]] = None,  # STORY-267: user's free search terms
     on_progress: Optional[Callable[[int, int, str], None]] = None,  # STORY-329 AC1: (processed, total, phase)
     pncp_degraded: bool = False,  # CRIT-054 AC4: flag for PNCP source degradation
+    event_loop: Optional[asyncio.AbstractEventLoop] = None,  # app loop for async item inspection
 ) -> Tuple[List[dict], Dict[str, int]]:
     """Apply all filters sequentially (fail-fast: UF → Status → Esfera → Modalidade →
     Municipio → Orgao → Valor → Keywords → LLM → Recovery).
@@ -84,6 +87,10 @@ def aplicar_todos_filtros(
         f"aplicar_todos_filtros: iniciando com {len(licitacoes)} licitações"
     )
 
+    # Sub-phase timings for profiled searches (no-op otherwise)
+    from pipeline.profiling import phase_clock
+    _phases = phase_clock()
+
     # Etapa 1: Filtro de UF (mais rápido - O(1))
     resultado_uf: List[dict] = []
     _empty_uf_count = 0
@@ -218,6 +225,8 @@ def aplicar_todos_filtros(
     else:
         resultado_status = resultado_uf
 
+    _phases.lap("uf_status")
+
     # Etapa 3: Filtro de Esfera
     if esferas:
         resultado_esfera: List[dict] = []
@@ -376,6 +385,8 @@ def aplicar_todos_filtros(
             f"(rejeitadas: {rejeitadas_prazo})"
         )
 
+    _phases.lap("metadata")
+
     # STORY-179 AC1.3: Camada 1A - Value Threshold (Anti-False Positive)
     # Apply sector-specific max_contract_value check BEFORE keyword matching
     # to reject obvious false positives (e.g., R$ 47.6M "melhorias urbanas" + uniformes)
@@ -434,6 +445,8 @@ def aplicar_todos_filtros(
         except KeyError:
             logger.warning(f"Setor '{setor}' não encontrado - pulando Camada 1A")
 
+    _phases.lap("value_ceiling")
+
     # Etapa 8: Filtro de Keywords (mais lento - regex)
     # When keywords=None and setor is given, auto-populate from sector config.
     # When keywords=set() (explicitly empty), skip keyword filter.
@@ -473,19 +486,7 @@ def aplicar_todos_filtros(
     # Normal keyword matching when keywords are provided
     if kw:
         # AC9.1: Pre-compile regex patterns once for the batch
-        compiled_patterns: Dict[str, re.Pattern] = {}
-        for keyword in kw:
-            try:
-                # ISSUE-017: Normalize keyword before compiling regex.
-                # match_keywords() searches against normalize_text(objeto) which strips
-                # accents, so the compiled pattern must also be accent-free.
-                kw_normalized = normalize_text(keyword)
-                escaped = re.escape(kw_normalized)
-                compiled_patterns[keyword] = re.compile(
-                    rf'\b{escaped}\b', re.IGNORECASE | re.UNICODE
-                )
-            except re.error:
-                logger.warning(f"Failed to compile regex for keyword: {keyword}")
+        compiled_patterns: Dict[str, re.Pattern] = keyword_patterns(kw)
 
         # STORY-328 AC7-AC8: Compute effective global exclusions for this sector
         _effective_global_exc: Set[str] = set()
@@ -625,6 +626,8 @@ def aplicar_todos_filtros(
                 except Exception:
                     pass
 
+    _phases.lap("keywords")
+
     # ========================================================================
     # SECTOR-PROX: Camada 1B.3 — Proximity Context Filter
     # ========================================================================
@@ -686,6 +689,8 @@ def aplicar_todos_filtros(
                 )
             resultado_keyword = resultado_after_prox
 
+    _phases.lap("proximity")
+
     # ========================================================================
     # GTM-RESILIENCE-D03: Camada 1B.5 — Co-occurrence Negative Patterns
     # ========================================================================
@@ -747,6 +752,8 @@ def aplicar_todos_filtros(
         except KeyError:
             pass  # Sector not found — skip co-occurrence
 
+    _phases.lap("co_occurrence")
+
     # ========================================================================
     # ISSUE-029 v6: Negative-keyword POST-FILTER on keyword-matched results
     # ========================================================================
@@ -792,6 +799,8 @@ def aplicar_todos_filtros(
                     f"{stats['negative_keyword_postfilter']}/{_pre_count} bids"
                 )
 
+    _phases.lap("negative_postfilter")
+
     # ========================================================================
     # GTM-FIX-028: LLM Zero Match Classification
     # ========================================================================
@@ -1054,6 +1063,8 @@ def aplicar_todos_filtros(
                 f"{stats['llm_zero_match_skipped_short']} skipped (short)"
             )
 
+    _phases.lap("llm_zero_match")
+
     # ========================================================================
     # GTM-RESILIENCE-D01: Camada 1C — Item Inspection for Gray Zone (0-5%)
     # ========================================================================
@@ -1094,6 +1105,7 @@ def aplicar_todos_filtros(
                     ncm_prefixes=ds.ncm_prefixes,
                     unit_patterns=ds.unit_patterns,
                     size_patterns=ds.size_patterns,
+                    event_loop=event_loop,
                 )
 
                 stats["item_inspections_performed"] = item_metrics.get(
@@ -1117,6 +1129,8 @@ def aplicar_todos_filtros(
             except Exception as e:
                 logger.warning(f"D-01 item inspection failed, continuing with LLM: {e}")
 
+    _phases.lap("item_inspection")
+
     # STORY-181 AC2: Camada 2A - Calibrated Term Density Decision Thresholds
     # Using configurable thresholds from config.py (env-var adjustable)
 
@@ -1267,6 +1281,8 @@ def aplicar_todos_filtros(
         f"{stats['rejeitadas_baixa_densidade']} rejeitadas (baixa densidade)"
     )
 
+    _phases.lap("density")
+
     # STORY-179 AC3: Camada 3A - LLM Arbiter (GPT-4o-mini)
     # For contracts in the uncertain zone (1-5% density), use LLM to determine
     # if the contract is PRIMARILY about the sector/terms or just a tangential mention
@@ -1470,6 +1486,8 @@ def aplicar_todos_filtros(
             f"elapsed={elapsed_arbiter:.2f}s (parallel, {len(resultado_llm_candidates)} bids)"
         )
 
+    _phases.lap("llm_arbiter")
+
     resultado_keyword = resultado_densidade
 
     # GTM-FIX-028: Merge LLM zero-match approved bids into the keyword results
@@ -1651,6 +1669,8 @@ def aplicar_todos_filtros(
     else:
         aprovadas = resultado_keyword
 
+    _phases.lap("min_match_prazo")
+
     # ========================================================================
     # STORY-179 FLUXO 2: Anti-False Negative Recovery Pipeline
     # ========================================================================
@@ -1781,6 +1801,8 @@ def aplicar_todos_filtros(
                     lic["_near_miss_synonyms"] = synonym_matches
                     llm_candidates_fn.append(lic)
 
+            _phases.lap("synonyms")
+
             # ------------------------------------------------------------------
             # Camada 3B: LLM Recovery for ambiguous synonym matches
             # ------------------------------------------------------------------
@@ -1904,6 +1926,8 @@ def aplicar_todos_filtros(
         f"zero_results={stats['recuperadas_zero_results']}, "
         f"llm_calls_fn={stats['llm_arbiter_calls_fn_flow']}"
     )
+    _phases.lap("recovery")
+
     # ========================================================================
 
     stats["aprovadas"] = len(aprovadas)
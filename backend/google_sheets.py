@@ -26,11 +26,15 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from fastapi import HTTPException
 
+from utils.lazy_import import lazy_attr, lazy_module
+
+# Google API client is imported on the first export, not at worker boot
+Credentials = lazy_attr("google.oauth2.credentials", "Credentials")
+build = lazy_attr("googleapiclient.discovery", "build")
+google_errors = lazy_module("googleapiclient.errors")
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -146,7 +150,7 @@ class GoogleSheetsExporter:
                 'total_rows': len(licitacoes)
             }
 
-        except HttpError as e:
+        except google_errors.HttpError as e:
             self._handle_google_api_error(e)
 
     async def update_spreadsheet(
@@ -186,7 +190,7 @@ class GoogleSheetsExporter:
                 self.service.spreadsheets().get(
                     spreadsheetId=spreadsheet_id
                 ).execute()
-            except HttpError as validation_error:
+            except google_errors.HttpError as validation_error:
                 if validation_error.resp.status == 404:
                     # Spreadsheet not found - automatic fallback to CREATE
                     logger.warning(
@@ -219,7 +223,7 @@ class GoogleSheetsExporter:
                 'updated_at': datetime.now(timezone.utc).isoformat()
             }
 
-        except HttpError as e:
+        except google_errors.HttpError as e:
             self._handle_google_api_error(e)
 
     # ========================================================================
@@ -382,7 +386,7 @@ class GoogleSheetsExporter:
             range='Licitações!A2:K'  # Clear from row 2 onwards
         ).execute()
 
-    def _handle_google_api_error(self, error: HttpError):
+    def _handle_google_api_error(self, error: "google_errors.HttpError"):
         """
         Convert Google API errors to FastAPI HTTPExceptions.
 
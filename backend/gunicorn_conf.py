@@ -6,6 +6,9 @@ are set via CLI args in start.sh so they can be env-var-overridden)
 and logconfig_dict (to redirect Gunicorn internal logs to stdout).
 
 Hooks:
+    on_starting:      Pre-fork warm-up — builds sector/keyword tables once in the
+                      master and gc.freeze()s them so workers share the pages
+                      (startup/warmup.py). GUNICORN_PREFORK_WARMUP=false disables.
     when_ready:       STORY-303 AC5 — Logs readiness after workers spawned.
     post_worker_init: CRIT-034 — Installs SIGABRT handler in each worker for
                       structured timeout logging + Sentry.
@@ -101,6 +104,24 @@ logconfig_dict = {
 
 logger = logging.getLogger("gunicorn.conf")
 
+_prefork_warmup = os.getenv("GUNICORN_PREFORK_WARMUP", "true").lower() == "true"
+
+
+def on_starting(server):
+    """Build immutable filter data before fork so workers inherit it copy-on-write.
+
+    Runs once in the ARBITER process. Only pure-Python modules are loaded
+    (see startup/warmup.py) — safe without --preload.
+    """
+    if not _prefork_warmup:
+        return
+    try:
+        from startup.warmup import prepare_for_fork
+        prepare_for_fork()
+    except Exception as e:
+        # Workers build the same data on import — never block the arbiter
+        logger.warning(f"Pre-fork warm-up failed, workers will load data themselves: {e}")
+
 
 def when_ready(server):
     """STORY-303 AC5: Log readiness after all workers have been spawned.
@@ -65,6 +65,53 @@ async def get_last_checkpoint(
         return None
 
 
+async def get_checkpoints(
+    ufs: list[str],
+    modalidades: list[int],
+    source: str = "pncp",
+) -> dict[tuple[str, int], date] | None:
+    """Return the last completed crawl date for every (uf, modalidade) pair.
+
+    Single-query variant of ``get_last_checkpoint`` for the search pipeline:
+    combinations without a completed checkpoint are absent from the result.
+
+    Returns None if the checkpoints could not be read (callers should not
+    assume the datalake is stale just because Supabase is unreachable).
+
+    ingestion_checkpoints keeps one row per crawl batch, so the max
+    last_date per pair is computed in SQL (latest_ingestion_checkpoints) —
+    a plain select would be cut at the PostgREST row cap.
+    """
+    from supabase_client import sb_execute
+
+    supabase = get_supabase()
+    try:
+        result = await sb_execute(
+            supabase.rpc(
+                "latest_ingestion_checkpoints",
+                {"p_source": source, "p_ufs": ufs, "p_modalidades": modalidades},
+            ),
+            category="rpc",
+        )
+    except Exception as exc:
+        logger.warning(
+            "get_checkpoints: ufs=%s modalidades=%s — %s: %s",
+            ufs,
+            modalidades,
+            type(exc).__name__,
+            exc,
+        )
+        return None
+
+    checkpoints: dict[tuple[str, int], date] = {}
+    for row in result.data or []:
+        last_date = _parse_date(row.get("last_date"))
+        if not last_date or row.get("modalidade_id") is None:
+            continue
+        checkpoints[(row.get("uf"), int(row["modalidade_id"]))] = last_date
+    return checkpoints
+
+
 # ---------------------------------------------------------------------------
 # Checkpoint writes
 # ---------------------------------------------------------------------------
@@ -56,6 +56,60 @@ INGESTION_MAX_PAGES = int(os.getenv("INGESTION_MAX_PAGES", "50"))
 # Max simultaneous UF crawls (asyncio.Semaphore)
 INGESTION_CONCURRENT_UFS = int(os.getenv("INGESTION_CONCURRENT_UFS", "5"))
 
+# ---------------------------------------------------------------------------
+# Bid items (gray-zone item inspection)
+# ---------------------------------------------------------------------------
+
+# Crawl and store item lists for newly ingested bids (pncp_bid_items) and let
+# item_inspector read them before fetching live.
+INGESTION_ITEMS_ENABLED = os.getenv("INGESTION_ITEMS_ENABLED", "false").lower() in ("true", "1")
+
+# Minute past each INGESTION_INCREMENTAL_HOURS hour the items crawl starts
+INGESTION_ITEMS_MINUTE = int(os.getenv("INGESTION_ITEMS_MINUTE", "45"))
+
+# Cap on the items crawler's share of the shared pncp_rate_limiter budget (requests/second)
+INGESTION_ITEMS_RATE_PER_S = float(os.getenv("INGESTION_ITEMS_RATE_PER_S", "2.0"))
+
+# Max simultaneous item fetches
+INGESTION_ITEMS_CONCURRENCY = int(os.getenv("INGESTION_ITEMS_CONCURRENCY", "3"))
+
+# Max bids whose items are fetched per run
+INGESTION_ITEMS_MAX_BIDS = int(os.getenv("INGESTION_ITEMS_MAX_BIDS", "2000"))
+
+# Only bids ingested in the last N hours are considered
+INGESTION_ITEMS_LOOKBACK_HOURS = int(os.getenv("INGESTION_ITEMS_LOOKBACK_HOURS", "24"))
+
+# ---------------------------------------------------------------------------
+# Sanctions mirror (CEIS / CNEP)
+# ---------------------------------------------------------------------------
+
+# Daily download of the CEIS / CNEP datasets into sanctions_mirror; when on,
+# SanctionsService answers from the mirror and uses the API only if stale.
+SANCTIONS_MIRROR_ENABLED = os.getenv("SANCTIONS_MIRROR_ENABLED", "false").lower() in ("true", "1")
+
+# Sync hour (UTC) — the Portal da Transparência publishes the day's files overnight
+SANCTIONS_MIRROR_HOUR_UTC = int(os.getenv("SANCTIONS_MIRROR_HOUR_UTC", "10"))
+
+# Download base; files live at {base}/ceis/{YYYYMMDD} and {base}/cnep/{YYYYMMDD}
+SANCTIONS_MIRROR_DOWNLOAD_URL = os.getenv(
+    "SANCTIONS_MIRROR_DOWNLOAD_URL",
+    "https://portaldatransparencia.gov.br/download-de-dados",
+)
+
+# Mirror older than this (per dataset) is stale: SanctionsService falls back to the API
+SANCTIONS_MIRROR_MAX_AGE_HOURS = int(os.getenv("SANCTIONS_MIRROR_MAX_AGE_HOURS", "36"))
+
+# Published dataset older than this (days) is stale too, even if it was re-synced
+# recently — the sync falls back to older files while today's is not out yet
+SANCTIONS_MIRROR_MAX_DATASET_AGE_DAYS = int(os.getenv("SANCTIONS_MIRROR_MAX_DATASET_AGE_DAYS", "2"))
+
+# How often API workers re-check sanctions_mirror_state for a newer sync (seconds)
+SANCTIONS_MIRROR_RELOAD_S = int(os.getenv("SANCTIONS_MIRROR_RELOAD_S", "300"))
+
+# A sync that would delete more than this share of a dataset's rows is rejected
+# (truncated download / format change) and the previous mirror is kept
+SANCTIONS_MIRROR_MAX_DELETE_RATIO = float(os.getenv("SANCTIONS_MIRROR_MAX_DELETE_RATIO", "0.5"))
+
 # ---------------------------------------------------------------------------
 # Upsert
 # ---------------------------------------------------------------------------
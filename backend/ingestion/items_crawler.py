@@ -0,0 +1,207 @@
+"""PNCP bid items crawler (gray-zone item inspection).
+
+Runs after each incremental crawl when INGESTION_ITEMS_ENABLED=true:
+  1. Selects active bids ingested in the last INGESTION_ITEMS_LOOKBACK_HOURS
+     that have no row in pncp_bid_items yet (capped at INGESTION_ITEMS_MAX_BIDS)
+  2. Fetches /orgaos/{cnpj}/compras/{ano}/{seq}/itens for each via
+     AsyncPNCPClient.fetch_bid_items()
+  3. Upserts the compact item lists into pncp_bid_items
+
+item_inspector then reads these lists in one bulk query instead of spending
+MAX_ITEM_INSPECTIONS on live fetches during searches.
+
+Empty lists (404, no items, transient errors) are not stored — the bid is
+retried on the next run while it is still inside the lookback window.
+
+Rate budget: the budget is SHARED, not separate. fetch_bid_items() acquires
+the process-wide pncp_rate_limiter like every other PNCP call, so item
+fetches compete with page crawls and live searches for the same tokens.
+INGESTION_ITEMS_RATE_PER_S only caps the crawler's share of that budget
+(an additional pacer in front of the shared limiter); keep it well below
+the PNCP limiter rate so searches running during a crawl are not starved.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from pncp_client import AsyncPNCPClient
+from ingestion.config import (
+    INGESTION_ITEMS_CONCURRENCY,
+    INGESTION_ITEMS_LOOKBACK_HOURS,
+    INGESTION_ITEMS_MAX_BIDS,
+    INGESTION_ITEMS_RATE_PER_S,
+    INGESTION_UPSERT_BATCH_SIZE,
+)
+from ingestion.metrics import ITEMS_BIDS_PROCESSED, ITEMS_RUN_DURATION
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = 1000      # pncp_raw_bids rows per select page
+_LOOKUP_CHUNK = 200    # pncp_ids per .in_() lookup on pncp_bid_items
+
+
+class _RequestPacer:
+    """Spaces request starts at 1/rate seconds.
+
+    Caps the crawler's share of the shared pncp_rate_limiter budget; it
+    does not add capacity of its own.
+    """
+
+    def __init__(self, rate_per_s: float):
+        self._interval = 1.0 / rate_per_s if rate_per_s > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def crawl_bid_items(
+    *,
+    lookback_hours: int = INGESTION_ITEMS_LOOKBACK_HOURS,
+    max_bids: int = INGESTION_ITEMS_MAX_BIDS,
+) -> dict[str, Any]:
+    """Fetch and store item lists for recently ingested bids.
+
+    Returns:
+        dict with status, candidates, stored, empty, failed, duration_s.
+    """
+    start = time.monotonic()
+    since = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+
+    pncp_ids = await _pending_bid_ids(since, max_bids)
+    if not pncp_ids:
+        logger.info("crawl_bid_items: no bids without items since %s", since.isoformat())
+        return {"status": "completed", "candidates": 0, "stored": 0, "empty": 0,
+                "failed": 0, "duration_s": round(time.monotonic() - start, 1)}
+
+    logger.info("crawl_bid_items: fetching items for %d bids", len(pncp_ids))
+
+    from item_inspector import parse_numero_controle
+
+    pacer = _RequestPacer(INGESTION_ITEMS_RATE_PER_S)
+    sem = asyncio.Semaphore(INGESTION_ITEMS_CONCURRENCY)
+
+    async with AsyncPNCPClient(max_concurrent=INGESTION_ITEMS_CONCURRENCY) as client:
+
+        async def _fetch_one(pncp_id: str) -> list[dict] | None:
+            ids = parse_numero_controle(pncp_id)
+            if ids is None:
+                return None
+            async with sem:
+                await pacer.wait()
+                return await client.fetch_bid_items(*ids)
+
+        results = await asyncio.gather(
+            *(_fetch_one(pncp_id) for pncp_id in pncp_ids), return_exceptions=True,
+        )
+
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    rows: list[dict] = []
+    empty = failed = 0
+    for pncp_id, res in zip(pncp_ids, results):
+        if isinstance(res, Exception) or res is None:
+            if isinstance(res, Exception):
+                logger.debug("crawl_bid_items: %s failed: %s", pncp_id, res)
+            failed += 1
+        elif not res:
+            empty += 1
+        else:
+            rows.append({
+                "pncp_id": pncp_id,
+                "items": res,
+                "item_count": len(res),
+                "fetched_at": fetched_at,
+            })
+
+    stored = await _store_items(rows)
+    failed += len(rows) - stored
+
+    ITEMS_BIDS_PROCESSED.labels(result="stored").inc(stored)
+    ITEMS_BIDS_PROCESSED.labels(result="empty").inc(empty)
+    ITEMS_BIDS_PROCESSED.labels(result="failed").inc(failed)
+    duration_s = round(time.monotonic() - start, 1)
+    ITEMS_RUN_DURATION.observe(duration_s)
+
+    logger.info(
+        "crawl_bid_items: DONE in %.1fs — candidates=%d stored=%d empty=%d failed=%d",
+        duration_s, len(pncp_ids), stored, empty, failed,
+    )
+    return {
+        "status": "completed",
+        "candidates": len(pncp_ids),
+        "stored": stored,
+        "empty": empty,
+        "failed": failed,
+        "duration_s": duration_s,
+    }
+
+
+async def _pending_bid_ids(since: datetime, max_bids: int) -> list[str]:
+    """Active bids ingested since ``since`` that have no stored items yet."""
+    from supabase_client import get_supabase
+    sb = get_supabase()
+
+    pending: list[str] = []
+    offset = 0
+    while len(pending) < max_bids:
+        resp = (
+            sb.table("pncp_raw_bids")
+            .select("pncp_id")
+            .eq("is_active", True)
+            .gte("ingested_at", since.isoformat())
+            .order("ingested_at", desc=True)
+            .range(offset, offset + _PAGE_SIZE - 1)
+            .execute()
+        )
+        page = [row["pncp_id"] for row in (resp.data or []) if row.get("pncp_id")]
+        if not page:
+            break
+
+        stored: set[str] = set()
+        for i in range(0, len(page), _LOOKUP_CHUNK):
+            chunk = page[i:i + _LOOKUP_CHUNK]
+            existing = (
+                sb.table("pncp_bid_items")
+                .select("pncp_id")
+                .in_("pncp_id", chunk)
+                .execute()
+            )
+            stored.update(row["pncp_id"] for row in (existing.data or []))
+
+        pending.extend(pncp_id for pncp_id in page if pncp_id not in stored)
+        if len(resp.data or []) < _PAGE_SIZE:
+            break
+        offset += _PAGE_SIZE
+
+    return pending[:max_bids]
+
+
+async def _store_items(rows: list[dict]) -> int:
+    """Upsert item rows into pncp_bid_items. Returns the number stored."""
+    if not rows:
+        return 0
+
+    from supabase_client import get_supabase
+    sb = get_supabase()
+
+    stored = 0
+    for i in range(0, len(rows), INGESTION_UPSERT_BATCH_SIZE):
+        chunk = rows[i:i + INGESTION_UPSERT_BATCH_SIZE]
+        try:
+            sb.table("pncp_bid_items").upsert(chunk, on_conflict="pncp_id").execute()
+            stored += len(chunk)
+        except Exception as exc:
+            # Partial success is better than abort — missing rows are retried next run
+            logger.error(
+                "crawl_bid_items: upsert of %d rows failed — %s: %s",
+                len(chunk), type(exc).__name__, exc,
+            )
+    return stored
@@ -172,3 +172,35 @@ CONTRACTS_RUN_DURATION = _histogram(
     labelnames=["run_type"],
     buckets=[30, 60, 300, 600, 1800, 3600, 7200, 14400],
 )
+
+# ---------------------------------------------------------------------------
+# Bid items crawler metrics
+# ---------------------------------------------------------------------------
+
+ITEMS_BIDS_PROCESSED = _counter(
+    "smartlic_ingestion_items_bids_total",
+    "Bids processed by the items crawler",
+    labelnames=["result"],  # result: stored | empty | failed
+)
+
+ITEMS_RUN_DURATION = _histogram(
+    "smartlic_ingestion_items_run_duration_seconds",
+    "Total duration of an items crawl run",
+    buckets=[10, 30, 60, 300, 600, 1200, 1800, 3600],
+)
+
+# ---------------------------------------------------------------------------
+# Sanctions mirror metrics
+# ---------------------------------------------------------------------------
+
+SANCTIONS_MIRROR_CHANGES = _counter(
+    "smartlic_sanctions_mirror_changes_total",
+    "Sanctions mirror rows written by the daily sync",
+    labelnames=["source", "change"],  # source: CEIS | CNEP; change: upserted | deleted
+)
+
+SANCTIONS_MIRROR_RUN_DURATION = _histogram(
+    "smartlic_sanctions_mirror_run_duration_seconds",
+    "Total duration of a sanctions mirror sync run",
+    buckets=[5, 15, 30, 60, 120, 300, 600, 1800],
+)
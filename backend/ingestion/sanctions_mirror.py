@@ -0,0 +1,297 @@
+"""CEIS / CNEP sanctions mirror sync.
+
+Runs daily when SANCTIONS_MIRROR_ENABLED=true:
+  1. Downloads the full published CEIS and CNEP datasets from the Portal da
+     Transparência (zip with one ``;``-separated CSV, published per day at
+     {SANCTIONS_MIRROR_DOWNLOAD_URL}/{ceis|cnep}/{YYYYMMDD}); when today's
+     file is not out yet the most recent of the previous days is used
+  2. Keeps legal entities only (14-digit CNPJ) and hashes each record
+  3. Diffs against sanctions_mirror: new / changed records are upserted,
+     records gone from the dataset are deleted — a daily run writes only
+     what changed, not the whole dataset
+  4. Records the dataset date in sanctions_mirror_state (freshness check)
+
+A dataset that would delete more than SANCTIONS_MIRROR_MAX_DELETE_RATIO of
+the mirrored rows (truncated download, column rename) is rejected: the
+previous mirror stays and, once it ages past SANCTIONS_MIRROR_MAX_AGE_HOURS,
+SanctionsService falls back to the API.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import re
+import time
+import unicodedata
+import zipfile
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional
+
+import httpx
+
+from clients.sanctions import SanctionsChecker
+from ingestion.config import (
+    INGESTION_UPSERT_BATCH_SIZE,
+    SANCTIONS_MIRROR_DOWNLOAD_URL,
+    SANCTIONS_MIRROR_MAX_DELETE_RATIO,
+)
+from ingestion.metrics import SANCTIONS_MIRROR_CHANGES, SANCTIONS_MIRROR_RUN_DURATION
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("CEIS", "CNEP")
+
+_PAGE_SIZE = 1000         # sanctions_mirror rows per select page
+_DELETE_CHUNK = 200       # record_ids per .in_() delete
+_LOOKBACK_DAYS = 5        # how far back to look for the latest published file
+_DOWNLOAD_TIMEOUT_S = 120
+
+# Normalized CSV header (upper case, no accents) -> mirror column
+_COLUMNS = {
+    "CODIGO DA SANCAO": "record_id",
+    "TIPO DE PESSOA": "person_type",
+    "CPF OU CNPJ DO SANCIONADO": "cnpj",
+    "RAZAO SOCIAL - CADASTRO RECEITA": "company_name",
+    "NOME DO SANCIONADO": "sanctioned_name",
+    "CATEGORIA DA SANCAO": "sanction_type",
+    "DATA INICIO SANCAO": "start_date",
+    "DATA FINAL SANCAO": "end_date",
+    "ORGAO SANCIONADOR": "sanctioning_body",
+    "FUNDAMENTACAO LEGAL": "legal_basis",
+    "VALOR DA MULTA": "fine_amount",
+}
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+async def sync_sanctions_mirror(sources: tuple[str, ...] = SOURCES) -> dict[str, Any]:
+    """Download the datasets and apply the diff to sanctions_mirror.
+
+    Returns:
+        dict with status, per-source results (dataset_date, records,
+        upserted, deleted, status) and duration_s.
+    """
+    start = time.monotonic()
+    results: dict[str, dict] = {}
+
+    async with httpx.AsyncClient(timeout=_DOWNLOAD_TIMEOUT_S, follow_redirects=True) as client:
+        for source in sources:
+            try:
+                results[source] = await _sync_source(client, source)
+            except Exception as exc:
+                logger.error(
+                    "sync_sanctions_mirror: %s failed — %s: %s", source, type(exc).__name__, exc,
+                    exc_info=True,
+                )
+                results[source] = {"status": "failed", "error": str(exc)}
+
+    statuses = {r["status"] for r in results.values()}
+    status = "completed" if statuses == {"completed"} else "failed" if "completed" not in statuses else "partial"
+    duration_s = round(time.monotonic() - start, 1)
+    SANCTIONS_MIRROR_RUN_DURATION.observe(duration_s)
+
+    logger.info("sync_sanctions_mirror: %s in %.1fs — %s", status.upper(), duration_s, results)
+    return {"status": status, "sources": results, "duration_s": duration_s}
+
+
+async def _sync_source(client: httpx.AsyncClient, source: str) -> dict[str, Any]:
+    dataset_date, payload = await _download_latest(client, source)
+    records = parse_dataset(source, payload)
+
+    existing = _existing_hashes(source)
+    upserts = [r for r in records.values() if existing.get(r["record_id"]) != r["record_hash"]]
+    deletes = [record_id for record_id in existing if record_id not in records]
+
+    if existing and len(deletes) > len(existing) * SANCTIONS_MIRROR_MAX_DELETE_RATIO:
+        logger.error(
+            "sync_sanctions_mirror: %s dataset of %s would delete %d of %d rows — rejected",
+            source, dataset_date, len(deletes), len(existing),
+        )
+        return {"status": "rejected", "dataset_date": dataset_date.isoformat(),
+                "records": len(records), "would_delete": len(deletes)}
+
+    synced_at = datetime.now(timezone.utc).isoformat()
+    for row in upserts:
+        row["synced_at"] = synced_at
+    upserted = _upsert_rows(upserts)
+    deleted = _delete_rows(source, deletes)
+    SANCTIONS_MIRROR_CHANGES.labels(source=source, change="upserted").inc(upserted)
+    SANCTIONS_MIRROR_CHANGES.labels(source=source, change="deleted").inc(deleted)
+
+    if upserted < len(upserts) or deleted < len(deletes):
+        # Leave the state untouched: the next run retries the same diff
+        return {"status": "failed", "error": "partial write", "dataset_date": dataset_date.isoformat(),
+                "records": len(records), "upserted": upserted, "deleted": deleted}
+
+    _write_state(source, dataset_date, len(records), synced_at)
+    return {
+        "status": "completed",
+        "dataset_date": dataset_date.isoformat(),
+        "records": len(records),
+        "upserted": upserted,
+        "deleted": deleted,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Download / parse
+# ---------------------------------------------------------------------------
+
+
+async def _download_latest(client: httpx.AsyncClient, source: str) -> tuple[date, bytes]:
+    """Most recent published file for ``source``: (dataset date, zip bytes)."""
+    today = datetime.now(timezone.utc).date()
+    for days_back in range(_LOOKBACK_DAYS + 1):
+        day = today - timedelta(days=days_back)
+        url = f"{SANCTIONS_MIRROR_DOWNLOAD_URL}/{source.lower()}/{day:%Y%m%d}"
+        response = await client.get(url)
+        if response.status_code == 200 and response.content[:2] == b"PK":
+            logger.info("sync_sanctions_mirror: %s dataset %s (%d bytes)", source, day, len(response.content))
+            return day, response.content
+        logger.debug("sync_sanctions_mirror: %s %s not available (HTTP %d)", source, day, response.status_code)
+    raise RuntimeError(f"no {source} dataset published in the last {_LOOKBACK_DAYS} days")
+
+
+def parse_dataset(source: str, payload: bytes) -> dict[str, dict]:
+    """Mirror rows keyed by record_id from a CEIS / CNEP zip (legal entities only)."""
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        name = next(n for n in archive.namelist() if n.lower().endswith(".csv"))
+        raw = archive.read(name)
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = raw.decode("latin-1")
+
+    reader = csv.reader(io.StringIO(text), delimiter=";")
+    header = [_COLUMNS.get(_normalize_header(h)) for h in next(reader, [])]
+    if "cnpj" not in header:
+        raise ValueError(f"{source} dataset has no CNPJ column (header changed?)")
+
+    records: dict[str, dict] = {}
+    for values in reader:
+        fields = {col: value.strip() for col, value in zip(header, values) if col}
+        row = _to_row(source, fields)
+        if row is not None:
+            records[row["record_id"]] = row
+    return records
+
+
+def _to_row(source: str, fields: dict[str, str]) -> Optional[dict]:
+    cnpj = re.sub(r"\D", "", fields.get("cnpj", ""))
+    if len(cnpj) != 14 or fields.get("person_type", "").upper() == "F":
+        return None
+
+    start_date = SanctionsChecker._parse_date(fields.get("start_date"))
+    end_date = SanctionsChecker._parse_date(fields.get("end_date"))
+    row = {
+        "source": source,
+        "cnpj": cnpj,
+        "company_name": fields.get("company_name") or fields.get("sanctioned_name", ""),
+        "sanction_type": fields.get("sanction_type", ""),
+        "start_date": start_date.isoformat() if start_date else None,
+        "end_date": end_date.isoformat() if end_date else None,
+        "sanctioning_body": fields.get("sanctioning_body", ""),
+        "legal_basis": fields.get("legal_basis", ""),
+        "fine_amount": _parse_amount(fields.get("fine_amount")),
+    }
+    row["record_hash"] = hashlib.sha1(json.dumps(row, sort_keys=True).encode("utf-8")).hexdigest()
+    row["record_id"] = fields.get("record_id") or row["record_hash"]
+    return row
+
+
+def _normalize_header(value: str) -> str:
+    value = unicodedata.normalize("NFKD", value.strip().strip('"'))
+    return "".join(c for c in value if not unicodedata.combining(c)).upper()
+
+
+def _parse_amount(value: Optional[str]) -> Optional[str]:
+    """'1.234.567,89' -> '1234567.89' (string keeps NUMERIC exact through JSON)."""
+    if not value:
+        return None
+    try:
+        return str(Decimal(value.replace(".", "").replace(",", ".")))
+    except InvalidOperation:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+def _existing_hashes(source: str) -> dict[str, str]:
+    from supabase_client import get_supabase
+    sb = get_supabase()
+
+    hashes: dict[str, str] = {}
+    offset = 0
+    while True:
+        resp = (
+            sb.table("sanctions_mirror")
+            .select("record_id,record_hash")
+            .eq("source", source)
+            .order("record_id")
+            .range(offset, offset + _PAGE_SIZE - 1)
+            .execute()
+        )
+        page = resp.data or []
+        hashes.update((row["record_id"], row["record_hash"]) for row in page)
+        if len(page) < _PAGE_SIZE:
+            return hashes
+        offset += _PAGE_SIZE
+
+
+def _upsert_rows(rows: list[dict]) -> int:
+    if not rows:
+        return 0
+    from supabase_client import get_supabase
+    sb = get_supabase()
+
+    stored = 0
+    for i in range(0, len(rows), INGESTION_UPSERT_BATCH_SIZE):
+        chunk = rows[i:i + INGESTION_UPSERT_BATCH_SIZE]
+        try:
+            sb.table("sanctions_mirror").upsert(chunk, on_conflict="source,record_id").execute()
+            stored += len(chunk)
+        except Exception as exc:
+            logger.error(
+                "sync_sanctions_mirror: upsert of %d rows failed — %s: %s",
+                len(chunk), type(exc).__name__, exc,
+            )
+    return stored
+
+
+def _delete_rows(source: str, record_ids: list[str]) -> int:
+    if not record_ids:
+        return 0
+    from supabase_client import get_supabase
+    sb = get_supabase()
+
+    deleted = 0
+    for i in range(0, len(record_ids), _DELETE_CHUNK):
+        chunk = record_ids[i:i + _DELETE_CHUNK]
+        try:
+            sb.table("sanctions_mirror").delete().eq("source", source).in_("record_id", chunk).execute()
+            deleted += len(chunk)
+        except Exception as exc:
+            logger.error(
+                "sync_sanctions_mirror: delete of %d rows failed — %s: %s",
+                len(chunk), type(exc).__name__, exc,
+            )
+    return deleted
+
+
+def _write_state(source: str, dataset_date: date, record_count: int, synced_at: str) -> None:
+    from supabase_client import get_supabase
+    get_supabase().table("sanctions_mirror_state").upsert({
+        "source": source,
+        "dataset_date": dataset_date.isoformat(),
+        "record_count": record_count,
+        "synced_at": synced_at,
+    }, on_conflict="source").execute()
@@ -6,11 +6,15 @@ They are intentionally thin wrappers — all logic lives in crawler.py / loader.
 Schedule (default, all UTC):
   - Full crawl:         05:00 daily  (2am BRT)
   - Incremental crawl: 11:00, 17:00, 23:00  (8am, 2pm, 8pm BRT)
+  - Bid items:         :45 after each incremental (INGESTION_ITEMS_ENABLED)
+  - Sanctions mirror:  10:00 daily  (SANCTIONS_MIRROR_ENABLED)
   - Purge:             07:00 daily  (4am BRT, 2h after full crawl)
 
 Timeouts (ARQ-enforced):
   - Full crawl:    4h  (14400s) — 30-60 min expected, safety margin for retries
   - Incremental:   1h  (3600s)  — 10-20 min expected
+  - Bid items:     1h  (3600s)  — ~15 min at 2 req/s for 2000 bids
+  - Sanctions:    30m  (1800s)  — two dataset downloads + diff, ~1-2 min
   - Purge:        10m  (600s)   — simple DELETE, no heavy I/O
 """
 
@@ -133,6 +137,90 @@ async def ingestion_incremental_job(ctx: dict) -> dict:
     return {**result, "duration_s": duration_s}
 
 
+async def ingestion_items_job(ctx: dict) -> dict:
+    """ARQ job: Fetch item lists for newly ingested bids into pncp_bid_items.
+
+    Scheduled INGESTION_ITEMS_MINUTE past each incremental crawl hour so the
+    new bids are already in pncp_raw_bids. Uses its own request budget
+    (INGESTION_ITEMS_RATE_PER_S).
+
+    Feature flags: DATALAKE_ENABLED and INGESTION_ITEMS_ENABLED must be true.
+
+    Returns:
+        dict with status, candidates, stored, empty, failed, duration_s.
+    """
+    from ingestion.config import INGESTION_ITEMS_ENABLED
+    if not DATALAKE_ENABLED or not INGESTION_ITEMS_ENABLED:
+        logger.info("[Ingestion:Items] Skipped — DATALAKE_ENABLED/INGESTION_ITEMS_ENABLED=false")
+        return {"status": "skipped", "reason": "INGESTION_ITEMS_ENABLED=false"}
+
+    start = time.monotonic()
+    logger.info("[Ingestion:Items] Starting bid items crawl")
+
+    try:
+        from ingestion.items_crawler import crawl_bid_items
+        result = await crawl_bid_items()
+    except Exception as e:
+        duration_s = round(time.monotonic() - start, 1)
+        logger.error(
+            f"[Ingestion:Items] Failed after {duration_s}s: {type(e).__name__}: {e}",
+            exc_info=True,
+        )
+        await _notify_failure("Items", f"{type(e).__name__}: {e}", duration_s)
+        return {
+            "status": "failed",
+            "error": str(e),
+            "duration_s": duration_s,
+        }
+
+    logger.info(
+        f"[Ingestion:Items] Completed in {result.get('duration_s')}s — "
+        f"stored={result.get('stored', 0)}"
+    )
+    return result
+
+
+async def sanctions_mirror_job(ctx: dict) -> dict:
+    """ARQ job: Sync the CEIS / CNEP datasets into sanctions_mirror.
+
+    Scheduled daily at SANCTIONS_MIRROR_HOUR_UTC, after the Portal da
+    Transparência publishes the day's files.
+
+    Feature flag: SANCTIONS_MIRROR_ENABLED must be true.
+
+    Returns:
+        dict with status, per-source results and duration_s.
+    """
+    from ingestion.config import SANCTIONS_MIRROR_ENABLED
+    if not SANCTIONS_MIRROR_ENABLED:
+        logger.info("[Ingestion:Sanctions] Skipped — SANCTIONS_MIRROR_ENABLED=false")
+        return {"status": "skipped", "reason": "SANCTIONS_MIRROR_ENABLED=false"}
+
+    start = time.monotonic()
+    logger.info("[Ingestion:Sanctions] Starting sanctions mirror sync")
+
+    try:
+        from ingestion.sanctions_mirror import sync_sanctions_mirror
+        result = await sync_sanctions_mirror()
+    except Exception as e:
+        duration_s = round(time.monotonic() - start, 1)
+        logger.error(
+            f"[Ingestion:Sanctions] Failed after {duration_s}s: {type(e).__name__}: {e}",
+            exc_info=True,
+        )
+        await _notify_failure("Sanctions", f"{type(e).__name__}: {e}", duration_s)
+        return {
+            "status": "failed",
+            "error": str(e),
+            "duration_s": duration_s,
+        }
+
+    if result["status"] != "completed":
+        await _notify_failure("Sanctions", f"sync {result['status']}", result["duration_s"], extra=result["sources"])
+    logger.info(f"[Ingestion:Sanctions] {result['status']} in {result['duration_s']}s")
+    return result
+
+
 async def contracts_full_crawl_job(ctx: dict) -> dict:
     """ARQ job: Full contracts crawl. Daily at 06:00 UTC (3am BRT).
 
@@ -8,11 +8,20 @@ Key concepts:
 - **Majority rule**: >50% items matching sector keywords → accept
 - **Domain signals**: NCM prefixes, unit patterns, size patterns → boost matching
 - **Budget**: Max N item-fetches per search (configurable via MAX_ITEM_INSPECTIONS)
-- **Cache**: LRU in-memory cache (24h TTL, max 1000 entries)
-
-Called from filter.py (sync context) using ThreadPoolExecutor for parallel fetching.
+- **Cache**: LRU in-memory cache (24h TTL, max 1000 entries) in front of a
+  shared Redis tier (same TTL) so item lists are reused across workers
+- **Stored items**: when INGESTION_ITEMS_ENABLED, item lists crawled at
+  ingestion time (pncp_bid_items) are read in one bulk query by pncp_id and
+  only misses are fetched live
+
+Called from filter.py (sync context). When the caller passes the app event
+loop, the gray zone is inspected by ``inspect_bids_async`` on that loop
+(shared AsyncPNCPClient + rate limiter, concurrent fetches under a phase
+deadline); otherwise a ThreadPoolExecutor fetches items in parallel.
 """
 
+import asyncio
+import json
 import logging
 import re
 import time
@@ -81,6 +90,157 @@ def clear_cache() -> None:
     logger.info("Item inspector cache cleared")
 
 
+# ============================================================================
+# Shared Redis tier for fetched items (cross-worker, 24h TTL)
+# ============================================================================
+
+_REDIS_KEY_PREFIX = "item_inspection:items:"
+
+
+def _redis_key(key: str) -> str:
+    return f"{_REDIS_KEY_PREFIX}{key}"
+
+
+async def _redis_get_many(keys: List[str]) -> Dict[str, List[Dict]]:
+    """Read cached item lists for ``keys`` in one MGET. Fail-open: {}."""
+    if not keys:
+        return {}
+    try:
+        from redis_pool import get_redis_pool
+
+        redis = await get_redis_pool()
+        if redis is None:
+            return {}
+        values = await redis.mget([_redis_key(k) for k in keys])
+    except Exception as e:
+        logger.debug(f"Item inspection Redis read failed: {e}")
+        return {}
+
+    found: Dict[str, List[Dict]] = {}
+    for key, raw in zip(keys, values or []):
+        if raw is None:
+            continue
+        try:
+            items = json.loads(raw)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(items, list):
+            found[key] = items
+    return found
+
+
+async def _redis_put_many(entries: Dict[str, List[Dict]]) -> None:
+    """Write fetched item lists with one pipelined SETEX batch. Fail-open."""
+    if not entries:
+        return
+    try:
+        from redis_pool import get_redis_pool
+
+        redis = await get_redis_pool()
+        if redis is None:
+            return
+        pipe = redis.pipeline(transaction=False)
+        for key, items in entries.items():
+            pipe.setex(_redis_key(key), _CACHE_TTL_SECONDS, json.dumps(items, ensure_ascii=False))
+        await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Item inspection Redis write failed: {e}")
+
+
+# ============================================================================
+# Stored item lists (pncp_bid_items, written by ingestion.items_crawler)
+# ============================================================================
+
+_STORED_ITEMS_CHUNK = 200
+
+
+def _stored_items_enabled() -> bool:
+    from ingestion.config import INGESTION_ITEMS_ENABLED
+
+    return INGESTION_ITEMS_ENABLED
+
+
+def _stored_items_query(sb, pncp_ids: List[str]):
+    return sb.table("pncp_bid_items").select("pncp_id, items").in_("pncp_id", pncp_ids)
+
+
+def _collect_stored_items(rows: List[Dict], found: Dict[str, List[Dict]]) -> None:
+    for row in rows or []:
+        items = row.get("items")
+        # Empty lists are never stored; treat anything else as a miss
+        if row.get("pncp_id") and isinstance(items, list) and items:
+            found[row["pncp_id"]] = items
+
+
+def _load_stored_items(pncp_ids: List[str]) -> Dict[str, List[Dict]]:
+    """Bulk-read ingested item lists by pncp_id (sync). Fail-open: {}."""
+    found: Dict[str, List[Dict]] = {}
+    if not pncp_ids or not _stored_items_enabled():
+        return found
+    try:
+        from supabase_client import get_supabase
+
+        sb = get_supabase()
+        for i in range(0, len(pncp_ids), _STORED_ITEMS_CHUNK):
+            result = _stored_items_query(sb, pncp_ids[i:i + _STORED_ITEMS_CHUNK]).execute()
+            _collect_stored_items(result.data, found)
+    except Exception as e:
+        logger.debug(f"Stored item lists unavailable: {e}")
+    return found
+
+
+async def _load_stored_items_async(pncp_ids: List[str]) -> Dict[str, List[Dict]]:
+    """Bulk-read ingested item lists by pncp_id (async). Fail-open: {}."""
+    found: Dict[str, List[Dict]] = {}
+    if not pncp_ids or not _stored_items_enabled():
+        return found
+    try:
+        from supabase_client import get_supabase, sb_execute
+
+        sb = get_supabase()
+        for i in range(0, len(pncp_ids), _STORED_ITEMS_CHUNK):
+            result = await sb_execute(_stored_items_query(sb, pncp_ids[i:i + _STORED_ITEMS_CHUNK]))
+            _collect_stored_items(result.data, found)
+    except Exception as e:
+        logger.debug(f"Stored item lists unavailable: {e}")
+    return found
+
+
+# ============================================================================
+# Shared AsyncPNCPClient for item fetches (one per event loop)
+# ============================================================================
+
+_async_client = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_async_client():
+    """Return the long-lived AsyncPNCPClient bound to the running loop."""
+    global _async_client, _async_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        from config import ITEM_INSPECTION_CONCURRENCY
+        from pncp_client import AsyncPNCPClient
+
+        client = AsyncPNCPClient(max_concurrent=ITEM_INSPECTION_CONCURRENCY)
+        await client.__aenter__()
+        _async_client, _async_client_loop = client, loop
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared item-fetch client (app shutdown)."""
+    global _async_client, _async_client_loop
+
+    client, _async_client, _async_client_loop = _async_client, None, None
+    if client is not None:
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Item inspection client close failed: {e}")
+
+
 # ============================================================================
 # AC1: Sync item fetch via httpx (called from ThreadPoolExecutor)
 # ============================================================================
@@ -252,6 +412,271 @@ def apply_majority_rule(
     return accepted, ratio, matching, total
 
 
+_CONTROL_NUMBER_RE = re.compile(r"^(\d{14})-\d+-(\d+)/(\d{4})$")
+
+
+def parse_numero_controle(numero_controle: str) -> Optional[Tuple[str, str, str]]:
+    """Split a numeroControlePNCP ("{cnpj}-{tipo}-{seq}/{ano}") into ids.
+
+    Returns (cnpj, ano, sequencial) or None if the value is malformed.
+    """
+    match = _CONTROL_NUMBER_RE.match((numero_controle or "").strip())
+    if not match:
+        return None
+    cnpj, sequencial, ano = match.groups()
+    return cnpj, ano, str(int(sequencial))
+
+
+def _extract_ids(bid: Dict) -> Tuple[str, str, str]:
+    """Extract cnpj, ano, sequencial from a bid dict.
+
+    Datalake rows only carry numeroControlePNCP, so the ids are parsed from it
+    when the explicit fields are missing.
+    """
+    orgao = bid.get("orgaoEntidade") or {}
+    cnpj = orgao.get("cnpj", "") if isinstance(orgao, dict) else ""
+    if not cnpj:
+        cnpj = bid.get("cnpjOrgao", "") or bid.get("cnpj", "")
+    ano = str(bid.get("anoCompra", ""))
+    sequencial = str(bid.get("sequencialCompra", ""))
+    if not (cnpj and ano and sequencial):
+        parsed = parse_numero_controle(bid.get("numeroControlePNCP", ""))
+        if parsed:
+            return parsed
+    return cnpj, ano, sequencial
+
+
+def _apply_rule_to_bid(
+    bid: Dict,
+    items: List[Dict],
+    sector_keywords: Set[str],
+    ncm_prefixes: List[str],
+    unit_patterns: List[str],
+    size_patterns: List[str],
+) -> bool:
+    """Apply the majority rule to one bid, tagging it when accepted."""
+    if not items:
+        return False
+
+    accepted_flag, ratio, matching, total = apply_majority_rule(
+        items, sector_keywords, ncm_prefixes, unit_patterns, size_patterns
+    )
+
+    if accepted_flag:
+        bid["_relevance_source"] = "item_inspection"
+        bid["_item_inspection_detail"] = (
+            f"{matching}/{total} items matching ({ratio:.0%})"
+        )
+        # D-02 AC4: Item inspection gets confidence_score=85
+        bid["_confidence_score"] = 85
+        bid["_llm_evidence"] = []
+        logger.debug(
+            f"Item inspection ACCEPT: {matching}/{total} ({ratio:.0%}) "
+            f"for {'/'.join(_extract_ids(bid))}"
+        )
+
+    return accepted_flag
+
+
+def _finalize_metrics(metrics: Dict[str, Any], elapsed_s: float, mode: str) -> None:
+    """Fill derived rates (inspections/s, cache hit rate) and export them."""
+    performed = metrics["item_inspections_performed"]
+    lookups = metrics["item_inspections_cache_hits"] + metrics["item_fetch_count"]
+    metrics["item_inspections_per_sec"] = round(performed / elapsed_s, 1) if elapsed_s > 0 else 0.0
+    metrics["item_cache_hit_rate"] = (
+        round(metrics["item_inspections_cache_hits"] / lookups, 3) if lookups else 0.0
+    )
+
+    try:
+        from metrics import ITEM_INSPECTION_LOOKUPS, ITEM_INSPECTION_THROUGHPUT
+
+        redis_hits = metrics.get("item_inspections_redis_hits", 0)
+        stored_hits = metrics.get("item_inspections_stored_hits", 0)
+        l1_hits = metrics["item_inspections_cache_hits"] - redis_hits - stored_hits
+        ITEM_INSPECTION_LOOKUPS.labels(result="memory_hit", mode=mode).inc(l1_hits)
+        ITEM_INSPECTION_LOOKUPS.labels(result="redis_hit", mode=mode).inc(redis_hits)
+        ITEM_INSPECTION_LOOKUPS.labels(result="stored_hit", mode=mode).inc(stored_hits)
+        ITEM_INSPECTION_LOOKUPS.labels(result="fetched", mode=mode).inc(metrics["item_fetch_count"])
+        if performed:
+            ITEM_INSPECTION_THROUGHPUT.labels(mode=mode).observe(metrics["item_inspections_per_sec"])
+    except Exception:
+        pass
+
+
+# ============================================================================
+# Async orchestrator (shared client, Redis tier, phase deadline)
+# ============================================================================
+
+async def inspect_bids_async(
+    gray_zone_bids: List[Dict[str, Any]],
+    sector_keywords: Set[str],
+    ncm_prefixes: List[str],
+    unit_patterns: List[str],
+    size_patterns: List[str],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+    """Inspect gray zone bids on the event loop.
+
+    Cache lookups go memory → Redis (one MGET for the whole gray zone) →
+    ingested item lists (one bulk query by pncp_id). Misses within MAX_ITEM_INSPECTIONS are fetched concurrently through the
+    shared AsyncPNCPClient (connection pool + PNCP rate limiter), bounded by
+    ITEM_INSPECTION_CONCURRENCY; fetches still running at
+    ITEM_INSPECTION_PHASE_TIMEOUT are cancelled and their bids go to LLM.
+    Fetched lists are written back to both cache tiers.
+
+    Returns:
+        Tuple of (accepted, remaining, metrics) — same contract as
+        ``inspect_bids_in_filter``.
+    """
+    from config import (
+        MAX_ITEM_INSPECTIONS,
+        ITEM_INSPECTION_CONCURRENCY,
+        ITEM_INSPECTION_PHASE_TIMEOUT,
+        get_feature_flag,
+    )
+
+    metrics: Dict[str, Any] = {
+        "item_inspections_performed": 0,
+        "item_inspections_accepted": 0,
+        "item_inspections_cache_hits": 0,
+        "item_inspections_redis_hits": 0,
+        "item_inspections_stored_hits": 0,
+        "item_fetch_total_ms": 0.0,
+        "item_fetch_count": 0,
+    }
+
+    if not get_feature_flag("ITEM_INSPECTION_ENABLED"):
+        return [], gray_zone_bids, metrics
+
+    if not gray_zone_bids:
+        return [], [], metrics
+
+    phase_start = time.monotonic()
+    accepted: List[Dict[str, Any]] = []
+    remaining: List[Dict[str, Any]] = []
+
+    def _record(bid: Dict, items: List[Dict]) -> None:
+        metrics["item_inspections_performed"] += 1
+        if _apply_rule_to_bid(bid, items, sector_keywords, ncm_prefixes, unit_patterns, size_patterns):
+            metrics["item_inspections_accepted"] += 1
+            accepted.append(bid)
+        else:
+            remaining.append(bid)
+
+    # 1. Memory tier
+    hits: List[Tuple[Dict, List[Dict]]] = []
+    lookup: List[Tuple[Dict, str]] = []
+    for bid in gray_zone_bids:
+        cnpj, ano, sequencial = _extract_ids(bid)
+        if not (cnpj and ano and sequencial):
+            remaining.append(bid)
+            continue
+        key = _cache_key(cnpj, ano, sequencial)
+        cached = _get_cached_items(key)
+        if cached is not None:
+            hits.append((bid, cached))
+        else:
+            lookup.append((bid, key))
+
+    # 2. Redis tier — one round trip for the whole gray zone
+    redis_found = await _redis_get_many([key for _, key in lookup])
+    misses: List[Tuple[Dict, str]] = []
+    for bid, key in lookup:
+        items = redis_found.get(key)
+        if items is not None:
+            _put_cached_items(key, items)
+            hits.append((bid, items))
+            metrics["item_inspections_redis_hits"] += 1
+        else:
+            misses.append((bid, key))
+
+    # 3. Item lists stored at ingestion time — one bulk query by pncp_id
+    stored = await _load_stored_items_async(
+        [bid["numeroControlePNCP"] for bid, _ in misses if bid.get("numeroControlePNCP")]
+    )
+    fetch_needed: List[Tuple[Dict, str]] = []
+    budget_remaining = MAX_ITEM_INSPECTIONS
+    for bid, key in misses:
+        items = stored.get(bid.get("numeroControlePNCP", ""))
+        if items is not None:
+            _put_cached_items(key, items)
+            hits.append((bid, items))
+            metrics["item_inspections_stored_hits"] += 1
+        elif budget_remaining > 0:
+            fetch_needed.append((bid, key))
+            budget_remaining -= 1
+        else:
+            remaining.append(bid)  # Over budget → LLM flow
+
+    metrics["item_inspections_cache_hits"] = len(hits)
+    for bid, items in hits:
+        _record(bid, items)
+
+    # 4. Concurrent fetch under the phase deadline
+    if fetch_needed:
+        client = await _get_async_client()
+        semaphore = asyncio.Semaphore(ITEM_INSPECTION_CONCURRENCY)
+
+        async def _fetch(bid: Dict) -> Tuple[List[Dict], float]:
+            async with semaphore:
+                start = time.monotonic()
+                items = await client.fetch_bid_items(*_extract_ids(bid))
+                return items, (time.monotonic() - start) * 1000
+
+        tasks = {asyncio.create_task(_fetch(bid)): (bid, key) for bid, key in fetch_needed}
+        deadline = max(0.0, ITEM_INSPECTION_PHASE_TIMEOUT - (time.monotonic() - phase_start))
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+
+        if pending:
+            logger.warning(
+                f"Item inspection phase timeout ({ITEM_INSPECTION_PHASE_TIMEOUT}s). "
+                f"{len(pending)} bids go to LLM."
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        fetched: Dict[str, List[Dict]] = {}
+        for task, (bid, key) in tasks.items():
+            if task not in done or task.cancelled() or task.exception() is not None:
+                if task in done and not task.cancelled():
+                    logger.debug(f"Item inspection failed: {task.exception()}")
+                remaining.append(bid)
+                continue
+            items, elapsed_ms = task.result()
+            metrics["item_fetch_count"] += 1
+            metrics["item_fetch_total_ms"] += elapsed_ms
+            # Cache result (even empty — avoids re-fetching 404s)
+            _put_cached_items(key, items)
+            fetched[key] = items
+            _record(bid, items)
+
+        await _redis_put_many(fetched)
+
+    metrics["item_fetch_avg_ms"] = round(
+        metrics["item_fetch_total_ms"] / metrics["item_fetch_count"], 1
+    ) if metrics["item_fetch_count"] else 0
+    _finalize_metrics(metrics, time.monotonic() - phase_start, "async")
+
+    logger.info(
+        f"D-01 Item inspection (async): "
+        f"{metrics['item_inspections_performed']} inspected, "
+        f"{metrics['item_inspections_accepted']} accepted, "
+        f"{metrics['item_inspections_cache_hits']} cache hits "
+        f"({metrics['item_inspections_redis_hits']} redis, "
+        f"{metrics['item_inspections_stored_hits']} stored), "
+        f"{metrics['item_inspections_per_sec']}/s"
+    )
+
+    return accepted, remaining, metrics
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
 # ============================================================================
 # AC2 + AC6: Sync orchestrator for filter.py integration
 # ============================================================================
@@ -262,11 +687,15 @@ def inspect_bids_in_filter(
     ncm_prefixes: List[str],
     unit_patterns: List[str],
     size_patterns: List[str],
+    event_loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
     """Inspect gray zone bids synchronously (called from filter.py).
 
-    Uses ThreadPoolExecutor for parallel item fetching, matching the
-    pattern used by LLM zero-match in filter.py.
+    When ``event_loop`` is the running app loop and this call is on a worker
+    thread (filter runs via ``asyncio.to_thread``), the inspection is
+    delegated to ``inspect_bids_async`` on that loop. Otherwise uses
+    ThreadPoolExecutor for parallel item fetching, matching the pattern used
+    by LLM zero-match in filter.py.
 
     Args:
         gray_zone_bids: Bids with 0-5% keyword density.
@@ -274,6 +703,7 @@ def inspect_bids_in_filter(
         ncm_prefixes: NCM code prefixes for domain signals.
         unit_patterns: Unit patterns for domain signals.
         size_patterns: Size regex patterns for domain signals.
+        event_loop: App event loop to run the async inspection on (optional).
 
     Returns:
         Tuple of (accepted, remaining, metrics).
@@ -285,10 +715,32 @@ def inspect_bids_in_filter(
         get_feature_flag,
     )
 
+    if (
+        event_loop is not None
+        and event_loop.is_running()
+        and not _on_loop_thread(event_loop)
+        and get_feature_flag("ITEM_INSPECTION_ASYNC_ENABLED")
+    ):
+        from config import ITEM_INSPECTION_PHASE_TIMEOUT
+
+        future = asyncio.run_coroutine_threadsafe(
+            inspect_bids_async(
+                gray_zone_bids, sector_keywords, ncm_prefixes, unit_patterns, size_patterns,
+            ),
+            event_loop,
+        )
+        try:
+            # Phase deadline is enforced inside; the margin covers cache I/O
+            return future.result(timeout=ITEM_INSPECTION_PHASE_TIMEOUT + 5)
+        except Exception as e:
+            future.cancel()
+            logger.warning(f"D-01 async item inspection failed, falling back to thread pool: {e}")
+
     metrics: Dict[str, Any] = {
         "item_inspections_performed": 0,
         "item_inspections_accepted": 0,
         "item_inspections_cache_hits": 0,
+        "item_inspections_stored_hits": 0,
         "item_fetch_total_ms": 0.0,
         "item_fetch_count": 0,
     }
@@ -305,16 +757,6 @@ def inspect_bids_in_filter(
     remaining: List[Dict[str, Any]] = []
     phase_start = time.time()
 
-    def _extract_ids(bid: Dict) -> Tuple[str, str, str]:
-        """Extract cnpj, ano, sequencial from a bid dict."""
-        orgao = bid.get("orgaoEntidade") or {}
-        cnpj = orgao.get("cnpj", "") if isinstance(orgao, dict) else ""
-        if not cnpj:
-            cnpj = bid.get("cnpjOrgao", "") or bid.get("cnpj", "")
-        ano = str(bid.get("anoCompra", ""))
-        sequencial = str(bid.get("sequencialCompra", ""))
-        return cnpj, ano, sequencial
-
     def _inspect_one(bid: Dict) -> Tuple[Dict, bool, bool]:
         """Inspect a single bid. Returns (bid, accepted, used_cache)."""
         cnpj, ano, sequencial = _extract_ids(bid)
@@ -325,49 +767,27 @@ def inspect_bids_in_filter(
         cached = _get_cached_items(key)
 
         if cached is not None:
-            items = cached
-            return _apply_rule(bid, items, cnpj, ano, sequencial, True)
+            return bid, _apply_rule(bid, cached), True
 
         # Fetch from API
         start_ms = time.time() * 1000
         items = _fetch_items_sync(cnpj, ano, sequencial, timeout=ITEM_INSPECTION_TIMEOUT)
-        elapsed_ms = time.time() * 1000 - start_ms
+        metrics["item_fetch_total_ms"] += time.time() * 1000 - start_ms
 
         # Cache result (even empty — avoids re-fetching 404s)
         _put_cached_items(key, items)
 
-        return _apply_rule(bid, items, cnpj, ano, sequencial, False, elapsed_ms)
-
-    def _apply_rule(
-        bid: Dict,
-        items: List[Dict],
-        cnpj: str,
-        ano: str,
-        sequencial: str,
-        was_cached: bool,
-        elapsed_ms: float = 0.0,
-    ) -> Tuple[Dict, bool, bool]:
-        if not items:
-            return bid, False, was_cached
-
-        accepted_flag, ratio, matching, total = apply_majority_rule(
-            items, sector_keywords, ncm_prefixes, unit_patterns, size_patterns
-        )
+        return bid, _apply_rule(bid, items), False
 
-        if accepted_flag:
-            bid["_relevance_source"] = "item_inspection"
-            bid["_item_inspection_detail"] = (
-                f"{matching}/{total} items matching ({ratio:.0%})"
-            )
-            # D-02 AC4: Item inspection gets confidence_score=85
-            bid["_confidence_score"] = 85
-            bid["_llm_evidence"] = []
-            logger.debug(
-                f"Item inspection ACCEPT: {matching}/{total} ({ratio:.0%}) "
-                f"for {cnpj}/{ano}/{sequencial}"
-            )
+    def _apply_rule(bid: Dict, items: List[Dict]) -> bool:
+        return _apply_rule_to_bid(
+            bid, items, sector_keywords, ncm_prefixes, unit_patterns, size_patterns
+        )
 
-        return bid, accepted_flag, was_cached
+    # Item lists stored at ingestion time — one bulk query for the gray zone
+    stored = _load_stored_items(
+        [bid["numeroControlePNCP"] for bid in gray_zone_bids if bid.get("numeroControlePNCP")]
+    )
 
     # Separate cache-hit bids from fetch-needed bids
     cache_hit_bids: List[Tuple[Dict, List[Dict]]] = []
@@ -381,6 +801,10 @@ def inspect_bids_in_filter(
 
         key = _cache_key(cnpj, ano, sequencial)
         cached = _get_cached_items(key)
+        if cached is None and bid.get("numeroControlePNCP") in stored:
+            cached = stored[bid["numeroControlePNCP"]]
+            _put_cached_items(key, cached)
+            metrics["item_inspections_stored_hits"] += 1
         if cached is not None:
             cache_hit_bids.append((bid, cached))
             metrics["item_inspections_cache_hits"] += 1
@@ -393,15 +817,12 @@ def inspect_bids_in_filter(
 
     # Process cache hits immediately (no network, no budget cost)
     for bid, items in cache_hit_bids:
-        bid_result, was_accepted, _ = _apply_rule(
-            bid, items, *_extract_ids(bid), True
-        )
         metrics["item_inspections_performed"] += 1
-        if was_accepted:
+        if _apply_rule(bid, items):
             metrics["item_inspections_accepted"] += 1
-            accepted.append(bid_result)
+            accepted.append(bid)
         else:
-            remaining.append(bid_result)
+            remaining.append(bid)
 
     # Fetch items in parallel via ThreadPoolExecutor
     if fetch_needed:
@@ -455,6 +876,7 @@ def inspect_bids_in_filter(
         else 0
     )
     metrics["item_fetch_avg_ms"] = round(avg_ms, 1)
+    _finalize_metrics(metrics, time.time() - phase_start, "sync")
 
     logger.info(
         f"D-01 Item inspection: "
@@ -1,12 +1,15 @@
 """jobs.cron.new_bids_notifier — Daily detection of new bids for in-app notification.
 
 STORY-445: New Bid Count Badge — runs once daily at 12:00 UTC (09:00 BRT) after
-morning ingestion. For each active user with profile_context, queries pncp_raw_bids
-and stores count in Redis key ``new_bids_count:{user_id}`` with 26h TTL.
+morning ingestion. For each active user with profile_context, sums the grouped
+(setor_id, uf) counts of pncp_raw_bids and stores the total in Redis key
+``new_bids_count:{user_id}`` with 26h TTL. A bid belongs to a sector when it
+matches the sector keywords full-text query, as in search_datalake.
 """
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 
 from jobs.cron.canary import _is_cb_or_connection_error
@@ -25,13 +28,81 @@ def _next_utc_hour(target_hour: int) -> float:
     return max(60.0, min((next_run - now).total_seconds(), 86400.0))
 
 
+def _profile_targets(profiles: list) -> tuple[dict, int, int]:
+    """Extract ``{user_id: (setor_id, ufs)}`` from profile_context.
+
+    Returns ``(targets, skipped, errors)``; profiles without a sector or UFs
+    are skipped, malformed rows counted as errors.
+    """
+    targets: dict = {}
+    skipped = 0
+    errors = 0
+    for profile in profiles:
+        try:
+            user_id = profile["id"]
+            ctx = profile.get("profile_context") or {}
+
+            # Support multiple field name conventions
+            setor_id = (
+                ctx.get("setor_id")
+                or ctx.get("setor")
+                or ctx.get("sector_id")
+            )
+            ufs_raw = (
+                ctx.get("ufs")
+                or ctx.get("ufs_selecionadas")
+                or ctx.get("states")
+                or []
+            )
+            ufs = list(ufs_raw) if isinstance(ufs_raw, (list, tuple)) else []
+
+            if not setor_id or not ufs:
+                skipped += 1
+                continue
+            targets[user_id] = (setor_id, ufs)
+
+        except Exception as e:
+            uid_prefix = profile.get("id", "?") if isinstance(profile, dict) else "?"
+            if isinstance(uid_prefix, str):
+                uid_prefix = uid_prefix[:8]
+            logger.warning(
+                "STORY-445: Error processing user %s: %s", uid_prefix, e
+            )
+            errors += 1
+    return targets, skipped, errors
+
+
+def _sector_queries(setor_ids: set) -> dict:
+    """``{setor_id: tsquery}`` from the sector keywords; unknown sectors omitted."""
+    from datalake_query import _build_tsquery
+    from sectors import SECTORS
+
+    queries: dict = {}
+    for setor_id in sorted(setor_ids):
+        sector = SECTORS.get(setor_id)
+        if sector is None or not sector.keywords:
+            logger.warning("STORY-445: Unknown sector %r in profile_context", setor_id)
+            continue
+        tsquery, _ = _build_tsquery(sorted(sector.keywords), None)
+        if tsquery:
+            queries[setor_id] = tsquery
+    return queries
+
+
 async def run_new_bids_notifier() -> dict:
     """Compute per-user new-bid counts and cache them in Redis.
 
     For each active profile (free_trial + smartlic_pro) that has a setor_id
     and UFs configured in profile_context, counts bids ingested in the last
     26 h and writes the count to ``new_bids_count:{user_id}`` in Redis.
+
+    Counts come from one grouped RPC (``count_new_bids_by_setor_uf``) per
+    run; each user's count is the sum of their UFs, so the cost no longer
+    grows with the number of profiles. All keys are written in a single
+    Redis pipeline.
     """
+    started = time.monotonic()
+    queries = 0
     try:
         from supabase_client import get_supabase, sb_execute
         from redis_pool import get_redis_pool
@@ -48,75 +119,89 @@ async def run_new_bids_notifier() -> dict:
             .in_("plan_type", ["free_trial", "smartlic_pro"])
             .not_.is_("profile_context", "null")
         )
+        queries += 1
         profiles = profiles_resp.data or []
 
         if not profiles:
+            _record_run(time.monotonic() - started, queries)
             return {"processed": 0, "reason": "no_active_profiles"}
 
+        targets, skipped, errors = _profile_targets(profiles)
         processed = 0
-        skipped = 0
-        errors = 0
-
-        for profile in profiles:
-            try:
-                user_id = profile["id"]
-                ctx = profile.get("profile_context") or {}
-
-                # Support multiple field name conventions
-                setor_id = (
-                    ctx.get("setor_id")
-                    or ctx.get("setor")
-                    or ctx.get("sector_id")
-                )
-                ufs_raw = (
-                    ctx.get("ufs")
-                    or ctx.get("ufs_selecionadas")
-                    or ctx.get("states")
-                    or []
-                )
-                ufs = list(ufs_raw) if isinstance(ufs_raw, (list, tuple)) else []
-
-                if not setor_id or not ufs:
-                    skipped += 1
-                    continue
-
-                # Count bids in last 26h matching user's sector + UFs
-                count_resp = await sb_execute(
-                    sb.table("pncp_raw_bids")
-                    .select("id", count="exact")
-                    .eq("setor_id", setor_id)
-                    .in_("uf", ufs)
-                    .gte("ingested_at", since)
-                    .eq("is_active", True)
-                )
-                count = count_resp.count or 0
-
-                if redis:
-                    await redis.setex(
-                        f"new_bids_count:{user_id}",
-                        NEW_BIDS_REDIS_TTL,
-                        str(count),
-                    )
-                processed += 1
 
-            except Exception as e:
-                uid_prefix = profile.get("id", "?")
-                if isinstance(uid_prefix, str):
-                    uid_prefix = uid_prefix[:8]
-                logger.warning(
-                    "STORY-445: Error processing user %s: %s", uid_prefix, e
+        sector_queries = _sector_queries({setor_id for setor_id, _ in targets.values()})
+        unknown = [uid for uid, (setor_id, _) in targets.items() if setor_id not in sector_queries]
+        for user_id in unknown:
+            del targets[user_id]
+        skipped += len(unknown)
+
+        if targets:
+            ufs = sorted({uf for _, user_ufs in targets.values() for uf in user_ufs})
+            sectors_param = [
+                {"setor_id": setor_id, "tsquery": tsquery}
+                for setor_id, tsquery in sector_queries.items()
+            ]
+
+            # One grouped count per (setor_id, uf) for the whole run
+            grouped_resp = await sb_execute(
+                sb.rpc(
+                    "count_new_bids_by_setor_uf",
+                    {"p_since": since, "p_sectors": sectors_param, "p_ufs": ufs},
                 )
-                errors += 1
+            )
+            queries += 1
+            grouped = {
+                (row["setor_id"], row["uf"]): int(row["bid_count"] or 0)
+                for row in grouped_resp.data or []
+            }
+
+            counts = {
+                user_id: sum(grouped.get((setor_id, uf), 0) for uf in set(user_ufs))
+                for user_id, (setor_id, user_ufs) in targets.items()
+            }
+
+            if redis:
+                try:
+                    pipe = redis.pipeline(transaction=False)
+                    for user_id, count in counts.items():
+                        pipe.setex(
+                            f"new_bids_count:{user_id}",
+                            NEW_BIDS_REDIS_TTL,
+                            str(count),
+                        )
+                    await pipe.execute()
+                    processed = len(counts)
+                except Exception as e:
+                    logger.warning(
+                        "STORY-445: Redis pipeline write failed for %d users: %s",
+                        len(counts),
+                        e,
+                    )
+                    errors += len(counts)
+            else:
+                processed = len(counts)
 
+        duration = time.monotonic() - started
+        _record_run(duration, queries)
         logger.info(
-            "STORY-445 new_bids_notifier: processed=%d, skipped=%d, errors=%d",
+            "STORY-445 new_bids_notifier: processed=%d, skipped=%d, errors=%d, "
+            "queries=%d, duration=%.2fs",
             processed,
             skipped,
             errors,
+            queries,
+            duration,
         )
-        return {"processed": processed, "skipped": skipped, "errors": errors}
+        return {
+            "processed": processed,
+            "skipped": skipped,
+            "errors": errors,
+            "queries": queries,
+            "duration_s": round(duration, 3),
+        }
 
     except Exception as e:
+        _record_run(time.monotonic() - started, queries)
         if _is_cb_or_connection_error(e):
             logger.warning(
                 "STORY-445: New bids notifier skipped (Supabase unavailable): %s", e
@@ -128,6 +213,13 @@ async def run_new_bids_notifier() -> dict:
         return {"processed": 0, "error": str(e)}
 
 
+def _record_run(duration: float, queries: int) -> None:
+    from metrics import NEW_BIDS_NOTIFIER_DURATION, NEW_BIDS_NOTIFIER_QUERIES
+
+    NEW_BIDS_NOTIFIER_DURATION.observe(duration)
+    NEW_BIDS_NOTIFIER_QUERIES.set(queries)
+
+
 async def _new_bids_notifier_loop() -> None:
     await asyncio.sleep(_next_utc_hour(NEW_BIDS_NOTIFIER_HOUR_UTC))
     while True:
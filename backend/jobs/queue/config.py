@@ -52,6 +52,20 @@ try:
                 _arq_cron(ingestion_incremental_job, hour=set(INGESTION_INCREMENTAL_HOURS), minute=0, timeout=3600),
                 _arq_cron(ingestion_purge_job, hour={INGESTION_FULL_CRAWL_HOUR_UTC + 2}, minute=0, timeout=600),
             ])
+            # D-01: item lists for newly ingested bids, after each incremental crawl
+            from ingestion.config import INGESTION_ITEMS_ENABLED, INGESTION_ITEMS_MINUTE
+            if INGESTION_ITEMS_ENABLED:
+                from ingestion.scheduler import ingestion_items_job
+                _worker_cron_jobs.append(
+                    _arq_cron(ingestion_items_job, hour=set(INGESTION_INCREMENTAL_HOURS), minute=INGESTION_ITEMS_MINUTE, timeout=3600),
+                )
+            # Local CEIS / CNEP mirror for SanctionsService, daily
+            from ingestion.config import SANCTIONS_MIRROR_ENABLED, SANCTIONS_MIRROR_HOUR_UTC
+            if SANCTIONS_MIRROR_ENABLED:
+                from ingestion.scheduler import sanctions_mirror_job
+                _worker_cron_jobs.append(
+                    _arq_cron(sanctions_mirror_job, hour={SANCTIONS_MIRROR_HOUR_UTC}, minute=0, timeout=1800),
+                )
             # Supplier contracts index: 3x/week full crawl (Mon/Wed/Fri 06 UTC) + same days incremental
             # CONTRACTS_CRAWL_WEEKDAYS env var: comma-separated weekday names (default: mon,wed,fri)
             # Set CONTRACTS_CRAWL_WEEKDAYS=mon,tues,wed,thurs,fri,sat,sun for daily crawl
@@ -125,6 +139,8 @@ class WorkerSettings:
         if _dl_enabled:
             from ingestion.scheduler import (
                 ingestion_full_crawl_job, ingestion_incremental_job, ingestion_purge_job,
+                ingestion_items_job,
+                sanctions_mirror_job,
                 ingestion_backfill_func,
                 contracts_full_crawl_func, contracts_incremental_func,
                 enrich_entities_func,
@@ -132,6 +148,8 @@ class WorkerSettings:
             )
             _ingestion_functions = [
                 ingestion_full_crawl_job, ingestion_incremental_job, ingestion_purge_job,
+                ingestion_items_job,
+                sanctions_mirror_job,
                 ingestion_backfill_func,
                 contracts_full_crawl_func, contracts_incremental_func,
                 enrich_entities_func,
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from typing import Any
 
@@ -45,8 +46,11 @@ async def excel_generation_job(ctx: dict, search_id: str, licitacoes: list, allo
     search_id_var.set(search_id)
     request_id_var.set(kwargs.get("_trace_id", search_id))
 
-    from excel import create_excel
-    from storage import upload_excel
+    from config import EXCEL_STREAMING_ENABLED, EXCEL_STREAMING_MIN_ROWS
+    from excel import create_excel, stream_excel_to_tempfile
+    from export_cache import get_or_create_artifact
+    from metrics import EXCEL_GENERATION_DURATION, EXCEL_ROWS_EXPORTED
+    from storage import upload_excel, upload_excel_file
     from progress import get_tracker
     from jobs.queue.result_store import persist_job_result, _update_results_excel_url
 
@@ -58,18 +62,42 @@ async def excel_generation_job(ctx: dict, search_id: str, licitacoes: list, allo
         return result
 
     download_url = None
+    artifact_reused = False
     try:
-        excel_buffer = create_excel(licitacoes)
-        storage_result = upload_excel(excel_buffer.read(), search_id)
+        def _produce_excel():
+            _start = time.monotonic()
+            if EXCEL_STREAMING_ENABLED and len(licitacoes) >= EXCEL_STREAMING_MIN_ROWS:
+                mode = "streaming"
+                excel_path = stream_excel_to_tempfile(licitacoes)
+                try:
+                    result = upload_excel_file(excel_path, search_id)
+                finally:
+                    os.unlink(excel_path)
+            else:
+                mode = "buffered"
+                excel_buffer = create_excel(licitacoes)
+                result = upload_excel(excel_buffer.read(), search_id)
+            EXCEL_GENERATION_DURATION.labels(mode=mode).observe(time.monotonic() - _start)
+            EXCEL_ROWS_EXPORTED.labels(mode=mode).observe(len(licitacoes))
+            return result
+
+        # Identical result sets (re-runs, cached searches) reuse the stored artifact
+        storage_result = await get_or_create_artifact("excel", licitacoes, _produce_excel)
         if storage_result:
             download_url = storage_result["signed_url"]
+            artifact_reused = storage_result.get("reused", False)
+            logger.info(
+                f"[Excel Job] artifact {'reused' if artifact_reused else 'generated'}: "
+                f"{storage_result.get('generation_s', 0.0):.2f}s "
+                f"{'saved' if artifact_reused else 'spent'}"
+            )
         else:
             logger.error("[Excel Job] Storage upload returned None")
     except Exception as e:
         logger.error(f"[Excel Job] Generation/upload failed: {e}", exc_info=True)
 
     excel_status = "ready" if download_url else "failed"
-    result = {"excel_status": excel_status, "download_url": download_url}
+    result = {"excel_status": excel_status, "download_url": download_url, "artifact_reused": artifact_reused}
     await persist_job_result(search_id, "excel_result", result)
     if download_url:
         await _update_results_excel_url(search_id, download_url)
@@ -126,7 +154,7 @@ async def daily_digest_job(ctx: dict) -> dict:
         return {"status": "db_unavailable", **stats}
 
     try:
-        from services.digest_service import get_digest_eligible_users, build_digest_for_user, mark_digest_sent
+        from services.digest_service import get_digest_eligible_users, build_digest_for_user, load_digest_batch, mark_digest_sent
         from templates.emails.digest import render_daily_digest_email
         from email_service import send_batch_email
 
@@ -136,13 +164,14 @@ async def daily_digest_job(ctx: dict) -> dict:
             DIGEST_JOB_DURATION.observe(time.monotonic() - start)
             return {"status": "no_users", **stats}
 
+        digest_batch = await load_digest_batch(eligible, db=db, max_items=DIGEST_MAX_PER_EMAIL)
         batch_messages = []
         user_ids_in_batch = []
 
         for user_prefs in eligible:
             user_id = user_prefs["user_id"]
             try:
-                digest = await build_digest_for_user(user_id=user_id, db=db, max_items=DIGEST_MAX_PER_EMAIL)
+                digest = await build_digest_for_user(user_id=user_id, db=db, max_items=DIGEST_MAX_PER_EMAIL, batch=digest_batch)
                 if not digest or not digest.get("email"):
                     stats["emails_skipped"] += 1
                     DIGEST_EMAILS_SENT.labels(status="skipped").inc()
@@ -143,7 +143,8 @@ async def store_pending_review_bids(search_id: str, bids: list[dict], sector_nam
         return False
     from config import PENDING_REVIEW_TTL_SECONDS
     try:
-        payload = json.dumps({"bids": bids, "sector_name": sector_name, "stored_at": time.time()})
+        from bid_record import json_default
+        payload = json.dumps({"bids": bids, "sector_name": sector_name, "stored_at": time.time()}, default=json_default)
         await redis.setex(f"{_PENDING_REVIEW_KEY_PREFIX}{search_id}", PENDING_REVIEW_TTL_SECONDS, payload)
         logger.info(f"STORY-354: Stored {len(bids)} pending review bids for search_id={search_id}")
         return True
@@ -157,8 +158,9 @@ async def store_zero_match_results(search_id: str, results: list[dict]) -> bool:
     redis = await get_redis_pool()
     if redis is None:
         return False
+    from bid_record import json_default
     try:
-        await redis.setex(f"{_ZERO_MATCH_KEY_PREFIX}{search_id}", 3600, json.dumps({"results": results, "stored_at": time.time()}))
+        await redis.setex(f"{_ZERO_MATCH_KEY_PREFIX}{search_id}", 3600, json.dumps({"results": results, "stored_at": time.time()}, default=json_default))
         logger.info(f"CRIT-059: Stored {len(results)} zero-match results for search_id={search_id}")
         return True
     except Exception as e:
@@ -15,11 +15,12 @@ async def _persist_search_results_to_redis(search_id: str, response) -> None:
         return
     try:
         from config import RESULTS_REDIS_TTL
+        from pipeline.helpers import encode_search_response
         key = f"smartlic:results:{search_id}"
-        data = response.model_dump(mode="json") if hasattr(response, "model_dump") else (response if isinstance(response, dict) else None)
-        if data is None:
+        encoded = encode_search_response(response)
+        if encoded is None:
             return
-        await redis.setex(key, RESULTS_REDIS_TTL, json.dumps(data, default=str))
+        await redis.setex(key, RESULTS_REDIS_TTL, encoded)
         logger.debug(f"STORY-363: Results stored in Redis L2: {key}")
     except Exception as e:
         logger.warning(f"STORY-363: Failed to persist results to Redis L2: {e}")
@@ -33,11 +34,12 @@ async def _persist_search_results_to_supabase(search_id: str, user_id: str, resp
         db = get_supabase()
         if not db:
             return
-        data = response.model_dump(mode="json") if hasattr(response, "model_dump") else (response if isinstance(response, dict) else None)
-        if data is None:
+        from pipeline.helpers import encode_search_response
+        encoded = encode_search_response(response)
+        if encoded is None:
             return
         expires_at = datetime.now(timezone.utc) + timedelta(hours=RESULTS_SUPABASE_TTL_HOURS)
-        await sb_execute(db.table("search_results_l3").upsert({"search_id": search_id, "user_id": user_id, "results": json.dumps(data, default=str), "expires_at": expires_at.isoformat()}, on_conflict="search_id"))
+        await sb_execute(db.table("search_results_l3").upsert({"search_id": search_id, "user_id": user_id, "results": encoded.decode(), "expires_at": expires_at.isoformat()}, on_conflict="search_id"))
         logger.debug(f"STORY-363: Results stored in Supabase L3: {search_id}")
     except Exception as e:
         logger.warning(f"STORY-363: Failed to persist results to Supabase L3: {e}")
@@ -120,9 +122,12 @@ async def search_job(ctx: dict, search_id: str, request_data: dict, user_data: d
         total_results = response.total_filtrado if response else 0
 
         if response:
-            await persist_job_result(search_id, "search_result", response.model_dump())
-            await _persist_search_results_to_redis(search_id, response)
-            await _persist_search_results_to_supabase(search_id, user_id, response)
+            # Serialize once; the same JSON goes to all three result stores
+            from pipeline.helpers import encode_search_response
+            encoded = encode_search_response(response)
+            await persist_job_result(search_id, "search_result", encoded.decode())
+            await _persist_search_results_to_redis(search_id, encoded)
+            await _persist_search_results_to_supabase(search_id, user_id, encoded)
             await _update_search_session(search_id, user_id, response)
 
         tracker = await get_tracker(search_id)
@@ -22,13 +22,15 @@ from typing import Any
 import json
 import os
 
-from openai import OpenAI
-
 from schemas import ResumoLicitacoes, ResumoEstrategico, Recomendacao
 from excel import parse_datetime
+from utils.lazy_import import lazy_attr
 
 import re as _re_llm
 
+# openai SDK is imported on the first summary call, not at worker boot
+OpenAI = lazy_attr("openai", "OpenAI")
+
 
 def _fmt_brl(value: float) -> str:
     """Format float as pt-BR currency (e.g., 360.366,00)."""
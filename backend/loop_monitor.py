@@ -0,0 +1,168 @@
+"""Event-loop lag monitor and blocking-call detector for API workers.
+
+Synchronous I/O on the event loop (``.execute()`` on the Supabase client,
+the sync Redis client, CPU-heavy loops) stalls every request on the worker,
+SSE heartbeats included. The monitor makes those stalls visible:
+
+- A ticker task wakes up every ``LOOP_LAG_INTERVAL_S`` and records how late
+  it was woken (the loop lag) in ``smartlic_event_loop_lag_seconds``; ticks
+  later than ``LOOP_BLOCKING_THRESHOLD_MS`` also count in
+  ``smartlic_event_loop_blocked_total``.
+- ``get_loop_lag_summary()`` gives p50/p99/max over the last
+  ``LOOP_LAG_WINDOW_S`` seconds for ``GET /health``.
+- With ``LOOP_BLOCKING_DETECTOR_ENABLED=true`` or asyncio debug mode on, a
+  watchdog thread logs the loop thread's stack while a tick is overdue by
+  more than the threshold — i.e. the stack of the call that is blocking,
+  taken while it blocks. asyncio's own slow-callback warning (debug mode
+  only) is aligned to the same threshold.
+
+Registered as a background task in startup/lifespan.py.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """Loop-lag ticker for the running event loop, with an optional stack watchdog."""
+
+    def __init__(self, interval_s: float, window_s: float, threshold_s: float, detector: bool = False):
+        self.interval_s = interval_s
+        self.window_s = window_s
+        self.threshold_s = threshold_s
+        self.detector = detector
+        self.blocked = 0
+        self.stalls_reported = 0
+        self._samples: deque[tuple[float, float]] = deque()
+        self._expected_wake: Optional[float] = None
+        self._loop_thread_id: Optional[int] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def run(self) -> None:
+        """Tick until cancelled."""
+        from metrics import EVENT_LOOP_BLOCKED_TOTAL, EVENT_LOOP_LAG_SECONDS
+
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if loop.get_debug():
+            self.detector = True
+            loop.slow_callback_duration = self.threshold_s
+        if self.detector:
+            self._start_watchdog()
+
+        try:
+            while True:
+                self._expected_wake = time.monotonic() + self.interval_s
+                await asyncio.sleep(self.interval_s)
+                lag = max(0.0, time.monotonic() - self._expected_wake)
+                EVENT_LOOP_LAG_SECONDS.observe(lag)
+                if lag >= self.threshold_s:
+                    EVENT_LOOP_BLOCKED_TOTAL.inc()
+                self.record(lag)
+        finally:
+            self._stop.set()
+
+    def record(self, lag: float, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._samples.append((now, lag))
+        if lag >= self.threshold_s:
+            self.blocked += 1
+            logger.warning("Event loop blocked for %.0f ms (threshold %.0f ms)", lag * 1000, self.threshold_s * 1000)
+        cutoff = now - self.window_s
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def summary(self) -> dict[str, Any]:
+        """Rolling lag summary over the last ``window_s`` seconds."""
+        lags = sorted(lag for _, lag in self._samples)
+        if not lags:
+            return {"enabled": True, "samples": 0, "window_s": self.window_s}
+
+        def _pct(q: float) -> float:
+            return round(lags[min(len(lags) - 1, int(q * len(lags)))] * 1000, 1)
+
+        blocked_in_window = sum(1 for lag in lags if lag >= self.threshold_s)
+        return {
+            "enabled": True,
+            "status": "blocked" if blocked_in_window else "ok",
+            "window_s": self.window_s,
+            "samples": len(lags),
+            "lag_p50_ms": _pct(0.50),
+            "lag_p99_ms": _pct(0.99),
+            "lag_max_ms": round(lags[-1] * 1000, 1),
+            "last_lag_ms": round(self._samples[-1][1] * 1000, 1),
+            "blocked_in_window": blocked_in_window,
+            "blocked_total": self.blocked,
+            "threshold_ms": round(self.threshold_s * 1000),
+            "blocking_detector": self.detector,
+            "stalls_reported": self.stalls_reported,
+        }
+
+    # ------------------------------------------------------------------
+    # Blocking-call detector
+    # ------------------------------------------------------------------
+
+    def _start_watchdog(self) -> None:
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info("Loop blocking-call detector enabled (threshold %.0f ms)", self.threshold_s * 1000)
+
+    def _watch(self) -> None:
+        reported_wake = None
+        while not self._stop.wait(self.threshold_s / 2):
+            expected_wake = self._expected_wake
+            if expected_wake is None or expected_wake == reported_wake:
+                continue
+            overdue = time.monotonic() - expected_wake
+            if overdue >= self.threshold_s:
+                reported_wake = expected_wake  # one stack per stall
+                self.check_stall(overdue)
+
+    def check_stall(self, overdue: float) -> Optional[str]:
+        """Log the loop thread's current stack for a stall of ``overdue`` seconds."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        stack = "".join(traceback.format_stack(frame))
+        self.stalls_reported += 1
+        logger.warning(
+            "Event loop blocked for >= %.0f ms — loop thread stack:\n%s", overdue * 1000, stack,
+        )
+        return stack
+
+
+_monitor: Optional[LoopMonitor] = None
+
+
+async def run_loop_monitor() -> None:
+    """Background task entry point (task_registry, is_coroutine=True)."""
+    global _monitor
+    from config import (
+        LOOP_BLOCKING_DETECTOR_ENABLED, LOOP_BLOCKING_THRESHOLD_MS,
+        LOOP_LAG_INTERVAL_S, LOOP_LAG_WINDOW_S,
+    )
+
+    _monitor = LoopMonitor(
+        interval_s=LOOP_LAG_INTERVAL_S,
+        window_s=LOOP_LAG_WINDOW_S,
+        threshold_s=LOOP_BLOCKING_THRESHOLD_MS / 1000,
+        detector=LOOP_BLOCKING_DETECTOR_ENABLED,
+    )
+    await _monitor.run()
+
+
+def get_loop_lag_summary() -> dict[str, Any]:
+    """Summary for /health; ``{"enabled": False}`` when the monitor is not running."""
+    if _monitor is None:
+        return {"enabled": False}
+    return _monitor.summary()
@@ -1105,6 +1105,38 @@ WORKER_MEMORY_BYTES = _create_gauge(
     labelnames=["worker_pid"],
 )
 
+WORKER_TIME_TO_READY_SECONDS = _create_gauge(
+    "smartlic_worker_time_to_ready_seconds",
+    "Seconds from worker process start to lifespan ready",
+    labelnames=["prefork_warmup"],
+)
+
+# Event-loop lag (loop_monitor.py): how late the monitor's ticker wakes up
+EVENT_LOOP_LAG_SECONDS = _create_histogram(
+    "smartlic_event_loop_lag_seconds",
+    "Event-loop lag measured by the loop monitor ticker",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+)
+
+EVENT_LOOP_BLOCKED_TOTAL = _create_counter(
+    "smartlic_event_loop_blocked_total",
+    "Loop monitor ticks delayed by more than LOOP_BLOCKING_THRESHOLD_MS",
+)
+
+# Batched sanctions checks (SanctionsService.check_batch)
+SANCTIONS_LOOKUPS_TOTAL = _create_counter(
+    "smartlic_sanctions_lookups_total",
+    "Unique CNPJs checked for sanctions, by the tier that answered",
+    labelnames=["tier"],  # mirror | redis | api | unavailable | budget_exceeded
+)
+
+SANCTIONS_CHECKS_PER_SEARCH = _create_histogram(
+    "smartlic_sanctions_checks_per_search",
+    "Sanctions checks per batch: unique CNPJs and those that needed the API",
+    labelnames=["kind"],  # unique | api
+    buckets=[0, 1, 5, 10, 25, 50, 100, 250, 500],
+)
+
 
 # ============================================================================
 # DEBT-010 DB-031: Database table size monitoring
@@ -1232,6 +1264,195 @@ FEEDBACK_NEGATIVE_TOTAL = _create_counter(
     labelnames=["setor"],
 )
 
+# ============================================================================
+# Excel export generation
+# ============================================================================
+
+EXCEL_GENERATION_DURATION = _create_histogram(
+    "smartlic_excel_generation_duration_seconds",
+    "Excel generation + upload wall time by mode (buffered=create_excel, streaming=write-only)",
+    labelnames=["mode"],
+    buckets=[0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60],
+)
+
+EXCEL_ROWS_EXPORTED = _create_histogram(
+    "smartlic_excel_rows_exported",
+    "Rows written per Excel export",
+    labelnames=["mode"],
+    buckets=[10, 100, 500, 1000, 2500, 5000, 10000, 25000, 50000],
+)
+
+# Content-addressed export artifact cache (export_cache.py)
+EXPORT_ARTIFACT_REQUESTS = _create_counter(
+    "smartlic_export_artifact_requests_total",
+    "Export artifact lookups by outcome (hit=reused from storage, miss=generated)",
+    labelnames=["kind", "outcome"],
+)
+
+EXPORT_ARTIFACT_TIME_SAVED = _create_counter(
+    "smartlic_export_artifact_time_saved_seconds_total",
+    "Generation time avoided by reusing cached export artifacts",
+    labelnames=["kind"],
+)
+
+# ============================================================================
+# SSE progress emission (ProgressTracker)
+# ============================================================================
+
+PROGRESS_REDIS_OPS_PER_SEARCH = _create_histogram(
+    "smartlic_progress_redis_ops_per_search",
+    "Redis work per search for progress events (round_trips=network calls, commands=queued commands)",
+    labelnames=["unit"],
+    buckets=[5, 10, 20, 40, 80, 160, 320, 640],
+)
+
+PROGRESS_EVENTS_COALESCED = _create_counter(
+    "smartlic_progress_events_coalesced_total",
+    "High-frequency progress events superseded by a newer one inside the coalescing window",
+    labelnames=["stage"],
+)
+
+# Cross-worker SSE delivery (sse_multiplexer.py)
+SSE_MUX_SUBSCRIBERS = _create_gauge(
+    "smartlic_sse_mux_subscribers",
+    "SSE connections served by this worker's stream multiplexer",
+)
+
+SSE_MUX_STREAMS = _create_gauge(
+    "smartlic_sse_mux_streams",
+    "Distinct progress streams in this worker's multiplexed XREAD",
+)
+
+SSE_REDIS_READS = _create_counter(
+    "smartlic_sse_redis_reads_total",
+    "XREAD calls issued for SSE progress delivery (mux=shared blocking read, poll=per-connection poll)",
+    labelnames=["mode"],
+)
+
+SSE_EVENT_DELIVERY_LATENCY = _create_histogram(
+    "smartlic_sse_event_delivery_latency_seconds",
+    "Time from XADD (stream entry id) to dispatch to the SSE connection",
+    labelnames=["mode"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5],
+)
+
+# ============================================================================
+# PNCP pagination (AsyncPNCPClient._fetch_single_modality)
+# ============================================================================
+
+PNCP_UF_FETCH_DURATION = _create_histogram(
+    "smartlic_pncp_uf_fetch_duration_seconds",
+    "Wall time to fetch all modalities of one UF (fanout=sequential|parallel page fetch)",
+    labelnames=["uf", "fanout"],
+    buckets=[1, 2, 5, 10, 15, 20, 30, 45, 60, 90],
+)
+
+PNCP_MODALITY_FETCHES = _create_counter(
+    "smartlic_pncp_modality_fetches_total",
+    "(UF, modalidade) fetch outcomes — truncated/timeout_partial over total gives the truncation rate",
+    labelnames=["outcome", "fanout"],
+)
+
+# ============================================================================
+# PNCP adaptive rate control (rate_limiter.AIMDRateController)
+# ============================================================================
+
+PNCP_ALLOWED_RATE = _create_gauge(
+    "smartlic_pncp_allowed_rate",
+    "Current AIMD-allowed PNCP request rate (req/s, shared across workers)",
+)
+
+PNCP_THROTTLE_EVENTS = _create_counter(
+    "smartlic_pncp_throttle_events_total",
+    "PNCP throttle signals fed to the AIMD controller",
+    labelnames=["reason"],  # 429, 5xx, timeout, latency
+)
+
+PNCP_EFFECTIVE_REQUEST_RATE = _create_gauge(
+    "smartlic_pncp_effective_request_rate",
+    "PNCP requests actually issued by this worker (req/s over the last window)",
+)
+
+# ============================================================================
+# Shared rate limiter (rate_limiter.RedisRateLimiter)
+# ============================================================================
+
+RATE_LIMITER_REDIS_CALLS = _create_counter(
+    "smartlic_rate_limiter_redis_calls_total",
+    "Redis round-trips spent by the shared token bucket",
+    labelnames=["limiter", "mode"],  # mode: eval (per request) | lease
+)
+
+RATE_LIMITER_ACQUIRES = _create_counter(
+    "smartlic_rate_limiter_acquires_total",
+    "Token acquisitions — redis_calls / acquires = Redis calls per request",
+    labelnames=["limiter", "mode"],
+)
+
+# ============================================================================
+# Datalake hybrid fetch (pipeline.stages.execute)
+# ============================================================================
+
+DATALAKE_HYBRID_SEARCHES = _create_counter(
+    "smartlic_datalake_hybrid_searches_total",
+    "Hybrid datalake searches by live fetch plan",
+    labelnames=["plan"],  # datalake_only, live_delta, live_full
+)
+
+DATALAKE_HYBRID_LIVE_PAGES_SAVED = _create_histogram(
+    "smartlic_datalake_hybrid_live_pages_saved",
+    "Estimated PNCP pages per search served from the datalake instead of live (lower bound)",
+    buckets=[0, 1, 5, 10, 25, 50, 100, 250, 500],
+)
+
+# ============================================================================
+# New bids notifier (jobs.cron.new_bids_notifier)
+# ============================================================================
+
+NEW_BIDS_NOTIFIER_DURATION = _create_histogram(
+    "smartlic_new_bids_notifier_duration_seconds",
+    "Daily new-bids notifier run duration",
+    buckets=[0.5, 1, 2, 5, 10, 30, 60, 120, 300],
+)
+
+NEW_BIDS_NOTIFIER_QUERIES = _create_gauge(
+    "smartlic_new_bids_notifier_queries",
+    "Supabase queries issued by the last new-bids notifier run",
+)
+
+# ============================================================================
+# Item inspection (item_inspector)
+# ============================================================================
+
+ITEM_INSPECTION_LOOKUPS = _create_counter(
+    "smartlic_item_inspection_lookups_total",
+    "Gray-zone item list lookups by source",
+    labelnames=["result", "mode"],  # result: memory_hit|redis_hit|fetched; mode: async|sync
+)
+
+ITEM_INSPECTION_THROUGHPUT = _create_histogram(
+    "smartlic_item_inspection_throughput",
+    "Gray-zone bids inspected per second in one filter pass",
+    labelnames=["mode"],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500],
+)
+
+# ============================================================================
+# PNCP fetch planner (clients.pncp.fetch_planner)
+# ============================================================================
+
+PNCP_FETCH_PLANS = _create_counter(
+    "smartlic_pncp_fetch_plans_total",
+    "Live PNCP fetch plans built, by history source and deadline scaling",
+    labelnames=["source", "scaled"],  # source: history|mixed|heuristic; scaled: true|false
+)
+
+PNCP_FETCH_PLAN_ESTIMATED_SECONDS = _create_histogram(
+    "smartlic_pncp_fetch_plan_estimated_seconds",
+    "Planned wall time of a live PNCP fetch (all UF batches)",
+    buckets=[5, 10, 20, 30, 45, 60, 90, 120, 180],
+)
+
 # ============================================================================
 # ASGI app factory for /metrics endpoint
 # ============================================================================
@@ -26,9 +26,11 @@ from typing import Optional, Dict, Any
 import httpx
 from cryptography.fernet import Fernet
 from fastapi import HTTPException
-from google_auth_oauthlib.flow import Flow
-
 from supabase_client import get_supabase, sb_execute
+from utils.lazy_import import lazy_attr
+
+# google_auth_oauthlib pulls in google.auth + requests-oauthlib; load on first OAuth flow
+Flow = lazy_attr("google_auth_oauthlib.flow", "Flow")
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,7 @@ import json
 import logging
 from datetime import datetime, timezone
 
+from bid_record import json_default
 from redis_pool import get_fallback_cache
 from cache.manager import (
     _dedup_cross_uf,
@@ -175,7 +176,7 @@ def _write_cache(cache_key: str, data: dict) -> None:
     """Write search results to InMemoryCache with TTL."""
     cache = get_fallback_cache()
     try:
-        cache.setex(cache_key, SEARCH_CACHE_TTL, json.dumps(data, default=str))
+        cache.setex(cache_key, SEARCH_CACHE_TTL, json.dumps(data, default=json_default))
     except Exception as e:
         logger.warning(f"Failed to write search cache: {e}")
 
@@ -4,6 +4,7 @@ Standalone utility functions for bid processing, coverage metrics,
 and confidence mapping. No pipeline state or class dependencies.
 """
 
+import json
 import logging
 from datetime import datetime, timezone as _tz
 
@@ -158,6 +159,27 @@ def _convert_to_licitacao_items(licitacoes: list[dict]) -> list[LicitacaoItem]:
     return items
 
 
+def encode_search_response(response) -> bytes | None:
+    """Serialize a search response to JSON once, for every result store.
+
+    Accepts a BuscaResponse (pydantic-core model_dump_json, no intermediate
+    dict), an already-encoded payload (returned as bytes) or a plain dict.
+    Field names, not aliases: the stored format predates this helper and
+    readers of the stores depend on it.
+    """
+    if isinstance(response, bytes):
+        return response
+    if isinstance(response, str):
+        return response.encode()
+    if hasattr(response, "model_dump_json"):
+        return response.model_dump_json().encode()
+    if hasattr(response, "model_dump"):
+        response = response.model_dump(mode="json")
+    if isinstance(response, dict):
+        return json.dumps(response, default=str).encode()
+    return None
+
+
 def _build_coverage_metrics(ctx) -> tuple[int, list[UfStatusDetail]]:
     """Build coverage_pct and ufs_status_detail from search context."""
     requested_ufs = list(ctx.request.ufs)
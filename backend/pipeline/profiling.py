@@ -0,0 +1,338 @@
+"""Opt-in per-stage profiling for the search pipeline.
+
+A profile is started for a search when the request asks for it
+(``BuscaRequest.profile`` — honored for admin/master users only, checked
+once ``pipeline.validate`` has resolved the roles) or when the search is
+sampled (``SEARCH_PROFILE_SAMPLE_RATE``, default 0). For each stage run
+through ``traced_stage`` it records:
+
+- wall_ms:          stage wall time
+- cpu_ms:           process CPU time (all threads, so to_thread work counts)
+- loop_cpu_ms:      CPU time of the event-loop thread
+- loop_lag_max_ms / loop_lag_mean_ms: event-loop lag seen by a 50 ms ticker
+- alloc_peak_kb:    tracemalloc peak above the stage's starting allocation
+- phases:           aplicar_todos_filtros sub-phase wall/CPU (filter stage)
+
+CPU and allocation figures are process-wide: other searches running on the
+same worker are included. Treat them as an upper bound for one search —
+that is why profiling is opt-in and sampled rather than always on.
+
+The finished profile is logged as one ``search_profile`` JSON line, attached
+to the stage spans as ``profile.*`` attributes and stored for
+``GET /v1/admin/search-trace/{search_id}`` (Redis, in-memory fallback).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_PROFILE_KEY_PREFIX = "smartlic:search_profile:"
+_LAG_INTERVAL_S = 0.05
+_MEMORY_STORE_MAX = 200
+
+_current_profile: contextvars.ContextVar[Optional["SearchProfile"]] = contextvars.ContextVar(
+    "search_profile", default=None,
+)
+
+# Profiles kept when Redis is unavailable (bounded, oldest evicted first).
+_memory_store: "OrderedDict[str, dict]" = OrderedDict()
+
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+@dataclass
+class SearchProfile:
+    """Profile of one search: per-stage measurements plus filter phases."""
+
+    search_id: str
+    reason: str  # "request" | "sampled" | "benchmark"
+    started_at: float = field(default_factory=time.time)
+    total_ms: Optional[float] = None
+    stages: dict[str, dict] = field(default_factory=dict)
+    # Phases recorded by aplicar_todos_filtros, claimed by the enclosing stage
+    pending_phases: list[tuple[str, float, float]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("pending_phases")
+        return data
+
+
+def current_profile() -> Optional[SearchProfile]:
+    return _current_profile.get()
+
+
+def start_profile(ctx) -> Optional[SearchProfile]:
+    """Start profiling ``ctx`` if requested or sampled; returns the profile or None."""
+    from config import SEARCH_PROFILE_SAMPLE_RATE
+
+    if getattr(ctx.request, "profile", False) is True:
+        reason = "request"
+    elif SEARCH_PROFILE_SAMPLE_RATE > 0 and random.random() < SEARCH_PROFILE_SAMPLE_RATE:
+        reason = "sampled"
+    else:
+        return None
+
+    profile = SearchProfile(search_id=getattr(ctx.request, "search_id", None) or "", reason=reason)
+    ctx.profile = profile
+    _current_profile.set(profile)
+    _tracemalloc_acquire()
+    return profile
+
+
+async def finish_profile(ctx) -> None:
+    """Close the profile of ``ctx`` (if any): log it and store it for the trace endpoint."""
+    profile = getattr(ctx, "profile", None)
+    if not isinstance(profile, SearchProfile):
+        return
+    ctx.profile = None
+    _current_profile.set(None)
+    _tracemalloc_release()
+
+    profile.total_ms = round((time.time() - profile.started_at) * 1000, 1)
+    data = profile.to_dict()
+    logger.info(json.dumps({"event": "search_profile", **data}, default=str))
+    try:
+        await store_profile(profile.search_id, data)
+    except Exception as e:
+        logger.warning(f"search_profile: store failed for {profile.search_id}: {e}")
+
+
+def _drop_unauthorized(ctx) -> None:
+    """Requested profiles are admin/master only; sampled ones are kept for everyone."""
+    profile = ctx.profile
+    if profile is not None and profile.reason == "request" and not (ctx.is_admin or ctx.is_master):
+        logger.debug("search_profile: dropping profile requested by non-admin user")
+        ctx.profile = None
+        _current_profile.set(None)
+        _tracemalloc_release()
+
+
+# ---------------------------------------------------------------------------
+# Stage measurement
+# ---------------------------------------------------------------------------
+
+
+@asynccontextmanager
+async def profile_stage(ctx, span_name: str, span):
+    """Measure one stage of a profiled search; no-op when ``ctx`` is not profiled."""
+    profile = getattr(ctx, "profile", None)
+    if not isinstance(profile, SearchProfile):
+        yield
+        return
+
+    sampler = _LagSampler()
+    await sampler.start()
+    traced = tracemalloc.is_tracing()
+    if traced:
+        tracemalloc.reset_peak()
+        alloc_start = tracemalloc.get_traced_memory()[0]
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    loop_cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        loop_cpu = time.thread_time() - loop_cpu_start
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        alloc_peak = tracemalloc.get_traced_memory()[1] - alloc_start if traced else None
+        lags = sampler.stop()
+
+        stage = {
+            "wall_ms": round(wall * 1000, 1),
+            "cpu_ms": round(cpu * 1000, 1),
+            "loop_cpu_ms": round(loop_cpu * 1000, 1),
+            "loop_lag_max_ms": round(max(lags, default=0.0) * 1000, 1),
+            "loop_lag_mean_ms": round(sum(lags) / len(lags) * 1000, 1) if lags else 0.0,
+            "alloc_peak_kb": round(alloc_peak / 1024, 1) if alloc_peak is not None else None,
+        }
+        phases = _claim_phases(profile)
+        if phases:
+            stage["phases"] = phases
+        profile.stages[span_name] = stage
+
+        span.set_attribute("profile.cpu_ms", stage["cpu_ms"])
+        span.set_attribute("profile.loop_lag_max_ms", stage["loop_lag_max_ms"])
+        if stage["alloc_peak_kb"] is not None:
+            span.set_attribute("profile.alloc_peak_kb", stage["alloc_peak_kb"])
+        for name, timing in (phases or {}).items():
+            span.set_attribute(f"profile.phase.{name}_ms", timing["wall_ms"])
+
+        if span_name == "pipeline.validate":
+            _drop_unauthorized(ctx)
+
+
+class _LagSampler:
+    """Event-loop lag: how late each ``_LAG_INTERVAL_S`` tick wakes up (seconds)."""
+
+    def __init__(self) -> None:
+        self.lags: list[float] = []
+        self._loop = asyncio.get_running_loop()
+        self._deadline = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._deadline = self._loop.time() + _LAG_INTERVAL_S
+        self._task = asyncio.create_task(self._run())
+        await asyncio.sleep(0)  # arm the first tick before the stage runs
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(max(0.0, self._deadline - self._loop.time()))
+            self.lags.append(max(0.0, self._loop.time() - self._deadline))
+            self._deadline = self._loop.time() + _LAG_INTERVAL_S
+
+    def stop(self) -> list[float]:
+        """Cancel the ticker; a tick overdue at stop time (blocked stage tail) counts too."""
+        self._task.cancel()
+        overdue = self._loop.time() - self._deadline
+        if overdue > 0:
+            self.lags.append(overdue)
+        return self.lags
+
+
+def _claim_phases(profile: SearchProfile) -> dict[str, dict]:
+    """Sum the pending filter phases by name (the relaxed retry runs the filter twice)."""
+    phases: dict[str, dict] = {}
+    for name, wall, cpu in profile.pending_phases:
+        entry = phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+        entry["wall_ms"] = round(entry["wall_ms"] + wall * 1000, 1)
+        entry["cpu_ms"] = round(entry["cpu_ms"] + cpu * 1000, 1)
+    profile.pending_phases.clear()
+    return phases
+
+
+def _tracemalloc_acquire() -> None:
+    """Start tracemalloc for the first active profile (unless someone else already did)."""
+    global _tracemalloc_users, _tracemalloc_owned
+    from config import SEARCH_PROFILE_TRACEMALLOC
+
+    if not SEARCH_PROFILE_TRACEMALLOC:
+        return
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+
+
+def _tracemalloc_release() -> None:
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0:
+            return
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
+# ---------------------------------------------------------------------------
+# Filter sub-phases
+# ---------------------------------------------------------------------------
+
+
+class PhaseClock:
+    """Lap timer for aplicar_todos_filtros: ``lap(name)`` closes the phase that just ran."""
+
+    __slots__ = ("_profile", "_wall", "_cpu")
+
+    def __init__(self, profile: SearchProfile) -> None:
+        self._profile = profile
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+
+    def lap(self, name: str) -> None:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        self._profile.pending_phases.append((name, wall - self._wall, cpu - self._cpu))
+        self._wall, self._cpu = wall, cpu
+
+
+class _NoopPhaseClock:
+    __slots__ = ()
+
+    def lap(self, name: str) -> None:
+        pass
+
+
+_NOOP_CLOCK = _NoopPhaseClock()
+
+
+def phase_clock():
+    """PhaseClock for the current profiled search, or a shared no-op clock.
+
+    Called from the filter thread: ``asyncio.to_thread`` copies the context,
+    so the profile set by the pipeline is visible here. CPU is thread time
+    of the filter thread.
+    """
+    profile = _current_profile.get()
+    return PhaseClock(profile) if profile is not None else _NOOP_CLOCK
+
+
+@contextmanager
+def record_phases(label: str = "benchmark"):
+    """Collect aplicar_todos_filtros phases outside a search (benchmarks).
+
+    Yields a SearchProfile whose ``pending_phases`` fill up as the filter
+    runs in this context; nothing is logged or stored.
+    """
+    profile = SearchProfile(search_id=label, reason="benchmark")
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+
+async def store_profile(search_id: str, data: dict) -> None:
+    """Keep the profile for the admin trace endpoint (Redis with TTL, else memory)."""
+    if not search_id:
+        return
+    from config import SEARCH_PROFILE_TTL_S
+    from redis_pool import get_redis_pool
+
+    redis = await get_redis_pool()
+    if redis is not None:
+        try:
+            await redis.setex(f"{_PROFILE_KEY_PREFIX}{search_id}", SEARCH_PROFILE_TTL_S, json.dumps(data, default=str))
+            return
+        except Exception as e:
+            logger.warning(f"search_profile: Redis store failed for {search_id}: {e}")
+
+    _memory_store[search_id] = data
+    _memory_store.move_to_end(search_id)
+    while len(_memory_store) > _MEMORY_STORE_MAX:
+        _memory_store.popitem(last=False)
+
+
+async def get_search_profile(search_id: str) -> Optional[dict]:
+    """Stored profile for ``search_id`` or None."""
+    from redis_pool import get_redis_pool
+
+    redis = await get_redis_pool()
+    if redis is not None:
+        raw = await redis.get(f"{_PROFILE_KEY_PREFIX}{search_id}")
+        if raw:
+            return json.loads(raw)
+    return _memory_store.get(search_id)
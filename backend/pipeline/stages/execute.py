@@ -57,6 +57,9 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
     # DATALAKE: Shortcut to local DB query when DATALAKE_QUERY_ENABLED=true.
     # Returns records in identical format to _normalize_item() so all downstream
     # stages (filter, LLM, Excel) work without modification.
+    # DATALAKE_HYBRID_ENABLED: serve up to the ingestion checkpoint from the
+    # datalake and fetch only the window after it live (merged after the fetch).
+    _live_delta = None
     try:
         from ingestion.config import DATALAKE_QUERY_ENABLED
         if DATALAKE_QUERY_ENABLED:
@@ -95,7 +98,16 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
             logger.info(
                 f"[stage_execute] Datalake returned {len(ctx.licitacoes_raw)} records"
             )
-            if len(ctx.licitacoes_raw) == 0:
+            from config import get_feature_flag
+            if get_feature_flag("DATALAKE_HYBRID_ENABLED"):
+                _live_delta = await _plan_datalake_hybrid(ctx, request)
+            if _live_delta is not None:
+                # Hybrid: keep datalake rows aside, fetch the delta window live
+                ctx._datalake_base_results = ctx.licitacoes_raw
+                ctx.licitacoes_raw = []
+                ctx.cache_status = None
+                ctx.source_stats_data = []
+            elif len(ctx.licitacoes_raw) == 0:
                 logger.warning(
                     "[stage_execute] Datalake returned 0 records — falling through to live API"
                 )
@@ -116,7 +128,9 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
     cache_key = _compute_cache_key(request)
 
     # AC10: Respect force_fresh flag
-    if not request.force_fresh:
+    # Hybrid datalake: the search cache holds full-window results — skip it and
+    # fetch only the live delta.
+    if not request.force_fresh and _live_delta is None:
         # CRIT-051 AC2: Try composed per-UF cache first (multi-UF requests)
         composed = _read_cache_composed(request)
         if composed and composed.get("licitacoes"):
@@ -258,7 +272,7 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
     enable_multi_source = os.getenv("ENABLE_MULTI_SOURCE", "true").lower() == "true"
     ctx.source_stats_data = None
 
-    use_parallel = len(request.ufs) > 1
+    use_parallel = len((_live_delta or request).ufs) > 1
     status_value = request.status.value if request.status else None
     modalidades_to_fetch = request.modalidades if request.modalidades else None
 
@@ -286,21 +300,46 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
 
     # CRIT-051 AC3: Hybrid fetch — only fetch missing UFs if partial cache hit
     _hybrid_ufs = getattr(ctx, "_missing_ufs", None)
+    # Hybrid datalake: live fetch restricted to the delta window / UFs
+    _fetch_request = _live_delta or request
 
     if enable_multi_source:
         await _execute_multi_source(
-            pipeline, ctx, request, deps, modalidades_to_fetch, status_value,
+            pipeline, ctx, _fetch_request, deps, modalidades_to_fetch, status_value,
             uf_progress_callback, FETCH_TIMEOUT,
             uf_status_callback=uf_status_callback,
             ufs_override=_hybrid_ufs,
         )
     else:
         await _execute_pncp_only(
-            pipeline, ctx, request, deps, use_parallel, modalidades_to_fetch,
+            pipeline, ctx, _fetch_request, deps, use_parallel, modalidades_to_fetch,
             status_value, uf_progress_callback, FETCH_TIMEOUT,
             uf_status_callback=uf_status_callback,
         )
 
+    # Hybrid datalake: merge the datalake rows behind the live delta (live wins dedup)
+    _datalake_base = ctx._datalake_base_results
+    if _datalake_base is not None:
+        from cache.manager import _dedup_cross_uf
+        _live_count = len(ctx.licitacoes_raw)
+        ctx.licitacoes_raw = _dedup_cross_uf(ctx.licitacoes_raw + _datalake_base)
+        logger.info(
+            f"[stage_execute] Hybrid datalake merge — {len(_datalake_base)} datalake + "
+            f"{_live_count} live (from {_live_delta.data_inicial}) "
+            f"= {len(ctx.licitacoes_raw)} after dedup"
+        )
+        ctx._datalake_base_results = None
+        if ctx.response_state == "empty_failure" and ctx.licitacoes_raw:
+            # Live delta failed but the datalake covers the window up to the
+            # checkpoint — partial results, not a failure
+            ctx.response_state = "degraded"
+            ctx.is_partial = True
+            ctx.degradation_guidance = (
+                f"Fontes de dados governamentais estão temporariamente indisponíveis. "
+                f"Exibindo licitações da base local; publicações a partir de "
+                f"{_live_delta.data_inicial} podem estar ausentes."
+            )
+
     fetch_elapsed = sync_time_module.time() - ctx.start_time
     logger.info(f"Fetched {len(ctx.licitacoes_raw)} raw bids in {fetch_elapsed:.2f}s")
     FETCH_DURATION.labels(source="pipeline").observe(fetch_elapsed)
@@ -336,7 +375,6 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
                 ufs_completed=list(ctx.succeeded_ufs or ctx.request.ufs),
                 is_final=False,
             )
-            ctx.tracker.add_partial_licitacoes(ctx.licitacoes_raw)
 
     # CRIT-051 AC3: Merge cached results with fresh results (hybrid fetch)
     _composed_cached = getattr(ctx, "_composed_cached_results", None)
@@ -444,6 +482,100 @@ async def stage_execute(pipeline, ctx: SearchContext) -> None:
                 logger.warning(f"Supabase cache write failed (non-fatal): {e}")
 
 
+def _plan_live_delta(
+    ufs: list[str],
+    modalidades: list[int],
+    data_inicial: str,
+    data_final: str,
+    checkpoints: dict,
+) -> tuple[list[str], str | None]:
+    """Hybrid datalake: which UFs still need a live fetch, and from which date.
+
+    A UF is covered by the datalake up to its oldest checkpoint among the
+    requested modalidades. Its live window starts on that day (the crawl may
+    have stopped mid-day; overlapping records are removed by dedup), or on
+    ``data_inicial`` when a modalidade was never crawled or the checkpoint
+    predates the window. UFs checkpointed after ``data_final`` need no live
+    fetch. The returned start is the earliest among live UFs, so one live
+    fetch covers them all.
+    """
+    from datetime import date
+
+    window_start = date.fromisoformat(data_inicial)
+    window_end = date.fromisoformat(data_final)
+    live_ufs: list[str] = []
+    starts = []
+    for uf in ufs:
+        dates = [checkpoints.get((uf, m)) for m in modalidades]
+        covered = min(dates) if dates and all(dates) else None
+        if covered is not None and covered > window_end:
+            continue
+        live_ufs.append(uf)
+        starts.append(covered if covered is not None and covered > window_start else window_start)
+    if not live_ufs:
+        return [], None
+    return live_ufs, min(starts).isoformat()
+
+
+def _estimate_pages_saved(records: list[dict], live_ufs: list[str], delta_start: str | None) -> int:
+    """Lower bound of live PNCP pages replaced by datalake rows.
+
+    Counts datalake rows outside the live window per (UF, modalidade) in
+    PNCP pages. Datalake rows are already narrowed by full-text search, so
+    the pages a full live fetch would have read are at least this many.
+    """
+    from math import ceil
+    from config import PNCP_MAX_PAGE_SIZE
+
+    live = set(live_ufs)
+    per_combo: dict[tuple, int] = {}
+    for r in records:
+        uf = r.get("uf")
+        published = (r.get("dataPublicacaoFormatted") or "")[:10]
+        if uf in live and delta_start and published >= delta_start:
+            continue
+        key = (uf, r.get("codigoModalidadeContratacao"))
+        per_combo[key] = per_combo.get(key, 0) + 1
+    return sum(ceil(n / PNCP_MAX_PAGE_SIZE) for n in per_combo.values())
+
+
+async def _plan_datalake_hybrid(ctx, request):
+    """Return the live delta request for a hybrid datalake search, or None.
+
+    None means the datalake alone covers the window — or the checkpoints
+    could not be read, in which case the search behaves as datalake-only.
+    """
+    from config import DEFAULT_MODALIDADES
+    from ingestion.checkpoint import get_checkpoints
+    from metrics import DATALAKE_HYBRID_LIVE_PAGES_SAVED, DATALAKE_HYBRID_SEARCHES
+
+    modalidades = list(request.modalidades or DEFAULT_MODALIDADES)
+    checkpoints = await get_checkpoints(list(request.ufs), modalidades)
+    if checkpoints is None:
+        return None
+
+    live_ufs, delta_start = _plan_live_delta(
+        request.ufs, modalidades, request.data_inicial, request.data_final, checkpoints,
+    )
+    pages_saved = _estimate_pages_saved(ctx.licitacoes_raw, live_ufs, delta_start)
+    if not live_ufs:
+        plan = "datalake_only"
+    elif delta_start == request.data_inicial:
+        plan = "live_full"
+    else:
+        plan = "live_delta"
+    DATALAKE_HYBRID_SEARCHES.labels(plan=plan).inc()
+    DATALAKE_HYBRID_LIVE_PAGES_SAVED.observe(pages_saved)
+    logger.info(
+        f"[stage_execute] Hybrid datalake plan={plan} live_ufs={live_ufs} "
+        f"delta={delta_start}..{request.data_final} pages_saved>={pages_saved}"
+    )
+
+    if not live_ufs:
+        return None
+    return request.model_copy(update={"ufs": live_ufs, "data_inicial": delta_start})
+
+
 async def _execute_multi_source(
     pipeline, ctx, request, deps, modalidades_to_fetch, status_value,
     uf_progress_callback, fetch_timeout, uf_status_callback=None,
@@ -714,6 +846,10 @@ async def _execute_multi_source(
                             ctx.truncated_ufs = []
                         ctx.truncated_ufs.extend(adapter.truncated_ufs)
 
+        pncp_adapter = adapters.get("PNCP")
+        if getattr(pncp_adapter, "fetch_plan", None):
+            ctx.fetch_plan = pncp_adapter.fetch_plan
+
         if any(truncation_details.values()):
             ctx.truncation_details = truncation_details
             logger.warning(
@@ -1038,6 +1174,7 @@ async def _execute_pncp_only(
                 if isinstance(fetch_result, ParallelFetchResult):
                     ctx.succeeded_ufs = fetch_result.succeeded_ufs
                     ctx.failed_ufs = fetch_result.failed_ufs
+                    ctx.fetch_plan = fetch_result.fetch_plan
                     # CRIT-052 AC4: Propagate canary telemetry to context
                     if fetch_result.canary_result:
                         ctx._pncp_canary_result = fetch_result.canary_result
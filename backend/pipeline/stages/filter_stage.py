@@ -101,6 +101,7 @@ async def stage_filter(pipeline, ctx: SearchContext) -> None:
         custom_terms=ctx.custom_terms or None,  # STORY-267: pass custom terms for quality parity
         on_progress=_on_filter_progress,
         pncp_degraded="PNCP" in (ctx.sources_degraded or []),  # CRIT-054 AC4
+        event_loop=asyncio.get_running_loop(),  # item inspection runs on the app loop
     )
     # Let pending progress events flush before continuing
     await asyncio.sleep(0)
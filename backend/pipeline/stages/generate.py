@@ -5,6 +5,8 @@ Extracted from SearchPipeline.stage_generate + _enrich_with_sanctions (DEBT-015
 
 import asyncio
 import logging
+import os
+import time
 from datetime import datetime, timezone as _tz
 
 from search_context import SearchContext
@@ -25,7 +27,10 @@ _tracer = get_tracer("search_pipeline")
 
 
 import quota  # noqa: E402
-from storage import upload_excel  # noqa: E402
+from config import EXCEL_STREAMING_ENABLED, EXCEL_STREAMING_MIN_ROWS  # noqa: E402
+from export_cache import get_or_create_artifact  # noqa: E402
+from metrics import EXCEL_GENERATION_DURATION, EXCEL_ROWS_EXPORTED  # noqa: E402
+from storage import upload_excel, upload_excel_file  # noqa: E402
 from llm import gerar_resumo, gerar_resumo_fallback  # noqa: E402
 
 
@@ -344,19 +349,45 @@ async def stage_generate(pipeline, ctx: SearchContext) -> None:
                 "excel.input_count": len(ctx.licitacoes_filtradas),
             }) as excel_span:
                 logger.debug("Generating Excel report")
-                # STORY-290-patch: offload CPU-bound Excel generation to thread pool
-                excel_buffer = await asyncio.to_thread(deps.create_excel, ctx.licitacoes_filtradas)
-                excel_bytes = excel_buffer.read()
-
-                with optional_span(_tracer, "generate.upload"):
-                    # STORY-290-patch: offload sync storage upload to thread pool
-                    storage_result = await asyncio.to_thread(upload_excel, excel_bytes, ctx.request.search_id)
+                _lics = ctx.licitacoes_filtradas
+                _search_id = ctx.request.search_id
+
+                def _produce_excel():
+                    _excel_start = time.monotonic()
+                    if EXCEL_STREAMING_ENABLED and len(_lics) >= EXCEL_STREAMING_MIN_ROWS:
+                        # Large export: write-only workbook streamed to a temp file,
+                        # then streamed to storage (no full workbook/bytes in memory).
+                        _excel_mode = "streaming"
+                        from excel import stream_excel_to_tempfile
+                        excel_path = stream_excel_to_tempfile(_lics)
+                        try:
+                            with optional_span(_tracer, "generate.upload"):
+                                result = upload_excel_file(excel_path, _search_id)
+                        finally:
+                            os.unlink(excel_path)
+                    else:
+                        _excel_mode = "buffered"
+                        excel_bytes = deps.create_excel(_lics).read()
+                        with optional_span(_tracer, "generate.upload"):
+                            result = upload_excel(excel_bytes, _search_id)
+                    EXCEL_GENERATION_DURATION.labels(mode=_excel_mode).observe(time.monotonic() - _excel_start)
+                    EXCEL_ROWS_EXPORTED.labels(mode=_excel_mode).observe(len(_lics))
+                    excel_span.set_attribute("excel.mode", _excel_mode)
+                    return result
+
+                # STORY-290-patch: generation + sync storage upload run in the thread
+                # pool (inside get_or_create_artifact). Identical result sets reuse
+                # the stored artifact instead of regenerating it.
+                storage_result = await get_or_create_artifact("excel", _lics, _produce_excel)
+                excel_span.set_attribute(
+                    "excel.artifact_reused", bool(storage_result and storage_result.get("reused"))
+                )
 
                 if storage_result:
                     ctx.download_url = storage_result["signed_url"]
                     logger.debug(
-                        f"Excel uploaded to storage: {storage_result['file_path']} "
-                        f"(signed URL valid for {storage_result['expires_in']}s)"
+                        f"Excel uploaded to storage: {storage_result.get('file_path')} "
+                        f"(signed URL valid for {storage_result.get('expires_in')}s)"
                     )
                     ctx.excel_base64 = None
                     ctx.excel_status = "ready"
@@ -546,10 +577,18 @@ async def _enrich_with_sanctions(ctx: SearchContext) -> None:
         # Batch check
         service = SanctionsService()
         try:
-            reports = await service.check_companies(unique_cnpjs)
+            reports, stats = await service.check_batch(unique_cnpjs)
         finally:
             await service.close()
 
+        logger.info(
+            f"[SANCTIONS] search_id={ctx.request.search_id} {stats.unique} CNPJs: "
+            f"mirror={stats.mirror_hits} redis={stats.redis_hits + stats.memory_hits} "
+            f"api={stats.api_checks} unavailable={stats.unavailable} "
+            f"(budget_exceeded={stats.budget_exceeded}) hit_ratio={stats.hit_ratio:.2f} "
+            f"in {stats.duration_ms:.0f}ms"
+        )
+
         # Map results back to LicitacaoItems
         enriched = 0
         for cnpj, indices in cnpj_map.items():
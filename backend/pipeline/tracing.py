@@ -21,15 +21,21 @@ def validate_stage_outputs(stage_name: str, ctx) -> None:
 
 
 async def traced_stage(tracer, ctx, span_name: str, stage_fn):
-    """AC11-AC12: Run a pipeline stage wrapped in a child span with timing and counts."""
+    """AC11-AC12: Run a pipeline stage wrapped in a child span with timing and counts.
+
+    Profiled searches (pipeline/profiling.py) also get CPU, loop-lag and
+    allocation figures for the stage as ``profile.*`` span attributes.
+    """
     from telemetry import optional_span
+    from pipeline.profiling import profile_stage
 
     stage_start = time.time()
     items_in = len(ctx.licitacoes_raw) if hasattr(ctx, "licitacoes_raw") and ctx.licitacoes_raw else 0
 
     with optional_span(tracer, span_name) as span:
         try:
-            result = await stage_fn(ctx)
+            async with profile_stage(ctx, span_name, span):
+                result = await stage_fn(ctx)
             validate_stage_outputs(span_name, ctx)
             duration_ms = int((time.time() - stage_start) * 1000)
             span.set_attribute("duration_ms", duration_ms)
@@ -500,6 +500,9 @@ class PNCPCache:
 
 # Singleton instances for application-wide use
 _timeout_manager = AdaptiveTimeoutManager()
+# Per-page latency of successful /contratacoes/publicacao requests, keyed by UF.
+# Feeds the PNCP fetch planner (clients.pncp.fetch_planner).
+_page_latency_tracker = AdaptiveTimeoutManager()
 _circuit_breaker = CircuitBreaker("pncp_api")
 _cache = PNCPCache(ttl_seconds=3600)  # 1 hour
 
@@ -509,6 +512,11 @@ def get_timeout_manager() -> AdaptiveTimeoutManager:
     return _timeout_manager
 
 
+def get_page_latency_tracker() -> AdaptiveTimeoutManager:
+    """Get global per-page latency tracker instance."""
+    return _page_latency_tracker
+
+
 def get_circuit_breaker() -> CircuitBreaker:
     """Get global circuit breaker instance."""
     return _circuit_breaker
@@ -19,12 +19,15 @@ The mode is determined by REDIS_URL environment variable and connection health.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+from bid_record import json_default
+from config import PROGRESS_COALESCE_WINDOW_MS
 from redis_pool import get_redis_pool, is_redis_available
 
 logger = logging.getLogger(__name__)
@@ -59,6 +62,50 @@ _TERMINAL_STAGES = frozenset({
     "complete", "error", "degraded", "refresh_available", "search_complete",
     "shutdown",  # DEBT-124 AC5: Graceful shutdown terminates SSE connections
 })
+def partial_item_id(lic: dict) -> str:
+    """Stable ID of a bid for partial_data deltas (matches LicitacaoItem.pncp_id)."""
+    for field_name in ("pncp_id", "codigoCompra", "numeroControlePNCP", "id"):
+        value = lic.get(field_name)
+        if value:
+            return str(value)
+    return hashlib.sha1(json.dumps(lic, sort_keys=True, default=json_default).encode("utf-8")).hexdigest()
+
+
+def project_partial_item(lic: dict) -> dict:
+    """Compact card projection of a bid for partial_data events.
+
+    Accepts legacy PNCP-shaped dicts (objetoCompra, nomeOrgao, ...) and
+    already-converted LicitacaoItem dicts. Only the fields the results card
+    renders are kept; the full record is fetched on demand.
+    """
+    def _first(*keys: str) -> Any:
+        for key in keys:
+            value = lic.get(key)
+            if value not in (None, ""):
+                return value
+        return None
+
+    def _date(*keys: str) -> Optional[str]:
+        value = _first(*keys)
+        return str(value)[:10] if value else None
+
+    objeto = _first("objeto", "objetoCompra")
+    return {
+        "pncp_id": partial_item_id(lic),
+        "objeto": str(objeto)[:300] if objeto else "",
+        "orgao": _first("orgao", "nomeOrgao") or "",
+        "uf": lic.get("uf") or "",
+        "municipio": lic.get("municipio"),
+        "valor": _first("valor", "valorTotalEstimado"),
+        "modalidade": _first("modalidade", "modalidadeNome"),
+        "data_abertura": _date("data_abertura", "dataAberturaProposta"),
+        "data_encerramento": _date("data_encerramento", "dataEncerramentoProposta"),
+        "source": _first("source", "_source"),
+    }
+
+
+# UF statuses that end a UF's fetch — never held back by coalescing
+_UF_FINAL_STATUSES = frozenset({"success", "failed", "recovered"})
 # STORY-276 AC1: TTL for stream key after terminal event (5 minutes)
 _STREAM_EXPIRE_TTL = 300
 
@@ -67,6 +114,12 @@ _REPLAY_LIST_TTL = 600       # 10 minutes TTL for replay list
 _REPLAY_MAX_EVENTS = 200     # HARDEN-017 AC1: reduced from 1000 (ring buffer max)
 _REPLAY_KEY_PREFIX = "sse_events:"  # Redis list key prefix
 
+# Delta-encoded partial_data: per-search hashes of what was sent (card
+# projection) and of the full records, for replay snapshots and on-demand fetch.
+_PARTIAL_CARD_KEY_PREFIX = "sse_partial:"
+_PARTIAL_FULL_KEY_PREFIX = "sse_partial_full:"
+_PARTIAL_MAX_INLINE = 500  # max items per partial_data frame
+
 
 @dataclass
 class ProgressEvent:
@@ -120,8 +173,20 @@ class ProgressTracker:
         # STORY-297: Monotonic event counter + local history for replay
         self._event_counter = 0
         self._event_history: list[tuple[int, dict]] = []
-        # CRIT-071: Accumulated partial licitacoes for progressive SSE
-        self.partial_licitacoes: list[dict] = []
+        # CRIT-071: Partial bids for progressive SSE, keyed by partial_item_id.
+        # _partial_items holds full records (on-demand fetch), _partial_sent the
+        # card projection last sent to clients (delta baseline).
+        self._partial_items: dict[str, dict] = {}
+        self._partial_sent: dict[str, dict] = {}
+        # Coalescing state for high-frequency events (key -> latest event)
+        self._coalesce_pending: dict[str, ProgressEvent] = {}
+        self._coalesce_last: dict[str, float] = {}
+        self._coalesce_timer: Optional[asyncio.Task] = None
+        self._coalesce_timer_flushing = False  # timer past its sleep, dispatching
+        # Redis usage per search (observed once on the terminal event)
+        self._redis_round_trips = 0
+        self._redis_commands = 0
+        self._redis_usage_recorded = False
 
     async def emit(self, stage: str, progress: int, message: str, **detail: Any) -> None:
         """Push a progress event to the queue and/or Redis pub/sub channel."""
@@ -133,61 +198,76 @@ class ProgressTracker:
         )
         await self._emit_event(event)
 
-    async def _publish_to_redis(self, event: ProgressEvent) -> None:
-        """Publish event to Redis Stream (STORY-276 AC1).
+    def _queue_stream_commands(self, pipe: Any, event: ProgressEvent, event_dict: dict) -> int:
+        """Queue the Redis Stream append for ``event`` (STORY-276 AC1).
 
         Uses XADD to append to an append-only log instead of Pub/Sub PUBLISH.
         This ensures events are persisted and can be replayed by late subscribers.
+        Returns the number of commands queued.
         """
-        redis = await get_redis_pool()
-        if redis is None:
-            return
-
         stream_key = f"smartlic:progress:{self.search_id}:stream"
-        try:
-            event_dict = event.to_dict()
-            fields: Dict[str, str] = {
-                "stage": event.stage,
-                "progress": str(event.progress),
-                "message": event.message,
-                "detail_json": json.dumps(event.detail),
-            }
-            # Preserve correlation fields
-            for key in ("trace_id", "search_id", "request_id"):
-                if key in event_dict:
-                    fields[key] = event_dict[key]
-
-            await redis.xadd(stream_key, fields)
-
-            # AC1: Set EXPIRE after terminal events (5 min cleanup)
-            if event.stage in _TERMINAL_STAGES:
-                await redis.expire(stream_key, _STREAM_EXPIRE_TTL)
+        fields: Dict[str, str] = {
+            "stage": event.stage,
+            "progress": str(event.progress),
+            "message": event.message,
+            "detail_json": json.dumps(event.detail),
+        }
+        # Preserve correlation fields
+        for key in ("trace_id", "search_id", "request_id"):
+            if key in event_dict:
+                fields[key] = event_dict[key]
 
-        except Exception as e:
-            from metrics import STATE_STORE_ERRORS
-            STATE_STORE_ERRORS.labels(store="tracker", operation="write").inc()
-            logger.warning(f"Failed to publish progress event to Redis Stream: {e}")
+        pipe.xadd(stream_key, fields)
+
+        # AC1: Set EXPIRE after terminal events (5 min cleanup)
+        if event.stage in _TERMINAL_STAGES:
+            pipe.expire(stream_key, _STREAM_EXPIRE_TTL)
+            return 2
+        return 1
 
-    async def _store_replay_event(self, event_id: int, event_dict: dict) -> None:
-        """STORY-297 AC2: Store event in Redis list for Last-Event-ID replay.
+    def _queue_replay_commands(self, pipe: Any, event_id: int, event_dict: dict) -> int:
+        """STORY-297 AC2: Queue the replay-list write for Last-Event-ID resumption.
 
-        Uses RPUSH + LTRIM (ring buffer) with 10min TTL.
-        Graceful failure — replay is best-effort, not critical path.
+        RPUSH + LTRIM (ring buffer) with 10min TTL. Returns the number of
+        commands queued.
         """
+        replay_key = f"{_REPLAY_KEY_PREFIX}{self.search_id}"
+        pipe.rpush(replay_key, json.dumps({"id": event_id, "data": event_dict}))
+        # AC5: Ring buffer — keep max _REPLAY_MAX_EVENTS entries
+        pipe.ltrim(replay_key, -_REPLAY_MAX_EVENTS, -1)
+        # AC2: 10min TTL
+        pipe.expire(replay_key, _REPLAY_LIST_TTL)
+        return 3
+
+    async def _write_to_redis(
+        self, event: ProgressEvent, event_id: int, event_dict: dict, replay: bool = True,
+    ) -> None:
+        """Write replay entry + stream entry for one event in a single round-trip.
+
+        All commands go through one non-transactional pipeline, so an event
+        costs one network round-trip instead of 4-5 sequential calls.
+        Graceful failure — progress delivery is best-effort, not critical path.
+        """
+        if not replay and not self._use_redis:
+            return
         redis = await get_redis_pool()
         if redis is None:
             return
 
-        replay_key = f"{_REPLAY_KEY_PREFIX}{self.search_id}"
         try:
-            entry = json.dumps({"id": event_id, "data": event_dict})
-            await redis.rpush(replay_key, entry)
-            # AC5: Ring buffer — keep max 1000 entries
-            await redis.ltrim(replay_key, -_REPLAY_MAX_EVENTS, -1)
-            # AC2: 10min TTL
-            await redis.expire(replay_key, _REPLAY_LIST_TTL)
+            pipe = redis.pipeline(transaction=False)
+            commands = 0
+            if replay:
+                commands += self._queue_replay_commands(pipe, event_id, event_dict)
+            if self._use_redis:
+                commands += self._queue_stream_commands(pipe, event, event_dict)
+            await pipe.execute()
+            self._redis_round_trips += 1
+            self._redis_commands += commands
         except Exception as e:
-            logger.warning(f"STORY-297: Failed to store replay event: {e}")
+            from metrics import STATE_STORE_ERRORS
+            STATE_STORE_ERRORS.labels(store="tracker", operation="write").inc()
+            logger.warning(f"Failed to write progress event to Redis: {e}")
 
     def get_events_after(self, after_id: int) -> list[tuple[int, dict]]:
         """STORY-297 AC3: Get local events with id > after_id for replay."""
@@ -197,8 +277,14 @@ class ProgressTracker:
         """STORY-297: Common event dispatch — counter, queue, replay storage, Redis stream.
 
         All emit_* methods that create ProgressEvent directly should call this
-        instead of manually doing queue.put + _publish_to_redis.
+        instead of manually doing queue.put + Redis writes. Pending coalesced
+        updates are flushed first so events keep their relative order.
         """
+        if self._coalesce_pending or self._coalesce_timer is not None:
+            await self._flush_coalesced(cancel_timer=True)
+        await self._dispatch(event)
+
+    async def _dispatch(self, event: ProgressEvent) -> None:
         self._event_counter += 1
         event_id = self._event_counter
 
@@ -214,22 +300,92 @@ class ProgressTracker:
 
         await self.queue.put(event)
 
+        event_dict = event.to_dict()
+
         # HARDEN-017 AC2/AC3: partial_data events are emitted via queue (real-time SSE)
         # but excluded from replay history (they are the largest events, 10KB+)
         if event.stage == "partial_data":
-            if self._use_redis:
-                await self._publish_to_redis(event)
+            await self._write_to_redis(event, event_id, event_dict, replay=False)
             return
 
-        event_dict = event.to_dict()
         self._event_history.append((event_id, event_dict))
         if len(self._event_history) > _REPLAY_MAX_EVENTS:
             self._event_history = self._event_history[-_REPLAY_MAX_EVENTS:]
 
-        await self._store_replay_event(event_id, event_dict)
+        await self._write_to_redis(event, event_id, event_dict)
+
+        if event.stage in _TERMINAL_STAGES:
+            self._record_redis_usage()
 
-        if self._use_redis:
-            await self._publish_to_redis(event)
+    async def _emit_coalesced(self, key: str, event: ProgressEvent, final: bool = False) -> None:
+        """Emit a high-frequency update, coalescing bursts on a short window.
+
+        The first update for ``key`` goes out immediately (leading edge). Later
+        updates inside PROGRESS_COALESCE_WINDOW_MS replace each other and the
+        latest one is emitted when the window closes, so clients still see the
+        current state without one Redis write per item. ``final`` updates
+        (e.g. 200/200, UF success) are emitted immediately and supersede any
+        pending update for the same key.
+        """
+        window_s = PROGRESS_COALESCE_WINDOW_MS / 1000
+        now = time.monotonic()
+        superseded = self._coalesce_pending.pop(key, None)
+        if superseded is not None:
+            from metrics import PROGRESS_EVENTS_COALESCED
+            PROGRESS_EVENTS_COALESCED.labels(stage=superseded.stage).inc()
+
+        if final or window_s <= 0 or now - self._coalesce_last.get(key, float("-inf")) >= window_s:
+            self._coalesce_last[key] = now
+            await self._emit_event(event)
+            return
+
+        self._coalesce_pending[key] = event
+        if self._coalesce_timer is None or self._coalesce_timer.done():
+            self._coalesce_timer = asyncio.create_task(self._coalesce_flush_after(window_s))
+
+    async def _coalesce_flush_after(self, delay_s: float) -> None:
+        await asyncio.sleep(delay_s)
+        self._coalesce_timer_flushing = True
+        try:
+            await self._flush_coalesced()
+        finally:
+            self._coalesce_timer_flushing = False
+
+    async def _flush_coalesced(self, cancel_timer: bool = False) -> None:
+        """Emit all pending coalesced updates in arrival order.
+
+        With ``cancel_timer`` a sleeping flush timer is cancelled, but one that
+        is already dispatching is awaited instead: the events it popped would
+        otherwise be lost, and they must go out before the caller's event.
+        """
+        timer = self._coalesce_timer
+        if cancel_timer and timer is not None and not timer.done() and timer is not asyncio.current_task():
+            if self._coalesce_timer_flushing:
+                try:
+                    await asyncio.shield(timer)
+                except Exception as e:
+                    logger.debug(f"Coalesced flush failed for {self.search_id}: {e}")
+            else:
+                timer.cancel()
+        self._coalesce_timer = None if cancel_timer else self._coalesce_timer
+        pending, self._coalesce_pending = self._coalesce_pending, {}
+        now = time.monotonic()
+        for key, event in pending.items():
+            self._coalesce_last[key] = now
+            await self._dispatch(event)
+
+    def _record_redis_usage(self) -> None:
+        """Observe Redis round-trips/commands spent on this search's progress events."""
+        if self._redis_usage_recorded or not self._redis_round_trips:
+            return
+        self._redis_usage_recorded = True
+        from metrics import PROGRESS_REDIS_OPS_PER_SEARCH
+        PROGRESS_REDIS_OPS_PER_SEARCH.labels(unit="round_trips").observe(self._redis_round_trips)
+        PROGRESS_REDIS_OPS_PER_SEARCH.labels(unit="commands").observe(self._redis_commands)
+        logger.debug(
+            f"Progress Redis usage for {self.search_id}: {self._event_counter} events, "
+            f"{self._redis_round_trips} round-trips, {self._redis_commands} commands"
+        )
 
     async def emit_uf_complete(self, uf: str, items_count: int) -> None:
         """Emit progress for a single UF completion."""
@@ -246,9 +402,23 @@ class ProgressTracker:
             items_found=items_count,
         )
 
+    @property
+    def partial_licitacoes(self) -> list[dict]:
+        """CRIT-071: Full partial bid records accumulated so far (deduplicated)."""
+        return list(self._partial_items.values())
+
     def add_partial_licitacoes(self, licitacoes: list[dict]) -> None:
-        """CRIT-071: Append-only accumulation of partial bid data."""
-        self.partial_licitacoes.extend(licitacoes)
+        """CRIT-071: Accumulate partial bid data (upsert by bid ID)."""
+        for lic in licitacoes:
+            self._partial_items[partial_item_id(lic)] = lic
+
+    def get_partial_item(self, item_id: str) -> Optional[dict]:
+        """Full record of a bid previously sent as a partial_data card."""
+        return self._partial_items.get(item_id)
+
+    def get_partial_snapshot(self) -> list[dict]:
+        """Card projections of every partial bid sent so far (delta baseline)."""
+        return list(self._partial_sent.values())
 
     async def emit_partial_data(
         self,
@@ -257,25 +427,49 @@ class ProgressTracker:
         ufs_completed: list[str],
         is_final: bool = False,
     ) -> None:
-        """CRIT-071: Emit partial_data SSE event with actual bid data.
+        """CRIT-071: Emit partial_data SSE event with the bids new or changed since the last one.
+
+        Each bid is sent as a compact card projection (project_partial_item);
+        bids whose projection is unchanged since the previous partial_data
+        event are omitted, so overlapping batches (raw -> filtered) only cost
+        their delta. Full records stay available via get_partial_item and
+        GET /buscar-progress/{search_id}/item.
 
-        If the payload exceeds 500 items, sends a truncated event with count
-        and metadata only to avoid oversized SSE frames.
+        If the delta exceeds 500 items, sends a truncated event with count
+        and metadata only to avoid oversized SSE frames; those bids stay
+        pending and are included in the next delta.
         """
-        _MAX_INLINE = 500
+        self.add_partial_licitacoes(licitacoes)
+
+        delta: dict[str, dict] = {}
+        new_count = 0
+        for lic in licitacoes:
+            item_id = partial_item_id(lic)
+            card = project_partial_item(lic)
+            previous = self._partial_sent.get(item_id)
+            if previous != card:
+                delta[item_id] = card
+                new_count += previous is None
+
         detail: dict[str, Any] = {
             "batch_index": batch_index,
             "ufs_completed": ufs_completed,
             "is_final": is_final,
             "total_items": len(licitacoes),
+            "delta": True,
+            "new_count": new_count,
+            "changed_count": len(delta) - new_count,
         }
 
-        if len(licitacoes) > _MAX_INLINE:
+        if len(delta) > _PARTIAL_MAX_INLINE:
             detail["truncated"] = True
             detail["licitacoes"] = []
         else:
             detail["truncated"] = False
-            detail["licitacoes"] = licitacoes
+            detail["licitacoes"] = list(delta.values())
+            self._partial_sent.update(delta)
+            await self._store_partial_items(delta)
+        detail["items_total"] = len(self._partial_sent)
 
         event = ProgressEvent(
             stage="partial_data",
@@ -285,6 +479,32 @@ class ProgressTracker:
         )
         await self._emit_event(event)
 
+    async def _store_partial_items(self, delta: dict[str, dict]) -> None:
+        """Persist sent cards + full records so other workers can replay/serve them."""
+        if not delta:
+            return
+        redis = await get_redis_pool()
+        if redis is None:
+            return
+
+        card_key = f"{_PARTIAL_CARD_KEY_PREFIX}{self.search_id}"
+        full_key = f"{_PARTIAL_FULL_KEY_PREFIX}{self.search_id}"
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.hset(card_key, mapping={
+                item_id: json.dumps(card, default=str) for item_id, card in delta.items()
+            })
+            pipe.hset(full_key, mapping={
+                item_id: json.dumps(self._partial_items[item_id], default=json_default) for item_id in delta
+            })
+            pipe.expire(card_key, _REPLAY_LIST_TTL)
+            pipe.expire(full_key, _REPLAY_LIST_TTL)
+            await pipe.execute()
+            self._redis_round_trips += 1
+            self._redis_commands += 4
+        except Exception as e:
+            logger.warning(f"Failed to store partial items in Redis: {e}")
+
     async def emit_uf_status(self, uf: str, status: str, **detail: Any) -> None:
         """Emit per-UF status event for real-time tracking grid.
 
@@ -295,13 +515,14 @@ class ProgressTracker:
             status: One of "pending", "fetching", "retrying", "success", "failed", "recovered"
             **detail: Additional details (count, attempt, max, reason)
         """
-        await self.emit(
+        event = ProgressEvent(
             stage="uf_status",
-            progress=-1,  # UF status events don't map to overall progress
+            progress=0,  # UF status events don't map to overall progress
             message=f"UF {uf}: {status}",
-            uf=uf,
-            uf_status=status,
-            **detail,
+            detail={"uf": uf, "uf_status": status, **detail},
+        )
+        await self._emit_coalesced(
+            f"uf_status:{uf}", event, final=status in _UF_FINAL_STATUSES,
         )
 
     async def emit_batch_progress(
@@ -315,14 +536,17 @@ class ProgressTracker:
             ufs_in_batch: UF codes in this batch
         """
         batch_progress = 10 + int((batch_num / max(total_batches, 1)) * 45)
-        await self.emit(
+        event = ProgressEvent(
             stage="batch_progress",
-            progress=batch_progress,
+            progress=min(100, max(0, batch_progress)),
             message=f"Fase {batch_num} de {total_batches}",
-            batch_num=batch_num,
-            total_batches=total_batches,
-            ufs_in_batch=ufs_in_batch,
+            detail={
+                "batch_num": batch_num,
+                "total_batches": total_batches,
+                "ufs_in_batch": ufs_in_batch,
+            },
         )
+        await self._emit_coalesced("batch_progress", event, final=batch_num >= total_batches)
 
     async def emit_degraded(self, reason: str, detail: Optional[Dict[str, Any]] = None) -> None:
         """Signal search completed with degraded data (cache/partial).
@@ -570,7 +794,9 @@ class ProgressTracker:
                 "total": total,
             },
         )
-        await self._emit_event(event)
+        await self._emit_coalesced(
+            f"filtering_progress:{phase}", event, final=processed >= total,
+        )
 
     async def emit_llm_classifying(
         self,
@@ -709,6 +935,68 @@ async def get_replay_events(search_id: str, after_id: int) -> list[tuple[int, di
         return []
 
 
+async def get_partial_snapshot(search_id: str) -> list[dict]:
+    """Rebuild the full partial result set from the partial_data deltas.
+
+    Used on Last-Event-ID reconnection: partial_data events are not kept in
+    the replay history (HARDEN-017), so the client gets the accumulated card
+    projections as snapshot partial_data events (max 500 items each) instead.
+    Tries the local tracker first, then the Redis card hash.
+    """
+    tracker = _active_trackers.get(search_id)
+    if tracker and tracker._partial_sent:
+        cards = tracker.get_partial_snapshot()
+    else:
+        redis = await get_redis_pool()
+        if redis is None:
+            return []
+        try:
+            raw = await redis.hgetall(f"{_PARTIAL_CARD_KEY_PREFIX}{search_id}")
+            if not isinstance(raw, dict) or not raw:
+                return []
+            cards = [json.loads(v) for v in raw.values()]
+        except Exception as e:
+            logger.warning(f"Failed to load partial snapshot from Redis: {e}")
+            return []
+
+    events = []
+    for start in range(0, len(cards), _PARTIAL_MAX_INLINE):
+        chunk = cards[start:start + _PARTIAL_MAX_INLINE]
+        events.append({
+            "stage": "partial_data",
+            "progress": -1,
+            "message": f"Dados parciais: {len(cards)} licitações",
+            "detail": {
+                "snapshot": True,
+                "delta": False,
+                "is_final": False,
+                "truncated": False,
+                "total_items": len(cards),
+                "licitacoes": chunk,
+            },
+        })
+    return events
+
+
+async def get_partial_item(search_id: str, item_id: str) -> Optional[dict]:
+    """Full record of a bid sent in a partial_data event (local tracker, then Redis)."""
+    tracker = _active_trackers.get(search_id)
+    if tracker:
+        item = tracker.get_partial_item(item_id)
+        if item is not None:
+            return item
+
+    redis = await get_redis_pool()
+    if redis is None:
+        return None
+    try:
+        raw = await redis.hget(f"{_PARTIAL_FULL_KEY_PREFIX}{search_id}", item_id)
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"Failed to load partial item from Redis: {e}")
+        return None
+
+
 async def is_search_terminal(search_id: str) -> Optional[dict]:
     """STORY-297 AC4 + HARDEN-019: Check if search has reached a terminal state.
 
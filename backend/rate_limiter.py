@@ -7,6 +7,7 @@ GTM-GO-002: Per-user/per-IP rate limiting for anti-abuse protection
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import time as _time
@@ -129,9 +130,19 @@ class RedisRateLimiter:
     Fallback: returns True (allows request) when Redis is unavailable,
     letting the per-worker local rate limiter handle it.
 
+    Leasing (``lease_size`` > 1): instead of one EVAL + INCR/EXPIRE pipeline
+    per request, a worker claims up to ``lease_size`` tokens with a single
+    EVALSHA and hands them out locally. Unused tokens go back to the bucket
+    when the lease expires (``lease_ttl_s``), and waiters sleep on a local
+    condition that is notified when a new lease arrives instead of polling
+    Redis with backoff.
+
     Redis keys:
         rate_limiter:{name}:bucket          → HASH {tokens, last_refill}
         rate_limiter:{name}:requests_count  → INT (requests in current minute)
+
+    Metrics: smartlic_rate_limiter_redis_calls_total / smartlic_rate_limiter_acquires_total
+    ({limiter, mode}) give the Redis calls per request for each mode.
     """
 
     _BUCKET_SCRIPT = """
@@ -158,46 +169,122 @@ else
 end
 """
 
+    # Claims up to ARGV[4] whole tokens at once and counts them as requests.
+    _LEASE_SCRIPT = """
+local key = KEYS[1]
+local requests_key = KEYS[2]
+local max_tokens = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local want = tonumber(ARGV[4])
+
+local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1]) or max_tokens
+local last_refill = tonumber(bucket[2]) or now
+
+tokens = math.min(max_tokens, tokens + math.max(0, now - last_refill) * refill_rate)
+local granted = math.min(want, math.floor(tokens))
+
+redis.call('HMSET', key, 'tokens', tokens - granted, 'last_refill', now)
+redis.call('EXPIRE', key, 60)
+if granted > 0 then
+    redis.call('INCRBY', requests_key, granted)
+    redis.call('EXPIRE', requests_key, 60)
+end
+return granted
+"""
+
+    # Gives back ARGV[2] unused leased tokens (capped at max_tokens).
+    _RETURN_SCRIPT = """
+local key = KEYS[1]
+local requests_key = KEYS[2]
+local max_tokens = tonumber(ARGV[1])
+local unused = tonumber(ARGV[2])
+
+local tokens = tonumber(redis.call('HGET', key, 'tokens'))
+if tokens then
+    redis.call('HSET', key, 'tokens', math.min(max_tokens, tokens + unused))
+end
+local requests = tonumber(redis.call('GET', requests_key))
+if requests then
+    redis.call('SET', requests_key, math.max(0, requests - unused), 'KEEPTTL')
+end
+return 1
+"""
+
+    _LEASE_SHA = hashlib.sha1(_LEASE_SCRIPT.encode("utf-8")).hexdigest()
+    _RETURN_SHA = hashlib.sha1(_RETURN_SCRIPT.encode("utf-8")).hexdigest()
+
     def __init__(
         self,
         name: str = "pncp",
         max_tokens: int = 10,
         refill_rate: float = 10.0,
+        controller: "AIMDRateController | None" = None,
+        lease_size: int = 0,
+        lease_ttl_s: float = 1.0,
     ):
         self.name = name
         self.max_tokens = max_tokens
         self.refill_rate = refill_rate
+        # When set, the bucket refills at the controller's current allowed rate
+        self.controller = controller
+        self.lease_size = lease_size
+        self.lease_ttl_s = lease_ttl_s
         self._key = f"rate_limiter:{name}:bucket"
         self._requests_key = f"rate_limiter:{name}:requests_count"
+        # Local lease state, bound to the event loop that created the condition
+        self._lease_tokens = 0
+        self._lease_expires = 0.0
+        self._lease_cond: asyncio.Condition | None = None
+        self._lease_loop = None
+
+    def _current_refill_rate(self) -> float:
+        return self.controller.current_rate if self.controller else self.refill_rate
+
+    def _count_redis_calls(self, mode: str, calls: int = 1) -> None:
+        from metrics import RATE_LIMITER_REDIS_CALLS
+
+        RATE_LIMITER_REDIS_CALLS.labels(limiter=self.name, mode=mode).inc(calls)
 
     async def acquire(self, timeout: float = 5.0) -> bool:
         """Acquire a token from the shared bucket.
 
         Returns True if token acquired or Redis unavailable (fail-open).
-        Waits with exponential backoff up to ``timeout`` seconds if rate limited.
+        Waits up to ``timeout`` seconds if rate limited — on a local condition
+        in leasing mode, with exponential backoff otherwise.
         """
         redis = await get_redis_pool()
         if not redis:
             return True  # Fail open — per-worker limiter handles it
 
+        from metrics import RATE_LIMITER_ACQUIRES
+
+        if self.lease_size > 1:
+            RATE_LIMITER_ACQUIRES.labels(limiter=self.name, mode="lease").inc()
+            return await self._acquire_leased(redis, timeout)
+        RATE_LIMITER_ACQUIRES.labels(limiter=self.name, mode="eval").inc()
+
         start = _time.time()
         backoff = 0.05  # 50ms initial
 
         while True:
             try:
                 now = _time.time()
+                self._count_redis_calls("eval")
                 result = await redis.eval(
                     self._BUCKET_SCRIPT,
                     1,
                     self._key,
                     str(self.max_tokens),
-                    str(self.refill_rate),
+                    str(self._current_refill_rate()),
                     str(now),
                 )
 
                 if int(result) == 1:
                     # Token acquired — track request count for metrics
                     try:
+                        self._count_redis_calls("eval")
                         pipe = redis.pipeline()
                         pipe.incr(self._requests_key)
                         pipe.expire(self._requests_key, 60)
@@ -218,6 +305,81 @@ end
                 logger.debug(f"Redis rate limiter error: {e} — allowing request")
                 return True  # Fail open
 
+    def _lease_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._lease_cond is None or self._lease_loop is not loop:
+            # A lease from a closed loop (worker reload, tests) is simply dropped;
+            # its tokens refill in the bucket on their own.
+            self._lease_cond = asyncio.Condition()
+            self._lease_loop = loop
+            self._lease_tokens = 0
+            self._lease_expires = 0.0
+        return self._lease_cond
+
+    async def _acquire_leased(self, redis, timeout: float) -> bool:
+        deadline = _time.monotonic() + timeout
+        cond = self._lease_condition()
+        async with cond:
+            while True:
+                if self._lease_tokens > 0 and _time.monotonic() < self._lease_expires:
+                    self._lease_tokens -= 1
+                    return True
+                try:
+                    if self._lease_tokens > 0:
+                        await self._return_lease(redis, self._lease_tokens)
+                        self._lease_tokens = 0
+                    granted = await self._claim_lease(redis)
+                except Exception as e:
+                    logger.debug(f"Redis rate limiter error: {e} — allowing request")
+                    return True  # Fail open
+
+                if granted > 0:
+                    self._lease_tokens = granted
+                    self._lease_expires = _time.monotonic() + self.lease_ttl_s
+                    cond.notify_all()
+                    continue
+
+                remaining = deadline - _time.monotonic()
+                if remaining <= 0:
+                    return False
+                # Bucket empty: wait about one refill interval, or less if
+                # another waiter claims a lease first and notifies.
+                try:
+                    await asyncio.wait_for(
+                        cond.wait(),
+                        timeout=min(remaining, 1.0 / self._current_refill_rate()),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _claim_lease(self, redis) -> int:
+        result = await self._run_script(
+            redis, self._LEASE_SCRIPT, self._LEASE_SHA,
+            str(self.max_tokens),
+            str(self._current_refill_rate()),
+            str(_time.time()),
+            str(self.lease_size),
+        )
+        return int(result)
+
+    async def _return_lease(self, redis, unused: int) -> None:
+        await self._run_script(
+            redis, self._RETURN_SCRIPT, self._RETURN_SHA,
+            str(self.max_tokens),
+            str(unused),
+        )
+
+    async def _run_script(self, redis, script: str, sha: str, *args: str):
+        """EVALSHA a lease script, loading it with EVAL if Redis lost its cache."""
+        from redis.exceptions import NoScriptError
+
+        self._count_redis_calls("lease")
+        try:
+            return await redis.evalsha(sha, 2, self._key, self._requests_key, *args)
+        except NoScriptError:
+            self._count_redis_calls("lease")
+            return await redis.eval(script, 2, self._key, self._requests_key, *args)
+
     async def get_stats(self) -> dict:
         """Get rate limiter statistics for health endpoint (AC10)."""
         redis = await get_redis_pool()
@@ -245,8 +407,238 @@ end
             }
 
 
+# ============================================================================
+# Adaptive PNCP request rate (AIMD)
+# ============================================================================
+
+class AIMDRateController:
+    """Additive-increase / multiplicative-decrease request rate, shared via Redis.
+
+    Replaces the fixed 100ms per-client interval for PNCP. Every worker feeds
+    the controller with request outcomes:
+
+    - ``record_throttle(reason)`` on 429, retryable 5xx, timeouts and responses
+      slower than ``latency_threshold_s``: rate *= decrease_factor (>= min_rate).
+    - ``record_success(latency_s)`` otherwise: at most once per ``cooldown_s``
+      the rate grows by ``increase`` (<= max_rate), unless any worker decreased
+      it during the last ``cooldown_s``.
+
+    The rate lives in Redis (``rate_controller:{name}`` → HASH {rate,
+    last_decrease, last_increase}) and is updated by an atomic Lua script, so
+    all workers converge on the same value; each worker keeps the last value
+    it saw in ``current_rate``. A burst of concurrent 429s from one worker
+    costs a single Redis call (local cooldown). Without Redis the same rules
+    are applied per worker.
+
+    Metrics: smartlic_pncp_allowed_rate, smartlic_pncp_throttle_events_total{reason}
+    and smartlic_pncp_effective_request_rate.
+    """
+
+    _ADJUST_SCRIPT = """
+local key = KEYS[1]
+local op = ARGV[1]
+local now = tonumber(ARGV[2])
+local min_rate = tonumber(ARGV[3])
+local max_rate = tonumber(ARGV[4])
+local initial = tonumber(ARGV[5])
+local step = tonumber(ARGV[6])
+local factor = tonumber(ARGV[7])
+local cooldown = tonumber(ARGV[8])
+
+local state = redis.call('HMGET', key, 'rate', 'last_decrease', 'last_increase')
+local rate = tonumber(state[1]) or initial
+local last_decrease = tonumber(state[2]) or 0
+local last_increase = tonumber(state[3]) or 0
+
+if op == 'dec' then
+    if now - last_decrease >= cooldown then
+        rate = math.max(min_rate, rate * factor)
+        last_decrease = now
+    end
+elseif op == 'inc' then
+    if now - last_decrease >= cooldown and now - last_increase >= cooldown then
+        rate = math.min(max_rate, rate + step)
+        last_increase = now
+    end
+end
+
+redis.call('HMSET', key, 'rate', rate, 'last_decrease', last_decrease, 'last_increase', last_increase)
+redis.call('EXPIRE', key, 3600)
+return tostring(rate)
+"""
+
+    def __init__(
+        self,
+        name: str = "pncp",
+        min_rate: float = 2.0,
+        max_rate: float = 30.0,
+        initial_rate: float = 10.0,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold_s: float = 8.0,
+        cooldown_s: float = 2.0,
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.initial_rate = initial_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_threshold_s = latency_threshold_s
+        self.cooldown_s = cooldown_s
+        self.enabled = enabled
+        self._key = f"rate_controller:{name}"
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the initial rate and forget local state (tests, reloads)."""
+        self._rate = self.initial_rate
+        # Local fallback state (epoch seconds, mirrors the Redis hash)
+        self._last_decrease = 0.0
+        self._last_increase = 0.0
+        # Local cooldowns (monotonic) that bound Redis calls per worker
+        self._last_dec_attempt = float("-inf")
+        self._last_inc_attempt = _time.monotonic()
+        self._window_start = _time.monotonic()
+        self._window_requests = 0
+
+    @property
+    def current_rate(self) -> float:
+        """Allowed request rate (req/s) as last seen by this worker."""
+        return self._rate
+
+    def note_request(self) -> None:
+        """Count an issued request for the effective-rate gauge."""
+        self._window_requests += 1
+        now = _time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            from metrics import PNCP_EFFECTIVE_REQUEST_RATE
+
+            PNCP_EFFECTIVE_REQUEST_RATE.set(self._window_requests / elapsed)
+            self._window_start = now
+            self._window_requests = 0
+
+    async def record_success(self, latency_s: float) -> None:
+        """Feed a successful response; slow responses count as a throttle."""
+        if not self.enabled:
+            return
+        if latency_s > self.latency_threshold_s:
+            await self.record_throttle("latency")
+            return
+        now = _time.monotonic()
+        if now - self._last_inc_attempt < self.cooldown_s:
+            return
+        self._last_inc_attempt = now
+        await self._adjust("inc")
+
+    async def record_throttle(self, reason: str) -> None:
+        """Feed a throttle signal (``429``, ``5xx``, ``timeout``, ``latency``)."""
+        from metrics import PNCP_THROTTLE_EVENTS
+
+        PNCP_THROTTLE_EVENTS.labels(reason=reason).inc()
+        if not self.enabled:
+            return
+        now = _time.monotonic()
+        if now - self._last_dec_attempt < self.cooldown_s:
+            return
+        self._last_dec_attempt = now
+        # A decrease also postpones this worker's next increase attempt
+        self._last_inc_attempt = now
+        await self._adjust("dec")
+
+    async def _adjust(self, op: str) -> None:
+        now = _time.time()
+        try:
+            redis = await get_redis_pool()
+            if redis:
+                result = await redis.eval(
+                    self._ADJUST_SCRIPT,
+                    1,
+                    self._key,
+                    op,
+                    str(now),
+                    str(self.min_rate),
+                    str(self.max_rate),
+                    str(self.initial_rate),
+                    str(self.increase),
+                    str(self.decrease_factor),
+                    str(self.cooldown_s),
+                )
+                self._set_rate(float(result), op)
+                return
+        except Exception as e:
+            logger.debug(f"AIMD controller Redis error: {e} — adjusting locally")
+        self._adjust_local(op, now)
+
+    def _adjust_local(self, op: str, now: float) -> None:
+        rate = self._rate
+        if op == "dec" and now - self._last_decrease >= self.cooldown_s:
+            rate = max(self.min_rate, rate * self.decrease_factor)
+            self._last_decrease = now
+        elif (
+            op == "inc"
+            and now - self._last_decrease >= self.cooldown_s
+            and now - self._last_increase >= self.cooldown_s
+        ):
+            rate = min(self.max_rate, rate + self.increase)
+            self._last_increase = now
+        self._set_rate(rate, op)
+
+    def _set_rate(self, rate: float, op: str) -> None:
+        from metrics import PNCP_ALLOWED_RATE
+
+        if rate != self._rate:
+            log = logger.info if op == "dec" else logger.debug
+            log(f"PNCP allowed rate {self._rate:.1f} -> {rate:.1f} req/s ({op})")
+        self._rate = rate
+        PNCP_ALLOWED_RATE.set(rate)
+
+
+def _build_pncp_rate_controller() -> AIMDRateController:
+    from config import (
+        PNCP_AIMD_COOLDOWN_S,
+        PNCP_AIMD_DECREASE_FACTOR,
+        PNCP_AIMD_ENABLED,
+        PNCP_AIMD_INCREASE,
+        PNCP_AIMD_LATENCY_THRESHOLD_S,
+        PNCP_RATE_INITIAL,
+        PNCP_RATE_MAX,
+        PNCP_RATE_MIN,
+    )
+
+    return AIMDRateController(
+        name="pncp",
+        min_rate=PNCP_RATE_MIN,
+        max_rate=PNCP_RATE_MAX,
+        initial_rate=PNCP_RATE_INITIAL,
+        increase=PNCP_AIMD_INCREASE,
+        decrease_factor=PNCP_AIMD_DECREASE_FACTOR,
+        latency_threshold_s=PNCP_AIMD_LATENCY_THRESHOLD_S,
+        cooldown_s=PNCP_AIMD_COOLDOWN_S,
+        enabled=PNCP_AIMD_ENABLED,
+    )
+
+
+pncp_rate_controller = _build_pncp_rate_controller()
+
+
+def _build_pncp_rate_limiter() -> RedisRateLimiter:
+    from config import PNCP_TOKEN_LEASE_SIZE, PNCP_TOKEN_LEASE_TTL_S
+
+    return RedisRateLimiter(
+        name="pncp",
+        max_tokens=10,
+        refill_rate=10.0,
+        controller=pncp_rate_controller,
+        lease_size=PNCP_TOKEN_LEASE_SIZE,
+        lease_ttl_s=PNCP_TOKEN_LEASE_TTL_S,
+    )
+
+
 # Global shared rate limiter instances (B-06)
-pncp_rate_limiter = RedisRateLimiter(name="pncp", max_tokens=10, refill_rate=10.0)
+pncp_rate_limiter = _build_pncp_rate_limiter()
 pcp_rate_limiter = RedisRateLimiter(name="pcp", max_tokens=5, refill_rate=5.0)
 
 
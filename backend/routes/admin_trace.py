@@ -91,6 +91,7 @@ async def get_search_trace(search_id: str, user=Depends(require_admin)) -> dict[
     - Progress tracker state (if still active)
     - Cache entries matching this search
     - Job queue results (if ARQ available)
+    - Per-stage profile (if the search was profiled — pipeline/profiling.py)
     """
     trace: dict[str, Any] = {
         "search_id": search_id,
@@ -98,6 +99,7 @@ async def get_search_trace(search_id: str, user=Depends(require_admin)) -> dict[
         "progress": None,
         "cache": None,
         "jobs": None,
+        "profile": None,
     }
 
     # 1. Check active progress tracker
@@ -143,6 +145,13 @@ async def get_search_trace(search_id: str, user=Depends(require_admin)) -> dict[
     except Exception as e:
         trace["cache"] = {"error": str(e)}
 
+    # 4. Per-stage profile (opt-in / sampled searches only)
+    try:
+        from pipeline.profiling import get_search_profile
+        trace["profile"] = await get_search_profile(search_id)
+    except Exception as e:
+        trace["profile"] = {"error": str(e)}
+
     return trace
 
 
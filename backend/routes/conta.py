@@ -22,7 +22,6 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-import stripe
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
@@ -32,6 +31,9 @@ from services.trial_cancel_token import (
     verify_cancel_trial_token,
 )
 from supabase_client import get_supabase
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = get_sanitized_logger(__name__)
 router = APIRouter(prefix="/conta", tags=["conta"])
@@ -176,6 +176,7 @@ _FLAG_DESCRIPTIONS: dict[str, str] = {
     "SECTOR_RED_FLAGS_ENABLED": "Sector-specific red flag detection",
     "PROXIMITY_CONTEXT_ENABLED": "Proximity context window for keyword matching",
     "ITEM_INSPECTION_ENABLED": "Item-level inspection for gray-zone contracts",
+    "ITEM_INSPECTION_ASYNC_ENABLED": "Inspect gray-zone items on the app event loop (shared client + Redis cache)",
     # Term Search Quality
     "TERM_SEARCH_LLM_AWARE": "LLM-aware term search quality parity",
     "TERM_SEARCH_SYNONYMS": "Synonym expansion for term search",
@@ -186,6 +187,7 @@ _FLAG_DESCRIPTIONS: dict[str, str] = {
     "PCP_V2_ENABLED": "Portal de Compras Publicas v2 data source",
     "DATALAKE_ENABLED": "ETL ingestion pipeline (pncp_raw_bids)",
     "DATALAKE_QUERY_ENABLED": "Query local datalake instead of live APIs",
+    "DATALAKE_HYBRID_ENABLED": "Datalake up to the ingestion checkpoint + live fetch of the delta window",
     # Cache
     "CACHE_LEGACY_KEY_FALLBACK": "Fallback to legacy cache key format",
     "SHOW_CACHE_FALLBACK_BANNER": "Show cache fallback banner in frontend",
@@ -193,6 +195,9 @@ _FLAG_DESCRIPTIONS: dict[str, str] = {
     # Search Pipeline
     "SEARCH_ASYNC_ENABLED": "Async search via ARQ job queue",
     "PARTIAL_DATA_SSE_ENABLED": "Partial data delivery via SSE events",
+    "SSE_MULTIPLEXER_ENABLED": "Per-worker blocking XREAD fan-out for SSE progress streams",
+    "PNCP_FETCH_PLANNER_ENABLED": "Per-UF page budgets and timeouts from datalake volume and page latency",
+    "BID_RECORD_SLOTS_ENABLED": "Slotted bid records (core fields + annotation sub-record) instead of per-bid dicts",
     # Cron & Operations
     "HEALTH_CANARY_ENABLED": "PNCP health canary checks (5-min interval)",
     "DIGEST_ENABLED": "Email digest cron job",
@@ -240,6 +245,7 @@ _FLAG_LIFECYCLE: dict[str, dict] = {
     "SECTOR_RED_FLAGS_ENABLED": {"owner": "search", "category": "filter", "lifecycle": "permanent", "created": "2025-12"},
     "PROXIMITY_CONTEXT_ENABLED": {"owner": "search", "category": "filter", "lifecycle": "permanent", "created": "2025-12"},
     "ITEM_INSPECTION_ENABLED": {"owner": "search", "category": "filter", "lifecycle": "permanent", "created": "2025-12"},
+    "ITEM_INSPECTION_ASYNC_ENABLED": {"owner": "search", "category": "filter", "lifecycle": "ops-toggle", "created": "2026-10"},
     # Term Search Quality — experimental, remove when graduated
     "TERM_SEARCH_LLM_AWARE": {"owner": "search", "category": "experimental", "lifecycle": "experimental", "created": "2026-01"},
     "TERM_SEARCH_SYNONYMS": {"owner": "search", "category": "experimental", "lifecycle": "experimental", "created": "2026-01"},
@@ -250,6 +256,7 @@ _FLAG_LIFECYCLE: dict[str, dict] = {
     "PCP_V2_ENABLED": {"owner": "data", "category": "source", "lifecycle": "permanent", "created": "2025-10"},
     "DATALAKE_ENABLED": {"owner": "data", "category": "source", "lifecycle": "permanent", "created": "2026-01"},
     "DATALAKE_QUERY_ENABLED": {"owner": "data", "category": "source", "lifecycle": "permanent", "created": "2026-01"},
+    "DATALAKE_HYBRID_ENABLED": {"owner": "data", "category": "source", "lifecycle": "ops-toggle", "created": "2026-10"},
     # Cache
     "CACHE_LEGACY_KEY_FALLBACK": {"owner": "infra", "category": "cache", "lifecycle": "deprecating", "created": "2026-02", "remove_after": "2026-06"},
     "SHOW_CACHE_FALLBACK_BANNER": {"owner": "frontend", "category": "cache", "lifecycle": "ops-toggle", "created": "2026-02"},
@@ -257,6 +264,9 @@ _FLAG_LIFECYCLE: dict[str, dict] = {
     # Search Pipeline
     "SEARCH_ASYNC_ENABLED": {"owner": "search", "category": "pipeline", "lifecycle": "experimental", "created": "2025-12"},
     "PARTIAL_DATA_SSE_ENABLED": {"owner": "search", "category": "pipeline", "lifecycle": "permanent", "created": "2025-12"},
+    "SSE_MULTIPLEXER_ENABLED": {"owner": "search", "category": "pipeline", "lifecycle": "ops-toggle", "created": "2026-10"},
+    "PNCP_FETCH_PLANNER_ENABLED": {"owner": "search", "category": "pipeline", "lifecycle": "ops-toggle", "created": "2026-10"},
+    "BID_RECORD_SLOTS_ENABLED": {"owner": "search", "category": "pipeline", "lifecycle": "ops-toggle", "created": "2026-10"},
     # Cron & Operations
     "HEALTH_CANARY_ENABLED": {"owner": "infra", "category": "ops", "lifecycle": "permanent", "created": "2025-11"},
     "DIGEST_ENABLED": {"owner": "email", "category": "ops", "lifecycle": "experimental", "created": "2025-12"},
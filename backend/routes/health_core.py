@@ -208,6 +208,9 @@ async def health():
     from bulkhead import get_all_bulkheads
     bulkhead_status = {bh_name: bh.to_dict() for bh_name, bh in get_all_bulkheads().items()}
 
+    # Event-loop lag of this worker (rolling window)
+    from loop_monitor import get_loop_lag_summary
+
     return {
         "status": status,
         "ready": is_ready,
@@ -217,6 +220,7 @@ async def health():
         "dependencies": dependencies,
         "sources": sources,
         "bulkheads": bulkhead_status,
+        "event_loop": get_loop_lag_summary(),
     }
 
 
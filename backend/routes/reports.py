@@ -13,10 +13,14 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from auth import require_auth
+from export_cache import get_or_create_artifact_bytes
 from routes.search import get_background_results_async
-import pdf_report
+from utils.lazy_import import lazy_module
 from viability import assess_batch
 
+# reportlab-backed generator, imported on the first PDF request
+pdf_report = lazy_module("pdf_report")
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["reports"])
@@ -146,15 +150,30 @@ async def generate_diagnostico(
         "total_raw": results.get("total_raw", 0) if isinstance(results, dict) else getattr(results, "total_raw", 0),
     }
 
-    try:
-        pdf_buffer = pdf_report.generate_diagnostico_pdf(
+    # Content-addressed reuse: same top-N bids + same options -> same PDF.
+    # The cover shows the generation date and the summary text, so both are
+    # part of the key.
+    artifact_options = {
+        "client_name": request.client_name,
+        "max_items": request.max_items,
+        "search_metadata": search_metadata,
+        "resumo": resumo,
+        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+    }
+
+    def _build_pdf() -> bytes:
+        return pdf_report.generate_diagnostico_pdf(
             licitacoes=sorted_licitacoes,
             resumo=resumo,
             search_metadata=search_metadata,
             client_name=request.client_name,
             max_items=request.max_items,
+        ).getvalue()
+
+    try:
+        pdf_bytes, _reused = await get_or_create_artifact_bytes(
+            "pdf", sorted_licitacoes, _build_pdf, options=artifact_options,
         )
-        pdf_bytes = pdf_buffer.getvalue()
     except Exception as exc:
         logger.error(
             f"PDF generation failed for search_id={request.search_id[:8]}: "
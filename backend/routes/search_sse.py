@@ -11,12 +11,18 @@ import os
 import uuid as _uuid
 
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from starlette.responses import StreamingResponse
 
 from auth import require_auth
 from log_sanitizer import get_sanitized_logger
-from progress import get_tracker, get_replay_events, is_search_terminal
+from progress import (
+    get_partial_item,
+    get_partial_snapshot,
+    get_replay_events,
+    get_tracker,
+    is_search_terminal,
+)
 from rate_limiter import (
     acquire_sse_connection,
     release_sse_connection,
@@ -24,11 +30,13 @@ from rate_limiter import (
     SSE_RECONNECT_WINDOW_SECONDS,
     _flexible_limiter,
 )
+from config import get_feature_flag
 from redis_pool import get_sse_redis_pool
 from search_state_manager import (
     get_search_status,
     get_current_state,
 )
+from sse_multiplexer import get_stream_multiplexer, observe_delivery_latency
 
 logger = get_sanitized_logger(__name__)
 
@@ -70,6 +78,8 @@ async def buscar_progress_stream(
         - excel (92-98%): Excel report generation
         - complete (100%): Search finished
         - partial_results: Non-terminal — intermediate results during background fetch (A-04)
+        - partial_data: Non-terminal — bids new/changed since the previous partial_data
+          event, as compact cards (full record via GET /buscar-progress/{id}/item)
         - refresh_available (100%): Background fetch complete, new data available (A-04)
         - error: Search failed
     """
@@ -134,6 +144,11 @@ async def buscar_progress_stream(
             # STORY-297 AC3+AC4: Replay events after Last-Event-ID on reconnection
             if last_event_id > 0:
                 # AC4: If search already completed, replay + send terminal immediately
+                # partial_data deltas are not in the replay history — send the
+                # rebuilt set first (no id: field, so Last-Event-ID is unchanged)
+                for snapshot_event in await get_partial_snapshot(search_id):
+                    yield f"data: {_json.dumps(snapshot_event)}\n\n"
+
                 terminal_event = await is_search_terminal(search_id)
                 if terminal_event:
                     replay_events = await get_replay_events(search_id, last_event_id)
@@ -234,118 +249,140 @@ async def buscar_progress_stream(
 
             if _use_streams:
                 # CRIT-026-ROOT: Non-blocking polled XREAD replaces XREAD BLOCK.
+                # With SSE_MULTIPLEXER_ENABLED the worker-wide multiplexer runs a
+                # single blocking XREAD for all connections and this loop waits
+                # on its subscription instead of polling Redis itself.
                 _stream_key = f"smartlic:progress:{search_id}:stream"
                 _last_id = "0"  # AC2: id=0 reads ALL history since beginning
                 _polls_since_heartbeat = 0
                 _consecutive_errors = 0
                 _MAX_CONSECUTIVE_ERRORS = 5  # circuit breaker for Redis failures
-                logger.debug(f"SSE using Redis Streams (polled) for {search_id}")
-
-                while True:
-                    # HARDEN-012 AC1: Check if client disconnected
-                    if await request.is_disconnected():
-                        from metrics import SSE_DISCONNECTS_TOTAL
-                        SSE_DISCONNECTS_TOTAL.inc()
-                        logger.debug(f"HARDEN-012: Client disconnected during Redis streaming for {search_id}")
-                        return
+                _mux = _mux_sub = None
+                if get_feature_flag("SSE_MULTIPLEXER_ENABLED"):
+                    _mux = get_stream_multiplexer()
+                    _mux_sub = _mux.subscribe(_redis, _stream_key, _last_id)
+                    logger.debug(f"SSE using Redis Streams (multiplexed) for {search_id}")
+                else:
+                    logger.debug(f"SSE using Redis Streams (polled) for {search_id}")
 
-                    try:
-                        # Non-blocking XREAD — returns immediately with data or empty
-                        result = await _redis.xread(
-                            {_stream_key: _last_id},
-                            count=100,
-                        )
-                        _consecutive_errors = 0  # reset on success
-
-                        if not result:
-                            # No new data — poll again after sleep
-                            _polls_since_heartbeat += 1
-                            if _polls_since_heartbeat >= _SSE_POLLS_PER_HEARTBEAT:
-                                heartbeat_count += 1
-                                yield ": heartbeat\n\n"
-                                logger.debug(
-                                    f"CRIT-012: Heartbeat #{heartbeat_count} "
-                                    f"for {search_id} (streams-polled)"
+                try:
+                    while True:
+                        # HARDEN-012 AC1: Check if client disconnected
+                        if await request.is_disconnected():
+                            from metrics import SSE_DISCONNECTS_TOTAL
+                            SSE_DISCONNECTS_TOTAL.inc()
+                            logger.debug(f"HARDEN-012: Client disconnected during Redis streaming for {search_id}")
+                            return
+
+                        try:
+                            if _mux_sub is not None:
+                                # Waits up to one poll interval for multiplexed entries
+                                result = await _mux_sub.read(timeout=_SSE_POLL_INTERVAL)
+                            else:
+                                # Non-blocking XREAD — returns immediately with data or empty
+                                result = await _redis.xread(
+                                    {_stream_key: _last_id},
+                                    count=100,
                                 )
-                                _polls_since_heartbeat = 0
-                            await asyncio.sleep(_SSE_POLL_INTERVAL)
-                            continue
-
-                        # AC2: Process entries, updating last_id for subsequent reads
-                        _polls_since_heartbeat = 0  # reset on data received
-                        for _stream_name, entries in result:
-                            for entry_id, fields in entries:
-                                _last_id = entry_id
-                                event_data = {
-                                    "stage": fields["stage"],
-                                    "progress": int(fields["progress"]),
-                                    "message": fields["message"],
-                                }
-                                detail_json = fields.get("detail_json", "{}")
-                                if detail_json and detail_json != "{}":
-                                    event_data["detail"] = _json.loads(detail_json)
-                                # Preserve correlation fields
-                                for _extra in ("trace_id", "search_id", "request_id"):
-                                    if _extra in fields:
-                                        event_data[_extra] = fields[_extra]
-
-                                # STORY-297 AC1: Include SSE event id
-                                _sse_event_counter += 1
-                                yield f"id: {_sse_event_counter}\ndata: {_json.dumps(event_data)}\n\n"
-
-                                if fields["stage"] in (
-                                    "complete", "degraded", "error",
-                                    "refresh_available", "search_complete", "shutdown",
-                                ):
-                                    return
-
-                    except asyncio.CancelledError:
-                        from metrics import SSE_CONNECTION_ERRORS
-                        SSE_CONNECTION_ERRORS.labels(
-                            error_type="cancelled", phase="streaming"
-                        ).inc()
-                        break
-
-                    except (TimeoutError, ConnectionError) as redis_timeout_err:
-                        # CRIT-048 AC3: Redis timeout/connection error
-                        from metrics import SSE_CONNECTION_ERRORS
-                        SSE_CONNECTION_ERRORS.labels(
-                            error_type="redis_timeout", phase="streaming"
-                        ).inc()
-                        logger.error(
-                            f"CRIT-048 AC3: Redis timeout for SSE {search_id}: "
-                            f"{type(redis_timeout_err).__name__}: {redis_timeout_err}"
-                        )
-                        # Emit non-terminal informational event before switching transport
-                        _sse_event_counter += 1
-                        yield (
-                            f"id: {_sse_event_counter}\n"
-                            f"data: {_json.dumps({'stage': 'connecting', 'progress': -1, 'message': 'Reconectando ao servidor de progresso...'})}\n\n"
-                        )
-                        _supabase_fallback = True
-                        _use_streams = False
-                        break
+                                from metrics import SSE_REDIS_READS
+                                SSE_REDIS_READS.labels(mode="poll").inc()
+                            _consecutive_errors = 0  # reset on success
+
+                            if not result:
+                                # No new data — poll again after sleep
+                                _polls_since_heartbeat += 1
+                                if _polls_since_heartbeat >= _SSE_POLLS_PER_HEARTBEAT:
+                                    heartbeat_count += 1
+                                    yield ": heartbeat\n\n"
+                                    logger.debug(
+                                        f"CRIT-012: Heartbeat #{heartbeat_count} "
+                                        f"for {search_id} (streams-polled)"
+                                    )
+                                    _polls_since_heartbeat = 0
+                                if _mux_sub is None:
+                                    await asyncio.sleep(_SSE_POLL_INTERVAL)
+                                continue
+
+                            # AC2: Process entries, updating last_id for subsequent reads
+                            _polls_since_heartbeat = 0  # reset on data received
+                            for _stream_name, entries in result:
+                                for entry_id, fields in entries:
+                                    _last_id = entry_id
+                                    if _mux_sub is None:
+                                        observe_delivery_latency(entry_id, "poll")
+                                    event_data = {
+                                        "stage": fields["stage"],
+                                        "progress": int(fields["progress"]),
+                                        "message": fields["message"],
+                                    }
+                                    detail_json = fields.get("detail_json", "{}")
+                                    if detail_json and detail_json != "{}":
+                                        event_data["detail"] = _json.loads(detail_json)
+                                    # Preserve correlation fields
+                                    for _extra in ("trace_id", "search_id", "request_id"):
+                                        if _extra in fields:
+                                            event_data[_extra] = fields[_extra]
+
+                                    # STORY-297 AC1: Include SSE event id
+                                    _sse_event_counter += 1
+                                    yield f"id: {_sse_event_counter}\ndata: {_json.dumps(event_data)}\n\n"
+
+                                    if fields["stage"] in (
+                                        "complete", "degraded", "error",
+                                        "refresh_available", "search_complete", "shutdown",
+                                    ):
+                                        return
+
+                        except asyncio.CancelledError:
+                            from metrics import SSE_CONNECTION_ERRORS
+                            SSE_CONNECTION_ERRORS.labels(
+                                error_type="cancelled", phase="streaming"
+                            ).inc()
+                            break
 
-                    except Exception as redis_err:
-                        # CRIT-026-ROOT: Circuit breaker for transient Redis errors.
-                        _consecutive_errors += 1
-                        logger.warning(
-                            f"CRIT-026: Redis read error #{_consecutive_errors} "
-                            f"for {search_id}: {type(redis_err).__name__}: {redis_err}"
-                        )
-                        if _consecutive_errors >= _MAX_CONSECUTIVE_ERRORS:
+                        except (TimeoutError, ConnectionError) as redis_timeout_err:
+                            # CRIT-048 AC3: Redis timeout/connection error
+                            from metrics import SSE_CONNECTION_ERRORS
+                            SSE_CONNECTION_ERRORS.labels(
+                                error_type="redis_timeout", phase="streaming"
+                            ).inc()
                             logger.error(
-                                f"CRIT-026: Circuit breaker open for {search_id} "
-                                f"after {_consecutive_errors} consecutive Redis errors, "
-                                f"falling back to Supabase polling"
+                                f"CRIT-048 AC3: Redis timeout for SSE {search_id}: "
+                                f"{type(redis_timeout_err).__name__}: {redis_timeout_err}"
+                            )
+                            # Emit non-terminal informational event before switching transport
+                            _sse_event_counter += 1
+                            yield (
+                                f"id: {_sse_event_counter}\n"
+                                f"data: {_json.dumps({'stage': 'connecting', 'progress': -1, 'message': 'Reconectando ao servidor de progresso...'})}\n\n"
                             )
-                            # CRIT-048 AC4: Fall through to Supabase polling
-                            _use_streams = False
                             _supabase_fallback = True
+                            _use_streams = False
                             break
-                        # Exponential backoff: 1s, 2s, 4s, 8s, 16s
-                        _backoff = min(2 ** (_consecutive_errors - 1), 16)
-                        await asyncio.sleep(_backoff)
+
+                        except Exception as redis_err:
+                            # CRIT-026-ROOT: Circuit breaker for transient Redis errors.
+                            _consecutive_errors += 1
+                            logger.warning(
+                                f"CRIT-026: Redis read error #{_consecutive_errors} "
+                                f"for {search_id}: {type(redis_err).__name__}: {redis_err}"
+                            )
+                            if _consecutive_errors >= _MAX_CONSECUTIVE_ERRORS:
+                                logger.error(
+                                    f"CRIT-026: Circuit breaker open for {search_id} "
+                                    f"after {_consecutive_errors} consecutive Redis errors, "
+                                    f"falling back to Supabase polling"
+                                )
+                                # CRIT-048 AC4: Fall through to Supabase polling
+                                _use_streams = False
+                                _supabase_fallback = True
+                                break
+                            # Exponential backoff: 1s, 2s, 4s, 8s, 16s
+                            _backoff = min(2 ** (_consecutive_errors - 1), 16)
+                            await asyncio.sleep(_backoff)
+                finally:
+                    if _mux_sub is not None:
+                        _mux.unsubscribe(_mux_sub)
 
             # CRIT-048 AC4: Supabase polling fallback when Redis is unavailable
             if _supabase_fallback:
@@ -463,3 +500,16 @@ async def buscar_progress_stream(
             "X-Accel-Buffering": "no",
         },
     )
+
+
+@router.get("/buscar-progress/{search_id}/item")
+async def buscar_progress_item(
+    search_id: str,
+    item_id: str = Query(..., alias="id"),
+    user: dict = Depends(require_auth),
+):
+    """Full record of a bid sent as a compact card in a partial_data SSE event."""
+    item = await get_partial_item(search_id, item_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item não encontrado")
+    return {"search_id": search_id, "item": item}
@@ -15,6 +15,7 @@ import sentry_sdk
 from types import SimpleNamespace
 
 from log_sanitizer import get_sanitized_logger
+from pipeline.helpers import encode_search_response
 from progress import get_tracker, remove_tracker
 from redis_pool import get_redis_pool
 from schemas import BuscaRequest, BuscaResponse
@@ -77,30 +78,25 @@ async def _persist_results_to_redis(search_id: str, response: Any) -> None:
     """STORY-294 AC2: Persist results to Redis for cross-worker access.
 
     Stores as JSON string with TTL from config.RESULTS_REDIS_TTL (30min default).
+    ``response`` may already be encoded (encode_search_response) so the
+    payload is serialized once for all stores.
     Fire-and-forget: errors are logged and metriced, never raised.
     """
-    import json as _json
-
     redis = await get_redis_pool()
     if not redis:
         return
 
     try:
         from config import RESULTS_REDIS_TTL
+        from pipeline.helpers import encode_search_response
         key = f"{_RESULTS_REDIS_PREFIX}{search_id}"
 
-        # Serialize: BuscaResponse → dict → JSON
-        if hasattr(response, "model_dump"):
-            data = response.model_dump(mode="json")
-        elif hasattr(response, "dict"):
-            data = response.dict()
-        elif isinstance(response, dict):
-            data = response
-        else:
+        encoded = encode_search_response(response)
+        if encoded is None:
             logger.warning(f"STORY-294: Cannot serialize response type {type(response)}")
             return
 
-        await redis.setex(key, RESULTS_REDIS_TTL, _json.dumps(data, default=str))
+        await redis.setex(key, RESULTS_REDIS_TTL, encoded)
         logger.debug(f"STORY-294: Results stored in Redis: {key} (TTL={RESULTS_REDIS_TTL}s)")
 
     except Exception as e:
@@ -128,15 +124,12 @@ async def _persist_results_to_supabase(
         if not db:
             return
 
-        # Serialize response
-        if hasattr(response, "model_dump"):
-            data = response.model_dump(mode="json")
-        elif hasattr(response, "dict"):
-            data = response.dict()
-        elif isinstance(response, dict):
-            data = response
-        else:
+        # Serialize response (once — reuses the Redis payload when pre-encoded)
+        from pipeline.helpers import encode_search_response
+        encoded = encode_search_response(response)
+        if encoded is None:
             return
+        data = _json.loads(encoded)
 
         sector = data.get("setor", "")
         ufs = data.get("ufs", [])
@@ -149,7 +142,7 @@ async def _persist_results_to_supabase(
             db.table("search_results_store").upsert({
                 "search_id": search_id,
                 "user_id": user_id,
-                "results": _json.loads(_json.dumps(data, default=str)),
+                "results": data,
                 "sector": sector,
                 "ufs": ufs,
                 "total_filtered": total_filtered,
@@ -247,6 +240,32 @@ async def _get_results_from_redis(search_id: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+async def get_stored_results_json(search_id: str) -> Optional[str]:
+    """Stored results as the JSON text written by _persist_results_to_redis.
+
+    Lets GET /buscar-results return the L2 payload as-is instead of parsing
+    it and re-encoding the dict. Returns None on an L1 hit (served from the
+    model, as before) or an L2 miss — callers then use get_background_results_async().
+    """
+    if get_background_results(search_id) is not None:
+        return None
+
+    redis = await get_redis_pool()
+    if not redis:
+        return None
+
+    try:
+        data = await redis.get(f"{_RESULTS_REDIS_PREFIX}{search_id}")
+        if data:
+            return data.decode() if isinstance(data, bytes) else data
+    except Exception as e:
+        from metrics import STATE_STORE_ERRORS
+        STATE_STORE_ERRORS.labels(store="results", operation="read").inc()
+        logger.warning(f"STORY-294: Failed to read results from Redis: {e}")
+
+    return None
+
+
 def get_background_results(search_id: str) -> Optional[BuscaResponse]:
     """Retrieve background fetch results from in-memory L1 cache.
 
@@ -454,9 +473,10 @@ async def _execute_background_fetch(
 
         # Store results for /buscar-results/{search_id}
         store_background_results(search_id, response)
-        await _persist_results_to_redis(search_id, response)
+        _encoded = encode_search_response(response)
+        await _persist_results_to_redis(search_id, _encoded)
         # HARDEN-005: Retry-wrapped L3 persist with done_callback
-        _persist_task = asyncio.create_task(_safe_persist_results(search_id, user.get("id", ""), response))
+        _persist_task = asyncio.create_task(_safe_persist_results(search_id, user.get("id", ""), _encoded))
         _persist_task.add_done_callback(_persist_done_callback)
 
         # Calculate diff summary for refresh_available event
@@ -558,11 +578,12 @@ async def _run_async_search(
         # STORY-320 AC3: Apply trial paywall truncation
         response = _apply_trial_paywall(response, user)
 
-        # Persist results: L1 (memory) + L2 (Redis) + L3 (Supabase)
+        # Persist results: L1 (memory) + L2 (Redis) + L3 (Supabase), encoded once
         store_background_results(search_id, response)
-        await _persist_results_to_redis(search_id, response)
+        _encoded = encode_search_response(response)
+        await _persist_results_to_redis(search_id, _encoded)
         # HARDEN-005: Retry-wrapped L3 persist with done_callback
-        _persist_task = asyncio.create_task(_safe_persist_results(search_id, user.get("id", ""), response))
+        _persist_task = asyncio.create_task(_safe_persist_results(search_id, user.get("id", ""), _encoded))
         _persist_task.add_done_callback(_persist_done_callback)
         asyncio.create_task(_update_session_on_complete(search_id, user.get("id"), response))
 
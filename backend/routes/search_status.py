@@ -10,7 +10,7 @@ GET /search/{id}/timeline, POST /search/{id}/retry, POST /search/{id}/cancel.
 import time as sync_time
 
 from fastapi import APIRouter, HTTPException, Depends
-from starlette.responses import JSONResponse as StarletteJSONResponse
+from starlette.responses import JSONResponse as StarletteJSONResponse, Response
 
 from auth import require_auth
 from excel import create_excel
@@ -28,6 +28,7 @@ from search_state_manager import (
 from routes.search_state import (
     get_background_results,
     get_background_results_async,
+    get_stored_results_json,
 )
 
 logger = get_sanitized_logger(__name__)
@@ -251,6 +252,11 @@ async def get_search_results(
     Returns 404 if search_id not found or expired.
     """
     await _verify_search_ownership(search_id, user["id"])
+    # Cross-worker hit: return the stored JSON without decoding/re-encoding it
+    stored_json = await get_stored_results_json(search_id)
+    if stored_json is not None:
+        return Response(content=stored_json, media_type="application/json")
+
     result = await get_background_results_async(search_id)
     if result is None:
         raise HTTPException(
@@ -395,10 +401,13 @@ async def regenerate_excel_endpoint(
 
     # Inline fallback when ARQ unavailable
     try:
-        excel_buffer = create_excel(licitacoes)
-        excel_bytes = excel_buffer.read()
+        from export_cache import get_or_create_artifact
         from storage import upload_excel
-        storage_result = upload_excel(excel_bytes, search_id)
+
+        def _produce_excel():
+            return upload_excel(create_excel(licitacoes).read(), search_id)
+
+        storage_result = await get_or_create_artifact("excel", licitacoes, _produce_excel)
         if storage_result:
             download_url = storage_result["signed_url"]
             from job_queue import persist_job_result
@@ -11,7 +11,6 @@ from typing import Literal, Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
-import stripe as stripe_lib
 
 from auth import require_auth
 from services.billing import (
@@ -19,6 +18,9 @@ from services.billing import (
     get_next_billing_date,
 )
 from log_sanitizer import mask_user_id, log_user_action
+from utils.lazy_import import lazy_module
+
+stripe_lib = lazy_module("stripe")
 
 logger = logging.getLogger(__name__)
 
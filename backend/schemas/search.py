@@ -254,6 +254,16 @@ class BuscaRequest(BaseModel):
                     "Cache write-through still happens on successful results.",
     )
 
+    # -------------------------------------------------------------------------
+    # Search profiling (admin/master only)
+    # -------------------------------------------------------------------------
+    profile: bool = Field(
+        default=False,
+        description="When true, record per-stage CPU time, event-loop lag and allocation peak "
+                    "for this search (see /v1/admin/search-trace/{search_id}). "
+                    "Ignored for non-admin users.",
+    )
+
     # -------------------------------------------------------------------------
     # Validators
     # -------------------------------------------------------------------------
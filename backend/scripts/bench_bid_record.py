@@ -0,0 +1,183 @@
+"""Bid record benchmark: per-bid dicts vs slotted BidRecord through a search.
+
+Runs the CPU side of one search — consolidation legacy conversion
+(``UnifiedProcurement.to_legacy_format`` vs ``to_bid_record``), status
+inference, ``aplicar_todos_filtros`` and viability — on synthetic bids
+(default 1k / 5k; the keyword stage dominates wall time, expect
+minutes at 5k) and reports, per record type:
+
+- wall_ms:        end-to-end time of the pass
+- peak_alloc_mb:  tracemalloc peak during the pass (per-search peak memory)
+- retained_mb:    traced memory still held by the raw + filtered lists
+- gc_pause_ms:    total / max collector pause during the pass (gc.callbacks)
+- full_gc_ms:     one gc.collect() with the search's bids alive (worst gen-2 pause)
+
+Each (mode, rows) measurement runs in a fresh child interpreter so GC state
+and allocator caches do not leak between runs. LLM arbitration, zero-match
+classification and item inspection are disabled (no network).
+
+USAGE
+
+    python backend/scripts/bench_bid_record.py
+    python backend/scripts/bench_bid_record.py --rows 2000 --json out.json
+
+This is a developer tool, not a test gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+backend_dir = str(Path(__file__).resolve().parent.parent)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+MODES = ("dict", "bid_record")
+
+_OBJETOS = (
+    "Aquisição de uniformes escolares — camisetas, calças e jalecos",
+    "Contratação de empresa para manutenção predial preventiva e corretiva",
+    "Aquisição de material de expediente e papelaria para secretarias",
+    "Fornecimento de fardamento para guarda municipal, incluindo coturnos",
+    "Serviços de limpeza e conservação de prédios públicos",
+)
+
+
+def synthetic_procurements(n: int) -> list:
+    """``n`` UnifiedProcurement records (deterministic, ~1 in 5 matches vestuario)."""
+    from clients.base import UnifiedProcurement
+
+    today = datetime.now().replace(microsecond=0)
+    return [
+        UnifiedProcurement(
+            source_id=f"12345678000190-1-{i:06d}/2026",
+            source_name="PNCP",
+            objeto=f"{_OBJETOS[i % len(_OBJETOS)]} lote {i}",
+            valor_estimado=10_000.0 + (i * 37.5),
+            orgao=f"Prefeitura Municipal de Cidade {i % 500}",
+            cnpj_orgao="12345678000190",
+            uf=("SP", "RJ", "MG", "BA", "PR")[i % 5],
+            municipio=f"Cidade {i % 500}",
+            data_publicacao=today - timedelta(days=i % 10),
+            data_abertura=today + timedelta(days=5),
+            data_encerramento=today + timedelta(days=15 + i % 10),
+            numero_edital=str(i),
+            ano="2026",
+            modalidade="Pregão Eletrônico",
+            modalidade_id=6,
+            situacao="Divulgada no PNCP",
+            esfera="M",
+            link_edital=f"https://pncp.gov.br/app/editais/{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def run_child(mode: str, rows: int) -> dict:
+    """Run one measurement in the current process (invoked via --child)."""
+    os.environ.update({
+        "BID_RECORD_SLOTS_ENABLED": "true" if mode == "bid_record" else "false",
+        "LLM_ARBITER_ENABLED": "false",
+        "LLM_ZERO_MATCH_ENABLED": "false",
+        "ITEM_INSPECTION_ENABLED": "false",
+    })
+    import gc
+    import tracemalloc
+
+    from filter import aplicar_todos_filtros
+    from sectors import get_sector
+    from status_inference import enriquecer_com_status_inferido
+    from viability import assess_batch
+
+    sector = get_sector("vestuario")
+    ufs = {"SP", "RJ", "MG", "BA", "PR"}
+    procurements = synthetic_procurements(rows)
+    convert = (lambda p: p.to_bid_record()) if mode == "bid_record" else (lambda p: p.to_legacy_format())
+
+    pauses: list[float] = []
+    started: list[float] = []
+
+    def _on_gc(phase: str, info: dict) -> None:
+        if phase == "start":
+            started.append(time.perf_counter())
+        elif started:
+            pauses.append(time.perf_counter() - started.pop())
+
+    gc.collect()
+    gc.callbacks.append(_on_gc)
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    raw = [convert(p) for p in procurements]
+    enriquecer_com_status_inferido(raw)
+    aprovadas, stats = aplicar_todos_filtros(
+        raw, ufs_selecionadas=ufs, status="todos",
+        keywords=sector.keywords, exclusions=sector.exclusions,
+        context_required=sector.context_required_keywords, setor=sector.id,
+    )
+    assess_batch(aprovadas, ufs, sector.viability_value_range)
+
+    wall = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.callbacks.remove(_on_gc)
+
+    full_start = time.perf_counter()
+    gc.collect()
+    full_gc = time.perf_counter() - full_start
+
+    return {
+        "mode": mode,
+        "rows": rows,
+        "approved": len(aprovadas),
+        "wall_ms": round(wall * 1000, 1),
+        "peak_alloc_mb": round(peak / 2**20, 2),
+        "retained_mb": round(retained / 2**20, 2),
+        "gc_collections": len(pauses),
+        "gc_pause_ms": round(sum(pauses) * 1000, 2),
+        "gc_max_pause_ms": round(max(pauses, default=0.0) * 1000, 2),
+        "full_gc_ms": round(full_gc * 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--json", help="Optional path to write raw results as JSON")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, rows = args.child
+        print(json.dumps(run_child(mode, int(rows))))
+        return 0
+
+    results = []
+    for rows in args.rows:
+        for mode in MODES:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(rows)],
+                capture_output=True, text=True, check=True, cwd=backend_dir,
+            )
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    cols = ("rows", "mode", "approved", "wall_ms", "peak_alloc_mb", "retained_mb",
+            "gc_collections", "gc_pause_ms", "gc_max_pause_ms", "full_gc_ms")
+    print(" ".join(f"{c:>15}" for c in cols))
+    for r in results:
+        print(" ".join(f"{r[c]!s:>15}" for c in cols))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Excel export benchmark: in-memory ``create_excel`` vs write-only streaming.
+
+Compares wall time and peak RSS of the two generation paths in ``excel.py``
+on synthetic result sets (default 1k / 10k / 50k rows). Each (mode, rows)
+measurement runs in a fresh child interpreter so peak RSS is not polluted by
+previous runs.
+
+USAGE
+
+    python backend/scripts/bench_excel.py
+    python backend/scripts/bench_excel.py --rows 1000 10000 --json out.json
+
+MODES
+
+- buffered:  create_excel(...) -> BytesIO -> .read()  (what the pipeline did)
+- streaming: stream_excel_to_tempfile(...) -> file on disk (write-only path)
+
+This is a developer tool, not a test gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+backend_dir = str(Path(__file__).resolve().parent.parent)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+MODES = ("buffered", "streaming")
+
+
+def synthetic_rows(n: int):
+    """Yield ``n`` PNCP-shaped bid dicts (deterministic, realistic field sizes)."""
+    for i in range(n):
+        yield {
+            "codigoCompra": f"{i:08d}",
+            "numeroControlePNCP": f"12345678000190-1-{i:06d}/2026",
+            "objetoCompra": (
+                f"Aquisição de uniformes escolares lote {i} — camisetas, calças, "
+                "jalecos e demais itens de vestuário conforme termo de referência"
+            ),
+            "nomeOrgao": f"Prefeitura Municipal de Cidade {i % 500}",
+            "uf": ("SP", "RJ", "MG", "BA", "PR")[i % 5],
+            "municipio": f"Cidade {i % 500}",
+            "valorTotalEstimado": 10_000.0 + (i * 37.5),
+            "modalidadeNome": "Pregão Eletrônico",
+            "dataPublicacaoPncp": "2026-02-10T10:00:00",
+            "dataAberturaProposta": "2026-02-20T09:30:00Z",
+            "situacaoCompraNome": "Divulgada no PNCP",
+            "linkSistemaOrigem": None if i % 3 else f"https://compras.example.gov.br/{i}",
+        }
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_child(mode: str, rows: int) -> dict:
+    """Run one measurement in the current process (invoked via --child)."""
+    from excel import create_excel, stream_excel_to_tempfile
+
+    # Input list is materialized for both modes so the comparison isolates the
+    # workbook cost (the pipeline always holds the filtered list anyway).
+    data = list(synthetic_rows(rows))
+    rss_before = _peak_rss_bytes()
+    start = time.perf_counter()
+    if mode == "buffered":
+        size = len(create_excel(data).read())
+    else:
+        path = stream_excel_to_tempfile(data)
+        size = os.path.getsize(path)
+        os.unlink(path)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "rows": rows,
+        "wall_s": round(elapsed, 3),
+        "peak_rss_mb": round(_peak_rss_bytes() / 2**20, 1),
+        "peak_rss_delta_mb": round((_peak_rss_bytes() - rss_before) / 2**20, 1),
+        "file_kb": round(size / 1024, 1),
+    }
+
+
+def _measure(mode: str, rows: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(rows)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--json", help="Optional path to write raw results as JSON")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child[0], int(args.child[1]))))
+        return 0
+
+    results = [_measure(mode, rows) for rows in args.rows for mode in MODES]
+
+    print(f"{'rows':>8} {'mode':>10} {'wall_s':>8} {'peak_rss_mb':>12} {'Δrss_mb':>8} {'file_kb':>9}")
+    for r in results:
+        print(
+            f"{r['rows']:>8} {r['mode']:>10} {r['wall_s']:>8} {r['peak_rss_mb']:>12} "
+            f"{r['peak_rss_delta_mb']:>8} {r['file_kb']:>9}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
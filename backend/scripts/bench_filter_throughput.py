@@ -0,0 +1,405 @@
+"""Filter-engine throughput benchmark: every sector over a fixed offline corpus.
+
+``tests/benchmark_ground_truth.json`` measures precision/recall; this
+measures what the filter costs. For every sector in ``sectors_data.yaml``
+it runs ``aplicar_todos_filtros`` over the same bid corpus (default 50k)
+and reports:
+
+- wall_ms / bids_per_s:   the whole filter call
+- phases:                 wall / CPU ms, corpus bids/s and µs per corpus bid
+                          for each sub-phase (keywords, proximity,
+                          co_occurrence, density, synonyms, llm_arbiter, ...)
+                          from pipeline/profiling.py's phase clock
+- llm_calls:              completions requested from the LLM (arbiter,
+                          zero-match, recovery)
+- rss_corpus_mb / peak_rss_mb / filter_rss_mb: RSS once the corpus is
+                          loaded, peak RSS and the difference (memory the
+                          filter call added)
+- approved and the filter's rejection stats
+
+Phase rates use the corpus size as numerator: a late phase only sees the
+bids that survived the earlier ones, so its rate is "corpus bids per second
+of this phase", comparable across runs rather than across phases.
+
+MODES
+
+    build-corpus   write the corpus (gzip JSON lines of search_datalake RPC
+                   rows). ``--source ground-truth`` (default, offline and
+                   deterministic) cycles the benchmark_ground_truth.json
+                   objetos with varied UF / value / dates;
+                   ``--source datalake`` samples real rows via the
+                   search_datalake RPC (needs SUPABASE_URL /
+                   SUPABASE_SERVICE_ROLE_KEY).
+    run            run every sector (or ``--sectors``) in a fresh child
+                   interpreter each, print the table, optionally write a JSON
+                   baseline (``--write-baseline``) and/or compare against one
+                   (``--compare``: % change of wall time, phase times and LLM
+                   calls per sector).
+
+The children run with item inspection and Redis off and the LLM client
+replaced by a zero-latency stub that counts calls (SIM/NAO from a hash of
+the prompt, so runs repeat). ``modo_busca="publicacao"`` and all UFs, so the
+corpus dates do not change which bids reach the keyword stage. A warm-up
+pass over the first ``--warmup`` bids (not measured) fills the regex and
+normalization caches first.
+
+The keyword stage dominates (a few ms per bid), so the full 50k x all
+sectors run takes on the order of an hour on one core: use ``--jobs`` on an
+idle machine or ``--limit`` while iterating.
+
+USAGE
+
+    python backend/scripts/bench_filter_throughput.py build-corpus --out /tmp/filter_corpus.jsonl.gz
+    python backend/scripts/bench_filter_throughput.py run --corpus /tmp/filter_corpus.jsonl.gz \\
+        --write-baseline /tmp/filter_baseline.json
+    python backend/scripts/bench_filter_throughput.py run --corpus /tmp/filter_corpus.jsonl.gz \\
+        --sectors vestuario saude --compare /tmp/filter_baseline.json
+
+Baselines only compare on the same machine and corpus (the corpus sha256 is
+recorded and checked).
+
+This is a developer tool, not a test gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+backend_dir = str(Path(__file__).resolve().parent.parent)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+GROUND_TRUTH_FILE = Path(backend_dir) / "tests" / "benchmark_ground_truth.json"
+
+ALL_UFS = (
+    "AC", "AL", "AM", "AP", "BA", "CE", "DF", "ES", "GO", "MA", "MG", "MS", "MT", "PA",
+    "PB", "PE", "PI", "PR", "RJ", "RN", "RO", "RR", "RS", "SC", "SE", "SP", "TO",
+)
+
+_MODALIDADES = ((6, "Pregão - Eletrônico"), (8, "Dispensa"), (4, "Concorrência - Eletrônica"), (9, "Inexigibilidade"))
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+
+def ground_truth_rows(size: int, seed: int) -> list[dict]:
+    """``size`` RPC-shaped rows cycling the ground-truth objetos (deterministic)."""
+    data = json.loads(GROUND_TRUTH_FILE.read_text(encoding="utf-8"))
+    objetos = sorted({
+        objeto
+        for sector in data.values()
+        for key in ("relevant", "irrelevant")
+        for objeto in sector.get(key, [])
+    })
+    rng = random.Random(seed)
+    rng.shuffle(objetos)
+    base = date(2026, 1, 5)
+
+    rows = []
+    for i, objeto in zip(range(size), itertools.cycle(objetos)):
+        published = base + timedelta(days=i % 60)
+        modalidade_id, modalidade_nome = _MODALIDADES[i % len(_MODALIDADES)]
+        rows.append({
+            "pncp_id": f"{10000000000000 + i % 9973:014d}-1-{i:06d}/2026",
+            "uf": ALL_UFS[i % len(ALL_UFS)],
+            "municipio": f"Municipio {i % 997}",
+            "orgao_razao_social": f"Prefeitura Municipal de Municipio {i % 997}",
+            "orgao_cnpj": f"{10000000000000 + i % 9973:014d}",
+            "objeto_compra": objeto,
+            "valor_total_estimado": round(rng.lognormvariate(11.5, 1.6), 2),
+            "modalidade_id": modalidade_id,
+            "modalidade_nome": modalidade_nome,
+            "situacao_compra": "Divulgada no PNCP",
+            "data_publicacao": published.isoformat(),
+            "data_abertura": (published + timedelta(days=3)).isoformat(),
+            "data_encerramento": (published + timedelta(days=20 + i % 15)).isoformat(),
+            "link_pncp": f"https://pncp.gov.br/app/editais/{i}",
+            "esfera_id": ("M", "E", "F")[i % 3],
+        })
+    return rows
+
+
+def datalake_rows(size: int, seed: int) -> list[dict]:
+    """``size`` rows sampled from the datalake (search_datalake RPC, all UFs)."""
+    from dotenv import load_dotenv
+    load_dotenv(str(Path(backend_dir).parent / ".env"))
+    from supabase import create_client
+
+    sb = create_client(os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_SERVICE_ROLE_KEY", ""))
+    by_id: dict[str, dict] = {}
+    for uf in ALL_UFS:
+        result = sb.rpc("search_datalake", {"p_ufs": [uf], "p_limit": 5000}).execute()
+        for row in result.data or []:
+            by_id.setdefault(row.get("pncp_id") or f"{uf}-{len(by_id)}", row)
+        print(f"  {uf}: {len(result.data or [])} rows", file=sys.stderr)
+
+    ids = sorted(by_id)
+    if len(ids) > size:
+        ids = sorted(random.Random(seed).sample(ids, size))
+    return [by_id[i] for i in ids]
+
+
+def write_corpus(path: Path, rows: list[dict], source: str) -> None:
+    with open(path, "wb") as raw, gzip.GzipFile(filename="", fileobj=raw, mode="wb", mtime=0) as fh:  # mtime=0: same rows, same sha
+        for row in rows:
+            fh.write((json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+    print(f"{len(rows)} rows ({source}) -> {path} sha256={corpus_sha256(path)[:12]}")
+
+
+def read_corpus(path: Path, limit: int | None = None) -> list[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        lines = itertools.islice(fh, limit) if limit else fh
+        return [json.loads(line) for line in lines]
+
+
+def corpus_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Sector child
+# ---------------------------------------------------------------------------
+
+
+class _CountingCompletions:
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+        prompt = kwargs["messages"][-1]["content"]
+        verdict = "SIM" if zlib.crc32(prompt.encode("utf-8")) % 2 == 0 else "NAO"
+        if kwargs.get("response_format"):
+            content = json.dumps({
+                "classe": verdict, "confianca": 70, "evidencias": [],
+                "motivo_exclusao": None if verdict == "SIM" else "stub", "precisa_mais_dados": False,
+            })
+        else:
+            content = verdict
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=len(prompt) // 4, completion_tokens=len(content) // 4),
+        )
+
+
+def _current_rss_mb() -> float | None:
+    try:
+        with open("/proc/self/statm") as fh:
+            return round(int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+    except (OSError, ValueError):
+        return None
+
+
+def run_child(sector_id: str, corpus: Path, limit: int | None, warmup: int) -> dict:
+    """Filter the corpus for one sector in the current process (invoked via --child)."""
+    os.environ.update({"ITEM_INSPECTION_ENABLED": "false", "REDIS_URL": ""})
+    import llm_arbiter
+    from datalake_query import _row_to_normalized
+    from filter import aplicar_todos_filtros
+    from pipeline.profiling import record_phases
+    from sectors import get_sector
+
+    completions = _CountingCompletions()
+    stub = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    llm_arbiter._get_client = lambda: stub
+
+    sector = get_sector(sector_id)
+    licitacoes = [_row_to_normalized(row) for row in read_corpus(corpus, limit)]
+    rss_corpus = _current_rss_mb()
+
+    def _filter(bids: list[dict]):
+        return aplicar_todos_filtros(
+            bids, ufs_selecionadas=set(ALL_UFS), status="todos",
+            keywords=sector.keywords, exclusions=sector.exclusions,
+            context_required=sector.context_required_keywords or None,
+            setor=sector.id, modo_busca="publicacao",
+        )
+
+    if warmup:
+        _filter(copy.deepcopy(licitacoes[:warmup]))
+    completions.calls = 0
+
+    with record_phases(sector_id) as profile:
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        aprovadas, stats = _filter(licitacoes)
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+    peak_rss = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+    n = len(licitacoes)
+    phases: dict[str, dict] = {}
+    for name, phase_wall, phase_cpu in profile.pending_phases:
+        entry = phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+        entry["wall_ms"] += phase_wall * 1000
+        entry["cpu_ms"] += phase_cpu * 1000
+    for entry in phases.values():
+        entry["bids_per_s"] = round(n / (entry["wall_ms"] / 1000)) if entry["wall_ms"] > 0 else None
+        entry["us_per_bid"] = round(entry["wall_ms"] * 1000 / n, 2) if n else None
+        entry["wall_ms"] = round(entry["wall_ms"], 1)
+        entry["cpu_ms"] = round(entry["cpu_ms"], 1)
+
+    return {
+        "sector": sector_id,
+        "bids": n,
+        "approved": len(aprovadas),
+        "wall_ms": round(wall * 1000, 1),
+        "cpu_ms": round(cpu * 1000, 1),
+        "bids_per_s": round(n / wall) if wall > 0 else None,
+        "llm_calls": completions.calls,
+        "rss_corpus_mb": rss_corpus,
+        "peak_rss_mb": peak_rss,
+        "filter_rss_mb": round(peak_rss - rss_corpus, 1) if rss_corpus is not None else None,
+        "phases": phases,
+        "stats": {k: v for k, v in stats.items() if isinstance(v, int)},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Run / report
+# ---------------------------------------------------------------------------
+
+
+def _spawn(sector_id: str, args) -> dict:
+    cmd = [sys.executable, __file__, "--child", sector_id, str(args.corpus), str(args.limit or 0), str(args.warmup)]
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=backend_dir)
+    if proc.returncode != 0:
+        return {"sector": sector_id, "error": proc.stderr.strip().splitlines()[-1:] or ["exit %d" % proc.returncode]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _pct(new: float | None, old: float | None) -> str:
+    if not new or not old:
+        return "-"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def print_report(results: list[dict]) -> None:
+    cols = ("sector", "bids", "approved", "wall_ms", "bids_per_s", "llm_calls", "filter_rss_mb", "peak_rss_mb")
+    print(" ".join(f"{c:>24}" if c == "sector" else f"{c:>13}" for c in cols))
+    for r in results:
+        if "error" in r:
+            print(f"{r['sector']:>24} ERROR {r['error']}")
+            continue
+        print(" ".join(f"{r[c]!s:>24}" if c == "sector" else f"{r[c]!s:>13}" for c in cols))
+
+    print("\nphase wall ms (corpus bids/s)")
+    names = list(dict.fromkeys(name for r in results for name in r.get("phases", {})))
+    for r in results:
+        if "error" in r:
+            continue
+        cells = [
+            f"{name}={r['phases'][name]['wall_ms']}({r['phases'][name]['bids_per_s']})"
+            for name in names if name in r["phases"]
+        ]
+        print(f"{r['sector']:>24} " + " ".join(cells))
+
+
+def print_comparison(results: list[dict], baseline: dict) -> None:
+    base = baseline.get("sectors", {})
+    print(f"\nvs baseline {baseline['meta'].get('generated_at', '?')} (wall / llm_calls / approved; phases)")
+    for r in results:
+        old = base.get(r["sector"])
+        if "error" in r or old is None:
+            print(f"{r['sector']:>24} no baseline" if old is None else f"{r['sector']:>24} ERROR")
+            continue
+        phases = " ".join(
+            f"{name}={_pct(entry['wall_ms'], old.get('phases', {}).get(name, {}).get('wall_ms'))}"
+            for name, entry in r["phases"].items()
+        )
+        print(
+            f"{r['sector']:>24} wall={_pct(r['wall_ms'], old['wall_ms'])} "
+            f"llm_calls={r['llm_calls']}/{old['llm_calls']} approved={r['approved']}/{old['approved']}  {phases}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--child", nargs=4, metavar=("SECTOR", "CORPUS", "LIMIT", "WARMUP"), help=argparse.SUPPRESS)
+    sub = parser.add_subparsers(dest="mode")
+
+    build = sub.add_parser("build-corpus", help="write the bid corpus")
+    build.add_argument("--out", type=Path, required=True)
+    build.add_argument("--source", choices=("ground-truth", "datalake"), default="ground-truth")
+    build.add_argument("--size", type=int, default=50_000)
+    build.add_argument("--seed", type=int, default=42)
+
+    run = sub.add_parser("run", help="run the sectors over a corpus")
+    run.add_argument("--corpus", type=Path, required=True)
+    run.add_argument("--sectors", nargs="+", help="default: every sector in sectors_data.yaml")
+    run.add_argument("--limit", type=int, help="only the first N bids of the corpus")
+    run.add_argument("--warmup", type=int, default=500)
+    run.add_argument("--jobs", type=int, default=1, help="sectors in parallel (skews timings; default 1)")
+    run.add_argument("--write-baseline", type=Path, help="write the results as a JSON baseline")
+    run.add_argument("--compare", type=Path, help="baseline JSON to compare against")
+    args = parser.parse_args()
+
+    if args.child:
+        sector_id, corpus, limit, warmup = args.child
+        print(json.dumps(run_child(sector_id, Path(corpus), int(limit) or None, int(warmup))))
+        return 0
+
+    if args.mode == "build-corpus":
+        rows = (ground_truth_rows if args.source == "ground-truth" else datalake_rows)(args.size, args.seed)
+        write_corpus(args.out, rows, args.source)
+        return 0
+    if args.mode != "run":
+        parser.print_help()
+        return 2
+
+    from sectors import SECTORS
+
+    sha = corpus_sha256(args.corpus)
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    if baseline and baseline["meta"].get("corpus_sha256") != sha:
+        print("warning: baseline was recorded on a different corpus", file=sys.stderr)
+
+    sector_ids = args.sectors or list(SECTORS)
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(lambda s: _spawn(s, args), sector_ids))
+
+    print_report(results)
+    if baseline:
+        print_comparison(results, baseline)
+
+    if args.write_baseline:
+        payload = {
+            "meta": {
+                "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "corpus": str(args.corpus),
+                "corpus_sha256": sha,
+                "limit": args.limit,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "jobs": args.jobs,
+            },
+            "sectors": {r["sector"]: r for r in results if "error" not in r},
+        }
+        args.write_baseline.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,540 @@
+"""End-to-end search pipeline benchmark with recorded PNCP/PCP responses.
+
+Runs ``SearchPipeline`` end to end (validate → fetch → filter → LLM →
+enrich → generate → persist) against a local HTTP stand-in that serves
+PNCP / PCP pages from a fixture archive, so pipeline regressions can be
+measured locally and without network.
+
+MODES
+
+    record       run the searches once against the live PNCP / PCP APIs and
+                 save every page response (gzip JSON lines archive)
+    synthesize   build an archive of synthetic PNCP pages (no network needed)
+    run          serve an archive from the stand-in and run N searches with
+                 C concurrent, then report the numbers below
+
+The stand-in runs in its own process (``--serve``) with configurable latency
+(``--latency-ms`` ± ``--jitter-ms``) and error injection (``--error-rate``
+503s, ``--throttle-rate`` 429s with ``Retry-After: 1``). Requests missing from
+the archive get a 204 (empty page) and are counted as misses in the report.
+
+The searches run in a fresh child interpreter with:
+
+- the PNCP / PCP clients pointed at the stand-in (ComprasGov, datalake,
+  item inspection and Redis off; no ARQ queue, so summary and Excel run
+  inline);
+- the LLM arbiter's OpenAI client replaced by a stub that answers in
+  ``--llm-latency-ms`` (SIM/NAO from a hash of the prompt, so runs repeat);
+- the executive summary from ``gerar_resumo_fallback`` and Excel storage
+  uploads discarded (the workbook is still generated);
+- ``BuscaRequest.profile`` set and admin roles, so per-stage wall times come
+  from pipeline/profiling.py.
+
+Report: throughput (searches/s), p50 / p95 / p99 latency of the whole
+search and of each stage, peak RSS of the child and stand-in hits / misses /
+injected errors.
+
+USAGE
+
+    python backend/scripts/bench_pipeline_e2e.py synthesize --out /tmp/e2e.jsonl.gz
+    python backend/scripts/bench_pipeline_e2e.py run --archive /tmp/e2e.jsonl.gz \\
+        --searches 20 --concurrency 4 --latency-ms 80 --error-rate 0.02
+    python backend/scripts/bench_pipeline_e2e.py record --out /tmp/live.jsonl.gz \\
+        --ufs SP RJ --setor vestuario --days 5
+
+This is a developer tool, not a test gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import zlib
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qsl, urlsplit
+
+backend_dir = str(Path(__file__).resolve().parent.parent)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+# Live hosts → stand-in path prefix
+SOURCES = {
+    "pncp.gov.br": "pncp",
+    "compras.api.portaldecompraspublicas.com.br": "pcp",
+}
+
+# Params that vary between runs of the same search (dates, page size); the
+# stand-in falls back to matching without them.
+_LOOSE_IGNORED = frozenset({"dataInicial", "dataFinal", "tamanhoPagina", "situacaoCompra", "tipoData"})
+
+_OBJETOS = (
+    "Aquisição de uniformes escolares — camisetas, calças e jalecos",
+    "Contratação de empresa para manutenção predial preventiva e corretiva",
+    "Aquisição de material de expediente e papelaria para secretarias",
+    "Fornecimento de fardamento para guarda municipal, incluindo coturnos",
+    "Serviços de limpeza e conservação de prédios públicos",
+    "Aquisição de camisetas e bonés para evento esportivo municipal",
+)
+
+
+# ---------------------------------------------------------------------------
+# Archive
+# ---------------------------------------------------------------------------
+
+
+def _canonical(params: list[tuple[str, str]], loose: bool = False) -> str:
+    return "&".join(f"{k}={v}" for k, v in sorted(params) if not (loose and k in _LOOSE_IGNORED))
+
+
+def write_archive(path: str, searches: list[dict], responses: list[dict]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        fh.write(json.dumps({"kind": "meta", "searches": searches, "created_at": time.time()}) + "\n")
+        for r in responses:
+            fh.write(json.dumps({"kind": "response", **r}) + "\n")
+
+
+def read_archive(path: str) -> tuple[list[dict], list[dict]]:
+    searches, responses = [], []
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            entry = json.loads(line)
+            if entry.pop("kind") == "meta":
+                searches = entry["searches"]
+            else:
+                responses.append(entry)
+    return searches, responses
+
+
+def _search_request(ufs: list[str], setor: str, days: int, end: date) -> dict:
+    return {
+        "ufs": ufs,
+        "setor_id": setor,
+        "data_inicial": (end - timedelta(days=days)).isoformat(),
+        "data_final": end.isoformat(),
+    }
+
+
+def synthesize(args) -> int:
+    """Synthetic PNCP pages for every (UF, modalidade, page) of one search."""
+    from config import DEFAULT_MODALIDADES
+
+    end = date.today()
+    search = _search_request(args.ufs, args.setor, args.days, end)
+    rng = random.Random(args.seed)
+    responses = []
+    seq = 0
+    for uf in args.ufs:
+        for modalidade in DEFAULT_MODALIDADES:
+            for page in range(1, args.pages + 1):
+                items = []
+                for _ in range(args.page_size):
+                    seq += 1
+                    published = end - timedelta(days=rng.randrange(args.days + 1))
+                    items.append({
+                        "numeroControlePNCP": f"{10000000 + seq % 900:08d}000190-1-{seq:06d}/2026",
+                        "objetoCompra": f"{rng.choice(_OBJETOS)} — processo {seq}",
+                        "valorTotalEstimado": round(rng.uniform(5_000, 2_000_000), 2),
+                        "orgaoEntidade": {"cnpj": f"{10000000 + seq % 900:08d}000190",
+                                          "razaoSocial": f"Prefeitura Municipal de Cidade {seq % 900}"},
+                        "unidadeOrgao": {"ufSigla": uf, "municipioNome": f"Cidade {seq % 900}",
+                                         "nomeUnidade": "Secretaria de Administração"},
+                        "dataPublicacaoPncp": f"{published.isoformat()}T10:00:00",
+                        "dataAberturaProposta": f"{(end + timedelta(days=3)).isoformat()}T09:00:00",
+                        "dataEncerramentoProposta": f"{(end + timedelta(days=rng.randint(5, 30))).isoformat()}T18:00:00",
+                        "modalidadeId": modalidade,
+                        "modalidadeNome": "Pregão - Eletrônico",
+                        "situacaoCompraId": 1,
+                        "situacaoCompraNome": "Divulgada no PNCP",
+                        "linkSistemaOrigem": f"https://pncp.gov.br/app/editais/{seq}",
+                        "anoCompra": 2026,
+                        "sequencialCompra": seq,
+                    })
+                body = {
+                    "data": items,
+                    "totalRegistros": args.pages * args.page_size,
+                    "totalPaginas": args.pages,
+                    "numeroPagina": page,
+                    "paginasRestantes": args.pages - page,
+                    "empty": False,
+                }
+                params = [("uf", uf), ("codigoModalidadeContratacao", str(modalidade)), ("pagina", str(page))]
+                responses.append({
+                    "source": "pncp", "path": "/contratacoes/publicacao", "query": _canonical(params),
+                    "status": 200, "content_type": "application/json", "body": json.dumps(body),
+                })
+    write_archive(args.out, [search], responses)
+    print(f"wrote {len(responses)} pages ({seq} bids) to {args.out}")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Stand-in server (separate process)
+# ---------------------------------------------------------------------------
+
+
+class _StandIn:
+    def __init__(self, responses: list[dict], latency_ms: float, jitter_ms: float,
+                 error_rate: float, throttle_rate: float, seed: int):
+        self.exact: dict[tuple, dict] = {}
+        self.loose: dict[tuple, dict] = {}
+        for r in responses:
+            params = parse_qsl(r["query"], keep_blank_values=True)
+            self.exact.setdefault((r["source"], r["path"], _canonical(params)), r)
+            self.loose.setdefault((r["source"], r["path"], _canonical(params, loose=True)), r)
+        self.latency_s = latency_ms / 1000
+        self.jitter_s = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "loose_hits": 0, "misses": 0, "errors_injected": 0, "throttled": 0}
+
+    def handle(self, raw_path: str) -> tuple[int, dict, bytes]:
+        parts = urlsplit(raw_path)
+        source, _, path = parts.path.lstrip("/").partition("/")
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        with self.lock:
+            roll = self.rng.random()
+            delay = max(0.0, self.latency_s + self.rng.uniform(-self.jitter_s, self.jitter_s))
+        time.sleep(delay)
+
+        if roll < self.error_rate:
+            self._count("errors_injected")
+            return 503, {"Content-Type": "text/plain"}, b"injected error"
+        if roll < self.error_rate + self.throttle_rate:
+            self._count("throttled")
+            return 429, {"Content-Type": "text/plain", "Retry-After": "1"}, b"injected throttle"
+
+        key = (source, "/" + path, _canonical(params))
+        entry = self.exact.get(key)
+        if entry is not None:
+            self._count("hits")
+        else:
+            entry = self.loose.get((key[0], key[1], _canonical(params, loose=True)))
+            self._count("loose_hits" if entry is not None else "misses")
+        if entry is None:
+            return 204, {}, b""
+        return entry["status"], {"Content-Type": entry["content_type"]}, entry["body"].encode("utf-8")
+
+    def _count(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+
+def serve(args) -> int:
+    _, responses = read_archive(args.archive)
+    standin = _StandIn(responses, args.latency_ms, args.jitter_ms, args.error_rate, args.throttle_rate, args.seed)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802
+            if self.path == "/__stats":
+                status, headers, body = 200, {"Content-Type": "application/json"}, json.dumps(standin.stats).encode()
+            else:
+                status, headers, body = standin.handle(self.path)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *a):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), Handler)
+    server.daemon_threads = True
+    print(f"PORT {server.server_address[1]}", flush=True)
+    server.serve_forever()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Pipeline child
+# ---------------------------------------------------------------------------
+
+
+class _StubCompletions:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    def create(self, **kwargs):
+        time.sleep(self.latency_s)
+        prompt = kwargs["messages"][-1]["content"]
+        verdict = "SIM" if zlib.crc32(prompt.encode("utf-8")) % 2 == 0 else "NAO"
+        if kwargs.get("response_format"):
+            content = json.dumps({
+                "classe": verdict, "confianca": 70, "evidencias": [],
+                "motivo_exclusao": None if verdict == "SIM" else "stub", "precisa_mais_dados": False,
+            })
+        else:
+            content = verdict
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=len(prompt) // 4, completion_tokens=len(content) // 4),
+        )
+
+
+def _prepare_child(base_url: str | None, llm_latency_ms: float) -> None:
+    """Environment and stubs shared by ``record`` and ``run`` children."""
+    os.environ.update({
+        "DATALAKE_QUERY_ENABLED": "false",
+        "ENABLE_MULTI_SOURCE": "true",
+        "COMPRASGOV_ENABLED": "false",
+        "ITEM_INSPECTION_ENABLED": "false",
+        "REDIS_URL": "",
+    })
+    import job_queue
+    import llm_arbiter
+    import pipeline.stages.generate as generate
+    from llm import gerar_resumo_fallback
+
+    async def _no_queue() -> bool:
+        return False
+
+    job_queue.is_queue_available = _no_queue
+    stub = SimpleNamespace(chat=SimpleNamespace(completions=_StubCompletions(llm_latency_ms / 1000)))
+    llm_arbiter._get_client = lambda: stub
+    generate.gerar_resumo = lambda licitacoes, sector_name="licitações", termos_busca=None, **_: (
+        gerar_resumo_fallback(licitacoes, sector_name=sector_name, termos_busca=termos_busca)
+    )
+    generate.upload_excel = lambda *a, **kw: {"file_path": "bench.xlsx", "signed_url": ""}
+    generate.upload_excel_file = lambda *a, **kw: {"file_path": "bench.xlsx", "signed_url": ""}
+
+    if base_url:
+        from clients.pncp.async_client import AsyncPNCPClient
+        from clients.portal_compras_client import PortalComprasAdapter
+
+        AsyncPNCPClient.BASE_URL = f"{base_url}/pncp"
+        PortalComprasAdapter.BASE_URL = f"{base_url}/pcp"
+
+
+async def _run_search(request_data: dict) -> tuple[float, dict]:
+    from pipeline.profiling import get_search_profile
+    from pipeline.worker import build_default_deps
+    from schemas import BuscaRequest
+    from search_context import SearchContext
+    from search_pipeline import SearchPipeline
+
+    search_id = str(uuid.uuid4())
+    request = BuscaRequest(**request_data, search_id=search_id, force_fresh=True, profile=True)
+    deps = build_default_deps()
+
+    async def _admin_roles(user_id):
+        return True, True
+
+    deps.check_user_roles = _admin_roles
+    ctx = SearchContext(request=request, user={"id": "bench-user", "email": "bench@example.com"})
+    start = time.perf_counter()
+    await SearchPipeline(deps).run(ctx)
+    elapsed = time.perf_counter() - start
+    profile = await get_search_profile(search_id) or {}
+    return elapsed, {name: s["wall_ms"] for name, s in profile.get("stages", {}).items()}
+
+
+def _percentiles(values: list[float]) -> dict:
+    ordered = sorted(values)
+
+    def pct(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+    return {"p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99)}
+
+
+async def _bench(searches: list[dict], total: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    totals: list[float] = []
+    stages: dict[str, list[float]] = {}
+    failures = 0
+
+    async def _one(i: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            try:
+                elapsed, stage_ms = await _run_search(searches[i % len(searches)])
+            except Exception as e:
+                failures += 1
+                print(f"search {i} failed: {e!r}", file=sys.stderr)
+                return
+        totals.append(elapsed * 1000)
+        for name, ms in stage_ms.items():
+            stages.setdefault(name, []).append(ms)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(total)))
+    wall = time.perf_counter() - start
+    return {
+        "searches": total,
+        "failed": failures,
+        "concurrency": concurrency,
+        "wall_s": round(wall, 2),
+        "throughput_per_s": round(len(totals) / wall, 3) if wall else 0.0,
+        "latency_ms": _percentiles(totals) if totals else {},
+        "stages_ms": {name: _percentiles(v) for name, v in stages.items()},
+    }
+
+
+def run_child(args) -> dict:
+    import resource
+
+    _prepare_child(f"http://127.0.0.1:{args.port}", args.llm_latency_ms)
+    searches, _ = read_archive(args.archive)
+    result = asyncio.run(_bench(searches, args.searches, args.concurrency))
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return result
+
+
+def record_child(args) -> int:
+    """Run each search once against the live sources, capturing every page."""
+    import httpx
+
+    _prepare_child(None, args.llm_latency_ms)
+    captured: list[dict] = []
+    original_send = httpx.AsyncClient.send
+
+    async def _recording_send(self, request, *a, **kw):
+        response = await original_send(self, request, *a, **kw)
+        source = SOURCES.get(request.url.host)
+        if source:
+            await response.aread()
+            prefix = "/api/consulta/v1" if source == "pncp" else ""
+            captured.append({
+                "source": source,
+                "path": request.url.path[len(prefix):] if request.url.path.startswith(prefix) else request.url.path,
+                "query": _canonical(parse_qsl(request.url.query.decode(), keep_blank_values=True)),
+                "status": response.status_code,
+                "content_type": response.headers.get("content-type", ""),
+                "body": response.text,
+            })
+        return response
+
+    httpx.AsyncClient.send = _recording_send
+    search = _search_request(args.ufs, args.setor, args.days, date.today())
+    asyncio.run(_bench([search], 1, 1))
+    write_archive(args.out, [search], [r for r in captured if r["status"] in (200, 204)])
+    print(f"recorded {len(captured)} responses to {args.out}")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Parent
+# ---------------------------------------------------------------------------
+
+
+def _start_standin(args) -> tuple[subprocess.Popen, int]:
+    proc = subprocess.Popen(
+        [sys.executable, __file__, "--serve", args.archive,
+         "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+         "--error-rate", str(args.error_rate), "--throttle-rate", str(args.throttle_rate),
+         "--seed", str(args.seed)],
+        stdout=subprocess.PIPE, text=True, cwd=backend_dir,
+    )
+    line = proc.stdout.readline()
+    if not line.startswith("PORT "):
+        proc.kill()
+        raise RuntimeError(f"stand-in failed to start: {line!r}")
+    return proc, int(line.split()[1])
+
+
+def run(args) -> int:
+    import urllib.request
+
+    server, port = _start_standin(args)
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", args.archive, str(port),
+             str(args.searches), str(args.concurrency), str(args.llm_latency_ms)],
+            capture_output=True, text=True, check=True, cwd=backend_dir,
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/__stats") as resp:
+            result["standin"] = json.loads(resp.read())
+    finally:
+        server.kill()
+        server.wait()
+
+    print(f"searches={result['searches']} failed={result['failed']} concurrency={result['concurrency']} "
+          f"wall={result['wall_s']}s throughput={result['throughput_per_s']}/s peak_rss={result['peak_rss_mb']}MB")
+    print(f"stand-in: {result['standin']}")
+    print(f"{'stage':>26} {'p50_ms':>10} {'p95_ms':>10} {'p99_ms':>10}")
+    rows = [("search (total)", result["latency_ms"])] + list(result["stages_ms"].items())
+    for name, p in rows:
+        if p:
+            print(f"{name:>26} {p['p50']:>10} {p['p95']:>10} {p['p99']:>10}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+def main() -> int:
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--serve", dest="archive")
+        parser.add_argument("--port", type=int, default=0)
+        for flag in ("--latency-ms", "--jitter-ms", "--error-rate", "--throttle-rate"):
+            parser.add_argument(flag, type=float, default=0.0)
+        parser.add_argument("--seed", type=int, default=0)
+        return serve(parser.parse_args())
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        archive, port, searches, concurrency, llm_latency_ms = sys.argv[2:7]
+        args = SimpleNamespace(archive=archive, port=int(port), searches=int(searches),
+                               concurrency=int(concurrency), llm_latency_ms=float(llm_latency_ms))
+        print(json.dumps(run_child(args)))
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    p_syn = sub.add_parser("synthesize", help="Build an archive of synthetic PNCP pages")
+    p_syn.add_argument("--out", required=True)
+    p_syn.add_argument("--ufs", nargs="+", default=["SP", "RJ", "MG"])
+    p_syn.add_argument("--setor", default="vestuario")
+    p_syn.add_argument("--days", type=int, default=10)
+    p_syn.add_argument("--pages", type=int, default=3, help="Pages per (UF, modalidade)")
+    p_syn.add_argument("--page-size", type=int, default=50)
+    p_syn.add_argument("--seed", type=int, default=42)
+
+    p_rec = sub.add_parser("record", help="Record live PNCP/PCP responses (needs network)")
+    p_rec.add_argument("--out", required=True)
+    p_rec.add_argument("--ufs", nargs="+", default=["SP"])
+    p_rec.add_argument("--setor", default="vestuario")
+    p_rec.add_argument("--days", type=int, default=5)
+    p_rec.add_argument("--llm-latency-ms", type=float, default=0.0)
+
+    p_run = sub.add_parser("run", help="Replay an archive through SearchPipeline")
+    p_run.add_argument("--archive", required=True)
+    p_run.add_argument("--searches", type=int, default=10)
+    p_run.add_argument("--concurrency", type=int, default=2)
+    p_run.add_argument("--latency-ms", type=float, default=50.0)
+    p_run.add_argument("--jitter-ms", type=float, default=20.0)
+    p_run.add_argument("--error-rate", type=float, default=0.0)
+    p_run.add_argument("--throttle-rate", type=float, default=0.0)
+    p_run.add_argument("--llm-latency-ms", type=float, default=300.0)
+    p_run.add_argument("--seed", type=int, default=42)
+    p_run.add_argument("--json", help="Optional path to write raw results as JSON")
+
+    args = parser.parse_args()
+    if args.mode == "synthesize":
+        return synthesize(args)
+    if args.mode == "record":
+        return record_child(args)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
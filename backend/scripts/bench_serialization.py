@@ -0,0 +1,148 @@
+"""Search response serialization benchmark: legacy vs encode-once paths.
+
+Measures wall time (best of --repeat) and peak traced allocations
+(tracemalloc) for the three places a BuscaResponse is serialized, on
+synthetic result sets (default 1k / 5k bids):
+
+- items:   LicitacaoItem(**kw) (validated) vs LicitacaoItem.model_construct(**kw)
+           (with pydantic 2.x the Rust validator beats the Python-level
+           model_construct loop, so _convert_to_licitacao_items keeps validating)
+- persist: model_dump(mode="json") + json.dumps per store (Redis, Supabase
+           dumps→loads) vs one model_dump_json() reused by both stores
+- read:    GET /buscar-results on an L2 hit — json.loads + jsonable_encoder +
+           json.dumps vs returning the stored JSON text as-is
+
+USAGE
+
+    python backend/scripts/bench_serialization.py
+    python backend/scripts/bench_serialization.py --rows 2000 --repeat 5 --json out.json
+
+This is a developer tool, not a test gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+backend_dir = str(Path(__file__).resolve().parent.parent)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+
+def synthetic_bids(n: int) -> list[dict]:
+    """``n`` post-filter bid dicts (deterministic, realistic field sizes)."""
+    return [
+        {
+            "codigoCompra": f"{i:08d}",
+            "numeroControlePNCP": f"12345678000190-1-{i:06d}/2026",
+            "objetoCompra": (
+                f"Aquisição de uniformes escolares lote {i} — camisetas, calças, "
+                "jalecos e demais itens de vestuário conforme termo de referência"
+            ),
+            "nomeOrgao": f"Prefeitura Municipal de Cidade {i % 500}",
+            "uf": ("SP", "RJ", "MG", "BA", "PR")[i % 5],
+            "municipio": f"Cidade {i % 500}",
+            "valorTotalEstimado": 10_000.0 + (i * 37.5),
+            "modalidadeNome": "Pregão Eletrônico",
+            "dataPublicacaoPncp": "2026-10-10T10:00:00",
+            "dataAberturaProposta": "2026-10-20T09:30:00Z",
+            "dataEncerramentoProposta": "2026-11-05T18:00:00",
+            "cnpjOrgao": "12345678000190",
+            "_source": "pncp",
+            "_relevance_source": "keyword",
+            "_matched_terms": ["uniforme", "jaleco"],
+            "_viability_score": 72,
+            "_viability_level": "alta",
+            "_viability_factors": {"modalidade": 80, "timeline": 70, "value_fit": 65, "geography": 75},
+            "_value_source": "estimated",
+        }
+        for i in range(n)
+    ]
+
+
+def _measure(fn, repeat: int) -> tuple[float, float]:
+    """(best wall seconds, peak traced MB) of ``fn()``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+
+def run(rows: int, repeat: int) -> list[dict]:
+    from fastapi.encoders import jsonable_encoder
+
+    from pipeline.helpers import _convert_to_licitacao_items, encode_search_response
+    from schemas import BuscaResponse, LicitacaoItem, ResumoLicitacoes
+
+    items = _convert_to_licitacao_items(synthetic_bids(rows))
+    item_kwargs = [dict(item.__dict__) for item in items]
+    response = BuscaResponse(
+        resumo=ResumoLicitacoes(
+            resumo_executivo="Benchmark", total_oportunidades=rows, valor_total=0.0,
+            destaques=[], alerta_urgencia=None,
+        ),
+        licitacoes=items, excel_available=False, quota_used=1, quota_remaining=9,
+        total_raw=rows, total_filtrado=rows,
+    )
+    stored = encode_search_response(response).decode()
+
+    def legacy_persist():
+        json.dumps(response.model_dump(mode="json"), default=str)                       # Redis
+        json.loads(json.dumps(response.model_dump(mode="json"), default=str))           # Supabase
+
+    def encode_once_persist():
+        encoded = encode_search_response(response)
+        json.loads(encoded)                                                             # Supabase
+
+    def legacy_read():
+        json.dumps(jsonable_encoder(json.loads(stored)))
+
+    cases = [
+        ("items", "validated", lambda: [LicitacaoItem(**kw) for kw in item_kwargs]),
+        ("items", "construct", lambda: [LicitacaoItem.model_construct(**kw) for kw in item_kwargs]),
+        ("persist", "legacy", legacy_persist),
+        ("persist", "encode_once", encode_once_persist),
+        ("read", "legacy", legacy_read),
+        ("read", "stored_json", lambda: stored.encode()),
+    ]
+    results = []
+    for step, mode, fn in cases:
+        wall, peak_mb = _measure(fn, repeat)
+        results.append({
+            "rows": rows, "step": step, "mode": mode,
+            "wall_ms": round(wall * 1000, 2), "peak_alloc_mb": round(peak_mb, 2),
+        })
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Optional path to write raw results as JSON")
+    args = parser.parse_args()
+
+    results = [r for rows in args.rows for r in run(rows, args.repeat)]
+
+    print(f"{'rows':>6} {'step':>8} {'mode':>12} {'wall_ms':>9} {'peak_alloc_mb':>14}")
+    for r in results:
+        print(f"{r['rows']:>6} {r['step']:>8} {r['mode']:>12} {r['wall_ms']:>9} {r['peak_alloc_mb']:>14}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
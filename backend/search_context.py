@@ -58,6 +58,8 @@ class SearchContext:
     is_truncated: bool = False  # True when any UF hit max_pages limit
     truncated_ufs: Optional[list] = None  # UF codes where data was truncated
     truncation_details: Optional[dict] = None  # Per-source truncation: {"pncp": True, "portal_compras": False}
+    fetch_plan: Optional[dict] = None  # PNCP per-UF page budgets/timeouts (PNCP_FETCH_PLANNER_ENABLED)
+    _datalake_base_results: Optional[list] = None  # Hybrid datalake: rows merged after the live delta
     # GTM-FIX-010: SWR cache fields
     cached: bool = False  # True when serving stale cached results
     cached_at: Optional[str] = None  # ISO timestamp of cache creation
@@ -124,6 +126,9 @@ class SearchContext:
     session_id: Optional[str] = None
     response: Any = None  # schemas.BuscaResponse
 
+    # === Search profiling (opt-in / sampled) ===
+    profile: Any = None  # pipeline.profiling.SearchProfile
+
     def deadline_remaining(self) -> float | None:
         """CRIT-072 AC8: Seconds until deadline, or None if no deadline set."""
         if self.deadline_ts is None:
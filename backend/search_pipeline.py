@@ -16,6 +16,7 @@ from pipeline.stages import (
     stage_filter, stage_enrich, stage_post_filter_llm, stage_generate, stage_persist,
 )
 from pipeline.tracing import traced_stage, validate_stage_outputs
+from pipeline.profiling import start_profile, finish_profile
 
 logger = logging.getLogger(__name__)
 _tracer = get_tracer("search_pipeline")
@@ -80,7 +81,11 @@ class SearchPipeline:
             "search.ufs": ",".join(ctx.request.ufs),
             "search.user_id": ctx.user.get("id", "") if ctx.user else "",
         }) as root_span:
-            return await self._run_stages(ctx, root_span)
+            start_profile(ctx)
+            try:
+                return await self._run_stages(ctx, root_span)
+            finally:
+                await finish_profile(ctx)
 
     async def _run_stages(self, ctx: SearchContext, root_span) -> BuscaResponse:
         """Execute pipeline stages with state machine transitions."""
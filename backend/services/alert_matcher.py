@@ -1,15 +1,21 @@
 """STORY-315 AC1-AC4: Alert matching engine.
 
-Queries active alerts for users with active plans, executes cached-result
-search per alert using filter.py–compatible logic, cross-deduplicates within
-the same user, and records runs in ``alert_runs`` for auditability.
+Queries active alerts for users with active plans, loads the candidate bid
+set once per run (``pncp_raw_bids`` ingested since the last run, falling back
+to ``search_results_cache``) into an in-memory inverted index, answers each
+alert by set intersections followed by filter.py–compatible checks,
+cross-deduplicates within the same user, and records runs in ``alert_runs``
+for auditability.
 
 Usage (from cron_jobs.py):
     from services.alert_matcher import match_alerts
     results = await match_alerts()
 """
 
+import json
 import logging
+import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
@@ -26,6 +32,17 @@ _ACTIVE_PLAN_TYPES = frozenset({
     "free_trial",
 })
 
+# Candidate window: last 24h, extended back to the previous run (capped)
+_CANDIDATE_LOOKBACK = timedelta(hours=24)
+_CANDIDATE_MAX_LOOKBACK = timedelta(hours=72)
+_CANDIDATE_PAGE_SIZE = 1000  # PostgREST max-rows
+_CANDIDATE_MAX_ROWS = 20000
+
+_RAW_BID_COLUMNS = (
+    "pncp_id, objeto_compra, orgao_razao_social, valor_total_estimado, uf, "
+    "modalidade_nome, situacao_compra, link_pncp, data_publicacao"
+)
+
 
 # ---------------------------------------------------------------------------
 # AC1: match_alerts() — main entry point
@@ -52,7 +69,8 @@ async def match_alerts(
         db: Supabase client (fetched if None).
 
     Returns:
-        Dict with keys: total_alerts, matched, skipped, errors, payloads.
+        Dict with keys: total_alerts, matched, skipped, errors, payloads,
+        candidates, db_bytes_read, alerts_per_sec.
     """
     if db is None:
         db = get_supabase()
@@ -65,6 +83,8 @@ async def match_alerts(
         "payloads": [],
     }
 
+    started = time.monotonic()
+
     # Step 1: Get active alerts with enriched user data
     alerts = await _get_eligible_alerts(db, limit=max_alerts)
     summary["total_alerts"] = len(alerts)
@@ -73,12 +93,19 @@ async def match_alerts(
         logger.info("STORY-315: No eligible alerts to process")
         return summary
 
+    # Step 2: Load the candidate bids once and index them for every alert
+    load_stats = {"db_bytes_read": 0}
+    candidates = await _load_candidate_bids(db, load_stats)
+    index = AlertCandidateIndex(candidates)
+    summary["candidates"] = len(index)
+    summary["db_bytes_read"] = load_stats["db_bytes_read"]
+
     # AC3: Cross-alert dedup per user — track items already assigned
     user_sent_items: dict[str, set[str]] = {}
 
     for alert in alerts:
         try:
-            payload = await _process_alert(alert, user_sent_items, db)
+            payload = await _process_alert(alert, user_sent_items, db, index=index)
 
             if payload.get("skipped"):
                 summary["skipped"] += 1
@@ -100,13 +127,20 @@ async def match_alerts(
                 alert["id"][:8], e,
             )
 
+    elapsed = max(time.monotonic() - started, 1e-6)
+    summary["alerts_per_sec"] = round(len(alerts) / elapsed, 2)
+
     logger.info(
         "STORY-315: match_alerts complete — "
-        "total=%d, matched=%d, skipped=%d, errors=%d",
+        "total=%d, matched=%d, skipped=%d, errors=%d, "
+        "candidates=%d, db_bytes_read=%d, alerts_per_sec=%.2f",
         summary["total_alerts"],
         summary["matched"],
         summary["skipped"],
         summary["errors"],
+        summary["candidates"],
+        summary["db_bytes_read"],
+        summary["alerts_per_sec"],
     )
 
     return summary
@@ -210,6 +244,7 @@ async def _process_alert(
     alert: dict,
     user_sent_items: dict[str, set[str]],
     db,
+    index: Optional["AlertCandidateIndex"] = None,
 ) -> dict:
     """Process one alert: search, filter, dedup, return payload.
 
@@ -219,7 +254,8 @@ async def _process_alert(
     AC3: Cross-alert dedup — skips items already in another alert
     for the same user.
 
-    AC4: Searches last 24h of cached results.
+    AC4: Searches last 24h of cached results. When ``index`` is given
+    (match_alerts), the run-wide candidate index is queried instead.
 
     Returns:
         Dict: alert_id, user_id, email, full_name, alert_name,
@@ -248,23 +284,29 @@ async def _process_alert(
         result["skip_reason"] = "rate_limited"
         return result
 
-    # AC4: Search cached results from last 24h
-    raw_results = await _search_cached_results(alert.get("filters", {}), db)
+    filters = alert.get("filters", {})
+    if index is None:
+        # AC4: Search cached results from last 24h
+        index = AlertCandidateIndex(await _search_cached_results(filters, db))
+    else:
+        # Run-wide candidates are not sector-scoped
+        filters = _effective_filters(filters)
 
-    if not raw_results:
+    if not len(index):
         result["skipped"] = True
         result["skip_reason"] = "no_results"
         # Record run even for empty results
         await _record_alert_run(alert_id, 0, 0, "no_results", db)
         return result
 
-    # AC2: Apply filter.py–compatible matching
-    filtered = _apply_alert_filters(raw_results, alert.get("filters", {}))
+    # AC2: Index lookup, then filter.py–compatible matching on the candidates
+    candidates = index.candidates(filters)
+    filtered = _apply_alert_filters(candidates, filters)
 
     if not filtered:
         result["skipped"] = True
         result["skip_reason"] = "no_matching_results"
-        await _record_alert_run(alert_id, len(raw_results), 0, "no_match", db)
+        await _record_alert_run(alert_id, len(candidates), 0, "no_match", db)
         return result
 
     # Dedup against previously sent items
@@ -286,7 +328,7 @@ async def _process_alert(
         result["skipped"] = True
         result["skip_reason"] = "all_already_sent"
         await _record_alert_run(
-            alert_id, len(raw_results), 0, "all_deduped", db,
+            alert_id, len(candidates), 0, "all_deduped", db,
         )
         return result
 
@@ -295,19 +337,239 @@ async def _process_alert(
 
     # AC10: Record successful run
     await _record_alert_run(
-        alert_id, len(raw_results), len(new_items), "matched", db,
+        alert_id, len(candidates), len(new_items), "matched", db,
     )
 
     return result
 
 
+# ---------------------------------------------------------------------------
+# Run-wide candidate set + inverted index
+# ---------------------------------------------------------------------------
+
+
+class AlertCandidateIndex:
+    """In-memory inverted index over the candidate bids of one run.
+
+    Maps normalized title/orgao tokens, UFs and estimated values to bid IDs
+    so each alert is answered with set intersections instead of a scan.
+    ``candidates()`` is a superset filter: each keyword word matches any
+    token containing it (``_apply_alert_filters`` matches substrings, so
+    "computador" must find "microcomputadores"), and the caller still
+    applies ``_apply_alert_filters`` for exact keyword/status checks and
+    density scoring.
+    """
+
+    def __init__(self, items: list[dict]):
+        from filter.keywords import normalize_text
+
+        self._items: dict[str, dict] = {}
+        self._tokens: dict[str, set[str]] = {}
+        self._by_uf: dict[str, set[str]] = {}
+        self._unvalued: set[str] = set()
+        valued: list[tuple[float, str]] = []
+
+        for item in items:
+            item_id = item.get("id")
+            if not item_id or item_id in self._items:
+                continue
+            self._items[item_id] = item
+
+            text = normalize_text(f"{item.get('titulo', '')} {item.get('orgao', '')}")
+            for token in set(text.split()):
+                self._tokens.setdefault(token, set()).add(item_id)
+
+            self._by_uf.setdefault(item.get("uf") or "", set()).add(item_id)
+
+            valor = item.get("valor_estimado") or 0
+            if valor > 0:
+                valued.append((valor, item_id))
+            else:
+                self._unvalued.add(item_id)
+
+        valued.sort()
+        self._values = [v for v, _ in valued]
+        self._value_ids = [i for _, i in valued]
+        # Newline-delimited vocabulary: one C-level str.find per keyword word
+        self._vocabulary = "\n" + "\n".join(self._tokens) + "\n"
+        self._word_ids: dict[str, set[str]] = {}
+        self._order = {item_id: pos for pos, item_id in enumerate(self._items)}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _substring_ids(self, word: str) -> set[str]:
+        cached = self._word_ids.get(word)
+        if cached is not None:
+            return cached
+        vocabulary = self._vocabulary
+        ids: set[str] = set()
+        pos = vocabulary.find(word)
+        while pos != -1:
+            start = vocabulary.rfind("\n", 0, pos) + 1
+            end = vocabulary.find("\n", pos)
+            ids |= self._tokens[vocabulary[start:end]]
+            pos = vocabulary.find(word, end)
+        self._word_ids[word] = ids
+        return ids
+
+    def _keyword_ids(self, keyword: str) -> Optional[set[str]]:
+        from filter.keywords import normalize_text
+
+        words = normalize_text(keyword).split()
+        if not words:
+            return None
+        ids = set(self._substring_ids(words[0]))
+        for word in words[1:]:
+            if not ids:
+                break
+            ids &= self._substring_ids(word)
+        return ids
+
+    def _value_range_ids(self, valor_min: float, valor_max: float) -> set[str]:
+        lo = bisect_left(self._values, valor_min) if valor_min > 0 else 0
+        hi = bisect_right(self._values, valor_max) if valor_max > 0 else len(self._values)
+        return set(self._value_ids[lo:hi]) | self._unvalued
+
+    def candidates(self, filters: dict) -> list[dict]:
+        """Return copies of the bids that may match ``filters``, in load order."""
+        ids: Optional[set[str]] = None
+
+        ufs = filters.get("ufs") or []
+        if ufs:
+            # Items without UF pass the UF check in _apply_alert_filters
+            ids = set(self._by_uf.get("", ()))
+            for uf in ufs:
+                ids |= self._by_uf.get(uf, set())
+
+        valor_min = float(filters.get("valor_min") or 0)
+        valor_max = float(filters.get("valor_max") or 0)
+        if valor_min > 0 or valor_max > 0:
+            in_range = self._value_range_ids(valor_min, valor_max)
+            ids = in_range if ids is None else ids & in_range
+
+        keyword_sets = [self._keyword_ids(kw) for kw in filters.get("keywords") or []]
+        keyword_sets = [kw_ids for kw_ids in keyword_sets if kw_ids is not None]
+        if keyword_sets:
+            matched = set().union(*keyword_sets)
+            ids = matched if ids is None else ids & matched
+
+        if ids is None:
+            selected = list(self._items)
+        else:
+            selected = sorted(ids, key=self._order.__getitem__)
+        # Copies: _apply_alert_filters annotates keyword_density per alert
+        return [dict(self._items[item_id]) for item_id in selected]
+
+
+def _effective_filters(filters: dict) -> dict:
+    """Use the sector vocabulary for sector-only alerts.
+
+    Raw bids carry no sector, so an alert with ``setor`` and no keywords is
+    matched on that sector's keywords instead of every bid in its UFs.
+    """
+    setor = filters.get("setor")
+    if not setor or filters.get("keywords"):
+        return filters
+    try:
+        from sectors import get_sector
+
+        keywords = sorted(get_sector(setor).keywords)
+    except KeyError:
+        return filters
+    return {**filters, "keywords": keywords}
+
+
+def _payload_bytes(data) -> int:
+    """Approximate bytes read from the database for a response payload."""
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+async def _candidate_window_start(db) -> datetime:
+    """Start of the candidate window: 24h ago, or the last run if older (max 72h)."""
+    now = datetime.now(timezone.utc)
+    since = now - _CANDIDATE_LOOKBACK
+    try:
+        result = await sb_execute(
+            db.table("alert_runs")
+            .select("run_at")
+            .order("run_at", desc=True)
+            .limit(1)
+        )
+        rows = result.data or []
+        run_at = rows[0].get("run_at") if rows else None
+        if run_at:
+            last_run = datetime.fromisoformat(str(run_at).replace("Z", "+00:00"))
+            since = max(min(since, last_run), now - _CANDIDATE_MAX_LOOKBACK)
+    except Exception as e:
+        logger.debug("STORY-315: Last alert run unavailable: %s", e)
+    return since
+
+
+async def _load_candidate_bids(db, stats: dict) -> list[dict]:
+    """Load this run's candidate bids once.
+
+    Reads ``pncp_raw_bids`` ingested since the last run (paged, capped at
+    ``_CANDIDATE_MAX_ROWS``); falls back to the 24h ``search_results_cache``
+    scan when the datalake returns nothing. Adds payload sizes to
+    ``stats["db_bytes_read"]``.
+    """
+    since = await _candidate_window_start(db)
+    items: list[dict] = []
+
+    try:
+        offset = 0
+        while offset < _CANDIDATE_MAX_ROWS:
+            result = await sb_execute(
+                db.table("pncp_raw_bids")
+                .select(_RAW_BID_COLUMNS)
+                .eq("is_active", True)
+                .gte("ingested_at", since.isoformat())
+                .order("ingested_at", desc=True)
+                .range(offset, offset + _CANDIDATE_PAGE_SIZE - 1)
+            )
+            rows = result.data or []
+            stats["db_bytes_read"] += _payload_bytes(rows)
+            items.extend(
+                _normalize_raw_bid(row) for row in rows if row.get("pncp_id")
+            )
+            if len(rows) < _CANDIDATE_PAGE_SIZE:
+                break
+            offset += _CANDIDATE_PAGE_SIZE
+    except Exception as e:
+        logger.warning("STORY-315: Raw bids candidate load failed: %s", e)
+
+    if items:
+        return items
+    return await _search_cached_results({}, db, stats=stats)
+
+
+def _normalize_raw_bid(row: dict) -> dict:
+    """Normalize a pncp_raw_bids row into the _normalize_item format."""
+    return {
+        "id": row["pncp_id"],
+        "titulo": row.get("objeto_compra") or "Sem titulo",
+        "orgao": row.get("orgao_razao_social") or "Nao informado",
+        "valor_estimado": float(row.get("valor_total_estimado") or 0),
+        "uf": row.get("uf") or "",
+        "modalidade": row.get("modalidade_nome") or "",
+        "link_pncp": row.get("link_pncp") or "",
+        "viability_score": None,
+        "status": row.get("situacao_compra") or "",
+        "data_publicacao": row.get("data_publicacao") or "",
+    }
+
+
 # ---------------------------------------------------------------------------
 # AC4: Search cached results (last 24h)
 # ---------------------------------------------------------------------------
 
 
 async def _search_cached_results(
-    alert_filters: dict, db,
+    alert_filters: dict, db, stats: Optional[dict] = None,
 ) -> list[dict]:
     """Search cached results for alert matching.
 
@@ -332,6 +594,8 @@ async def _search_cached_results(
 
         if not result.data:
             return []
+        if stats is not None:
+            stats["db_bytes_read"] = stats.get("db_bytes_read", 0) + _payload_bytes(result.data)
 
         all_items: list[dict] = []
         seen_ids: set[str] = set()
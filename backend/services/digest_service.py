@@ -2,12 +2,15 @@
 STORY-278 AC2: Digest Service — builds per-user opportunity digest.
 
 Queries search_results_cache filtered by user's profile_context (setor + UFs),
-returns top N opportunities sorted by viability_score.
+returns top N opportunities sorted by viability_score. A digest run loads the
+opportunity pool and profile contexts once (``load_digest_batch``) and builds
+every user's digest from it.
 
 Usage:
-    from services.digest_service import build_digest_for_user
+    from services.digest_service import build_digest_for_user, load_digest_batch
 
-    opportunities = await build_digest_for_user(user_id, max_items=10)
+    batch = await load_digest_batch(eligible, db, max_items=10)
+    digest = await build_digest_for_user(user_id, db, max_items=10, batch=batch)
 """
 
 import logging
@@ -96,51 +99,87 @@ def _is_digest_due(prefs: dict) -> bool:
         return False
 
 
-async def _query_recent_opportunities(
-    db,
-    setor_id: str | None,
-    ufs: list[str] | None,
-    since: datetime | None,
-    max_items: int = 10,
-) -> list[dict]:
-    """Query search_results_cache for recent opportunities matching user profile.
+_POOL_ROW_LIMIT = 50
+_PROFILE_BATCH_SIZE = 200
+
+# Map sector IDs to friendly names (subset)
+_SECTOR_NAMES = {
+    "vestuario": "Vestuario e Uniformes",
+    "alimentos": "Alimentos",
+    "informatica": "TI e Hardware",
+    "software_desenvolvimento": "Desenvolvimento de Software",
+    "software_licencas": "Licencas de Software",
+    "engenharia": "Engenharia",
+    "medicamentos": "Medicamentos",
+    "equipamentos_medicos": "Equipamentos Medicos",
+    "insumos_hospitalares": "Insumos Hospitalares",
+    "servicos_prediais": "Servicos Prediais",
+    "produtos_limpeza": "Produtos de Limpeza",
+    "mobiliario": "Mobiliario",
+}
+
+
+def _parse_timestamp(value) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
 
-    Args:
-        db: Supabase client.
-        setor_id: User's sector ID filter.
-        ufs: User's UFs filter.
-        since: Only include results newer than this timestamp.
-        max_items: Max opportunities to return.
 
-    Returns:
-        List of opportunity dicts.
-    """
-    try:
-        query = db.table("search_results_cache").select(
-            "results, search_params, created_at"
-        ).order("created_at", desc=True).limit(50)
+def _digest_since(prefs: dict | None) -> datetime:
+    """Start of a user's digest window: last send, else the last 24h."""
+    last_sent = _parse_timestamp((prefs or {}).get("last_digest_sent_at"))
+    if last_sent is None:
+        return datetime.now(timezone.utc) - timedelta(days=1)
+    return last_sent
 
-        if since:
-            query = query.gte("created_at", since.isoformat())
 
-        result = await sb_execute(query)
+class OpportunityPool:
+    """The most recent ``search_results_cache`` rows, shared by a digest run.
 
-        if not result.data:
-            return []
+    Rows are kept newest first, exactly as the per-user query returned them,
+    so a user's window is a prefix of the pool. Opportunities are grouped by
+    (setor, UF) per window and sorted once; each user's digest merges the
+    top-N lists of their UFs.
+    """
 
-        # Flatten all results and filter by setor/UFs
-        all_opps = []
+    def __init__(self, rows: list[dict], max_items: int = 10):
+        self.max_items = max_items
+        self._rows = rows
+        self._created = [_parse_timestamp(row.get("created_at")) for row in rows]
+        self._groups: dict[tuple, dict[str, list[tuple]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _window(self, since: datetime | None) -> int:
+        """Number of leading rows created at or after ``since``."""
+        if since is None:
+            return len(self._rows)
+        for pos, created in enumerate(self._created):
+            if created is not None and created < since:
+                return pos
+        return len(self._rows)
+
+    def _top_by_uf(self, setor_id: str | None, window: int) -> dict[str, list[tuple]]:
+        key = (setor_id, window)
+        groups = self._groups.get(key)
+        if groups is not None:
+            return groups
+
+        groups = {}
         seen_ids = set()
-
-        for row in result.data:
-            results = row.get("results") or []
+        position = 0
+        for row in self._rows[:window]:
             params = row.get("search_params") or {}
 
             # Filter by setor if user has one
             if setor_id and params.get("setor_id") and params["setor_id"] != setor_id:
                 continue
 
-            for item in results:
+            for item in row.get("results") or []:
                 if not isinstance(item, dict):
                     continue
 
@@ -150,49 +189,168 @@ async def _query_recent_opportunities(
                     continue
                 seen_ids.add(item_id)
 
-                # Filter by UF if user has UF preference
                 item_uf = item.get("uf") or item.get("unidadeFederativa", "")
-                if ufs and item_uf and item_uf not in ufs:
-                    continue
-
-                all_opps.append({
+                opp = {
                     "titulo": item.get("objetoCompra") or item.get("titulo") or "Sem titulo",
                     "orgao": item.get("nomeOrgao") or item.get("orgao") or "Nao informado",
                     "valor_estimado": float(item.get("valorTotalEstimado") or 0),
                     "uf": item_uf,
                     "viability_score": item.get("viability_score"),
                     "data_publicacao": item.get("dataPublicacaoPncp") or item.get("data_publicacao"),
-                })
-
-        # Sort: viability_score DESC (None at end), then valor_estimado DESC
-        all_opps.sort(
-            key=lambda x: (
-                x.get("viability_score") or 0.0,
-                x.get("valor_estimado") or 0.0,
-            ),
-            reverse=True,
-        )
+                }
+                # Sort: viability_score DESC (None at end), then valor_estimado DESC,
+                # ties in pool order
+                sort_key = (-(opp["viability_score"] or 0.0), -(opp["valor_estimado"] or 0.0), position)
+                position += 1
+                groups.setdefault(item_uf, []).append((sort_key, opp))
+
+        for uf, entries in groups.items():
+            entries.sort(key=lambda entry: entry[0])
+            del entries[self.max_items:]
+
+        self._groups[key] = groups
+        return groups
+
+    def top(
+        self,
+        setor_id: str | None,
+        ufs: list[str] | None,
+        since: datetime | None,
+        max_items: int | None = None,
+    ) -> list[dict]:
+        """Top opportunities for a (setor, UFs, window) profile."""
+        groups = self._top_by_uf(setor_id, self._window(since))
+        if ufs:
+            # Items without UF pass the UF filter
+            keys = [uf for uf in dict.fromkeys([*ufs, ""]) if uf in groups]
+        else:
+            keys = list(groups)
+
+        merged = [entry for uf in keys for entry in groups[uf]]
+        merged.sort(key=lambda entry: entry[0])
+        limit = self.max_items if max_items is None else min(max_items, self.max_items)
+        return [dict(opp) for _, opp in merged[:limit]]
+
+
+async def _load_opportunity_pool(db, since: datetime | None, max_items: int = 10) -> OpportunityPool:
+    """Load the shared pool of recent search_results_cache rows once."""
+    try:
+        query = db.table("search_results_cache").select(
+            "results, search_params, created_at"
+        ).order("created_at", desc=True).limit(_POOL_ROW_LIMIT)
+
+        if since:
+            query = query.gte("created_at", since.isoformat())
 
-        return all_opps[:max_items]
+        result = await sb_execute(query)
+        return OpportunityPool(list(result.data or []), max_items=max_items)
 
     except Exception as e:
         logger.error(f"Failed to query opportunities for digest: {e}")
-        return []
+        return OpportunityPool([], max_items=max_items)
+
+
+async def _query_recent_opportunities(
+    db,
+    setor_id: str | None,
+    ufs: list[str] | None,
+    since: datetime | None,
+    max_items: int = 10,
+) -> list[dict]:
+    """Query search_results_cache for recent opportunities matching user profile.
+
+    Args:
+        db: Supabase client.
+        setor_id: User's sector ID filter.
+        ufs: User's UFs filter.
+        since: Only include results newer than this timestamp.
+        max_items: Max opportunities to return.
+
+    Returns:
+        List of opportunity dicts.
+    """
+    pool = await _load_opportunity_pool(db, since, max_items=max_items)
+    return pool.top(setor_id, ufs, since)
+
+
+async def _get_profile_contexts(user_ids: list[str], db) -> dict[str, dict]:
+    """Fetch context_data for many users with one query per batch."""
+    contexts: dict[str, dict] = {}
+    for i in range(0, len(user_ids), _PROFILE_BATCH_SIZE):
+        chunk = user_ids[i:i + _PROFILE_BATCH_SIZE]
+        try:
+            result = await sb_execute(
+                db.table("profiles").select(
+                    "id, context_data"
+                ).in_("id", chunk)
+            )
+            for row in result.data or []:
+                contexts[row["id"]] = row.get("context_data") or {}
+        except Exception as e:
+            logger.warning(f"Failed to get profile contexts for digest batch ({len(chunk)} users): {e}")
+    return contexts
+
+
+class DigestBatch:
+    """Everything a digest run needs, loaded once for all eligible users.
+
+    Built by ``load_digest_batch``: preferences come from the eligibility
+    query, profile contexts from batched ``in_`` lookups, and opportunities
+    from one shared ``OpportunityPool``.
+    """
+
+    def __init__(self, prefs: dict[str, dict], contexts: dict[str, dict], pool: OpportunityPool):
+        self.prefs = prefs
+        self.contexts = contexts
+        self.pool = pool
+
+
+async def load_digest_batch(
+    eligible: list[dict],
+    db=None,
+    max_items: int = 10,
+) -> DigestBatch:
+    """Load preferences, profile contexts and the opportunity pool for a run.
+
+    Args:
+        eligible: Rows from ``get_digest_eligible_users`` (user_id + prefs).
+        db: Supabase client (fetched if None).
+        max_items: Max opportunities per digest email.
+    """
+    if db is None:
+        from supabase_client import get_supabase
+        db = get_supabase()
+
+    prefs = {row["user_id"]: row for row in eligible if row.get("user_id")}
+    contexts = await _get_profile_contexts(list(prefs), db)
+
+    since = min((_digest_since(p) for p in prefs.values()), default=None)
+    pool = await _load_opportunity_pool(db, since, max_items=max_items)
+
+    logger.info(
+        f"Digest batch loaded: users={len(prefs)}, contexts={len(contexts)}, pool_rows={len(pool)}"
+    )
+    return DigestBatch(prefs, contexts, pool)
 
 
 async def build_digest_for_user(
     user_id: str,
     db=None,
     max_items: int = 10,
+    batch: DigestBatch | None = None,
 ) -> dict | None:
     """Build a digest payload for a single user.
 
-    STORY-278 AC2: Main entry point for digest generation.
+    STORY-278 AC2: Main entry point for digest generation. Inside a digest
+    run, pass the ``batch`` from ``load_digest_batch`` so preferences,
+    profile and opportunities come from the shared run data instead of
+    per-user queries.
 
     Args:
         user_id: User UUID.
         db: Supabase client (fetched if None).
         max_items: Max opportunities per digest email.
+        batch: Preloaded run data (optional).
 
     Returns:
         Dict with keys: user_name, opportunities, stats, email.
@@ -203,12 +361,18 @@ async def build_digest_for_user(
         db = get_supabase()
 
     # Check alert preferences
-    prefs = await _get_alert_preferences(user_id, db)
+    if batch is not None:
+        prefs = batch.prefs.get(user_id)
+    else:
+        prefs = await _get_alert_preferences(user_id, db)
     if prefs and not _is_digest_due(prefs):
         return None
 
     # Get profile context
-    profile_ctx = await _get_user_profile_context(user_id, db)
+    if batch is not None:
+        profile_ctx = batch.contexts.get(user_id)
+    else:
+        profile_ctx = await _get_user_profile_context(user_id, db)
     if profile_ctx is None:
         return None
 
@@ -216,25 +380,11 @@ async def build_digest_for_user(
     ufs = profile_ctx.get("ufs_atuacao")
 
     # Determine time window
-    last_sent_str = (prefs or {}).get("last_digest_sent_at")
-    if last_sent_str:
-        try:
-            since = datetime.fromisoformat(
-                last_sent_str.replace("Z", "+00:00") if isinstance(last_sent_str, str) else str(last_sent_str)
-            )
-        except (ValueError, TypeError):
-            since = datetime.now(timezone.utc) - timedelta(days=1)
-    else:
-        since = datetime.now(timezone.utc) - timedelta(days=1)
+    since = _digest_since(prefs)
 
     # Query opportunities
-    opportunities = await _query_recent_opportunities(
-        db=db,
-        setor_id=setor_id,
-        ufs=ufs,
-        since=since,
-        max_items=max_items,
-    )
+    pool = batch.pool if batch is not None else await _load_opportunity_pool(db, since, max_items=max_items)
+    opportunities = pool.top(setor_id, ufs, since, max_items=max_items)
 
     # Get user email and name
     try:
@@ -251,23 +401,6 @@ async def build_digest_for_user(
 
     # Calculate stats
     total_valor = sum(opp.get("valor_estimado", 0) for opp in opportunities)
-    setor_nome = setor_id or "seu setor"
-
-    # Map sector IDs to friendly names (subset)
-    _SECTOR_NAMES = {
-        "vestuario": "Vestuario e Uniformes",
-        "alimentos": "Alimentos",
-        "informatica": "TI e Hardware",
-        "software_desenvolvimento": "Desenvolvimento de Software",
-        "software_licencas": "Licencas de Software",
-        "engenharia": "Engenharia",
-        "medicamentos": "Medicamentos",
-        "equipamentos_medicos": "Equipamentos Medicos",
-        "insumos_hospitalares": "Insumos Hospitalares",
-        "servicos_prediais": "Servicos Prediais",
-        "produtos_limpeza": "Produtos de Limpeza",
-        "mobiliario": "Mobiliario",
-    }
     setor_nome = _SECTOR_NAMES.get(setor_id, setor_id or "seu setor")
 
     return {
@@ -0,0 +1,179 @@
+"""In-memory CNPJ index over the CEIS / CNEP sanctions mirror.
+
+ingestion/sanctions_mirror.py keeps the sanctions_mirror table in sync with
+the published datasets once a day. Each API worker loads that table (a few
+thousand legal-entity rows) into a dict keyed by CNPJ, so SanctionsService
+answers a check with one dict lookup instead of two paginated Portal da
+Transparência requests.
+
+The index re-reads sanctions_mirror_state at most every
+SANCTIONS_MIRROR_RELOAD_S seconds and reloads the rows only when a newer sync
+happened. ``is_fresh()`` is false until both datasets have synced within
+SANCTIONS_MIRROR_MAX_AGE_HOURS *and* their published dataset_date is at most
+SANCTIONS_MIRROR_MAX_DATASET_AGE_DAYS old — the sync falls back to older
+files when today's is not out, and re-syncing one of those bumps synced_at
+without making the data any newer. Callers then use the API.
+
+Activity is evaluated at lookup time from the stored end dates, so a
+sanction that expires between two syncs stops counting on its end date.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from clients.sanctions import SanctionRecord, SanctionsChecker, SanctionsResult
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = 1000
+_SOURCES = ("CEIS", "CNEP")
+
+
+class SanctionsMirror:
+    """CNPJ -> sanctions index loaded from the sanctions_mirror table."""
+
+    def __init__(self, max_age_hours: int, reload_s: int, max_dataset_age_days: int = 2) -> None:
+        self._max_age = timedelta(hours=max_age_hours)
+        self._max_dataset_age = timedelta(days=max_dataset_age_days)
+        self._reload_s = reload_s
+        self._index: Dict[str, List[SanctionRecord]] = {}
+        self._synced: Dict[str, datetime] = {}
+        self._dataset_dates: Dict[str, date] = {}
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        """Reload the index if a newer sync landed (state checked every reload_s)."""
+        if self._checked_at is not None and time.monotonic() - self._checked_at < self._reload_s:
+            return
+        async with self._lock:
+            if self._checked_at is not None and time.monotonic() - self._checked_at < self._reload_s:
+                return
+            try:
+                synced, dataset_dates = await asyncio.to_thread(_read_state)
+                if synced != self._synced:
+                    rows = await asyncio.to_thread(_read_rows)
+                    self.load(rows, synced, dataset_dates)
+                else:
+                    self._dataset_dates = dataset_dates
+            finally:
+                self._checked_at = time.monotonic()
+
+    def load(
+        self, rows: List[dict], synced: Dict[str, datetime], dataset_dates: Dict[str, date],
+    ) -> None:
+        index: Dict[str, List[SanctionRecord]] = {}
+        for row in rows:
+            index.setdefault(row["cnpj"], []).append(_to_record(row))
+        self._index = index
+        self._synced = synced
+        self._dataset_dates = dataset_dates
+        logger.info(
+            "[SANCTIONS_MIRROR] Index loaded: %d rows, %d CNPJs (synced %s, datasets %s)",
+            len(rows), len(index), {s: t.isoformat() for s, t in synced.items()},
+            {s: d.isoformat() for s, d in dataset_dates.items()},
+        )
+
+    def is_fresh(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now(timezone.utc)
+        return all(
+            source in self._synced
+            and source in self._dataset_dates
+            and now - self._synced[source] <= self._max_age
+            and now.date() - self._dataset_dates[source] <= self._max_dataset_age
+            for source in _SOURCES
+        )
+
+    def lookup(self, cnpj: str, today: Optional[date] = None) -> SanctionsResult:
+        """Sanctions of ``cnpj`` as of the last sync (activity as of ``today``)."""
+        cnpj_digits = SanctionsChecker._clean_cnpj(cnpj)
+        today = today or date.today()
+        sanctions = [
+            SanctionRecord(**{**rec.__dict__, "is_active": rec.end_date is None or rec.end_date > today})
+            for rec in self._index.get(cnpj_digits, ())
+        ]
+        ceis_count = sum(1 for s in sanctions if s.source == "CEIS")
+        return SanctionsResult(
+            cnpj=cnpj_digits,
+            is_sanctioned=any(s.is_active for s in sanctions),
+            sanctions=sanctions,
+            checked_at=min(self._synced.values()),
+            ceis_count=ceis_count,
+            cnep_count=len(sanctions) - ceis_count,
+            from_mirror=True,
+        )
+
+
+def _to_record(row: dict) -> SanctionRecord:
+    end_date = date.fromisoformat(row["end_date"]) if row.get("end_date") else None
+    return SanctionRecord(
+        source=row["source"],
+        cnpj=row["cnpj"],
+        company_name=row.get("company_name") or "",
+        sanction_type=row.get("sanction_type") or "",
+        start_date=date.fromisoformat(row["start_date"]) if row.get("start_date") else None,
+        end_date=end_date,
+        sanctioning_body=row.get("sanctioning_body") or "",
+        legal_basis=row.get("legal_basis") or "",
+        fine_amount=Decimal(str(row["fine_amount"])) if row.get("fine_amount") is not None else None,
+        is_active=end_date is None or end_date > date.today(),
+    )
+
+
+def _read_state() -> Tuple[Dict[str, datetime], Dict[str, date]]:
+    """(synced_at, dataset_date) per source from sanctions_mirror_state."""
+    from supabase_client import get_supabase
+
+    resp = get_supabase().table("sanctions_mirror_state").select("source,synced_at,dataset_date").execute()
+    rows = resp.data or []
+    synced = {
+        row["source"]: datetime.fromisoformat(row["synced_at"].replace("Z", "+00:00"))
+        for row in rows
+    }
+    dataset_dates = {row["source"]: date.fromisoformat(row["dataset_date"][:10]) for row in rows}
+    return synced, dataset_dates
+
+
+def _read_rows() -> List[dict]:
+    from supabase_client import get_supabase
+    sb = get_supabase()
+
+    rows: List[dict] = []
+    offset = 0
+    while True:
+        resp = (
+            sb.table("sanctions_mirror")
+            .select("source,cnpj,company_name,sanction_type,start_date,end_date,"
+                    "sanctioning_body,legal_basis,fine_amount")
+            .order("source")
+            .order("record_id")
+            .range(offset, offset + _PAGE_SIZE - 1)
+            .execute()
+        )
+        page = resp.data or []
+        rows.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return rows
+        offset += _PAGE_SIZE
+
+
+_mirror: Optional[SanctionsMirror] = None
+
+
+def get_sanctions_mirror() -> SanctionsMirror:
+    """Process-wide mirror index (loaded lazily on first refresh)."""
+    global _mirror
+    if _mirror is None:
+        from ingestion.config import (
+            SANCTIONS_MIRROR_MAX_AGE_HOURS,
+            SANCTIONS_MIRROR_MAX_DATASET_AGE_DAYS,
+            SANCTIONS_MIRROR_RELOAD_S,
+        )
+        _mirror = SanctionsMirror(
+            SANCTIONS_MIRROR_MAX_AGE_HOURS, SANCTIONS_MIRROR_RELOAD_S, SANCTIONS_MIRROR_MAX_DATASET_AGE_DAYS,
+        )
+    return _mirror
@@ -6,15 +6,23 @@ This service wraps the low-level SanctionsChecker to provide:
 - Batch check with rate-limit-aware concurrency
 - 24h TTL cache (via SanctionsChecker's built-in cache)
 - Graceful degradation when Portal da Transparência is unavailable
+- Answers from the local CEIS/CNEP mirror while it is fresh
+  (SANCTIONS_MIRROR_ENABLED, services/sanctions_mirror.py)
+- Batched checks for a whole result set: CNPJs de-duplicated, then mirror,
+  then a shared Redis tier (clean results negatively cached), then the API
+  with bounded concurrency under a time budget (check_batch)
 
 STORY-256 AC1-AC5.
 """
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, timezone
-from typing import Dict, List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
 
 from clients.sanctions import (
     SanctionsChecker,
@@ -22,9 +30,18 @@ from clients.sanctions import (
     SanctionsResult,
     SanctionsAPIError,
 )
+from config import (
+    SANCTIONS_BATCH_BUDGET_S,
+    SANCTIONS_BATCH_CONCURRENCY,
+    SANCTIONS_CACHE_TTL_S,
+    SANCTIONS_NEGATIVE_CACHE_TTL_S,
+)
+from services.sanctions_mirror import SanctionsMirror, get_sanctions_mirror
 
 logger = logging.getLogger(__name__)
 
+_REDIS_KEY_PREFIX = "smartlic:sanctions:"
+
 # ---------------------------------------------------------------------------
 # Data models (AC1)
 # ---------------------------------------------------------------------------
@@ -64,6 +81,31 @@ class SanctionsSummary:
     checked_at: datetime
 
 
+@dataclass
+class SanctionsBatchStats:
+    """Where the answers of one check_batch call came from."""
+
+    requested: int = 0
+    unique: int = 0
+    mirror_hits: int = 0
+    redis_hits: int = 0
+    memory_hits: int = 0
+    api_checks: int = 0
+    unavailable: int = 0
+    budget_exceeded: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of unique CNPJs answered without querying the API."""
+        if not self.unique:
+            return 0.0
+        return round((self.mirror_hits + self.redis_hits + self.memory_hits) / self.unique, 3)
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
 # ---------------------------------------------------------------------------
 # SanctionsService (AC1-AC5)
 # ---------------------------------------------------------------------------
@@ -93,14 +135,16 @@ class SanctionsService:
     """
 
     # Max concurrent batch checks (respects 90 req/min via SanctionsChecker)
-    BATCH_CONCURRENCY = 5
+    BATCH_CONCURRENCY = SANCTIONS_BATCH_CONCURRENCY
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         timeout: Optional[int] = None,
+        mirror: Optional[SanctionsMirror] = None,
     ) -> None:
         self._checker = SanctionsChecker(api_key=api_key, timeout=timeout)
+        self._mirror = mirror
 
     # ------------------------------------------------------------------
     # Single company check (AC2)
@@ -114,12 +158,19 @@ class SanctionsService:
         AC3: Uses SanctionsChecker's 24h TTL cache.
         AC5: Returns status="unavailable" on API failure.
 
+        Answered from the local mirror when it is enabled and fresh; the
+        API is only queried when the mirror is stale or unavailable.
+
         Args:
             cnpj: CNPJ in any format.
 
         Returns:
             CompanySanctionsReport with aggregated data.
         """
+        mirrored = await self._check_mirror(cnpj)
+        if mirrored is not None:
+            return self._build_report(mirrored)
+
         try:
             result: SanctionsResult = await self._checker.check_sanctions(cnpj)
         except (SanctionsAPIError, Exception) as exc:
@@ -127,19 +178,7 @@ class SanctionsService:
             logger.warning(
                 "[SANCTIONS_SERVICE] API unavailable for %s: %s", cnpj, exc,
             )
-            return CompanySanctionsReport(
-                cnpj=SanctionsChecker._clean_cnpj(cnpj),
-                company_name=None,
-                checked_at=datetime.now(timezone.utc),
-                status="unavailable",
-                is_sanctioned=False,
-                ceis_records=[],
-                cnep_records=[],
-                tcu_ineligible=False,
-                total_active_sanctions=0,
-                most_severe_sanction=None,
-                earliest_end_date=None,
-            )
+            return self._unavailable_report(cnpj)
 
         return self._build_report(result)
 
@@ -161,26 +200,119 @@ class SanctionsService:
         Returns:
             Dict mapping cleaned CNPJ -> CompanySanctionsReport.
         """
-        if not cnpjs:
-            return {}
+        reports, _ = await self.check_batch(cnpjs)
+        return reports
 
-        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
-        results: Dict[str, CompanySanctionsReport] = {}
-
-        async def _check_one(cnpj: str) -> None:
-            async with semaphore:
-                report = await self.check_company(cnpj)
-                results[report.cnpj] = report
+    async def check_batch(
+        self, cnpjs: List[str], budget_s: Optional[float] = None,
+    ) -> Tuple[Dict[str, CompanySanctionsReport], SanctionsBatchStats]:
+        """
+        Check a whole result set's CNPJs, cheapest source first.
+
+        1. CNPJs are cleaned and de-duplicated.
+        2. Local mirror, when enabled and fresh, answers all of them.
+        3. Shared Redis tier: one MGET for the rest. Clean results are cached
+           too (SANCTIONS_NEGATIVE_CACHE_TTL_S), so the many suppliers with
+           no sanctions are not re-queried by every search.
+        4. The API for what is left: BATCH_CONCURRENCY at a time, and only
+           until ``budget_s`` (SANCTIONS_BATCH_BUDGET_S) runs out — CNPJs
+           still pending then are reported "unavailable". Complete API
+           answers are written back to Redis.
 
-        tasks = [_check_one(cnpj) for cnpj in cnpjs]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        Returns:
+            (dict cleaned CNPJ -> CompanySanctionsReport, SanctionsBatchStats)
+        """
+        start = time.monotonic()
+        unique = list(dict.fromkeys(
+            c for c in (SanctionsChecker._clean_cnpj(cnpj) for cnpj in cnpjs) if c
+        ))
+        stats = SanctionsBatchStats(requested=len(cnpjs), unique=len(unique))
+        reports: Dict[str, CompanySanctionsReport] = {}
+        if not unique:
+            return reports, stats
+
+        pending: List[str] = []
+        for cnpj in unique:
+            mirrored = await self._check_mirror(cnpj)
+            if mirrored is None:
+                pending.append(cnpj)
+            else:
+                reports[cnpj] = self._build_report(mirrored)
+        stats.mirror_hits = len(unique) - len(pending)
+
+        cached = await _redis_get_many(pending)
+        for cnpj, result in cached.items():
+            reports[cnpj] = self._build_report(result)
+        stats.redis_hits = len(cached)
+        pending = [cnpj for cnpj in pending if cnpj not in cached]
+
+        fetched, timed_out = await self._check_api_many(
+            pending, SANCTIONS_BATCH_BUDGET_S if budget_s is None else budget_s,
+        )
+        to_cache: Dict[str, SanctionsResult] = {}
+        for cnpj in pending:
+            result = fetched.get(cnpj)
+            if result is None:
+                reports[cnpj] = self._unavailable_report(cnpj)
+                continue
+            if result.cache_hit:
+                stats.memory_hits += 1
+            else:
+                stats.api_checks += 1
+                if result.complete:
+                    to_cache[cnpj] = result
+            reports[cnpj] = self._build_report(result)
+        await _redis_put_many(to_cache)
+
+        stats.budget_exceeded = len(timed_out)
+        stats.unavailable = sum(1 for r in reports.values() if r.status == "unavailable")
+        stats.duration_ms = round((time.monotonic() - start) * 1000, 1)
+        _record_batch_metrics(stats)
 
         logger.info(
-            "[SANCTIONS_SERVICE] Batch check complete: %d/%d CNPJs checked",
-            len(results), len(cnpjs),
+            "[SANCTIONS_SERVICE] Batch check complete: %d unique of %d CNPJs — "
+            "mirror=%d redis=%d api=%d unavailable=%d budget_exceeded=%d hit_ratio=%.2f",
+            stats.unique, stats.requested, stats.mirror_hits, stats.redis_hits,
+            stats.api_checks, stats.unavailable, stats.budget_exceeded, stats.hit_ratio,
         )
+        return reports, stats
+
+    async def _check_api_many(
+        self, cnpjs: List[str], budget_s: float,
+    ) -> Tuple[Dict[str, SanctionsResult], List[str]]:
+        """API results for ``cnpjs`` finished within ``budget_s``; (results, timed-out CNPJs)."""
+        if not cnpjs:
+            return {}, []
+
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
 
-        return results
+        async def _check_one(cnpj: str) -> SanctionsResult:
+            async with semaphore:
+                return await self._checker.check_sanctions(cnpj)
+
+        tasks = {cnpj: asyncio.create_task(_check_one(cnpj)) for cnpj in cnpjs}
+        _, not_done = await asyncio.wait(tasks.values(), timeout=budget_s)
+        for task in not_done:
+            task.cancel()
+        await asyncio.gather(*not_done, return_exceptions=True)
+
+        results: Dict[str, SanctionsResult] = {}
+        timed_out: List[str] = []
+        for cnpj, task in tasks.items():
+            if task in not_done:
+                timed_out.append(cnpj)
+            elif task.exception() is not None:
+                logger.warning(
+                    "[SANCTIONS_SERVICE] API unavailable for %s: %s", cnpj, task.exception(),
+                )
+            else:
+                results[cnpj] = task.result()
+        if timed_out:
+            logger.warning(
+                "[SANCTIONS_SERVICE] Budget of %.1fs exhausted: %d/%d API checks not done",
+                budget_s, len(timed_out), len(cnpjs),
+            )
+        return results, timed_out
 
     # ------------------------------------------------------------------
     # Summary builder (for search results — AC11)
@@ -216,6 +348,24 @@ class SanctionsService:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _check_mirror(self, cnpj: str) -> Optional[SanctionsResult]:
+        """Mirror answer for ``cnpj``, or None when the API must be used."""
+        mirror = self._mirror
+        if mirror is None:
+            from ingestion.config import SANCTIONS_MIRROR_ENABLED
+            if not SANCTIONS_MIRROR_ENABLED:
+                return None
+            mirror = get_sanctions_mirror()
+
+        try:
+            await mirror.refresh()
+        except Exception as exc:
+            logger.warning("[SANCTIONS_SERVICE] Mirror refresh failed: %s", exc)
+        if not mirror.is_fresh():
+            logger.debug("[SANCTIONS_SERVICE] Mirror stale, using API for %s", cnpj)
+            return None
+        return mirror.lookup(cnpj)
+
     def _build_report(self, result: SanctionsResult) -> CompanySanctionsReport:
         """Convert SanctionsResult to CompanySanctionsReport."""
         ceis = [s for s in result.sanctions if s.source == "CEIS"]
@@ -246,7 +396,11 @@ class SanctionsService:
         if result.sanctions:
             company_name = result.sanctions[0].company_name or None
 
-        status = "sanctioned" if result.is_sanctioned else "clean"
+        if result.is_sanctioned:
+            status = "sanctioned"
+        else:
+            # A failed CEIS/CNEP query may have hidden a sanction
+            status = "clean" if result.complete else "unavailable"
 
         return CompanySanctionsReport(
             cnpj=result.cnpj,
@@ -262,6 +416,22 @@ class SanctionsService:
             earliest_end_date=earliest_end,
         )
 
+    @staticmethod
+    def _unavailable_report(cnpj: str) -> CompanySanctionsReport:
+        return CompanySanctionsReport(
+            cnpj=SanctionsChecker._clean_cnpj(cnpj),
+            company_name=None,
+            checked_at=datetime.now(timezone.utc),
+            status="unavailable",
+            is_sanctioned=False,
+            ceis_records=[],
+            cnep_records=[],
+            tcu_ineligible=False,
+            total_active_sanctions=0,
+            most_severe_sanction=None,
+            earliest_end_date=None,
+        )
+
     # ------------------------------------------------------------------
     # Cache delegation
     # ------------------------------------------------------------------
@@ -288,3 +458,103 @@ class SanctionsService:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
+
+
+# ---------------------------------------------------------------------------
+# Shared Redis tier
+# ---------------------------------------------------------------------------
+
+
+def _redis_key(cnpj: str) -> str:
+    return f"{_REDIS_KEY_PREFIX}{cnpj}"
+
+
+def _result_to_json(result: SanctionsResult) -> str:
+    return json.dumps(asdict(result), default=str)
+
+
+def _result_from_json(raw: str) -> SanctionsResult:
+    """Cached result; sanction activity re-evaluated against today's date."""
+    data = json.loads(raw)
+    today = date.today()
+    sanctions = []
+    for rec in data.pop("sanctions"):
+        end_date = date.fromisoformat(rec["end_date"]) if rec.get("end_date") else None
+        sanctions.append(SanctionRecord(**{
+            **rec,
+            "start_date": date.fromisoformat(rec["start_date"]) if rec.get("start_date") else None,
+            "end_date": end_date,
+            "fine_amount": Decimal(rec["fine_amount"]) if rec.get("fine_amount") is not None else None,
+            "is_active": end_date is None or end_date > today,
+        }))
+    return SanctionsResult(**{
+        **data,
+        "sanctions": sanctions,
+        "is_sanctioned": any(s.is_active for s in sanctions),
+        "checked_at": datetime.fromisoformat(data["checked_at"]),
+        "cache_hit": True,
+    })
+
+
+async def _redis_get_many(cnpjs: List[str]) -> Dict[str, SanctionsResult]:
+    """Cached results for ``cnpjs`` in one MGET. Fail-open: {}."""
+    if not cnpjs:
+        return {}
+    try:
+        from redis_pool import get_redis_pool
+
+        redis = await get_redis_pool()
+        if redis is None:
+            return {}
+        values = await redis.mget([_redis_key(c) for c in cnpjs])
+    except Exception as exc:
+        logger.debug("[SANCTIONS_SERVICE] Redis read failed: %s", exc)
+        return {}
+
+    found: Dict[str, SanctionsResult] = {}
+    for cnpj, raw in zip(cnpjs, values or []):
+        if raw is None:
+            continue
+        try:
+            found[cnpj] = _result_from_json(raw)
+        except (TypeError, ValueError, KeyError) as exc:
+            logger.debug("[SANCTIONS_SERVICE] Bad cached entry for %s: %s", cnpj, exc)
+    return found
+
+
+async def _redis_put_many(results: Dict[str, SanctionsResult]) -> None:
+    """Write API results with one pipelined SETEX batch (clean ones with the negative TTL). Fail-open."""
+    if not results:
+        return
+    try:
+        from redis_pool import get_redis_pool
+
+        redis = await get_redis_pool()
+        if redis is None:
+            return
+        pipe = redis.pipeline(transaction=False)
+        for cnpj, result in results.items():
+            ttl = SANCTIONS_CACHE_TTL_S if result.sanctions else SANCTIONS_NEGATIVE_CACHE_TTL_S
+            pipe.setex(_redis_key(cnpj), ttl, _result_to_json(result))
+        await pipe.execute()
+    except Exception as exc:
+        logger.debug("[SANCTIONS_SERVICE] Redis write failed: %s", exc)
+
+
+def _record_batch_metrics(stats: SanctionsBatchStats) -> None:
+    try:
+        from metrics import SANCTIONS_CHECKS_PER_SEARCH, SANCTIONS_LOOKUPS_TOTAL
+
+        for tier, count in (
+            ("mirror", stats.mirror_hits),
+            ("redis", stats.redis_hits + stats.memory_hits),
+            ("api", stats.api_checks),
+            ("unavailable", stats.unavailable - stats.budget_exceeded),
+            ("budget_exceeded", stats.budget_exceeded),
+        ):
+            if count:
+                SANCTIONS_LOOKUPS_TOTAL.labels(tier=tier).inc(count)
+        SANCTIONS_CHECKS_PER_SEARCH.labels(kind="unique").observe(stats.unique)
+        SANCTIONS_CHECKS_PER_SEARCH.labels(kind="api").observe(stats.api_checks)
+    except Exception:
+        pass
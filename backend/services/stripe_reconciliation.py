@@ -14,12 +14,12 @@ Key design decisions:
 - Fire-and-forget email alert on divergences > 0.
 """
 
+from __future__ import annotations
+
 import os
 import time
 from datetime import datetime, timezone, timedelta
 
-import stripe
-
 from cache import redis_cache
 from log_sanitizer import get_sanitized_logger, mask_user_id
 from metrics import (
@@ -29,6 +29,9 @@ from metrics import (
     RECONCILIATION_DURATION,
 )
 from supabase_client import get_supabase
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = get_sanitized_logger(__name__)
 
@@ -25,7 +25,9 @@ import os
 from datetime import datetime, timezone
 from typing import Optional, TypedDict
 
-import stripe
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,313 @@
+"""Per-worker fan-out of Redis progress streams to SSE connections.
+
+Every SSE connection whose tracker publishes to Redis Streams used to run its
+own non-blocking XREAD every ``_SSE_POLL_INTERVAL`` (CRIT-026-ROOT), i.e. one
+Redis round-trip per connection per second even when nothing changes. The
+multiplexer replaces that with a single reader task per worker:
+
+    XREAD COUNT n BLOCK SSE_MUX_BLOCK_MS STREAMS s1 s2 ... id1 id2 ...
+
+Architecture:
+- Each connection subscribes with its stream key and its own cursor (``0``
+  to replay the whole stream). The reader reads every stream from the lowest
+  cursor among its subscribers and hands each subscriber only the entries
+  newer than its cursor, so late joiners get full history without a
+  separate code path.
+- ``StreamSubscription.read(timeout)`` returns the same shape as XREAD (or
+  ``[]`` on timeout), so the SSE route keeps its heartbeat, terminal-stage
+  and error handling unchanged.
+- One reader serves every connection, so a single failed XREAD must not
+  push them all to Supabase polling at once: the reader retries with
+  exponential backoff and only after ``_MUX_FAILURES_BEFORE_DEGRADE``
+  consecutive failures does ``read()`` raise the error, on every call until
+  a read succeeds. TimeoutError/ConnectionError then trigger the Supabase
+  polling fallback and other errors count towards the route's circuit
+  breaker.
+- A new subscription wakes the blocking XREAD in flight, so the new stream
+  is read right away instead of after up to SSE_MUX_BLOCK_MS. The XREAD also
+  covers a per-worker wake stream that ``subscribe()`` XADDs to: the read
+  returns normally instead of being cancelled, since redis-py drops the
+  pooled connection of a command cancelled mid-read.
+- The reader starts on the first subscription and is cancelled when the
+  last subscriber leaves.
+
+Observability: smartlic_sse_mux_subscribers, smartlic_sse_mux_streams,
+smartlic_sse_redis_reads_total{mode} and
+smartlic_sse_event_delivery_latency_seconds{mode}.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Optional
+
+from config import SSE_MUX_BLOCK_MS
+
+logger = logging.getLogger(__name__)
+
+# Entries per stream per XREAD — same page size as the polled path.
+_MUX_READ_COUNT = 100
+# Pause after a failed XREAD so a dead Redis does not turn into a hot loop;
+# doubled per consecutive failure up to _MUX_ERROR_BACKOFF_MAX_S.
+_MUX_ERROR_BACKOFF_S = 0.25
+_MUX_ERROR_BACKOFF_MAX_S = 5.0
+# Consecutive XREAD failures before subscribers are told (and fall back).
+_MUX_FAILURES_BEFORE_DEGRADE = 3
+# Per-worker stream read alongside the progress streams; one XADD ends the
+# blocking XREAD. Capped at one entry and expired once the worker goes away.
+_MUX_WAKE_KEY_PREFIX = "smartlic:sse:mux:wake"
+_MUX_WAKE_TTL_S = 300
+
+
+def _parse_entry_id(entry_id: str) -> tuple[int, int]:
+    """Split a stream entry id ("<ms>-<seq>", or "0") into a sortable tuple."""
+    ms, _, seq = str(entry_id).partition("-")
+    return int(ms), int(seq or 0)
+
+
+def observe_delivery_latency(entry_id: str, mode: str) -> None:
+    """Record XADD -> dispatch latency from the millisecond part of the entry id."""
+    try:
+        from metrics import SSE_EVENT_DELIVERY_LATENCY
+
+        ms, _seq = _parse_entry_id(entry_id)
+        if ms:
+            SSE_EVENT_DELIVERY_LATENCY.labels(mode=mode).observe(max(0.0, time.time() - ms / 1000))
+    except (ValueError, TypeError):
+        pass
+
+
+class StreamSubscription:
+    """One SSE connection's view of a multiplexed progress stream."""
+
+    def __init__(self, stream_key: str, last_id: str = "0"):
+        self.stream_key = stream_key
+        self.last_id = last_id
+        self._cursor = _parse_entry_id(last_id)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        # Set while the shared XREAD is failing; cleared on the next good read.
+        self._error: Optional[BaseException] = None
+
+    def _deliver(self, entries: list) -> None:
+        fresh = []
+        for entry_id, fields in entries:
+            parsed = _parse_entry_id(entry_id)
+            if parsed > self._cursor:
+                fresh.append((entry_id, fields))
+                self._cursor = parsed
+                self.last_id = entry_id
+        if fresh:
+            self._queue.put_nowait(fresh)
+
+    def _fail(self, error: BaseException) -> None:
+        self._error = error
+        self._queue.put_nowait(None)  # wake a pending read()
+
+    def _recover(self) -> None:
+        self._error = None
+
+    async def read(self, timeout: float) -> list:
+        """Wait up to ``timeout`` seconds for new entries.
+
+        Returns ``[(stream_key, [(entry_id, fields), ...])]`` like XREAD, or
+        ``[]`` when nothing arrived. While the shared XREAD is failing and no
+        entries are buffered, raises its error — exactly like a failed
+        per-connection XREAD would.
+        """
+        batches = []
+        if self._queue.empty() and self._error is None:
+            try:
+                batches.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                return []
+        while not self._queue.empty():
+            batches.append(self._queue.get_nowait())
+
+        entries = [entry for batch in batches if batch for entry in batch]
+        if entries:
+            return [(self.stream_key, entries)]
+        if self._error is not None:
+            raise self._error
+        return []
+
+
+class StreamMultiplexer:
+    """Single blocking XREAD over all progress streams subscribed on this worker."""
+
+    def __init__(self, block_ms: int = SSE_MUX_BLOCK_MS):
+        self.block_ms = block_ms
+        self._subs: dict[str, set[StreamSubscription]] = {}
+        self._redis: Any = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._wake_key = f"{_MUX_WAKE_KEY_PREFIX}:{uuid.uuid4().hex}"
+        self._wake_id = "0"
+        # Set once a wake is posted for the XREAD in flight (coalesces bursts)
+        self._wake_posted = False
+        self._wake_tasks: set[asyncio.Task] = set()
+        self._failing = False
+        self._consecutive_failures = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subs.values())
+
+    def subscribe(self, redis: Any, stream_key: str, last_id: str = "0") -> StreamSubscription:
+        """Register a connection for ``stream_key`` and make sure the reader runs."""
+        self._reset_if_loop_changed()
+        sub = StreamSubscription(stream_key, last_id)
+        self._subs.setdefault(stream_key, set()).add(sub)
+        self._redis = redis
+        self._update_gauges()
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="sse-stream-multiplexer")
+        else:
+            # Pick up the new stream right away: cut an idle/backoff wait
+            # short and end a blocking XREAD through the wake stream.
+            self._wake.set()
+            self._post_wake(redis)
+        return sub
+
+    def unsubscribe(self, sub: StreamSubscription) -> None:
+        subs = self._subs.get(sub.stream_key)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.stream_key]
+        self._update_gauges()
+        if not self._subs and self._task is not None and not self._task.done():
+            self._task.cancel()
+            self._task = None
+
+    def _reset_if_loop_changed(self) -> None:
+        # A reader bound to a closed loop (e.g. worker reload, test isolation)
+        # can never run again — start over with a fresh state.
+        if self._task is not None and self._task.get_loop() is not asyncio.get_running_loop():
+            self._task = None
+            self._subs.clear()
+
+    def _update_gauges(self) -> None:
+        from metrics import SSE_MUX_STREAMS, SSE_MUX_SUBSCRIBERS
+
+        SSE_MUX_SUBSCRIBERS.set(self.subscriber_count)
+        SSE_MUX_STREAMS.set(len(self._subs))
+
+    def _post_wake(self, redis: Any) -> None:
+        if self._wake_posted:
+            return
+        self._wake_posted = True
+        task = asyncio.create_task(self._xadd_wake(redis))
+        self._wake_tasks.add(task)
+        task.add_done_callback(self._wake_tasks.discard)
+
+    async def _xadd_wake(self, redis: Any) -> None:
+        try:
+            pipe = redis.pipeline()
+            pipe.xadd(self._wake_key, {"w": "1"}, maxlen=1, approximate=False)
+            pipe.expire(self._wake_key, _MUX_WAKE_TTL_S)
+            await pipe.execute()
+        except Exception as e:
+            # The new stream is still read once the current BLOCK window ends
+            logger.debug(f"SSE multiplexer wake XADD failed: {type(e).__name__}: {e}")
+
+    def _read_positions(self) -> dict[str, str]:
+        positions = {}
+        for key, subs in self._subs.items():
+            lowest = min(subs, key=lambda s: s._cursor)
+            positions[key] = lowest.last_id
+        return positions
+
+    def _dispatch(self, stream_key: str, entries: list, read_from: str) -> None:
+        for entry_id, _fields in entries:
+            observe_delivery_latency(entry_id, "mux")
+        position = _parse_entry_id(read_from)
+        for sub in list(self._subs.get(stream_key, ())):
+            # A subscriber that joined behind this read's position gets the
+            # gap (and these entries) from the next read, which starts at it.
+            if sub._cursor >= position:
+                sub._deliver(entries)
+
+    def _broadcast_error(self, error: BaseException) -> None:
+        self._failing = True
+        for subs in self._subs.values():
+            for sub in subs:
+                sub._fail(error)
+
+    def _broadcast_recovery(self) -> None:
+        self._failing = False
+        for subs in self._subs.values():
+            for sub in subs:
+                sub._recover()
+
+    async def _idle(self, seconds: float) -> None:
+        """Wait ``seconds`` or until a new subscription wakes the reader."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def _run(self) -> None:
+        from metrics import SSE_REDIS_READS
+
+        block_s = self.block_ms / 1000
+        while self._subs:
+            positions = self._read_positions()
+            started = time.monotonic()
+            # Subscriptions from here on need a new wake; earlier ones are in positions
+            self._wake_posted = False
+            self._wake.clear()
+            try:
+                result = await self._redis.xread(
+                    {**positions, self._wake_key: self._wake_id},
+                    count=_MUX_READ_COUNT, block=self.block_ms,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._consecutive_failures += 1
+                backoff = min(
+                    _MUX_ERROR_BACKOFF_S * 2 ** (self._consecutive_failures - 1),
+                    _MUX_ERROR_BACKOFF_MAX_S,
+                )
+                logger.warning(
+                    f"SSE multiplexer XREAD failed over {len(positions)} stream(s) "
+                    f"(attempt {self._consecutive_failures}, retry in {backoff:.2f}s): "
+                    f"{type(e).__name__}: {e}"
+                )
+                if self._consecutive_failures >= _MUX_FAILURES_BEFORE_DEGRADE:
+                    self._broadcast_error(e)
+                await self._idle(backoff)
+                continue
+            self._consecutive_failures = 0
+            SSE_REDIS_READS.labels(mode="mux").inc()
+            if self._failing:
+                self._broadcast_recovery()
+
+            if not result:
+                # BLOCK normally waits the full window; if the server answered
+                # early, wait out the rest instead of spinning.
+                await self._idle(max(0.0, block_s - (time.monotonic() - started)))
+                continue
+            for stream_key, entries in result:
+                if stream_key == self._wake_key:
+                    # New subscription — the next read includes its stream
+                    self._wake_id = entries[-1][0]
+                    continue
+                if stream_key in positions:
+                    self._dispatch(stream_key, entries, positions[stream_key])
+            # Let subscribers drain before the next read.
+            await asyncio.sleep(0)
+
+
+_multiplexer: Optional[StreamMultiplexer] = None
+
+
+def get_stream_multiplexer() -> StreamMultiplexer:
+    """Return this worker's StreamMultiplexer singleton."""
+    global _multiplexer
+    if _multiplexer is None:
+        _multiplexer = StreamMultiplexer()
+    return _multiplexer
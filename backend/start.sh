@@ -61,6 +61,9 @@ case "$PROCESS_TYPE" in
     GUNICORN_GRACEFUL_TIMEOUT="${GUNICORN_GRACEFUL_TIMEOUT:-${GRACEFUL_SHUTDOWN_TIMEOUT:-30}}"
     echo "  timeout=${GUNICORN_TIMEOUT:-110}s, workers=${WEB_CONCURRENCY:-2}, graceful=${GUNICORN_GRACEFUL_TIMEOUT}s, keep-alive=${GUNICORN_KEEP_ALIVE:-75}s"
     echo "  max-requests=${GUNICORN_MAX_REQUESTS:-1000}, jitter=${GUNICORN_MAX_REQUESTS_JITTER:-50}"
+    # Pre-fork warm-up (gunicorn_conf.py on_starting): sector/keyword tables built once
+    # in the master and shared copy-on-write. Pure-Python only — safe without --preload.
+    echo "  prefork-warmup=${GUNICORN_PREFORK_WARMUP:-true}"
 
     exec gunicorn main:app \
       -k uvicorn.workers.UvicornWorker \
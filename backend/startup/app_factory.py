@@ -5,6 +5,7 @@ Single entry point: call create_app() to get a fully-configured FastAPI instance
 
 import logging
 import os
+import time
 
 from fastapi import FastAPI
 
@@ -15,12 +16,15 @@ from startup.middleware_setup import setup_middleware, setup_metrics_endpoint, D
 from startup.routes import register_routes
 from startup.exception_handlers import register_exception_handlers
 from startup.endpoints import register_endpoints, APP_VERSION
+from startup import state as _state
 
 logger = logging.getLogger(__name__)
 
 
 def create_app() -> FastAPI:
     """Build and return the configured SmartLic FastAPI application."""
+    _build_start = time.monotonic()
+
     # Logging
     setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
     log_feature_flags()
@@ -85,8 +89,10 @@ def create_app() -> FastAPI:
     # Prometheus /metrics (conditional)
     setup_metrics_endpoint(app)
 
+    _state.create_app_seconds = round(time.monotonic() - _build_start, 3)
     logger.info(
-        "FastAPI application initialized — PORT=%s, docs=%s",
+        "FastAPI application initialized in %.3fs — PORT=%s, docs=%s",
+        _state.create_app_seconds,
         os.getenv("PORT", "8000"),
         "protected" if DOCS_ACCESS_TOKEN else "open",
     )
@@ -0,0 +1,153 @@
+"""startup/diagnostics.py — API worker cold-start report.
+
+Every Gunicorn worker pays for ``import startup.app_factory`` + ``create_app()``
+before it can serve. This module measures both in a fresh interpreter (so
+modules already loaded by the caller don't hide their cost) and ranks the
+heaviest imports from ``python -X importtime``.
+
+USAGE
+
+    python -m startup.diagnostics              # top 25 imports + timings
+    python -m startup.diagnostics --top 50 --json
+
+The same measurements back tests/test_startup_import_budget.py, which keeps
+the deferred SDKs (utils/lazy_import.py) out of the boot path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+
+# SDKs only billing / summaries / PDF / Excel / Sheets need — never at boot.
+DEFERRED_MODULES: tuple[str, ...] = (
+    "stripe",
+    "openai",
+    "reportlab",
+    "openpyxl",
+    "googleapiclient",
+    "google_auth_oauthlib",
+)
+
+_COLD_START_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+from startup.app_factory import create_app
+t1 = time.perf_counter()
+create_app()
+t2 = time.perf_counter()
+print(json.dumps({
+    "import_s": t1 - t0,
+    "create_app_s": t2 - t1,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` output into one entry per imported module."""
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, module = (p.strip() for p in parts)
+        if not self_us.isdigit():  # header row
+            continue
+        timings.append(ImportTiming(module, int(self_us), int(cumulative_us)))
+    return timings
+
+
+def _child_env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [BACKEND_DIR, env.get("PYTHONPATH")]))
+    env.setdefault("LOG_LEVEL", "WARNING")
+    return env
+
+
+def profile_imports(target: str = "startup.app_factory", top: int = 25) -> dict:
+    """Import ``target`` under ``-X importtime`` and return the heaviest modules."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, cwd=BACKEND_DIR, env=_child_env(), check=False,
+    )
+    timings = parse_importtime(proc.stderr)
+    total_us = sum(t.self_us for t in timings)
+    heaviest = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    return {
+        "target": target,
+        "returncode": proc.returncode,
+        "module_count": len(timings),
+        "total_s": round(total_us / 1e6, 3),
+        "top": [asdict(t) for t in heaviest],
+    }
+
+
+def measure_cold_start() -> dict:
+    """Time ``import startup.app_factory`` and ``create_app()`` in a fresh interpreter.
+
+    Returns import_s, create_app_s, total_s and deferred_loaded (any of
+    DEFERRED_MODULES that ended up in sys.modules).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", _COLD_START_SNIPPET],
+        capture_output=True, text=True, cwd=BACKEND_DIR, env=_child_env(), check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"create_app() failed in child interpreter:\n{proc.stderr[-2000:]}")
+    data = json.loads(proc.stdout.strip().splitlines()[-1])
+    modules = data.pop("modules")
+    loaded = sorted(
+        name for name in DEFERRED_MODULES
+        if any(m == name or m.startswith(name + ".") for m in modules)
+    )
+    return {
+        "import_s": round(data["import_s"], 3),
+        "create_app_s": round(data["create_app_s"], 3),
+        "total_s": round(data["import_s"] + data["create_app_s"], 3),
+        "module_count": len(modules),
+        "deferred_loaded": loaded,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=25, help="number of imports to list")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = {"cold_start": measure_cold_start(), "imports": profile_imports(top=args.top)}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    cold = report["cold_start"]
+    print(
+        f"cold start: import {cold['import_s']:.3f}s + create_app {cold['create_app_s']:.3f}s "
+        f"= {cold['total_s']:.3f}s ({cold['module_count']} modules)"
+    )
+    print(f"deferred SDKs loaded at boot: {', '.join(cold['deferred_loaded']) or 'none'}")
+    print(f"\n{'cumulative ms':>14} {'self ms':>9}  module")
+    for row in report["imports"]["top"]:
+        print(f"{row['cumulative_us'] / 1000:>14.1f} {row['self_us'] / 1000:>9.1f}  {row['module']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
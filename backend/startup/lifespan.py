@@ -250,6 +250,11 @@ async def lifespan(app_instance: FastAPI):
     task_registry.register("new_bids_notifier", start_new_bids_notifier_task)  # STORY-445
     task_registry.register("cron_monitor", start_cron_monitor_task)            # STORY-1.1
 
+    from config import LOOP_LAG_MONITOR_ENABLED
+    if LOOP_LAG_MONITOR_ENABLED:
+        from loop_monitor import run_loop_monitor
+        task_registry.register("loop_monitor", run_loop_monitor, is_coroutine=True)
+
     await task_registry.start_all()
 
     try:
@@ -325,6 +330,22 @@ async def lifespan(app_instance: FastAPI):
         _redis_status = "OK" if await is_redis_available() else "unavailable"
     logger.info("STARTUP GATE: Redis %s — setting ready=true", _redis_status)
 
+    # Sector/keyword tables: no-op when inherited from the Gunicorn master
+    try:
+        from startup.warmup import worker_ready_report
+        from metrics import WORKER_TIME_TO_READY_SECONDS
+        _ready = worker_ready_report(_state.process_start_time)
+        WORKER_TIME_TO_READY_SECONDS.labels(
+            prefork_warmup=str(_ready["prefork_warmup"]).lower(),
+        ).set(_ready["time_to_ready_s"])
+        logger.info(
+            "Worker pid=%d time-to-ready=%.2fs RSS=%sMB PSS=%sMB (prefork warm-up: %s)",
+            _ready["pid"], _ready["time_to_ready_s"], _ready["rss_mb"], _ready["pss_mb"],
+            "inherited" if _ready["prefork_warmup"] else "local",
+        )
+    except Exception as e:
+        logger.warning(f"Static data warm-up failed: {e}")
+
     _state.startup_time = time.monotonic()
 
     logger.info("APPLICATION READY — all routes registered, accepting traffic")
@@ -398,6 +419,9 @@ async def lifespan(app_instance: FastAPI):
     _thread_pool.shutdown(wait=False)
     logger.info("STORY-290-patch: thread pool executor shut down")
 
+    from item_inspector import close_async_client
+    await close_async_client()
+
     await shutdown_redis()
 
     logger.info("DEBT-124: Graceful shutdown complete")
@@ -5,6 +5,7 @@ import time
 # CRIT-010 AC5: Startup readiness tracking
 process_start_time: float = time.monotonic()
 startup_time: float | None = None  # Set when lifespan startup completes
+create_app_seconds: float | None = None  # Wall time of create_app() (imports excluded)
 
 # DEBT-124: Graceful shutdown drain flag
 shutting_down: bool = False
@@ -0,0 +1,125 @@
+"""startup/warmup.py — build immutable filter data once, before workers fork.
+
+Sector configs (sectors_data.yaml → SectorConfig), SECTOR_SYNONYMS, the
+keyword/red-flag tables in filter/keywords.py and the compiled per-keyword
+patterns are read-only after load. Under RUNNER=gunicorn, gunicorn_conf.py's
+on_starting hook calls prepare_for_fork() in the master: workers inherit the
+already-imported modules (no per-worker YAML parse) and gc.freeze() moves
+them to the permanent generation, so the collector never writes to those
+pages and copy-on-write keeps them shared across workers.
+
+Only pure-Python modules are loaded here — no config (reads env at import),
+no HTTP/Supabase/Redis clients and no cryptography, whose OpenSSL state is
+not fork-safe (STORY-303). Under RUNNER=uvicorn (spawn) the lifespan calls
+warm_static_data() so the compile cost is paid before ready, not on the
+first search.
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Must not be imported in the Gunicorn master before fork.
+FORK_UNSAFE_MODULES: tuple[str, ...] = ("cryptography", "supabase", "httpx", "redis", "config")
+
+_stats: dict | None = None
+
+
+def _proc_mb(path: str, key: str) -> float | None:
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(key):
+                    return round(int(line.split()[1]) / 1024, 1)  # kB → MB
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _rss_mb() -> float | None:
+    # Not health.get_memory_usage(): importing health pulls httpx into the master.
+    return _proc_mb("/proc/self/status", "VmRSS:")
+
+
+def proportional_set_size_mb() -> float | None:
+    """PSS (shared pages split across the processes that map them), Linux only.
+
+    RSS counts inherited copy-on-write pages in full in every worker; PSS is
+    what shows the saving from pre-fork warm-up.
+    """
+    return _proc_mb("/proc/self/smaps_rollup", "Pss:")
+
+
+def warm_static_data() -> dict:
+    """Load sectors/synonyms/keyword tables and compile every sector keyword pattern.
+
+    Idempotent per process tree: a forked worker sees the master's stats
+    (``pid`` differs from its own) and does nothing.
+    """
+    global _stats
+    if _stats is not None:
+        return _stats
+
+    start = time.monotonic()
+    rss_before = _rss_mb()
+
+    import synonyms  # noqa: F401 — SECTOR_SYNONYMS built at import
+    from filter.keywords import keyword_patterns
+    from sectors import SECTORS
+
+    pattern_count = 0
+    for sector in SECTORS.values():
+        pattern_count += len(keyword_patterns(sector.keywords))
+
+    _stats = {
+        "pid": os.getpid(),
+        "sectors": len(SECTORS),
+        "keyword_patterns": pattern_count,
+        "seconds": round(time.monotonic() - start, 3),
+        "rss_before_mb": rss_before,
+        "rss_after_mb": _rss_mb(),
+    }
+    return _stats
+
+
+def fork_unsafe_modules_loaded() -> list[str]:
+    return sorted(
+        name for name in FORK_UNSAFE_MODULES
+        if any(m == name or m.startswith(name + ".") for m in sys.modules)
+    )
+
+
+def prepare_for_fork() -> dict:
+    """Warm static data in the Gunicorn master, then freeze the heap for copy-on-write."""
+    stats = dict(warm_static_data())
+    unsafe = fork_unsafe_modules_loaded()
+    if unsafe:
+        logger.warning("Pre-fork warm-up imported fork-unsafe modules: %s", ", ".join(unsafe))
+
+    gc.collect()
+    gc.freeze()
+    stats["frozen_objects"] = gc.get_freeze_count()
+    stats["fork_unsafe_loaded"] = unsafe
+    logger.info(
+        "Pre-fork warm-up: %d sectors, %d keyword patterns in %.3fs — "
+        "RSS %s→%sMB, %d objects frozen",
+        stats["sectors"], stats["keyword_patterns"], stats["seconds"],
+        stats["rss_before_mb"], stats["rss_after_mb"], stats["frozen_objects"],
+    )
+    return stats
+
+
+def worker_ready_report(process_start_time: float) -> dict:
+    """Time-to-ready and memory of this worker, logged once the lifespan finishes."""
+    stats = warm_static_data()
+    return {
+        "pid": os.getpid(),
+        "time_to_ready_s": round(time.monotonic() - process_start_time, 3),
+        "prefork_warmup": stats["pid"] != os.getpid(),
+        "rss_mb": _rss_mb(),
+        "pss_mb": proportional_set_size_mb(),
+    }
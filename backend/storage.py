@@ -13,7 +13,7 @@ Architecture:
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, Union
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +60,12 @@ def _ensure_bucket_exists() -> None:
         logger.warning(f"Failed to ensure bucket exists (will retry on upload): {e}")
 
 
-def upload_excel(buffer_bytes: bytes, search_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+def upload_excel(buffer_bytes: Union[bytes, BinaryIO], search_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Upload Excel to Supabase Storage, return file_id and signed URL.
 
     Args:
-        buffer_bytes: Excel file content as bytes
+        buffer_bytes: Excel file content as bytes, or an open binary file
+            (streamed to storage without loading it into memory)
         search_id: Optional search ID for filename (generates UUID if None)
 
     Returns:
@@ -122,6 +123,97 @@ def upload_excel(buffer_bytes: bytes, search_id: Optional[str] = None) -> Option
         return None
 
 
+def upload_excel_file(file_path: str, search_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Upload an Excel file from disk, streaming it to storage.
+
+    Used by the write-only export path (``excel.stream_excel_to_tempfile``)
+    so large spreadsheets never need to be held as a single bytes object.
+    Same return contract as ``upload_excel``.
+    """
+    try:
+        with open(file_path, "rb") as fh:
+            return upload_excel(fh, search_id)
+    except OSError as e:
+        logger.error(f"Failed to read Excel file for upload ({file_path}): {e}")
+        return None
+
+
+def upload_object(
+    file: Union[bytes, BinaryIO],
+    file_path: str,
+    content_type: str,
+    upsert: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Upload an object to a caller-chosen path and return a signed URL.
+
+    Lower-level sibling of ``upload_excel`` used by the export artifact cache
+    (``export_cache.py``) to store PDFs under their content hash instead of
+    timestamp + search_id. Returns the same dict shape, or None on failure.
+    """
+    try:
+        storage = _get_storage()
+        file_options = {"content-type": content_type}
+        if upsert:
+            file_options["upsert"] = "true"
+        storage.from_(BUCKET_NAME).upload(path=file_path, file=file, file_options=file_options)
+    except Exception as e:
+        logger.error(f"Failed to upload object to storage ({file_path}): {e}", exc_info=True)
+        return None
+
+    signed_url = create_signed_url(file_path)
+    if not signed_url:
+        return None
+    return {
+        "file_id": file_path.rsplit("/", 1)[-1],
+        "file_path": file_path,
+        "signed_url": signed_url,
+        "expires_in": SIGNED_URL_TTL,
+    }
+
+
+def create_signed_url(file_path: str, expires_in: int = SIGNED_URL_TTL) -> Optional[str]:
+    """Create a signed download URL for an existing object (None on failure)."""
+    try:
+        response = _get_storage().from_(BUCKET_NAME).create_signed_url(path=file_path, expires_in=expires_in)
+        return response.get("signedURL") or response.get("signedUrl") or None
+    except Exception as e:
+        logger.warning(f"Failed to create signed URL for {file_path}: {e}")
+        return None
+
+
+def download_object(file_path: str) -> Optional[bytes]:
+    """Download an object's bytes (None if missing or storage unavailable)."""
+    try:
+        return _get_storage().from_(BUCKET_NAME).download(file_path)
+    except Exception as e:
+        logger.warning(f"Failed to download {file_path} from storage: {e}")
+        return None
+
+
+def list_objects(folder: str, limit: int = 1000) -> list[Dict[str, Any]]:
+    """List objects in a bucket folder, oldest first (empty list on failure)."""
+    try:
+        return _get_storage().from_(BUCKET_NAME).list(
+            folder,
+            {"limit": limit, "sortBy": {"column": "created_at", "order": "asc"}},
+        ) or []
+    except Exception as e:
+        logger.warning(f"Failed to list storage folder {folder}: {e}")
+        return []
+
+
+def remove_objects(file_paths: list[str]) -> int:
+    """Remove objects by path, returning how many removals were requested."""
+    if not file_paths:
+        return 0
+    try:
+        _get_storage().from_(BUCKET_NAME).remove(file_paths)
+        return len(file_paths)
+    except Exception as e:
+        logger.warning(f"Failed to remove {len(file_paths)} object(s) from storage: {e}")
+        return 0
+
+
 # Initialize bucket on module load (lazy, only if storage is used)
 try:
     _ensure_bucket_exists()
@@ -204,18 +204,20 @@ def _force_sync_search(monkeypatch):
 
 @pytest.fixture(autouse=True)
 def _reset_rate_limiter_state():
-    """GTM-GO-002: Reset FlexibleRateLimiter + SSE connection state between tests.
+    """GTM-GO-002: Reset FlexibleRateLimiter, SSE connection and PNCP AIMD state between tests.
 
     Prevents state contamination when multiple tests hit rate-limited endpoints
     from the same IP in the same process.
     """
-    from rate_limiter import _flexible_limiter, _sse_connections
+    from rate_limiter import _flexible_limiter, _sse_connections, pncp_rate_controller
 
     _flexible_limiter._memory_store.clear()
     _sse_connections.clear()
+    pncp_rate_controller.reset()
     yield
     _flexible_limiter._memory_store.clear()
     _sse_connections.clear()
+    pncp_rate_controller.reset()
 
 
 @pytest.fixture(autouse=True)
@@ -155,3 +155,20 @@ class MockLLMBuilder:
             completion.usage.completion_tokens = 1
             mock.chat.completions.create.return_value = completion
         return mock
+
+
+def mock_redis_pipeline(redis: Any) -> Mock:
+    """Attach a command-recording pipeline to a Redis mock.
+
+    ``redis.pipeline()`` returns a pipe whose commands (xadd, rpush, ...) are
+    plain Mocks that record calls; ``await pipe.execute()`` returns [].
+
+    Usage:
+        pipe = mock_redis_pipeline(mock_redis)
+        ...
+        pipe.xadd.assert_called_once()
+    """
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = Mock(return_value=pipe)
+    return pipe
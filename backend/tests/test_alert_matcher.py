@@ -518,6 +518,167 @@ class TestSearchCachedResults:
         assert items == []
 
 
+class TestAlertCandidateIndex:
+    """Run-wide inverted index: token/UF/value lookups match _apply_alert_filters."""
+
+    def _items(self):
+        from services.alert_matcher import _normalize_item
+        return [_normalize_item(i, i["id"]) for i in MOCK_CACHE_ROW["results"]] + [
+            {"id": "item-004", "titulo": "Aquisição de Computadores portáteis",
+             "orgao": "Câmara", "valor_estimado": 0, "uf": "", "status": ""},
+        ]
+
+    def test_keyword_substring_and_accent_insensitive_tokens(self):
+        from services.alert_matcher import AlertCandidateIndex
+
+        index = AlertCandidateIndex(self._items())
+        ids = [i["id"] for i in index.candidates({"keywords": ["computador"]})]
+        assert ids == ["item-001", "item-004"]
+        ids = [i["id"] for i in index.candidates({"keywords": ["aquisicao de computador"]})]
+        assert ids == ["item-001", "item-004"]
+
+    def test_keyword_inside_longer_token_matches_like_linear_filter(self):
+        from services.alert_matcher import AlertCandidateIndex, _apply_alert_filters
+
+        items = [{"id": "bid-1", "titulo": "Aquisição de microcomputadores para escolas",
+                  "orgao": "Prefeitura", "valor_estimado": 0, "uf": "SP", "status": ""}]
+        filters = {"keywords": ["computador"]}
+        index = AlertCandidateIndex(items)
+
+        assert len(_apply_alert_filters([dict(i) for i in items], filters)) == 1
+        assert [i["id"] for i in _apply_alert_filters(index.candidates(filters), filters)] == ["bid-1"]
+
+    def test_uf_and_value_buckets_intersect(self):
+        from services.alert_matcher import AlertCandidateIndex
+
+        index = AlertCandidateIndex(self._items())
+        ids = {i["id"] for i in index.candidates({"ufs": ["SP"], "valor_max": 100000})}
+        # item-004 has no UF and no value, so it passes both checks
+        assert ids == {"item-001", "item-004"}
+
+    def test_same_results_as_linear_filter(self):
+        from services.alert_matcher import AlertCandidateIndex, _apply_alert_filters
+
+        items = self._items()
+        index = AlertCandidateIndex(items)
+        for filters in (
+            {"ufs": ["SP"], "keywords": ["computador"]},
+            {"keywords": ["servidor", "limpeza"], "valor_min": 40000},
+            {"ufs": ["RJ"]},
+            {},
+        ):
+            expected = [i["id"] for i in _apply_alert_filters([dict(i) for i in items], filters)]
+            got = [i["id"] for i in _apply_alert_filters(index.candidates(filters), filters)]
+            assert got == expected, filters
+
+    @pytest.mark.asyncio
+    async def test_run_records_per_alert_candidate_count(self):
+        from services.alert_matcher import AlertCandidateIndex, _process_alert
+
+        index = AlertCandidateIndex(self._items())
+        alert = {**MOCK_ALERT_ROW, "email": "a@b.com", "full_name": "A",
+                 "filters": {"ufs": ["RJ"], "keywords": ["limpeza"]}}
+        record = AsyncMock()
+
+        with patch("services.alert_service.check_rate_limit", AsyncMock(return_value=False)), \
+             patch("services.alert_service.get_sent_item_ids", AsyncMock(return_value=set())), \
+             patch("services.alert_matcher._record_alert_run", record):
+            await _process_alert(alert, {}, MagicMock(), index=index)
+
+        expected = len(index.candidates(alert["filters"]))
+        assert expected < len(index)
+        assert record.await_args.args[1] == expected
+
+    def test_candidates_are_copies(self):
+        from services.alert_matcher import AlertCandidateIndex, _apply_alert_filters
+
+        index = AlertCandidateIndex(self._items())
+        _apply_alert_filters(index.candidates({"keywords": ["computador"]}), {"keywords": ["computador"]})
+        assert all("keyword_density" not in i for i in index.candidates({}))
+
+    def test_sector_only_alert_uses_sector_keywords(self):
+        from services.alert_matcher import _effective_filters
+        from sectors import get_sector
+
+        filters = _effective_filters({"setor": "informatica", "ufs": ["SP"]})
+        assert set(filters["keywords"]) == get_sector("informatica").keywords
+        assert _effective_filters({"setor": "inexistente"}) == {"setor": "inexistente"}
+        assert _effective_filters({"setor": "informatica", "keywords": ["x"]})["keywords"] == ["x"]
+
+
+class TestMatchAlertsCandidateLoad:
+    """Candidate bids are loaded once per run, not once per alert."""
+
+    @pytest.mark.asyncio
+    async def test_raw_bids_loaded_once_for_all_alerts(self):
+        from services.alert_matcher import match_alerts
+
+        alerts = [
+            {**MOCK_ALERT_ROW, "id": f"alert-uuid-{n:04d}", "user_id": f"user-uuid-{n:04d}"}
+            for n in range(5)
+        ]
+        raw_bids = [
+            {"pncp_id": "bid-1", "objeto_compra": "Aquisicao de computador", "orgao_razao_social": "Prefeitura",
+             "valor_total_estimado": 1000, "uf": "SP", "modalidade_nome": "Pregao",
+             "situacao_compra": "Divulgada no PNCP", "link_pncp": "", "data_publicacao": "2026-10-17"},
+            {"pncp_id": "bid-2", "objeto_compra": "Servico de limpeza", "orgao_razao_social": "Prefeitura",
+             "valor_total_estimado": 1000, "uf": "SP", "modalidade_nome": "Pregao",
+             "situacao_compra": "", "link_pncp": "", "data_publicacao": "2026-10-17"},
+        ]
+        tables = []
+
+        async def mock_sb_execute(query):
+            table = getattr(query, "_table_name", "unknown")
+            tables.append(table)
+            result = MagicMock()
+            result.count = 0
+            result.data = {
+                "alerts": alerts,
+                "profiles": MOCK_PROFILE,
+                "pncp_raw_bids": raw_bids,
+            }.get(table, [])
+            return result
+
+        mock_db = MagicMock()
+        mock_db.table = MagicMock(side_effect=lambda name: _make_table_chain(name))
+
+        with patch("services.alert_matcher.sb_execute", new_callable=AsyncMock, side_effect=mock_sb_execute), \
+             patch("services.alert_service.sb_execute", new_callable=AsyncMock, side_effect=mock_sb_execute):
+            result = await match_alerts(db=mock_db)
+
+        assert tables.count("pncp_raw_bids") == 1
+        assert "search_results_cache" not in tables
+        assert result["matched"] == 5
+        assert [i["id"] for i in result["payloads"][0]["new_items"]] == ["bid-1"]
+        assert result["candidates"] == 2
+        assert result["db_bytes_read"] > 0
+        assert result["alerts_per_sec"] > 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_search_cache_when_datalake_empty(self):
+        from services.alert_matcher import _load_candidate_bids
+
+        tables = []
+
+        async def mock_sb_execute(query):
+            table = getattr(query, "_table_name", "unknown")
+            tables.append(table)
+            result = MagicMock()
+            result.data = [MOCK_CACHE_ROW] if table == "search_results_cache" else []
+            return result
+
+        mock_db = MagicMock()
+        mock_db.table = MagicMock(side_effect=lambda name: _make_table_chain(name))
+        stats = {"db_bytes_read": 0}
+
+        with patch("services.alert_matcher.sb_execute", new_callable=AsyncMock, side_effect=mock_sb_execute):
+            items = await _load_candidate_bids(mock_db, stats)
+
+        assert [i["id"] for i in items] == ["item-001", "item-002", "item-003"]
+        assert tables == ["alert_runs", "pncp_raw_bids", "search_results_cache"]
+        assert stats["db_bytes_read"] > 0
+
+
 class TestRecordAlertRun:
     """AC10: Alert run recording."""
 
@@ -0,0 +1,122 @@
+"""Tests for the slotted bid record (bid_record.py).
+
+Covers:
+  - BidRecord mapping semantics: core slots, annotation sub-record, overflow keys
+  - json_default / as_dicts at serialization boundaries
+  - aplicar_todos_filtros gives the same result on BidRecords as on dicts
+  - to_bid_record / datalake rows: BidRecords only with BID_RECORD_SLOTS_ENABLED
+"""
+
+import copy
+import json
+import pickle
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from bid_record import BidRecord, as_dicts, json_default
+from clients.base import UnifiedProcurement
+
+
+def _bid(i: int = 0, objeto: str = "Aquisição de uniformes escolares e camisetas") -> dict:
+    return {
+        "codigoCompra": f"{i:08d}",
+        "objetoCompra": f"{objeto} lote {i}",
+        "nomeOrgao": "Prefeitura Municipal de São Paulo",
+        "uf": "SP",
+        "valorTotalEstimado": 100_000.0 + i,
+        "_source": "pncp",
+        "_status_inferido": "recebendo_proposta",
+    }
+
+
+class TestBidRecordMapping:
+    def test_keys_are_routed_to_slots_annotations_and_extra(self):
+        rec = BidRecord(_bid(), customKey="x")
+        rec["_viability_score"] = 72
+        rec["_llm_prompt_level"] = "full"
+
+        assert rec.objetoCompra.startswith("Aquisição")
+        assert rec.annotations._viability_score == 72
+        assert rec.annotations.other == {"_llm_prompt_level": "full"}
+        assert rec.extra == {"customKey": "x"}
+        assert not hasattr(rec, "__dict__")
+
+    def test_behaves_like_the_equivalent_dict(self):
+        plain = _bid()
+        rec = BidRecord(plain)
+
+        assert rec == plain and dict(rec) == plain and {**rec} == plain
+        assert len(rec) == len(plain)
+        assert rec.get("municipio") is None and "municipio" not in rec
+        assert rec.setdefault("_matched_terms", ["uniforme"]) == ["uniforme"]
+        assert rec.pop("_source") == "pncp" and "_source" not in rec
+        with pytest.raises(KeyError):
+            rec["cnpjOrgao"]
+        with pytest.raises(KeyError):
+            del rec["_dedup_key"]
+
+        clone = rec.copy()
+        clone["uf"] = "RJ"
+        assert rec["uf"] == "SP"
+
+    def test_pickle_and_deepcopy_roundtrip(self):
+        rec = BidRecord(_bid(), _viability_factors={"timeline": 70})
+        assert pickle.loads(pickle.dumps(rec)) == rec
+        assert copy.deepcopy(rec) == rec
+
+
+class TestSerializationBoundaries:
+    def test_json_default_and_as_dicts(self):
+        rec = BidRecord(_bid())
+        assert json.loads(json.dumps({"licitacoes": [rec]}, default=json_default)) == {"licitacoes": [_bid()]}
+
+        plain = {"uf": "RJ"}
+        converted = as_dicts([rec, plain])
+        assert type(converted[0]) is dict and converted[0] == _bid()
+        assert converted[1] is plain
+
+
+class TestFilterParity:
+    def test_filters_match_dict_results(self):
+        from filter import aplicar_todos_filtros
+
+        bids = [_bid(i) for i in range(10)] + [
+            _bid(i, objeto="Contratação de serviços de pavimentação asfáltica") for i in range(10, 20)
+        ]
+        kwargs = {"ufs_selecionadas": {"SP"}, "keywords": {"uniformes"}}
+
+        dict_ok, dict_stats = aplicar_todos_filtros(copy.deepcopy(bids), **kwargs)
+        rec_ok, rec_stats = aplicar_todos_filtros([BidRecord(b) for b in bids], **kwargs)
+
+        def _strip(records):  # _trace_id is random per filter run
+            return [{k: v for k, v in r.items() if k != "_trace_id"} for r in records]
+
+        assert rec_stats == dict_stats
+        assert all(isinstance(r, BidRecord) for r in rec_ok)
+        assert _strip(rec_ok) == _strip(dict_ok)
+
+
+class TestConsolidationOutput:
+    @pytest.mark.parametrize("enabled,expected_type", [(True, BidRecord), (False, dict)])
+    def test_flag_selects_record_type(self, enabled, expected_type):
+        proc = UnifiedProcurement(
+            source_id="1", source_name="PNCP", objeto="Uniformes", uf="sp",
+            data_publicacao=datetime(2026, 10, 1),
+        )
+        rec = proc.to_bid_record() if enabled else proc.to_legacy_format()
+        assert type(rec) is expected_type
+        assert dict(rec) == proc.to_legacy_format()
+
+    def test_datalake_rows_compacted_when_enabled(self):
+        from datalake_query import _compact_records
+
+        rows = [{"uf": "SP", "_source": "datalake"}]
+        with patch("config.get_feature_flag", return_value=True):
+            compacted = _compact_records(rows)
+        with patch("config.get_feature_flag", return_value=False):
+            untouched = _compact_records(rows)
+
+        assert isinstance(compacted[0], BidRecord) and compacted[0] == rows[0]
+        assert untouched is rows
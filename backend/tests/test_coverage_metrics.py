@@ -1,13 +1,5 @@
 """Tests for GTM-RESILIENCE-A05: Coverage metrics calculation (AC14-AC15)."""
 
-import sys
-from unittest.mock import MagicMock as _MagicMock
-
-# Pre-mock heavy third-party modules
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = _MagicMock()
-
 from unittest.mock import MagicMock  # noqa: E402
 from schemas import UfStatusDetail, BuscaResponse  # noqa: E402
 
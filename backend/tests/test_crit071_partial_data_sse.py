@@ -271,3 +271,135 @@ async def test_emit_partial_data_message_format(_mock_redis):
     finally:
         for p in patches:
             p.stop()
+
+
+# ===========================================================================
+# 9. Delta encoding — only new/changed bids, compact card projection
+# ===========================================================================
+
+
+def _legacy(i: int, **overrides) -> dict:
+    lic = {
+        "codigoCompra": f"C{i}",
+        "objetoCompra": f"Uniformes lote {i}",
+        "nomeOrgao": "Prefeitura",
+        "uf": "SP",
+        "municipio": "Campinas",
+        "valorTotalEstimado": 1000.0 + i,
+        "modalidadeNome": "Pregão Eletrônico",
+        "dataAberturaProposta": "2026-02-20T09:30:00",
+        "linkSistemaOrigem": "https://example.com",
+        "_source": "PNCP",
+        "_raw_payload": "x" * 2000,
+    }
+    lic.update(overrides)
+    return lic
+
+
+def test_project_partial_item_keeps_card_fields_only():
+    from progress import project_partial_item
+
+    card = project_partial_item(_legacy(1))
+    assert card == {
+        "pncp_id": "C1",
+        "objeto": "Uniformes lote 1",
+        "orgao": "Prefeitura",
+        "uf": "SP",
+        "municipio": "Campinas",
+        "valor": 1001.0,
+        "modalidade": "Pregão Eletrônico",
+        "data_abertura": "2026-02-20",
+        "data_encerramento": None,
+        "source": "PNCP",
+    }
+
+
+@pytest.mark.asyncio
+@patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=None)
+async def test_emit_partial_data_sends_only_new_or_changed(_mock_redis):
+    patches = _patch_event_deps()
+    for p in patches:
+        p.start()
+    try:
+        tracker = _make_tracker("test-delta", uf_count=2)
+        await tracker.emit_partial_data([_legacy(1), _legacy(2)], batch_index=1, ufs_completed=["SP"])
+        await tracker.emit_partial_data(
+            [_legacy(1), _legacy(2, valorTotalEstimado=5.0), _legacy(3)],
+            batch_index=2, ufs_completed=["SP", "RJ"], is_final=True,
+        )
+
+        first = tracker.queue.get_nowait()
+        second = tracker.queue.get_nowait()
+        assert [c["pncp_id"] for c in first.detail["licitacoes"]] == ["C1", "C2"]
+        assert [c["pncp_id"] for c in second.detail["licitacoes"]] == ["C2", "C3"]
+        assert second.detail["new_count"] == 1
+        assert second.detail["changed_count"] == 1
+        assert second.detail["items_total"] == 3
+        assert second.detail["total_items"] == 3
+        # Full record still available on demand
+        assert tracker.get_partial_item("C1")["_raw_payload"] == "x" * 2000
+    finally:
+        for p in patches:
+            p.stop()
+
+
+@pytest.mark.asyncio
+@patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=None)
+async def test_truncated_delta_stays_pending(_mock_redis):
+    patches = _patch_event_deps()
+    for p in patches:
+        p.start()
+    try:
+        tracker = _make_tracker("test-trunc-pending", uf_count=1)
+        await tracker.emit_partial_data(_make_licitacoes(600), batch_index=1, ufs_completed=["SP"])
+        await tracker.emit_partial_data(_make_licitacoes(400), batch_index=2, ufs_completed=["SP"])
+
+        assert tracker.queue.get_nowait().detail["truncated"] is True
+        assert len(tracker.queue.get_nowait().detail["licitacoes"]) == 400
+    finally:
+        for p in patches:
+            p.stop()
+
+
+@pytest.mark.asyncio
+async def test_partial_snapshot_rebuilds_set_from_deltas():
+    from progress import _active_trackers, get_partial_item, get_partial_snapshot
+
+    patches = _patch_event_deps()
+    for p in patches:
+        p.start()
+    try:
+        with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            tracker = _make_tracker("test-snapshot", uf_count=1)
+            _active_trackers["test-snapshot"] = tracker
+            await tracker.emit_partial_data(_make_licitacoes(300), batch_index=1, ufs_completed=["SP"])
+            await tracker.emit_partial_data(_make_licitacoes(700)[300:], batch_index=2, ufs_completed=["SP"])
+
+            snapshot = await get_partial_snapshot("test-snapshot")
+            item = await get_partial_item("test-snapshot", "id-650")
+
+        assert [len(e["detail"]["licitacoes"]) for e in snapshot] == [500, 200]
+        assert all(e["stage"] == "partial_data" and e["detail"]["snapshot"] for e in snapshot)
+        assert item == {"pncp_id": "id-650", "objeto": "Test 650"}
+    finally:
+        _active_trackers.pop("test-snapshot", None)
+        for p in patches:
+            p.stop()
+
+
+@pytest.mark.asyncio
+async def test_partial_snapshot_and_item_from_redis():
+    import json
+    from progress import get_partial_item, get_partial_snapshot
+
+    redis = AsyncMock()
+    redis.hgetall = AsyncMock(return_value={"C1": json.dumps({"pncp_id": "C1"})})
+    redis.hget = AsyncMock(return_value=json.dumps({"codigoCompra": "C1"}))
+    with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=redis):
+        snapshot = await get_partial_snapshot("other-worker")
+        item = await get_partial_item("other-worker", "C1")
+
+    assert snapshot[0]["detail"]["licitacoes"] == [{"pncp_id": "C1"}]
+    redis.hgetall.assert_awaited_once_with("sse_partial:other-worker")
+    assert item == {"codigoCompra": "C1"}
+    redis.hget.assert_awaited_once_with("sse_partial_full:other-worker", "C1")
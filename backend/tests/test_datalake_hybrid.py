@@ -0,0 +1,199 @@
+"""Tests for the hybrid datalake + live-delta fetch mode (DATALAKE_HYBRID_ENABLED).
+
+Covers:
+  - _plan_live_delta: live UFs and delta start from ingestion checkpoints
+  - _estimate_pages_saved: lower-bound page estimate per (UF, modalidade)
+  - get_checkpoints: one RPC, most recent date per combination
+  - stage_execute: live fetch restricted to the delta, merged with datalake rows
+"""
+
+import os
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pipeline.stages.execute import (
+    _estimate_pages_saved,
+    _plan_datalake_hybrid,
+    _plan_live_delta,
+)
+
+
+def _ckpt(uf_dates: dict, modalidades=(4, 6)):
+    return {(uf, m): d for uf, d in uf_dates.items() for m in modalidades}
+
+
+class TestPlanLiveDelta:
+    def test_delta_starts_at_checkpoint_day(self):
+        live, start = _plan_live_delta(
+            ["SC", "PR"], [4, 6], "2026-10-01", "2026-10-10",
+            _ckpt({"SC": date(2026, 10, 8), "PR": date(2026, 10, 9)}),
+        )
+        assert live == ["SC", "PR"]
+        assert start == "2026-10-08"
+
+    def test_checkpoint_after_window_needs_no_live_fetch(self):
+        live, start = _plan_live_delta(
+            ["SC"], [4, 6], "2026-10-01", "2026-10-05", _ckpt({"SC": date(2026, 10, 6)}),
+        )
+        assert live == [] and start is None
+
+    def test_missing_modalidade_checkpoint_fetches_full_window(self):
+        checkpoints = {("SC", 4): date(2026, 10, 9)}  # modalidade 6 never crawled
+        live, start = _plan_live_delta(["SC"], [4, 6], "2026-10-01", "2026-10-10", checkpoints)
+        assert live == ["SC"] and start == "2026-10-01"
+
+    def test_checkpoint_before_window_fetches_full_window(self):
+        live, start = _plan_live_delta(
+            ["SC"], [4, 6], "2026-10-01", "2026-10-10", _ckpt({"SC": date(2026, 9, 1)}),
+        )
+        assert start == "2026-10-01"
+
+    def test_only_stale_ufs_are_fetched_live(self):
+        live, start = _plan_live_delta(
+            ["SC", "PR"], [4, 6], "2026-10-01", "2026-10-05",
+            _ckpt({"SC": date(2026, 10, 7), "PR": date(2026, 10, 4)}),
+        )
+        assert live == ["PR"] and start == "2026-10-04"
+
+
+class TestEstimatePagesSaved:
+    def test_counts_rows_outside_live_window_in_pages(self):
+        rows = (
+            [{"uf": "SC", "codigoModalidadeContratacao": 6, "dataPublicacaoFormatted": "2026-10-02"}] * 51
+            + [{"uf": "SC", "codigoModalidadeContratacao": 6, "dataPublicacaoFormatted": "2026-10-09"}] * 10
+            + [{"uf": "PR", "codigoModalidadeContratacao": 4, "dataPublicacaoFormatted": "2026-10-09"}] * 3
+        )
+        # SC: 51 rows before the delta -> 2 pages; PR fully covered -> 1 page
+        assert _estimate_pages_saved(rows, ["SC"], "2026-10-08") == 3
+
+    def test_no_rows_no_pages(self):
+        assert _estimate_pages_saved([], ["SC"], "2026-10-08") == 0
+
+
+class TestGetCheckpoints:
+    @pytest.mark.asyncio
+    @patch("ingestion.checkpoint.get_supabase")
+    async def test_latest_per_combination_from_rpc(self, mock_get_sb):
+        from ingestion.checkpoint import get_checkpoints
+
+        rows = [
+            {"uf": "SC", "modalidade_id": 6, "last_date": "2026-10-09T00:00:00"},
+            {"uf": "PR", "modalidade_id": 4, "last_date": None},
+        ]
+        sb = mock_get_sb.return_value
+        with patch("supabase_client.sb_execute", new=AsyncMock(return_value=MagicMock(data=rows))) as execute:
+            result = await get_checkpoints(["SC", "PR"], [4, 6])
+
+        assert result == {("SC", 6): date(2026, 10, 9)}
+        sb.rpc.assert_called_once_with(
+            "latest_ingestion_checkpoints",
+            {"p_source": "pncp", "p_ufs": ["SC", "PR"], "p_modalidades": [4, 6]},
+        )
+        sb.table.assert_not_called()
+        execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("ingestion.checkpoint.get_supabase")
+    async def test_read_failure_returns_none(self, mock_get_sb):
+        from ingestion.checkpoint import get_checkpoints
+
+        with patch("supabase_client.sb_execute", new=AsyncMock(side_effect=RuntimeError("down"))):
+            assert await get_checkpoints(["SC"], [6]) is None
+
+
+def _request(**kw):
+    from schemas.search import BuscaRequest
+
+    params = dict(ufs=["SC", "PR"], data_inicial="2026-10-01", data_final="2026-10-10", setor_id="vestuario")
+    params.update(kw)
+    return BuscaRequest(**params)
+
+
+class TestPlanDatalakeHybrid:
+    @pytest.mark.asyncio
+    async def test_returns_delta_request(self):
+        ctx = MagicMock(licitacoes_raw=[])
+        checkpoints = _ckpt({"SC": date(2026, 10, 8), "PR": date(2026, 10, 11)}, modalidades=(4, 5, 6, 7))
+        with patch("ingestion.checkpoint.get_checkpoints", new=AsyncMock(return_value=checkpoints)):
+            delta = await _plan_datalake_hybrid(ctx, _request())
+
+        assert delta.ufs == ["SC"]
+        assert delta.data_inicial == "2026-10-08" and delta.data_final == "2026-10-10"
+
+    @pytest.mark.asyncio
+    async def test_unreadable_checkpoints_behave_as_datalake_only(self):
+        ctx = MagicMock(licitacoes_raw=[])
+        with patch("ingestion.checkpoint.get_checkpoints", new=AsyncMock(return_value=None)):
+            assert await _plan_datalake_hybrid(ctx, _request()) is None
+
+
+class TestStageExecuteHybrid:
+    @pytest.mark.asyncio
+    async def test_live_delta_is_merged_with_datalake_rows(self):
+        from pipeline.stages.execute import stage_execute
+        from search_context import SearchContext
+
+        datalake_rows = [
+            {"codigoCompra": "A", "uf": "SC", "objetoCompra": "datalake A"},
+            {"codigoCompra": "B", "uf": "SC", "objetoCompra": "datalake B"},
+        ]
+        live_rows = [
+            {"codigoCompra": "B", "uf": "SC", "objetoCompra": "live B"},
+            {"codigoCompra": "C", "uf": "SC", "objetoCompra": "live C"},
+        ]
+        delta = _request(ufs=["SC"], data_inicial="2026-10-09")
+        seen_requests = []
+
+        async def fake_multi_source(pipeline, ctx, request, *args, **kwargs):
+            seen_requests.append(request)
+            ctx.licitacoes_raw = list(live_rows)
+
+        ctx = SearchContext(request=_request(), user=None)
+        pipeline = MagicMock()
+        with patch("ingestion.config.DATALAKE_QUERY_ENABLED", True), \
+             patch.dict(os.environ, {"ENABLE_MULTI_SOURCE": "true"}), \
+             patch("datalake_query.query_datalake", new=AsyncMock(return_value=list(datalake_rows))), \
+             patch("config.get_feature_flag", side_effect=lambda name, *a, **k: name == "DATALAKE_HYBRID_ENABLED"), \
+             patch("pipeline.stages.execute._plan_datalake_hybrid", new=AsyncMock(return_value=delta)), \
+             patch("pipeline.stages.execute._execute_multi_source", side_effect=fake_multi_source), \
+             patch("pipeline.stages.execute._read_cache") as read_cache, \
+             patch("pipeline.stages.execute._write_cache"), \
+             patch("pipeline.stages.execute._write_cache_per_uf"):
+            await stage_execute(pipeline, ctx)
+
+        assert seen_requests == [delta]
+        read_cache.assert_not_called()
+        assert [(r["codigoCompra"], r["objetoCompra"]) for r in ctx.licitacoes_raw] == [
+            ("B", "live B"), ("C", "live C"), ("A", "datalake A"),
+        ]
+        assert ctx._datalake_base_results is None
+
+    @pytest.mark.asyncio
+    async def test_failed_live_delta_with_datalake_rows_is_degraded(self):
+        from pipeline.stages.execute import stage_execute
+        from search_context import SearchContext
+
+        datalake_rows = [{"codigoCompra": "A", "uf": "SC", "objetoCompra": "datalake A"}]
+        delta = _request(ufs=["SC"], data_inicial="2026-10-09")
+
+        async def failing_multi_source(pipeline, ctx, request, *args, **kwargs):
+            ctx.licitacoes_raw = []
+            ctx.is_partial = True
+            ctx.response_state = "empty_failure"
+
+        ctx = SearchContext(request=_request(), user=None)
+        with patch("ingestion.config.DATALAKE_QUERY_ENABLED", True), \
+             patch.dict(os.environ, {"ENABLE_MULTI_SOURCE": "true"}), \
+             patch("datalake_query.query_datalake", new=AsyncMock(return_value=list(datalake_rows))), \
+             patch("config.get_feature_flag", side_effect=lambda name, *a, **k: name == "DATALAKE_HYBRID_ENABLED"), \
+             patch("pipeline.stages.execute._plan_datalake_hybrid", new=AsyncMock(return_value=delta)), \
+             patch("pipeline.stages.execute._execute_multi_source", side_effect=failing_multi_source), \
+             patch("pipeline.stages.execute._write_cache"), \
+             patch("pipeline.stages.execute._write_cache_per_uf"):
+            await stage_execute(MagicMock(), ctx)
+
+        assert [r["codigoCompra"] for r in ctx.licitacoes_raw] == ["A"]
+        assert ctx.response_state == "degraded" and ctx.is_partial
+        assert "2026-10-09" in ctx.degradation_guidance
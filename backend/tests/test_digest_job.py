@@ -75,9 +75,12 @@ class TestDailyDigestJob:
                 "stats": {"total_novas": 1, "setor_nome": "TI", "total_valor": 100},
             }
 
+            digest_batch = MagicMock()
+
             with patch("supabase_client.get_supabase", return_value=mock_db), \
                  patch("services.digest_service.get_digest_eligible_users", new_callable=AsyncMock, return_value=eligible_users), \
-                 patch("services.digest_service.build_digest_for_user", new_callable=AsyncMock, return_value=digest_data), \
+                 patch("services.digest_service.load_digest_batch", new_callable=AsyncMock, return_value=digest_batch) as mock_load, \
+                 patch("services.digest_service.build_digest_for_user", new_callable=AsyncMock, return_value=digest_data) as mock_build, \
                  patch("services.digest_service.mark_digest_sent", new_callable=AsyncMock), \
                  patch("email_service.send_batch_email", return_value=[{"id": "email-1"}]):
 
@@ -87,6 +90,9 @@ class TestDailyDigestJob:
             assert result["status"] == "completed"
             assert result["emails_sent"] == 1
             assert result["users_queried"] == 1
+            # Run data is loaded once and shared by every user's digest
+            mock_load.assert_awaited_once()
+            assert mock_build.call_args.kwargs["batch"] is digest_batch
 
     @pytest.mark.asyncio
     @patch("config.DIGEST_ENABLED", True)
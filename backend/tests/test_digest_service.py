@@ -1,7 +1,8 @@
 """Tests for STORY-278 AC2: Digest Service.
 
-Tests build_digest_for_user(), get_digest_eligible_users(), mark_digest_sent(),
-_is_digest_due(), and _query_recent_opportunities().
+Tests build_digest_for_user(), load_digest_batch(), OpportunityPool,
+get_digest_eligible_users(), mark_digest_sent(), _is_digest_due(), and
+_query_recent_opportunities().
 """
 
 import pytest
@@ -250,6 +251,121 @@ class TestBuildDigestForUser:
         assert result is None
 
 
+# ============================================================================
+# OpportunityPool / load_digest_batch() tests
+# ============================================================================
+
+def _cache_row(hours_ago, setor_id, items):
+    return {
+        "results": items,
+        "search_params": {"setor_id": setor_id},
+        "created_at": (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat(),
+    }
+
+
+def _opp(pncp_id, uf, score, valor=1000):
+    return {"id": pncp_id, "objetoCompra": f"Objeto {pncp_id}", "nomeOrgao": "Org",
+            "valorTotalEstimado": valor, "uf": uf, "viability_score": score}
+
+
+POOL_ROWS = [
+    _cache_row(1, "vestuario", [_opp("a", "SP", 0.9), _opp("b", "RJ", 0.7), _opp("c", "", 0.1)]),
+    _cache_row(2, "engenharia", [_opp("d", "SP", 0.95)]),
+    _cache_row(30, "vestuario", [_opp("e", "SP", 0.99), _opp("a", "SP", 0.2), _opp("f", "MG", 0.5)]),
+]
+
+
+class TestOpportunityPool:
+
+    def test_matches_linear_scan_order(self):
+        from services.digest_service import OpportunityPool
+
+        pool = OpportunityPool(POOL_ROWS, max_items=10)
+        top = pool.top("vestuario", ["SP"], since=None)
+        # e (0.99) from the older row; a keeps its first (newest) occurrence; c has no UF
+        assert [o["titulo"] for o in top] == ["Objeto e", "Objeto a", "Objeto c"]
+        assert top[1]["viability_score"] == 0.9
+
+    def test_window_is_prefix_of_pool(self):
+        from services.digest_service import OpportunityPool
+
+        pool = OpportunityPool(POOL_ROWS, max_items=10)
+        since = datetime.now(timezone.utc) - timedelta(hours=24)
+        top = pool.top("vestuario", None, since=since)
+        assert [o["titulo"] for o in top] == ["Objeto a", "Objeto b", "Objeto c"]
+
+    def test_top_n_per_key_and_merge(self):
+        from services.digest_service import OpportunityPool
+
+        rows = [_cache_row(1, "vestuario", [_opp(f"sp{i}", "SP", i / 10) for i in range(8)]
+                           + [_opp(f"rj{i}", "RJ", i / 10 + 0.05) for i in range(8)])]
+        pool = OpportunityPool(rows, max_items=3)
+        top = pool.top("vestuario", ["SP", "RJ"], since=None)
+        assert [o["titulo"] for o in top] == ["Objeto rj7", "Objeto sp7", "Objeto rj6"]
+
+    def test_results_are_copies(self):
+        from services.digest_service import OpportunityPool
+
+        pool = OpportunityPool(POOL_ROWS, max_items=10)
+        pool.top("vestuario", ["SP"], since=None)[0]["titulo"] = "changed"
+        assert pool.top("vestuario", ["SP"], since=None)[0]["titulo"] == "Objeto e"
+
+
+class TestLoadDigestBatch:
+
+    @pytest.mark.asyncio
+    async def test_one_pool_and_profile_query_for_all_users(self):
+        from services.digest_service import build_digest_for_user, load_digest_batch
+
+        eligible = [
+            {"user_id": f"u{i}", "frequency": "daily", "enabled": True, "last_digest_sent_at": None}
+            for i in range(5)
+        ]
+        profiles = MagicMock()
+        profiles.data = [
+            {"id": f"u{i}", "context_data": {"setor_id": "vestuario", "ufs_atuacao": ["SP"] if i % 2 else ["RJ"]}}
+            for i in range(5)
+        ]
+        cache = MagicMock()
+        cache.data = POOL_ROWS
+
+        tables = []
+
+        def table_side_effect(name):
+            tables.append(name)
+            mock_table = MagicMock()
+            if name == "profiles":
+                mock_table.select.return_value.in_.return_value.execute.return_value = profiles
+            elif name == "search_results_cache":
+                mock_table.select.return_value.order.return_value.limit.return_value.gte.return_value.execute.return_value = cache
+            return mock_table
+
+        mock_db = MagicMock()
+        mock_db.table.side_effect = table_side_effect
+        mock_user = MagicMock()
+        mock_user.user.email = "user@example.com"
+        mock_db.auth.admin.get_user_by_id.return_value = mock_user
+
+        batch = await load_digest_batch(eligible, db=mock_db, max_items=10)
+        digests = [await build_digest_for_user(e["user_id"], db=mock_db, batch=batch) for e in eligible]
+
+        assert tables == ["profiles", "search_results_cache"]
+        assert [o["titulo"] for o in digests[1]["opportunities"]] == ["Objeto a", "Objeto c"]
+        assert [o["titulo"] for o in digests[0]["opportunities"]] == ["Objeto b", "Objeto c"]
+        assert digests[0]["stats"]["setor_nome"] == "Vestuario e Uniformes"
+
+    @pytest.mark.asyncio
+    async def test_user_without_profile_is_skipped(self):
+        from services.digest_service import DigestBatch, OpportunityPool, build_digest_for_user
+
+        batch = DigestBatch(
+            prefs={"u1": {"frequency": "daily", "enabled": True, "last_digest_sent_at": None}},
+            contexts={},
+            pool=OpportunityPool(POOL_ROWS),
+        )
+        assert await build_digest_for_user("u1", db=MagicMock(), batch=batch) is None
+
+
 # ============================================================================
 # get_digest_eligible_users() tests
 # ============================================================================
@@ -0,0 +1,203 @@
+"""
+Testes para a geração Excel em modo streaming (excel.write_excel_stream).
+
+Cobertura:
+- Paridade de layout com create_excel() (headers, valores, formatos, links)
+- Linha de totais e aba Metadata
+- Entrada via gerador (sem lista materializada)
+- stream_excel_to_tempfile + storage.upload_excel_file
+- Roteamento buffered/streaming no excel_generation_job
+"""
+
+import os
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openpyxl import load_workbook
+
+from excel import create_excel, resolve_link, stream_excel_to_tempfile, write_excel_stream
+
+
+def _lic(i: int = 0, **overrides) -> dict:
+    lic = {
+        "codigoCompra": f"C{i}",
+        "numeroControlePNCP": f"12345678000190-1-{i + 1:06d}/2026",
+        "objetoCompra": f"Uniformes \x13 lote {i}",
+        "nomeOrgao": "Prefeitura",
+        "uf": "SP",
+        "municipio": "Campinas",
+        "valorTotalEstimado": 1000.0 + i,
+        "modalidadeNome": "Pregão Eletrônico",
+        "dataPublicacaoPncp": "2026-02-10T10:00:00Z",
+        "dataAberturaProposta": "2026-02-20T09:30:00",
+        "situacaoCompraNome": "Divulgada",
+    }
+    lic.update(overrides)
+    return lic
+
+
+def _stream_to_workbook(licitacoes, **kwargs):
+    buf = BytesIO()
+    write_excel_stream(licitacoes, buf, **kwargs)
+    buf.seek(0)
+    return load_workbook(buf)
+
+
+class TestResolveLink:
+    def test_prefers_link_sistema_origem(self):
+        assert resolve_link({"linkSistemaOrigem": "https://a", "linkProcessoEletronico": "https://b"}) == "https://a"
+
+    def test_builds_pncp_url_from_numero_controle(self):
+        lic = {"numeroControlePNCP": "67366310000103-1-000189/2025"}
+        assert resolve_link(lic) == "https://pncp.gov.br/app/editais/67366310000103/2025/189"
+
+    def test_malformed_numero_controle_falls_back_to_search(self):
+        assert resolve_link({"numeroControlePNCP": "abc"}) == "https://pncp.gov.br/app/editais?q=abc"
+
+    def test_no_identifiers_returns_listing(self):
+        assert resolve_link({}) == "https://pncp.gov.br/app/editais"
+
+
+class TestWriteExcelStream:
+    def test_cell_values_match_create_excel(self):
+        data = [_lic(i) for i in range(5)]
+        wb_stream = _stream_to_workbook(data)
+        wb_mem = load_workbook(create_excel(data))
+        try:
+            ws_s = wb_stream["Licitações Uniformes"]
+            ws_m = wb_mem["Licitações Uniformes"]
+            for row in range(1, 8):
+                for col in range(1, 12):
+                    assert ws_s.cell(row, col).value == ws_m.cell(row, col).value, (row, col)
+        finally:
+            wb_stream.close()
+            wb_mem.close()
+
+    def test_formats_and_hyperlinks(self):
+        wb = _stream_to_workbook([_lic(0)])
+        try:
+            ws = wb["Licitações Uniformes"]
+            assert ws.freeze_panes == "A2"
+            assert ws.column_dimensions["B"].width == 60
+            assert ws["A1"].font.bold is True
+            assert ws["A1"].fill.start_color.rgb.endswith("2E7D32")
+            assert ws["F2"].number_format == "[$R$-416] #.##0,00"
+            assert ws["H2"].number_format == "DD/MM/YYYY"
+            assert ws["I2"].number_format == "DD/MM/YYYY HH:MM"
+            assert ws["K2"].hyperlink.target == "https://pncp.gov.br/app/editais/12345678000190/2026/1"
+            assert ws["B2"].border.left.style == "thin"
+            assert "\x13" not in ws["B2"].value
+        finally:
+            wb.close()
+
+    def test_totals_row_and_metadata(self):
+        data = [_lic(i) for i in range(3)]
+        wb = _stream_to_workbook(data, org_name="Org X")
+        try:
+            ws = wb["Licitações Uniformes"]
+            assert ws["E5"].value == "TOTAL:"
+            assert ws["F5"].value == "=SUM(F2:F4)"
+            meta = wb["Metadata"]
+            assert meta["A1"].value == "Organização:"
+            assert meta["B1"].value == "Org X"
+            assert meta["B3"].value == 3
+            assert meta["B4"].value == pytest.approx(3003.0)
+        finally:
+            wb.close()
+
+    def test_empty_input_has_no_totals_row(self):
+        wb = _stream_to_workbook([])
+        try:
+            ws = wb["Licitações Uniformes"]
+            assert ws.max_row == 1
+            assert wb["Metadata"]["B2"].value == 0
+        finally:
+            wb.close()
+
+    def test_accepts_generator(self):
+        buf = BytesIO()
+        rows = write_excel_stream((_lic(i) for i in range(10)), buf)
+        assert rows == 10
+        assert buf.getbuffer().nbytes > 0
+
+
+class TestStreamToTempfile:
+    def test_writes_file_and_caller_removes_it(self):
+        path = stream_excel_to_tempfile([_lic(0), _lic(1)])
+        try:
+            assert path.endswith(".xlsx")
+            wb = load_workbook(path)
+            assert wb["Licitações Uniformes"].max_row == 4
+            wb.close()
+        finally:
+            os.unlink(path)
+
+    def test_removes_file_on_failure(self):
+        created = []
+        real_mkstemp = __import__("tempfile").mkstemp
+
+        def _spy(*args, **kwargs):
+            fd, path = real_mkstemp(*args, **kwargs)
+            created.append(path)
+            return fd, path
+
+        with patch("excel.tempfile.mkstemp", side_effect=_spy):
+            with pytest.raises(AttributeError):
+                stream_excel_to_tempfile([None])
+        assert created and not os.path.exists(created[0])
+
+    def test_upload_excel_file_streams_handle(self):
+        from storage import upload_excel_file
+
+        path = stream_excel_to_tempfile([_lic(0)])
+        try:
+            with patch("storage.upload_excel", return_value={"signed_url": "u"}) as mock_upload:
+                result = upload_excel_file(path, "s1")
+            assert result == {"signed_url": "u"}
+            handle = mock_upload.call_args.args[0]
+            assert handle.name == path
+        finally:
+            os.unlink(path)
+
+    def test_upload_excel_file_missing_file_returns_none(self, tmp_path):
+        from storage import upload_excel_file
+
+        assert upload_excel_file(str(tmp_path / "missing.xlsx"), "s1") is None
+
+
+class TestExcelJobRouting:
+    @pytest.mark.asyncio
+    async def test_large_export_uses_streaming_path(self):
+        from job_queue import excel_generation_job
+
+        mock_storage = {"signed_url": "https://example.com/f.xlsx", "file_path": "f.xlsx"}
+        create_mock = MagicMock()
+        with patch("config.EXCEL_STREAMING_MIN_ROWS", 2), \
+             patch("excel.create_excel", create_mock), \
+             patch("storage.upload_excel_file", return_value=mock_storage) as upload_file, \
+             patch("redis_pool.get_redis_pool", new_callable=lambda: AsyncMock(return_value=AsyncMock(set=AsyncMock()))), \
+             patch("progress.get_tracker", new_callable=lambda: AsyncMock(return_value=None)):
+            result = await excel_generation_job({}, "s1", [_lic(0), _lic(1)], True)
+
+        assert result["excel_status"] == "ready"
+        create_mock.assert_not_called()
+        uploaded_path = upload_file.call_args.args[0]
+        assert not os.path.exists(uploaded_path)
+
+    @pytest.mark.asyncio
+    async def test_small_export_uses_buffered_path(self):
+        from job_queue import excel_generation_job
+
+        mock_storage = {"signed_url": "https://example.com/f.xlsx", "file_path": "f.xlsx"}
+        with patch("config.EXCEL_STREAMING_MIN_ROWS", 1000), \
+             patch("excel.create_excel", return_value=BytesIO(b"x")) as create_mock, \
+             patch("storage.upload_excel", return_value=mock_storage), \
+             patch("storage.upload_excel_file") as upload_file, \
+             patch("redis_pool.get_redis_pool", new_callable=lambda: AsyncMock(return_value=AsyncMock(set=AsyncMock()))), \
+             patch("progress.get_tracker", new_callable=lambda: AsyncMock(return_value=None)):
+            result = await excel_generation_job({}, "s1", [_lic(0)], True)
+
+        assert result["excel_status"] == "ready"
+        create_mock.assert_called_once()
+        upload_file.assert_not_called()
@@ -0,0 +1,150 @@
+"""
+Testes para o cache de artefatos de exportação (export_cache).
+
+Cobertura:
+- Chave de conteúdo: estável, sensível à ordem e às opções
+- get_or_create_artifact: miss gera e indexa, hit reaproveita com URL nova
+- Objeto removido do storage conta como miss
+- Variante em bytes (PDF): hit baixa o objeto em vez de regerar
+- cleanup_expired_artifacts remove apenas artefatos em artifacts/ acima de
+  TTL + validade da URL assinada; uploads por busca na raiz ficam intactos
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from export_cache import (
+    artifact_key,
+    artifact_path,
+    cleanup_expired_artifacts,
+    get_or_create_artifact,
+    get_or_create_artifact_bytes,
+)
+
+
+def _lics(*ids):
+    return [{"pncp_id": i, "objetoCompra": f"obj {i}"} for i in ids]
+
+
+@pytest.fixture
+def fallback_cache():
+    """Force the InMemoryCache path with an isolated cache instance."""
+    from redis_pool import InMemoryCache
+
+    cache = InMemoryCache()
+    with patch("redis_pool.get_redis_pool", new=AsyncMock(return_value=None)), \
+         patch("redis_pool.get_fallback_cache", return_value=cache):
+        yield cache
+
+
+class TestArtifactKey:
+    def test_stable_for_same_input(self):
+        assert artifact_key("excel", _lics("a", "b")) == artifact_key("excel", _lics("a", "b"))
+
+    def test_order_sensitive(self):
+        assert artifact_key("excel", _lics("a", "b")) != artifact_key("excel", _lics("b", "a"))
+
+    def test_options_and_kind_change_key(self):
+        base = artifact_key("pdf", _lics("a"), {"max_items": 20})
+        assert base != artifact_key("pdf", _lics("a"), {"max_items": 10})
+        assert base != artifact_key("excel", _lics("a"), {"max_items": 20})
+
+    def test_falls_back_to_content_without_ids(self):
+        assert artifact_key("excel", [{"x": 1}]) != artifact_key("excel", [{"x": 2}])
+
+    def test_artifact_path(self):
+        assert artifact_path("pdf", "abc") == "artifacts/pdf/abc.pdf"
+
+
+class TestGetOrCreateArtifact:
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, fallback_cache):
+        produce = MagicMock(return_value={"file_path": "s1/f.xlsx", "signed_url": "https://u1"})
+        with patch("storage.create_signed_url", return_value="https://u2") as sign:
+            first = await get_or_create_artifact("excel", _lics("a", "b"), produce)
+            second = await get_or_create_artifact("excel", _lics("a", "b"), produce)
+
+        assert first["reused"] is False and first["signed_url"] == "https://u1"
+        assert second["reused"] is True and second["signed_url"] == "https://u2"
+        assert second["file_path"] == "s1/f.xlsx"
+        produce.assert_called_once()
+        sign.assert_called_once_with("s1/f.xlsx")
+
+    @pytest.mark.asyncio
+    async def test_vanished_object_regenerates(self, fallback_cache):
+        produce = MagicMock(return_value={"file_path": "s1/f.xlsx", "signed_url": "https://u1"})
+        with patch("storage.create_signed_url", return_value=None):
+            await get_or_create_artifact("excel", _lics("a"), produce)
+            result = await get_or_create_artifact("excel", _lics("a"), produce)
+
+        assert result["reused"] is False
+        assert produce.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_produce_is_not_indexed(self, fallback_cache):
+        produce = MagicMock(return_value=None)
+        assert await get_or_create_artifact("excel", _lics("a"), produce) is None
+        assert not fallback_cache._store
+
+    @pytest.mark.asyncio
+    async def test_disabled_always_produces(self, fallback_cache):
+        produce = MagicMock(return_value={"file_path": "f.xlsx", "signed_url": "u"})
+        with patch("export_cache.EXPORT_ARTIFACT_CACHE_ENABLED", False), \
+             patch("storage.create_signed_url", return_value="u2"):
+            await get_or_create_artifact("excel", _lics("a"), produce)
+            await get_or_create_artifact("excel", _lics("a"), produce)
+        assert produce.call_count == 2
+
+
+class TestGetOrCreateArtifactBytes:
+    @pytest.mark.asyncio
+    async def test_hit_downloads_instead_of_building(self, fallback_cache):
+        build = MagicMock(return_value=b"%PDF-1")
+        upload = MagicMock(return_value={"file_path": "artifacts/pdf/k.pdf"})
+        with patch("storage.upload_object", upload), \
+             patch("storage.download_object", return_value=b"%PDF-cached") as download:
+            data, reused = await get_or_create_artifact_bytes("pdf", _lics("a"), build)
+            # Let the background upload + index write finish
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+            cached, reused_again = await get_or_create_artifact_bytes("pdf", _lics("a"), build)
+
+        assert (data, reused) == (b"%PDF-1", False)
+        assert (cached, reused_again) == (b"%PDF-cached", True)
+        build.assert_called_once()
+        assert upload.call_args.args[1].startswith("artifacts/pdf/")
+        download.assert_called_once_with("artifacts/pdf/k.pdf")
+
+
+class TestCleanupExpiredArtifacts:
+    @pytest.mark.asyncio
+    async def test_removes_only_expired_files(self):
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        old = (now - timedelta(days=3)).isoformat()
+        # Past the index TTL, but a URL signed just before it expired is still valid
+        signed_recently = (now - timedelta(hours=30)).isoformat()
+        listing = {
+            "artifacts/excel": [
+                {"name": "old.xlsx", "id": "1", "created_at": old},
+                {"name": "recent.xlsx", "id": "2", "created_at": signed_recently},
+            ],
+            "artifacts/pdf": [
+                {"name": "k.pdf", "id": "3", "created_at": old},
+                {"name": "nested", "id": None, "created_at": None},
+            ],
+        }
+        removed_paths = []
+
+        def _remove(paths):
+            removed_paths.extend(paths)
+            return len(paths)
+
+        with patch("storage.list_objects", side_effect=lambda folder: listing[folder]), \
+             patch("storage.remove_objects", side_effect=_remove):
+            result = await cleanup_expired_artifacts(now=now)
+
+        assert result == {"artifacts_removed": 2}
+        assert removed_paths == ["artifacts/excel/old.xlsx", "artifacts/pdf/k.pdf"]
@@ -0,0 +1,136 @@
+"""Unit tests for ingestion/items_crawler.py — bid item lists for gray-zone inspection."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ingestion.items_crawler import _RequestPacer, _pending_bid_ids, crawl_bid_items
+
+
+def _select_chain(pages):
+    """Route sb.table(name) to a mock whose .execute() returns ``pages`` in order."""
+    chain = MagicMock()
+    for attr in ("select", "eq", "gte", "order", "range", "in_", "upsert"):
+        getattr(chain, attr).return_value = chain
+    chain.execute.side_effect = [MagicMock(data=p) for p in pages]
+    return chain
+
+
+def _mock_supabase(raw_pages, stored_pages, upsert=None):
+    sb = MagicMock()
+    tables = {
+        "pncp_raw_bids": _select_chain(raw_pages),
+        "pncp_bid_items": _select_chain(stored_pages),
+    }
+    if upsert is not None:
+        tables["pncp_bid_items"].upsert = upsert
+    sb.table.side_effect = lambda name: tables[name]
+    return sb, tables
+
+
+class TestPendingBidIds:
+    @pytest.mark.asyncio
+    async def test_skips_bids_with_stored_items(self):
+        sb, _ = _mock_supabase(
+            raw_pages=[[{"pncp_id": "A"}, {"pncp_id": "B"}, {"pncp_id": "C"}]],
+            stored_pages=[[{"pncp_id": "B"}]],
+        )
+        with patch("supabase_client.get_supabase", return_value=sb):
+            pending = await _pending_bid_ids(datetime.now(timezone.utc), max_bids=10)
+
+        assert pending == ["A", "C"]
+
+    @pytest.mark.asyncio
+    async def test_caps_at_max_bids(self):
+        sb, _ = _mock_supabase(
+            raw_pages=[[{"pncp_id": str(i)} for i in range(5)]],
+            stored_pages=[[]],
+        )
+        with patch("supabase_client.get_supabase", return_value=sb):
+            pending = await _pending_bid_ids(datetime.now(timezone.utc), max_bids=2)
+
+        assert pending == ["0", "1"]
+
+
+class TestRequestPacer:
+    @pytest.mark.asyncio
+    async def test_spaces_request_starts(self):
+        pacer = _RequestPacer(rate_per_s=20)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(4):
+            await pacer.wait()
+        # 4 starts at 50ms spacing -> last one no earlier than 150ms
+        assert loop.time() - start >= 0.14
+
+
+class TestCrawlBidItems:
+    @pytest.mark.asyncio
+    async def test_stores_non_empty_item_lists(self):
+        items = [{"descricao": "uniforme", "codigoNcm": "6109", "unidadeMedida": "peça",
+                  "quantidade": 10, "valorUnitario": 25.0}]
+        responses = {"12345678000100-1-000007/2026": items, "12345678000100-1-000008/2026": []}
+        seen = []
+
+        async def fetch(cnpj, ano, sequencial):
+            seen.append((cnpj, ano, sequencial))
+            return responses[f"{cnpj}-1-{int(sequencial):06d}/{ano}"]
+
+        client = MagicMock()
+        client.fetch_bid_items = fetch
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=False)
+
+        upsert = MagicMock()
+        upsert.return_value.execute.return_value = MagicMock(data=[])
+        sb, _ = _mock_supabase(raw_pages=[], stored_pages=[], upsert=upsert)
+
+        pending = list(responses) + ["not-a-control-number"]
+        with patch("ingestion.items_crawler._pending_bid_ids", new=AsyncMock(return_value=pending)), \
+             patch("ingestion.items_crawler.AsyncPNCPClient", return_value=client), \
+             patch("ingestion.items_crawler.INGESTION_ITEMS_RATE_PER_S", 0), \
+             patch("supabase_client.get_supabase", return_value=sb):
+            result = await crawl_bid_items()
+
+        assert sorted(seen) == [("12345678000100", "2026", "7"), ("12345678000100", "2026", "8")]
+        assert result["candidates"] == 3
+        assert result["stored"] == 1 and result["empty"] == 1 and result["failed"] == 1
+        rows = upsert.call_args.args[0]
+        assert rows[0]["pncp_id"] == "12345678000100-1-000007/2026"
+        assert rows[0]["items"] == items and rows[0]["item_count"] == 1
+        assert upsert.call_args.kwargs == {"on_conflict": "pncp_id"}
+
+    @pytest.mark.asyncio
+    async def test_nothing_pending_skips_client(self):
+        with patch("ingestion.items_crawler._pending_bid_ids", new=AsyncMock(return_value=[])), \
+             patch("ingestion.items_crawler.AsyncPNCPClient") as client_cls:
+            result = await crawl_bid_items()
+
+        client_cls.assert_not_called()
+        assert result["candidates"] == 0 and result["status"] == "completed"
+
+
+class TestItemsJob:
+    @pytest.mark.asyncio
+    async def test_skipped_when_items_disabled(self):
+        from ingestion.scheduler import ingestion_items_job
+
+        with patch("ingestion.config.INGESTION_ITEMS_ENABLED", False):
+            result = await ingestion_items_job({})
+
+        assert result["status"] == "skipped"
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported(self):
+        from ingestion.scheduler import ingestion_items_job
+
+        with patch("ingestion.config.INGESTION_ITEMS_ENABLED", True), \
+             patch("ingestion.scheduler.DATALAKE_ENABLED", True), \
+             patch("ingestion.items_crawler.crawl_bid_items", new=AsyncMock(side_effect=RuntimeError("boom"))), \
+             patch("ingestion.scheduler._notify_failure", new=AsyncMock()) as notify:
+            result = await ingestion_items_job({})
+
+        assert result["status"] == "failed"
+        notify.assert_awaited_once()
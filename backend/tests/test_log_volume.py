@@ -8,17 +8,11 @@ After E-01 consolidation, a typical search should emit ~15-25 INFO lines
 """
 
 import logging
-import sys
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Pre-mock heavy third-party modules before importing pipeline
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = MagicMock()
-
 from pncp_client import ParallelFetchResult  # noqa: E402
 from schemas import ResumoEstrategico  # noqa: E402
 from search_context import SearchContext  # noqa: E402
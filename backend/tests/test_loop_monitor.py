@@ -0,0 +1,104 @@
+"""Tests for the event-loop lag monitor (loop_monitor.py).
+
+Covers:
+  - ticker records lag when a synchronous call blocks the loop
+  - rolling window summary (percentiles, eviction, blocked count)
+  - blocking-call detector captures the blocking frame's stack
+  - /health exposes the summary under "event_loop"
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import loop_monitor
+from loop_monitor import LoopMonitor, get_loop_lag_summary
+
+
+def _blocking_call(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestLagMeasurement:
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_up_as_lag(self):
+        monitor = LoopMonitor(interval_s=0.02, window_s=60, threshold_s=0.1)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.05)
+        _blocking_call(0.2)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        summary = monitor.summary()
+        assert summary["lag_max_ms"] >= 150
+        assert summary["blocked_total"] >= 1 and summary["status"] == "blocked"
+
+    def test_window_summary_and_eviction(self):
+        monitor = LoopMonitor(interval_s=0.5, window_s=10, threshold_s=0.25)
+        monitor.record(0.9, now=0.0)  # evicted below
+        for i in range(100):
+            monitor.record(0.001 * i, now=100.0 + i * 0.01)
+
+        summary = monitor.summary()
+        assert summary["samples"] == 100
+        assert summary["lag_p50_ms"] == 50.0 and summary["lag_max_ms"] == 99.0
+        assert summary["status"] == "ok" and summary["blocked_total"] == 1
+
+    def test_summary_disabled_without_monitor(self):
+        with patch.object(loop_monitor, "_monitor", None):
+            assert get_loop_lag_summary() == {"enabled": False}
+
+
+class TestBlockingCallDetector:
+    def test_stack_of_blocking_frame_logged(self):
+        monitor = LoopMonitor(interval_s=0.5, window_s=60, threshold_s=0.05, detector=True)
+        started = threading.Event()
+
+        def _loop_thread():
+            monitor._loop_thread_id = threading.get_ident()
+            started.set()
+            _blocking_call(0.3)
+
+        thread = threading.Thread(target=_loop_thread)
+        thread.start()
+        started.wait()
+        time.sleep(0.05)
+        stack = monitor.check_stall(0.1)
+        thread.join()
+
+        assert "_blocking_call" in stack
+        assert monitor.stalls_reported == 1
+
+    @pytest.mark.asyncio
+    async def test_watchdog_reports_stall_while_blocked(self):
+        monitor = LoopMonitor(interval_s=0.02, window_s=60, threshold_s=0.08, detector=True)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.05)
+        with patch.object(loop_monitor.logger, "warning") as warning:
+            _blocking_call(0.3)
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stacks = [c.args[2] for c in warning.call_args_list if "stack" in c.args[0]]
+        assert stacks and "_blocking_call" in stacks[0]
+
+
+class TestHealthEndpoint:
+    @pytest.mark.asyncio
+    async def test_health_includes_event_loop(self):
+        from routes.health_core import health
+
+        monitor = LoopMonitor(interval_s=0.5, window_s=60, threshold_s=0.25)
+        monitor.record(0.004)
+        with patch.object(loop_monitor, "_monitor", monitor):
+            body = await health()
+
+        assert body["event_loop"]["samples"] == 1
+        assert body["event_loop"]["last_lag_ms"] == 4.0
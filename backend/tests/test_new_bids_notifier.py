@@ -14,12 +14,12 @@ def mock_profiles():
         {
             "id": "user-a",
             "plan_type": "free_trial",
-            "profile_context": {"setor_id": "saude", "ufs": ["SP", "RJ"]},
+            "profile_context": {"setor_id": "medicamentos", "ufs": ["SP", "RJ"]},
         },
         {
             "id": "user-b",
             "plan_type": "smartlic_pro",
-            "profile_context": {"setor_id": "construcao", "ufs_selecionadas": ["MG"]},
+            "profile_context": {"setor_id": "engenharia", "ufs_selecionadas": ["MG"]},
         },
         {
             "id": "user-no-setor",
@@ -29,11 +29,33 @@ def mock_profiles():
         {
             "id": "user-no-ufs",
             "plan_type": "free_trial",
-            "profile_context": {"setor_id": "saude"},  # missing ufs
+            "profile_context": {"setor_id": "medicamentos"},  # missing ufs
         },
     ]
 
 
+def _mock_redis():
+    """Redis mock whose pipeline() records SETEX calls."""
+    mock_redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return mock_redis, pipe
+
+
+def _sb_execute_returning(profiles, grouped_rows):
+    """sb_execute stub: profiles query first, then the grouped count RPC."""
+    calls = []
+
+    async def mock_sb_execute(query):
+        calls.append(query)
+        resp = MagicMock()
+        resp.data = profiles if len(calls) == 1 else grouped_rows
+        return resp
+
+    return mock_sb_execute, calls
+
+
 # ---------------------------------------------------------------------------
 # Tests — run_new_bids_notifier
 # ---------------------------------------------------------------------------
@@ -42,34 +64,8 @@ def mock_profiles():
 async def test_run_new_bids_notifier_processes_valid_users(mock_profiles):
     """Users with setor_id AND ufs get a Redis key written."""
     mock_sb = MagicMock()
-    mock_redis = AsyncMock()
-    mock_redis.setex = AsyncMock()
-
-    # Profile query returns 4 profiles (2 valid, 2 missing fields)
-    profiles_resp = MagicMock()
-    profiles_resp.data = mock_profiles
-
-    # Count query returns 5 new bids
-    count_resp = MagicMock()
-    count_resp.count = 5
-
-    mock_table = MagicMock()
-    mock_table.select.return_value = mock_table
-    mock_table.in_.return_value = mock_table
-    mock_table.not_ = mock_table
-    mock_table.is_.return_value = mock_table
-    mock_table.eq.return_value = mock_table
-    mock_table.gte.return_value = mock_table
-
-    mock_sb.table.return_value = mock_table
-
-    call_count = [0]
-
-    async def mock_sb_execute(query):
-        call_count[0] += 1
-        if call_count[0] == 1:
-            return profiles_resp
-        return count_resp
+    mock_redis, pipe = _mock_redis()
+    mock_sb_execute, _calls = _sb_execute_returning(mock_profiles, [])
 
     with (
         patch("redis_pool.get_redis_pool", return_value=mock_redis),
@@ -83,30 +79,23 @@ async def test_run_new_bids_notifier_processes_valid_users(mock_profiles):
     assert result["processed"] == 2
     assert result["skipped"] == 2
     assert result["errors"] == 0
-    # Redis.setex called twice (once per valid user)
-    assert mock_redis.setex.call_count == 2
+    # One SETEX per valid user, flushed in a single pipeline round-trip
+    assert pipe.setex.call_count == 2
+    pipe.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_run_new_bids_notifier_stores_count_in_redis(mock_profiles):
     """Redis key format is new_bids_count:{user_id} with correct TTL."""
     mock_sb = MagicMock()
-    mock_redis = AsyncMock()
-    mock_redis.setex = AsyncMock()
-
-    profiles_resp = MagicMock()
-    profiles_resp.data = [mock_profiles[0]]  # only user-a
-
-    count_resp = MagicMock()
-    count_resp.count = 7
-
-    call_count = [0]
-
-    async def mock_sb_execute(query):
-        call_count[0] += 1
-        if call_count[0] == 1:
-            return profiles_resp
-        return count_resp
+    mock_redis, pipe = _mock_redis()
+    mock_sb_execute, _calls = _sb_execute_returning(
+        [mock_profiles[0]],  # only user-a (saude, SP+RJ)
+        [
+            {"setor_id": "medicamentos", "uf": "SP", "bid_count": 4},
+            {"setor_id": "medicamentos", "uf": "RJ", "bid_count": 3},
+        ],
+    )
 
     with (
         patch("redis_pool.get_redis_pool", return_value=mock_redis),
@@ -116,13 +105,102 @@ async def test_run_new_bids_notifier_stores_count_in_redis(mock_profiles):
         from jobs.cron.new_bids_notifier import run_new_bids_notifier, NEW_BIDS_REDIS_TTL
         await run_new_bids_notifier()
 
-    mock_redis.setex.assert_called_once_with(
+    pipe.setex.assert_called_once_with(
         "new_bids_count:user-a",
         NEW_BIDS_REDIS_TTL,
         "7",
     )
 
 
+@pytest.mark.asyncio
+async def test_run_new_bids_notifier_single_grouped_query():
+    """Query count is constant in the number of profiles; counts summed per user UFs."""
+    profiles = [
+        {"id": f"user-{i}", "plan_type": "smartlic_pro",
+         "profile_context": {"setor_id": "medicamentos", "ufs": ["SP", "RJ"] if i % 2 else ["SP"]}}
+        for i in range(50)
+    ] + [
+        {"id": "user-obras", "plan_type": "free_trial",
+         "profile_context": {"setor": "engenharia", "states": ["MG", "SP"]}},
+    ]
+    grouped = [
+        {"setor_id": "medicamentos", "uf": "SP", "bid_count": 10},
+        {"setor_id": "medicamentos", "uf": "RJ", "bid_count": 2},
+        {"setor_id": "engenharia", "uf": "MG", "bid_count": 5},
+    ]
+    mock_sb = MagicMock()
+    mock_redis, pipe = _mock_redis()
+    mock_sb_execute, calls = _sb_execute_returning(profiles, grouped)
+
+    with (
+        patch("redis_pool.get_redis_pool", return_value=mock_redis),
+        patch("supabase_client.get_supabase", return_value=mock_sb),
+        patch("supabase_client.sb_execute", side_effect=mock_sb_execute),
+    ):
+        from jobs.cron.new_bids_notifier import run_new_bids_notifier
+        result = await run_new_bids_notifier()
+
+    assert len(calls) == 2
+    assert result["queries"] == 2
+    assert result["processed"] == 51
+    mock_sb.rpc.assert_called_once()
+    rpc_name, params = mock_sb.rpc.call_args.args
+    assert rpc_name == "count_new_bids_by_setor_uf"
+    # Sector membership is the keyword tsquery, not a column on pncp_raw_bids
+    assert [sec["setor_id"] for sec in params["p_sectors"]] == ["engenharia", "medicamentos"]
+    assert all(sec["tsquery"] for sec in params["p_sectors"])
+    assert params["p_ufs"] == ["MG", "RJ", "SP"]
+
+    written = {c.args[0]: c.args[2] for c in pipe.setex.call_args_list}
+    assert written["new_bids_count:user-0"] == "10"
+    assert written["new_bids_count:user-1"] == "12"
+    assert written["new_bids_count:user-obras"] == "5"
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_new_bids_notifier_records_run_metrics(mock_profiles):
+    """Runtime and query count are reported per run."""
+    mock_sb = MagicMock()
+    mock_redis, _pipe = _mock_redis()
+    mock_sb_execute, _calls = _sb_execute_returning(mock_profiles, [])
+
+    with (
+        patch("redis_pool.get_redis_pool", return_value=mock_redis),
+        patch("supabase_client.get_supabase", return_value=mock_sb),
+        patch("supabase_client.sb_execute", side_effect=mock_sb_execute),
+        patch("metrics.NEW_BIDS_NOTIFIER_DURATION") as duration,
+        patch("metrics.NEW_BIDS_NOTIFIER_QUERIES") as queries,
+    ):
+        from jobs.cron.new_bids_notifier import run_new_bids_notifier
+        result = await run_new_bids_notifier()
+
+    duration.observe.assert_called_once()
+    queries.set.assert_called_once_with(2)
+    assert result["duration_s"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_run_new_bids_notifier_pipeline_failure_counts_errors(mock_profiles):
+    """A failed Redis pipeline marks the computed users as errors."""
+    mock_sb = MagicMock()
+    mock_redis, pipe = _mock_redis()
+    pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+    mock_sb_execute, _calls = _sb_execute_returning(mock_profiles, [])
+
+    with (
+        patch("redis_pool.get_redis_pool", return_value=mock_redis),
+        patch("supabase_client.get_supabase", return_value=mock_sb),
+        patch("supabase_client.sb_execute", side_effect=mock_sb_execute),
+    ):
+        from jobs.cron.new_bids_notifier import run_new_bids_notifier
+        result = await run_new_bids_notifier()
+
+    assert result["processed"] == 0
+    assert result["errors"] == 2
+
+
 @pytest.mark.asyncio
 async def test_run_new_bids_notifier_no_profiles():
     """Returns early when no active profiles found."""
@@ -151,20 +229,9 @@ async def test_run_new_bids_notifier_no_profiles():
 async def test_run_new_bids_notifier_redis_unavailable(mock_profiles):
     """Processes profiles gracefully when Redis is None (no exception raised)."""
     mock_sb = MagicMock()
-
-    profiles_resp = MagicMock()
-    profiles_resp.data = [mock_profiles[0]]
-
-    count_resp = MagicMock()
-    count_resp.count = 3
-
-    call_count = [0]
-
-    async def mock_sb_execute(query):
-        call_count[0] += 1
-        if call_count[0] == 1:
-            return profiles_resp
-        return count_resp
+    mock_sb_execute, _calls = _sb_execute_returning(
+        [mock_profiles[0]], [{"setor_id": "medicamentos", "uf": "SP", "bid_count": 3}],
+    )
 
     with (
         patch("redis_pool.get_redis_pool", return_value=None),
@@ -174,7 +241,7 @@ async def test_run_new_bids_notifier_redis_unavailable(mock_profiles):
         from jobs.cron.new_bids_notifier import run_new_bids_notifier
         result = await run_new_bids_notifier()
 
-    # processed == 1 because count_resp was returned; no Redis write attempted
+    # processed == 1 because the grouped count was computed; no Redis write attempted
     assert result["processed"] == 1
     assert result["errors"] == 0
 
@@ -198,3 +265,29 @@ async def test_run_new_bids_notifier_supabase_error():
 
     assert result["processed"] == 0
     assert "error" in result
+
+
+@pytest.mark.asyncio
+async def test_run_new_bids_notifier_skips_unknown_sector():
+    """A profile whose sector is not configured is skipped, not sent to the RPC."""
+    profiles = [
+        {"id": "user-a", "plan_type": "smartlic_pro",
+         "profile_context": {"setor_id": "medicamentos", "ufs": ["SP"]}},
+        {"id": "user-x", "plan_type": "smartlic_pro",
+         "profile_context": {"setor_id": "nao_existe", "ufs": ["SP"]}},
+    ]
+    mock_sb = MagicMock()
+    mock_redis, pipe = _mock_redis()
+    mock_sb_execute, _calls = _sb_execute_returning(profiles, [])
+
+    with (
+        patch("redis_pool.get_redis_pool", return_value=mock_redis),
+        patch("supabase_client.get_supabase", return_value=mock_sb),
+        patch("supabase_client.sb_execute", side_effect=mock_sb_execute),
+    ):
+        from jobs.cron.new_bids_notifier import run_new_bids_notifier
+        result = await run_new_bids_notifier()
+
+    assert (result["processed"], result["skipped"]) == (1, 1)
+    _, params = mock_sb.rpc.call_args.args
+    assert [sec["setor_id"] for sec in params["p_sectors"]] == ["medicamentos"]
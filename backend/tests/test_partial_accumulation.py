@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from config import PNCP_PAGE_CONCURRENCY
 from pncp_client import AsyncPNCPClient, ModalityFetchState, _circuit_breaker
 
 
@@ -135,11 +136,14 @@ class TestPartialAccumulation:
         async with AsyncPNCPClient(max_concurrent=10) as client:
             fetch_calls = 0
 
+            page1_calls = 0
+
             async def mock_fetch_page(**kwargs):
-                nonlocal fetch_calls
+                nonlocal fetch_calls, page1_calls
                 fetch_calls += 1
                 pg = kwargs.get("pagina", 1)
                 if pg == 1:
+                    page1_calls += 1
                     return {
                         "data": [{"numeroControlePNCP": "partial-1", "uf": "SP"}],
                         "paginasRestantes": 50,
@@ -162,9 +166,10 @@ class TestPartialAccumulation:
 
             assert len(items) >= 1
             assert was_truncated is True
-            # Page 1 succeeded on first attempt + page 2 started (then timeout)
-            # Should NOT have made a second attempt at page 1
-            assert fetch_calls <= 3, "Should not retry when partial items exist"
+            # Page 1 succeeded on first attempt + pages 2..N started concurrently
+            # (then timeout). Should NOT have made a second attempt at page 1
+            assert page1_calls == 1, "Should not retry when partial items exist"
+            assert fetch_calls <= 1 + PNCP_PAGE_CONCURRENCY
 
     @pytest.mark.asyncio
     @pytest.mark.timeout(10)
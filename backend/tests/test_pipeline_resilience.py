@@ -10,17 +10,11 @@ Validates that the search pipeline gracefully handles:
 - Generic exception handler (AC5-AC9)
 """
 
-import sys
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Pre-mock heavy third-party modules before importing pipeline
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = MagicMock()
-
 from search_context import SearchContext  # noqa: E402
 from search_pipeline import SearchPipeline  # noqa: E402
 
@@ -0,0 +1,189 @@
+"""Tests for the per-UF PNCP fetch planner (PNCP_FETCH_PLANNER_ENABLED).
+
+Covers:
+  - build_fetch_plan: page budgets from history, largest UFs first,
+    latency-based timeouts, deadline scaling
+  - load_page_history: one grouped RPC, TTL cache, fail-open backoff
+  - buscar_todas_ufs_paralelo: plan order, per-UF kwargs and trace output
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import clients.pncp.fetch_planner as fp
+from clients.pncp.fetch_planner import build_fetch_plan, load_page_history
+from pncp_client import AsyncPNCPClient, _circuit_breaker
+
+
+def _plan(ufs, modalidades=(6,), span_days=10, **kw):
+    params = dict(
+        history={},
+        page_latency_s={},
+        default_latency_s=2.0,
+        max_pages=20,
+        page_concurrency=4,
+        deadline_s=300.0,
+        batch_size=5,
+        batch_delay_s=2.0,
+        min_timeout_s=10.0,
+    )
+    params.update(kw)
+    return build_fetch_plan(list(ufs), list(modalidades), span_days, **params)
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    fp._history_cache.clear()
+    fp._history_loaded_at = 0.0
+    fp._history_retry_at = 0.0
+    _circuit_breaker.consecutive_failures = 0
+    _circuit_breaker.degraded_until = None
+    yield
+    fp._history_cache.clear()
+    fp._history_loaded_at = 0.0
+    fp._history_retry_at = 0.0
+
+
+class TestBuildFetchPlan:
+    def test_page_budget_follows_history(self):
+        # SP: 30 rows/day x 10 days = 6 pages (+25% slack -> 8); AC: 1 page (-> 2)
+        plan = _plan(["AC", "SP"], history={("SP", 6): 30.0, ("AC", 6): 2.0})
+        budgets = {t.uf: t.max_pages for t in plan.tasks}
+        assert budgets == {"SP": 8, "AC": 2}
+        assert plan.source == "history"
+
+    def test_budget_capped_at_max_pages(self):
+        plan = _plan(["SP"], history={("SP", 6): 500.0}, max_pages=20)
+        assert plan.tasks[0].max_pages == 20
+
+    def test_largest_ufs_scheduled_first(self):
+        history = {("AC", 6): 1.0, ("SP", 6): 80.0, ("SC", 6): 20.0}
+        plan = _plan(["AC", "SC", "SP"], history=history)
+        assert plan.uf_order == ["SP", "SC", "AC"]
+
+    def test_missing_history_uses_uf_size_heuristic(self):
+        plan = _plan(["SP", "AC"], history={("SP", 6): 30.0})
+        assert {t.uf: t.source for t in plan.tasks} == {"SP": "history", "AC": "heuristic"}
+        assert plan.source == "mixed"
+
+    def test_timeout_scales_with_page_latency(self):
+        history = {("SP", 6): 200.0, ("RJ", 6): 200.0}
+        plan = _plan(["SP", "RJ"], history=history, page_latency_s={"SP": 6.0})
+        timeouts = {t.uf: t.timeout_s for t in plan.tasks}
+        # 20 pages -> 1 + ceil(19/4) = 6 rounds x latency x 1.5
+        assert timeouts["SP"] == pytest.approx(6 * 6.0 * 1.5)
+        assert timeouts["RJ"] == pytest.approx(6 * 2.0 * 1.5)
+        assert plan.uf_timeouts["SP"] == pytest.approx(timeouts["SP"] + 5.0)
+
+    def test_small_tasks_get_minimum_timeout(self):
+        plan = _plan(["AC"], history={("AC", 6): 1.0})
+        assert plan.tasks[0].timeout_s == 10.0
+
+    def test_overrun_is_scaled_into_deadline(self):
+        ufs = ["SP", "RJ", "MG", "BA", "RS", "PR", "PE", "CE", "SC", "GO"]
+        history = {(uf, 6): 200.0 for uf in ufs}
+        plan = _plan(ufs, history=history, page_latency_s={uf: 10.0 for uf in ufs}, deadline_s=100.0)
+
+        assert plan.scaled
+        # 2 batches -> one 2s inter-batch delay, UF margin is not scaled
+        assert plan.estimated_s <= 100.0 + 2 * 5.0
+        assert all(t.max_pages < 20 for t in plan.tasks)
+
+    def test_within_deadline_not_scaled(self):
+        plan = _plan(["SP"], history={("SP", 6): 30.0})
+        assert not plan.scaled
+        assert plan.estimated_s == pytest.approx(plan.uf_timeouts["SP"])
+
+    def test_uf_kwargs_and_trace(self):
+        plan = _plan(["SP"], modalidades=(4, 6), history={("SP", 4): 5.0, ("SP", 6): 30.0})
+        kwargs = plan.uf_kwargs("SP")
+        assert kwargs["page_budgets"] == {4: 2, 6: 8}
+        assert set(kwargs["modality_timeouts"]) == {4, 6}
+
+        trace = plan.to_trace()
+        assert trace["uf_order"] == ["SP"]
+        assert trace["ufs"]["SP"]["pages"] == {"4": 2, "6": 8}
+
+
+def _rpc_supabase(rows):
+    sb = MagicMock()
+    sb.rpc.return_value = "query"
+    return sb, AsyncMock(return_value=MagicMock(data=rows))
+
+
+class TestLoadPageHistory:
+    @pytest.mark.asyncio
+    async def test_grouped_counts_become_rows_per_day_and_are_cached(self):
+        sb, execute = _rpc_supabase([{"uf": "SP", "modalidade_id": 6, "bid_count": 280}])
+        with patch("supabase_client.get_supabase", return_value=sb), \
+             patch("supabase_client.sb_execute", execute), \
+             patch("config.PNCP_PLANNER_HISTORY_DAYS", 14):
+            first = await load_page_history(["SP", "AC"], [6])
+            second = await load_page_history(["SP"], [6])
+
+        assert first == {("SP", 6): 20.0, ("AC", 6): 0.0}
+        assert second == {("SP", 6): 20.0}
+        execute.assert_awaited_once()
+        assert sb.rpc.call_args.args[0] == "count_recent_bids_by_uf_modalidade"
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_empty_and_backs_off(self):
+        sb = MagicMock()
+        execute = AsyncMock(side_effect=RuntimeError("down"))
+        with patch("supabase_client.get_supabase", return_value=sb), \
+             patch("supabase_client.sb_execute", execute):
+            assert await load_page_history(["SP"], [6]) == {}
+            assert await load_page_history(["SP"], [6]) == {}
+
+        execute.assert_awaited_once()
+
+
+class TestParallelFetchWithPlan:
+    @pytest.mark.asyncio
+    async def test_plan_drives_order_budgets_and_trace(self):
+        calls = []
+
+        async def fake_fetch_uf(**kwargs):
+            calls.append(kwargs)
+            return [{"codigoCompra": kwargs["uf"]}], False
+
+        history = {("AC", 6): 1.0, ("SP", 6): 80.0}
+        with patch("config.get_feature_flag", side_effect=lambda name, *a, **k: name == "PNCP_FETCH_PLANNER_ENABLED"), \
+             patch("clients.pncp.fetch_planner.load_page_history", new=AsyncMock(return_value=history)), \
+             patch.object(AsyncPNCPClient, "_fetch_uf_all_pages", side_effect=fake_fetch_uf), \
+             patch.object(AsyncPNCPClient, "health_canary", new_callable=AsyncMock, return_value=True), \
+             patch("clients.pncp._parallel_mixin.PNCP_BATCH_SIZE", 1), \
+             patch("clients.pncp._parallel_mixin.PNCP_BATCH_DELAY_S", 0.0):
+            client = AsyncPNCPClient(max_concurrent=10)
+            result = await client.buscar_todas_ufs_paralelo(
+                ufs=["AC", "SP"], data_inicial="2026-10-01", data_final="2026-10-10",
+                modalidades=[6],
+            )
+
+        assert [c["uf"] for c in calls] == ["SP", "AC"]
+        assert calls[0]["page_budgets"] == {6: 20}
+        assert calls[1]["page_budgets"] == {6: 2}
+        assert result.fetch_plan["uf_order"] == ["SP", "AC"]
+        assert result.succeeded_ufs == ["SP", "AC"]
+
+    @pytest.mark.asyncio
+    async def test_flag_off_keeps_static_budgets(self):
+        calls = []
+
+        async def fake_fetch_uf(**kwargs):
+            calls.append(kwargs)
+            return [], False
+
+        with patch("config.get_feature_flag", return_value=False), \
+             patch.object(AsyncPNCPClient, "_fetch_uf_all_pages", side_effect=fake_fetch_uf), \
+             patch.object(AsyncPNCPClient, "health_canary", new_callable=AsyncMock, return_value=True):
+            client = AsyncPNCPClient(max_concurrent=10)
+            result = await client.buscar_todas_ufs_paralelo(
+                ufs=["AC", "SP"], data_inicial="2026-10-01", data_final="2026-10-10",
+                modalidades=[6],
+            )
+
+        assert [c["uf"] for c in calls] == ["AC", "SP"]
+        assert "page_budgets" not in calls[0]
+        assert result.fetch_plan is None
@@ -0,0 +1,132 @@
+"""Tests for concurrent page fetching in AsyncPNCPClient._fetch_single_modality.
+
+Page 1 reports how many pages remain; pages 2..min(total, max_pages) are then
+fetched concurrently, bounded by PNCP_PAGE_CONCURRENCY. Partial accumulation
+into ModalityFetchState must keep working when the modality times out.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from pncp_client import AsyncPNCPClient, ModalityFetchState, _circuit_breaker
+from exceptions import PNCPAPIError
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breaker():
+    _circuit_breaker.consecutive_failures = 0
+    _circuit_breaker.degraded_until = None
+    yield
+    _circuit_breaker.consecutive_failures = 0
+    _circuit_breaker.degraded_until = None
+
+
+def _paged_fetch(total_pages: int, delays: dict | None = None, fail_pages: tuple = ()):
+    """Build a _fetch_page_async stub that tracks in-flight requests."""
+    stats = {"in_flight": 0, "max_in_flight": 0, "pages": []}
+
+    async def fetch(**kwargs):
+        pg = kwargs["pagina"]
+        stats["pages"].append(pg)
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep((delays or {}).get(pg, 0.01))
+            if pg in fail_pages:
+                raise PNCPAPIError("API returned non-retryable status 500")
+            return {
+                "data": [{"numeroControlePNCP": f"p{pg}-{i}", "uf": "SP"} for i in range(2)],
+                "totalRegistros": total_pages * 2,
+                "totalPaginas": total_pages,
+                "paginasRestantes": total_pages - pg,
+            }
+        finally:
+            stats["in_flight"] -= 1
+
+    return fetch, stats
+
+
+class TestPageFanOut:
+    @pytest.mark.asyncio
+    async def test_remaining_pages_fetched_concurrently_within_bound(self):
+        async with AsyncPNCPClient() as client:
+            client._fetch_page_async, stats = _paged_fetch(total_pages=8)
+            with patch("config.PNCP_PAGE_CONCURRENCY", 3):
+                items, truncated = await client._fetch_single_modality(
+                    uf="SP", data_inicial="2026-01-01", data_final="2026-01-10", modalidade=6,
+                )
+
+        assert sorted(stats["pages"]) == list(range(1, 9))
+        assert stats["pages"][0] == 1
+        assert stats["max_in_flight"] == 3
+        assert len(items) == 16 and truncated is False
+
+    @pytest.mark.asyncio
+    async def test_concurrency_one_is_sequential(self):
+        async with AsyncPNCPClient() as client:
+            client._fetch_page_async, stats = _paged_fetch(total_pages=4)
+            with patch("config.PNCP_PAGE_CONCURRENCY", 1):
+                await client._fetch_single_modality(
+                    uf="SP", data_inicial="2026-01-01", data_final="2026-01-10", modalidade=6,
+                )
+
+        assert stats["pages"] == [1, 2, 3, 4]
+        assert stats["max_in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_max_pages_caps_fan_out_and_flags_truncation(self):
+        async with AsyncPNCPClient() as client:
+            client._fetch_page_async, stats = _paged_fetch(total_pages=30)
+            items, truncated = await client._fetch_single_modality(
+                uf="SP", data_inicial="2026-01-01", data_final="2026-01-10", modalidade=6,
+                max_pages=5,
+            )
+
+        assert sorted(stats["pages"]) == [1, 2, 3, 4, 5]
+        assert truncated is True and len(items) == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_page_does_not_drop_other_pages(self):
+        async with AsyncPNCPClient() as client:
+            client._fetch_page_async, _stats = _paged_fetch(total_pages=5, fail_pages=(3,))
+            state = ModalityFetchState()
+            items, _ = await client._fetch_single_modality(
+                uf="SP", data_inicial="2026-01-01", data_final="2026-01-10", modalidade=6,
+                state=state,
+            )
+
+        assert state.fetched_pages == {1, 2, 4, 5}
+        assert len(items) == 8
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_pages_completed_out_of_order(self):
+        async with AsyncPNCPClient() as client:
+            client._fetch_page_async, _stats = _paged_fetch(
+                total_pages=5, delays={2: 10, 3: 0.01, 4: 0.01, 5: 10},
+            )
+            state = ModalityFetchState()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    client._fetch_single_modality(
+                        uf="SP", data_inicial="2026-01-01", data_final="2026-01-10",
+                        modalidade=6, state=state,
+                    ),
+                    timeout=0.3,
+                )
+
+        assert state.fetched_pages == {1, 3, 4}
+        assert state.pages_fetched == 3
+        assert {i["numeroControlePNCP"] for i in state.items} == {
+            "p1-0", "p1-1", "p3-0", "p3-1", "p4-0", "p4-1",
+        }
+
+
+class TestFanoutMetricsLabel:
+    def test_label_follows_page_concurrency(self):
+        from clients.pncp._parallel_mixin import _page_fanout_mode
+
+        with patch("config.PNCP_PAGE_CONCURRENCY", 1):
+            assert _page_fanout_mode() == "sequential"
+        with patch("config.PNCP_PAGE_CONCURRENCY", 4):
+            assert _page_fanout_mode() == "parallel"
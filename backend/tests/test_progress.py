@@ -17,6 +17,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from tests.helpers.mock_factories import mock_redis_pipeline
 from progress import (
     ProgressEvent,
     ProgressTracker,
@@ -207,8 +208,7 @@ class TestProgressTracker:
     async def test_emit_with_redis_enabled(self):
         """AC2: Test emit() publishes to Redis Stream when use_redis=True."""
         mock_redis_client = AsyncMock()
-        mock_redis_client.xadd = AsyncMock(return_value="1-0")
-        mock_redis_client.expire = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis_client)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock) as mock_pool:
             mock_pool.return_value = mock_redis_client
@@ -223,8 +223,8 @@ class TestProgressTracker:
             assert tracker.queue.qsize() == 1
 
             # Check Redis XADD was called (STORY-276)
-            mock_redis_client.xadd.assert_called_once()
-            call_args = mock_redis_client.xadd.call_args
+            pipe.xadd.assert_called_once()
+            call_args = pipe.xadd.call_args
             stream_key = call_args[0][0]
             fields = call_args[0][1]
 
@@ -237,7 +237,7 @@ class TestProgressTracker:
             # Non-terminal event should NOT set EXPIRE on stream key
             # STORY-297: Replay list EXPIRE is always called, but stream EXPIRE only on terminal
             stream_expire_calls = [
-                c for c in mock_redis_client.expire.call_args_list
+                c for c in pipe.expire.call_args_list
                 if c[0][0].endswith(":stream")
             ]
             assert len(stream_expire_calls) == 0
@@ -749,8 +749,7 @@ class TestEmitDegraded:
     async def test_emit_degraded_publishes_to_redis(self):
         """Test emit_degraded() publishes to Redis Stream when use_redis=True."""
         mock_redis_client = AsyncMock()
-        mock_redis_client.xadd = AsyncMock(return_value="1-0")
-        mock_redis_client.expire = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis_client)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock) as mock_pool:
             mock_pool.return_value = mock_redis_client
@@ -768,8 +767,8 @@ class TestEmitDegraded:
             assert tracker.queue.qsize() == 1
 
             # STORY-276: Check Redis XADD was called
-            mock_redis_client.xadd.assert_called_once()
-            call_args = mock_redis_client.xadd.call_args
+            pipe.xadd.assert_called_once()
+            call_args = pipe.xadd.call_args
             stream_key = call_args[0][0]
             fields = call_args[0][1]
 
@@ -783,7 +782,7 @@ class TestEmitDegraded:
             # Terminal event should set EXPIRE on stream key
             # STORY-297: Also sets EXPIRE on replay list, so expect 2 calls
             stream_expire_calls = [
-                c for c in mock_redis_client.expire.call_args_list
+                c for c in pipe.expire.call_args_list
                 if c[0][0].endswith(":stream")
             ]
             assert len(stream_expire_calls) == 1
@@ -1012,3 +1011,120 @@ class TestHarden019DbFallback:
 
             assert result["stage"] == "error"
             assert "failed" in result["message"].lower()
+
+
+class TestPipelinedEmission:
+    """Each event is written to Redis in a single pipelined round-trip."""
+
+    @pytest.mark.asyncio
+    async def test_one_round_trip_per_event(self):
+        mock_redis_client = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis_client)
+
+        with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis_client):
+            tracker = ProgressTracker(search_id="pipe-1", uf_count=1, use_redis=True)
+            await tracker.emit(stage="fetching", progress=30, message="Fetching...")
+            await tracker.emit_complete()
+
+        assert pipe.execute.await_count == 2
+        mock_redis_client.pipeline.assert_called_with(transaction=False)
+        # fetching: rpush+ltrim+expire+xadd; complete: same + stream expire
+        assert tracker._redis_round_trips == 2
+        assert tracker._redis_commands == 9
+
+    @pytest.mark.asyncio
+    async def test_partial_data_skips_replay_list(self):
+        mock_redis_client = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis_client)
+
+        with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis_client):
+            tracker = ProgressTracker(search_id="pipe-2", uf_count=1, use_redis=True)
+            await tracker.emit_partial_data([{"id": 1}], batch_index=0, ufs_completed=["SP"])
+
+        pipe.xadd.assert_called_once()
+        pipe.rpush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_usage_observed_once_on_terminal_event(self):
+        mock_redis_client = AsyncMock()
+        mock_redis_pipeline(mock_redis_client)
+
+        with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis_client), \
+             patch("metrics.PROGRESS_REDIS_OPS_PER_SEARCH") as mock_hist:
+            tracker = ProgressTracker(search_id="pipe-3", uf_count=1, use_redis=True)
+            await tracker.emit(stage="fetching", progress=30, message="Fetching...")
+            await tracker.emit_complete()
+            await tracker.emit_search_complete("pipe-3", total_results=1)
+
+        units = [c.kwargs["unit"] for c in mock_hist.labels.call_args_list]
+        assert units == ["round_trips", "commands"]
+
+
+class TestEventCoalescing:
+    """High-frequency events are coalesced on PROGRESS_COALESCE_WINDOW_MS."""
+
+    @pytest.mark.asyncio
+    async def test_uf_status_coalesced_per_uf(self):
+        tracker = ProgressTracker(search_id="coal-1", uf_count=2)
+        await tracker.emit_uf_status("SP", "fetching")
+        await tracker.emit_uf_status("RJ", "fetching")
+        await tracker.emit_uf_status("SP", "retrying", attempt=1)
+
+        # SP retrying is pending; each UF got its first update immediately
+        assert tracker.queue.qsize() == 2
+        assert "uf_status:SP" in tracker._coalesce_pending
+
+    @pytest.mark.asyncio
+    async def test_final_uf_status_supersedes_pending(self):
+        tracker = ProgressTracker(search_id="coal-2", uf_count=1)
+        await tracker.emit_uf_status("SP", "fetching")
+        await tracker.emit_uf_status("SP", "retrying", attempt=1)
+        await tracker.emit_uf_status("SP", "success", count=10)
+
+        statuses = []
+        while not tracker.queue.empty():
+            statuses.append(tracker.queue.get_nowait().detail["uf_status"])
+        assert statuses == ["fetching", "success"]
+        assert not tracker._coalesce_pending
+
+    @pytest.mark.asyncio
+    async def test_other_event_flushes_pending_first(self):
+        tracker = ProgressTracker(search_id="coal-3", uf_count=4)
+        await tracker.emit_batch_progress(1, 4, ["SP"])
+        await tracker.emit_batch_progress(2, 4, ["RJ"])
+        await tracker.emit("filtering", 60, "Aplicando filtros")
+
+        stages = []
+        while not tracker.queue.empty():
+            event = tracker.queue.get_nowait()
+            stages.append((event.stage, event.detail.get("batch_num")))
+        assert stages == [("batch_progress", 1), ("batch_progress", 2), ("filtering", None)]
+        assert tracker._coalesce_timer is None
+
+    @pytest.mark.asyncio
+    async def test_terminal_event_waits_for_in_flight_timer_flush(self):
+        """A flush already dispatching is awaited, not cancelled (no lost updates)."""
+        tracker = ProgressTracker(search_id="coal-4", uf_count=4)
+        await tracker.emit_batch_progress(1, 4, ["SP"])
+        await tracker.emit_batch_progress(2, 4, ["RJ"])
+        await tracker.emit_batch_progress(3, 4, ["MG"])
+
+        dispatching = asyncio.Event()
+        release = asyncio.Event()
+        written = []
+
+        async def slow_write(event, *args, **kwargs):
+            if event.stage == "batch_progress":
+                dispatching.set()
+                await release.wait()
+            written.append((event.stage, event.detail.get("batch_num")))
+
+        with patch.object(tracker, "_write_to_redis", side_effect=slow_write):
+            await asyncio.wait_for(dispatching.wait(), timeout=2)  # timer popped 2 and 3
+            terminal = asyncio.create_task(tracker.emit_complete())
+            await asyncio.sleep(0)
+            release.set()
+            await terminal
+
+        # The popped update reaches Redis (cross-worker SSE) before the terminal event
+        assert written == [("batch_progress", 3), ("complete", None)]
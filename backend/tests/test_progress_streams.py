@@ -22,6 +22,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from httpx import AsyncClient, ASGITransport
 
+from tests.helpers.mock_factories import mock_redis_pipeline
+
 from progress import (
     ProgressEvent,
     ProgressTracker,
@@ -56,14 +58,13 @@ def mock_redis_unavailable():
 
 
 class TestXADDPublishing:
-    """AC1: ProgressTracker._publish_to_redis() uses XADD with correct fields."""
+    """AC1: ProgressTracker writes events to the stream with XADD and correct fields."""
 
     @pytest.mark.asyncio
     async def test_xadd_stores_stage_progress_message_detail(self):
         """AC1: Each stream entry has stage, progress, message, detail_json fields."""
         mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(return_value="1-0")
-        mock_redis.expire = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("stream-test-1", uf_count=3, use_redis=True)
@@ -72,8 +73,8 @@ class TestXADDPublishing:
                 uf="SP", items_found=50,
             )
 
-        mock_redis.xadd.assert_called_once()
-        args = mock_redis.xadd.call_args
+        pipe.xadd.assert_called_once()
+        args = pipe.xadd.call_args
         stream_key = args[0][0]
         fields = args[0][1]
 
@@ -89,7 +90,7 @@ class TestXADDPublishing:
     async def test_xadd_preserves_correlation_fields(self):
         """AC1: trace_id, search_id, request_id stored when present."""
         mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(return_value="1-0")
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis), \
              patch("middleware.search_id_var") as mock_sid, \
@@ -101,7 +102,7 @@ class TestXADDPublishing:
             tracker = ProgressTracker("stream-corr", uf_count=1, use_redis=True)
             await tracker.emit(stage="connecting", progress=5, message="Init")
 
-        fields = mock_redis.xadd.call_args[0][1]
+        fields = pipe.xadd.call_args[0][1]
         assert fields.get("trace_id") == "trace-abc"
         assert fields.get("search_id") == "search-xyz"
         assert fields.get("request_id") == "req-123"
@@ -120,18 +121,17 @@ class TestStreamExpire:
     async def test_expire_set_on_terminal_event(self, terminal_stage):
         """AC1: EXPIRE called with 300s TTL for each terminal stage."""
         mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(return_value="1-0")
-        mock_redis.expire = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("stream-expire", uf_count=1, use_redis=True)
-            # Manually call _publish_to_redis with terminal event
+            # Write a terminal event straight to Redis
             event = ProgressEvent(
                 stage=terminal_stage, progress=100, message="Terminal"
             )
-            await tracker._publish_to_redis(event)
+            await tracker._write_to_redis(event, 1, event.to_dict(), replay=False)
 
-        mock_redis.expire.assert_called_once_with(
+        pipe.expire.assert_called_once_with(
             "smartlic:progress:stream-expire:stream",
             _STREAM_EXPIRE_TTL,
         )
@@ -140,10 +140,7 @@ class TestStreamExpire:
     async def test_no_expire_on_non_terminal_event(self):
         """AC1: No EXPIRE on stream key for non-terminal events like 'fetching'."""
         mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(return_value="1-0")
-        mock_redis.expire = AsyncMock()
-        mock_redis.rpush = AsyncMock()
-        mock_redis.ltrim = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("stream-no-expire", uf_count=1, use_redis=True)
@@ -151,7 +148,7 @@ class TestStreamExpire:
 
         # STORY-297: Replay list EXPIRE is called, but stream EXPIRE should NOT be
         stream_expire_calls = [
-            c for c in mock_redis.expire.call_args_list
+            c for c in pipe.expire.call_args_list
             if c[0][0].endswith(":stream")
         ]
         assert len(stream_expire_calls) == 0
@@ -160,23 +157,20 @@ class TestStreamExpire:
     async def test_emit_complete_publishes_and_expires(self):
         """STORY-276: emit_complete() now publishes to stream and sets EXPIRE."""
         mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(return_value="1-0")
-        mock_redis.expire = AsyncMock()
-        mock_redis.rpush = AsyncMock()
-        mock_redis.ltrim = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("stream-complete", uf_count=1, use_redis=True)
             await tracker.emit_complete()
 
         # emit_complete should now publish to Redis
-        mock_redis.xadd.assert_called_once()
-        fields = mock_redis.xadd.call_args[0][1]
+        pipe.xadd.assert_called_once()
+        fields = pipe.xadd.call_args[0][1]
         assert fields["stage"] == "complete"
         assert fields["progress"] == "100"
         # STORY-297: EXPIRE called twice — replay list (600s) + stream (300s)
         stream_expire_calls = [
-            c for c in mock_redis.expire.call_args_list
+            c for c in pipe.expire.call_args_list
             if c[0][0].endswith(":stream")
         ]
         assert len(stream_expire_calls) == 1
@@ -185,22 +179,19 @@ class TestStreamExpire:
     async def test_emit_error_publishes_and_expires(self):
         """STORY-276: emit_error() now publishes to stream and sets EXPIRE."""
         mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(return_value="1-0")
-        mock_redis.expire = AsyncMock()
-        mock_redis.rpush = AsyncMock()
-        mock_redis.ltrim = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("stream-error", uf_count=1, use_redis=True)
             await tracker.emit_error("Connection failed")
 
-        mock_redis.xadd.assert_called_once()
-        fields = mock_redis.xadd.call_args[0][1]
+        pipe.xadd.assert_called_once()
+        fields = pipe.xadd.call_args[0][1]
         assert fields["stage"] == "error"
         assert fields["progress"] == "-1"
         # STORY-297: EXPIRE called twice — replay list (600s) + stream (300s)
         stream_expire_calls = [
-            c for c in mock_redis.expire.call_args_list
+            c for c in pipe.expire.call_args_list
             if c[0][0].endswith(":stream")
         ]
         assert len(stream_expire_calls) == 1
@@ -518,7 +509,7 @@ class TestCrossWorkerE2E:
         stream_key = "smartlic:progress:heartbeat-mix:stream"
         xread_call = 0
 
-        async def mock_xread(streams, count=None):
+        async def mock_xread(streams, count=None, block=None):
             nonlocal xread_call
             xread_call += 1
 
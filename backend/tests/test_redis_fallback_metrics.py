@@ -12,17 +12,11 @@ Run from backend/:
 """
 
 import logging
-import sys
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Pre-mock heavy third-party modules not needed for these tests
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = MagicMock()
-
 import redis_pool  # noqa: E402
 from redis_pool import (  # noqa: E402
     get_redis_pool,
@@ -15,19 +15,12 @@ Run from backend/:
 """
 
 import asyncio
-import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-# Pre-mock heavy third-party modules that may appear in the import chain
-# but are NOT needed for unit-testing redis_pool.
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = MagicMock()
-
 import redis_pool
 from redis_pool import (
     INMEMORY_MAX_ENTRIES,
@@ -1,6 +1,6 @@
-"""Tests for RedisRateLimiter (B-06 AC6, AC7, AC10, AC12).
+"""Tests for RedisRateLimiter (B-06 AC6, AC7, AC10, AC12) and the PNCP AIMD controller.
 
-Tests use mock Redis to verify token bucket behavior.
+Tests use mock Redis to verify token bucket and token leasing behavior.
 When Redis is unavailable, verifies fail-open behavior.
 """
 
@@ -264,3 +264,253 @@ class TestAC12RateLimiterTTL:
         """Verify Lua script contains EXPIRE call."""
         assert "EXPIRE" in RedisRateLimiter._BUCKET_SCRIPT
         assert "60" in RedisRateLimiter._BUCKET_SCRIPT
+
+
+# ===========================================================================
+# AIMD — adaptive PNCP request rate
+# ===========================================================================
+
+def _controller(**kwargs):
+    from rate_limiter import AIMDRateController
+
+    params = dict(
+        name="test_aimd", min_rate=2.0, max_rate=12.0, initial_rate=10.0,
+        increase=1.0, decrease_factor=0.5, latency_threshold_s=5.0, cooldown_s=2.0,
+    )
+    params.update(kwargs)
+    return AIMDRateController(**params)
+
+
+class TestAIMDRateController:
+    """Additive increase / multiplicative decrease, local fallback + Redis script."""
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_rate_once_per_cooldown(self):
+        ctl = _controller()
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            await ctl.record_throttle("429")
+            await ctl.record_throttle("429")  # same burst — ignored
+        assert ctl.current_rate == 5.0
+
+    @pytest.mark.asyncio
+    async def test_rate_never_below_min(self):
+        ctl = _controller(cooldown_s=0.0)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            for _ in range(6):
+                await ctl.record_throttle("5xx")
+        assert ctl.current_rate == 2.0
+
+    @pytest.mark.asyncio
+    async def test_success_increases_additively_up_to_max(self):
+        ctl = _controller(cooldown_s=0.0)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            await ctl.record_success(0.2)
+            assert ctl.current_rate == 11.0
+            for _ in range(5):
+                await ctl.record_success(0.2)
+        assert ctl.current_rate == 12.0
+
+    @pytest.mark.asyncio
+    async def test_no_increase_right_after_decrease(self):
+        ctl = _controller()
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            await ctl.record_throttle("timeout")
+            ctl._last_inc_attempt = float("-inf")  # local cooldown elapsed
+            await ctl.record_success(0.2)
+        assert ctl.current_rate == 5.0
+
+    @pytest.mark.asyncio
+    async def test_slow_response_counts_as_throttle(self):
+        ctl = _controller()
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            await ctl.record_success(6.0)
+        assert ctl.current_rate == 5.0
+
+    @pytest.mark.asyncio
+    async def test_disabled_keeps_initial_rate(self):
+        ctl = _controller(enabled=False, cooldown_s=0.0)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            await ctl.record_throttle("429")
+            await ctl.record_success(0.1)
+        assert ctl.current_rate == 10.0
+
+    @pytest.mark.asyncio
+    async def test_redis_script_result_becomes_shared_rate(self):
+        mock_redis = AsyncMock()
+        mock_redis.eval = AsyncMock(return_value="7.5")
+        ctl = _controller()
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            await ctl.record_throttle("429")
+
+        args = mock_redis.eval.call_args[0]
+        assert args[0] == ctl._ADJUST_SCRIPT
+        assert args[1:4] == (1, "rate_controller:test_aimd", "dec")
+        assert ctl.current_rate == 7.5
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_local(self):
+        mock_redis = AsyncMock()
+        mock_redis.eval = AsyncMock(side_effect=Exception("Connection refused"))
+        ctl = _controller()
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            await ctl.record_throttle("429")
+        assert ctl.current_rate == 5.0
+
+    @pytest.mark.asyncio
+    async def test_bucket_refills_at_controller_rate(self):
+        mock_redis, _ = _make_mock_redis(token_result=1)
+        ctl = _controller()
+        ctl._rate = 4.0
+        rl = RedisRateLimiter(name="test_aimd_bucket", max_tokens=10, refill_rate=10.0, controller=ctl)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            await rl.acquire()
+        assert mock_redis.eval.call_args[0][4] == "4.0"
+
+    @pytest.mark.asyncio
+    async def test_client_pacing_follows_allowed_rate(self):
+        """_rate_limit spaces requests by 1/current_rate instead of a fixed 100ms."""
+        from pncp_client import AsyncPNCPClient
+        from rate_limiter import pncp_rate_controller
+
+        pncp_rate_controller._rate = 20.0
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        async with AsyncPNCPClient() as client:
+            with patch("rate_limiter.pncp_rate_limiter") as mock_rl, \
+                 patch("clients.pncp.async_client.asyncio.sleep", side_effect=fake_sleep):
+                mock_rl.acquire = AsyncMock(return_value=True)
+                for _ in range(3):
+                    await client._rate_limit()
+
+        assert len(sleeps) == 2
+        assert sleeps[0] == pytest.approx(0.05, abs=0.01)
+        assert sleeps[1] == pytest.approx(0.10, abs=0.01)
+
+
+class TestAIMDClientSignals:
+    """_fetch_page_async feeds 429/5xx/success to the controller."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,expected", [(429, "429"), (503, "5xx")])
+    async def test_throttle_statuses(self, status, expected):
+        from clients.pncp.async_client import _feed_rate_controller
+
+        with patch("rate_limiter.pncp_rate_controller") as ctl:
+            ctl.record_throttle = AsyncMock()
+            ctl.record_success = AsyncMock()
+            await _feed_rate_controller(status, 0.3, (429, 500, 503))
+        ctl.record_throttle.assert_awaited_once_with(expected)
+        ctl.record_success.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_success_reports_latency(self):
+        from clients.pncp.async_client import _feed_rate_controller
+
+        with patch("rate_limiter.pncp_rate_controller") as ctl:
+            ctl.record_throttle = AsyncMock()
+            ctl.record_success = AsyncMock()
+            await _feed_rate_controller(200, 0.3, (429, 500, 503))
+            await _feed_rate_controller(422, 0.3, (422, 429, 500, 503))
+        ctl.record_success.assert_awaited_once_with(0.3)
+        ctl.record_throttle.assert_not_called()
+
+
+# ===========================================================================
+# Token leasing — one EVALSHA per batch of tokens
+# ===========================================================================
+
+def _lease_redis(grants):
+    """Mock Redis whose lease script grants the given token counts in order."""
+    grants = list(grants)
+    calls = []
+
+    async def evalsha(sha, numkeys, *args):
+        calls.append((sha, args[numkeys:]))
+        if sha == RedisRateLimiter._RETURN_SHA:
+            return 1
+        return grants.pop(0) if grants else 0
+
+    mock_redis = AsyncMock()
+    mock_redis.evalsha = AsyncMock(side_effect=evalsha)
+    return mock_redis, calls
+
+
+class TestTokenLeasing:
+
+    @pytest.mark.asyncio
+    async def test_one_redis_call_per_lease(self):
+        mock_redis, calls = _lease_redis([4, 4, 4])
+        rl = RedisRateLimiter(name="test_lease", lease_size=4, lease_ttl_s=10)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            results = [await rl.acquire() for _ in range(10)]
+
+        assert all(results)
+        assert len(calls) == 3
+        assert calls[0][0] == RedisRateLimiter._LEASE_SHA
+        assert calls[0][1][3] == "4"  # tokens requested
+        mock_redis.eval.assert_not_called()
+        mock_redis.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_script_reloaded_after_noscript(self):
+        from redis.exceptions import NoScriptError
+
+        mock_redis = AsyncMock()
+        mock_redis.evalsha = AsyncMock(side_effect=NoScriptError("No matching script"))
+        mock_redis.eval = AsyncMock(return_value=4)
+        rl = RedisRateLimiter(name="test_noscript", lease_size=4, lease_ttl_s=10)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            assert await rl.acquire() is True
+
+        assert mock_redis.eval.call_args[0][0] == RedisRateLimiter._LEASE_SCRIPT
+        assert rl._lease_tokens == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_returns_unused_tokens(self):
+        mock_redis, calls = _lease_redis([4, 4])
+        rl = RedisRateLimiter(name="test_lease_expiry", lease_size=4, lease_ttl_s=10)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            await rl.acquire()
+            rl._lease_expires = 0.0  # lease expired with 3 tokens unused
+            await rl.acquire()
+
+        assert [c[0] for c in calls] == [
+            RedisRateLimiter._LEASE_SHA, RedisRateLimiter._RETURN_SHA, RedisRateLimiter._LEASE_SHA,
+        ]
+        assert calls[1][1] == ("10", "3")
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_a_single_new_lease(self):
+        """Empty bucket: waiters block on the local condition, not on Redis polling."""
+        import asyncio
+
+        mock_redis, calls = _lease_redis([0, 4])
+        rl = RedisRateLimiter(name="test_lease_wait", refill_rate=50.0, lease_size=4, lease_ttl_s=10)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            results = await asyncio.gather(*(rl.acquire(timeout=1.0) for _ in range(4)))
+
+        assert all(results)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_lease_timeout_returns_false(self):
+        mock_redis, _calls = _lease_redis([])
+        rl = RedisRateLimiter(name="test_lease_timeout", refill_rate=50.0, lease_size=4)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            assert await rl.acquire(timeout=0.1) is False
+
+    @pytest.mark.asyncio
+    async def test_lease_redis_error_fails_open(self):
+        mock_redis = AsyncMock()
+        mock_redis.evalsha = AsyncMock(side_effect=Exception("Connection refused"))
+        rl = RedisRateLimiter(name="test_lease_error", lease_size=4)
+        with patch("rate_limiter.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
+            assert await rl.acquire() is True
+
+    def test_pncp_limiter_uses_leasing(self):
+        from config import PNCP_TOKEN_LEASE_SIZE
+
+        assert pncp_rate_limiter.lease_size == PNCP_TOKEN_LEASE_SIZE
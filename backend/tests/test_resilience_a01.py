@@ -10,14 +10,6 @@ Run from backend/:
     python -m pytest tests/test_resilience_a01.py -v
 """
 
-import sys
-from unittest.mock import MagicMock as _MagicMock
-
-# Pre-mock heavy third-party modules
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = _MagicMock()
-
 import pytest  # noqa: E402
 from datetime import datetime, timezone, timedelta  # noqa: E402
 from unittest.mock import patch, MagicMock, AsyncMock  # noqa: E402
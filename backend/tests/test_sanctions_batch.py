@@ -0,0 +1,149 @@
+"""Tests for batched sanctions checks (SanctionsService.check_batch).
+
+Covers:
+  - CNPJ de-duplication across a result set
+  - shared Redis tier: hits skip the API, clean results cached with the
+    negative TTL, incomplete results never cached
+  - time budget: unfinished checks reported unavailable
+  - SanctionsChecker.check_sanctions: a failed source marks the result
+    incomplete
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from clients.sanctions import SanctionRecord, SanctionsChecker, SanctionsResult
+from config import SANCTIONS_CACHE_TTL_S, SANCTIONS_NEGATIVE_CACHE_TTL_S
+from services import sanctions_service as svc
+from services.sanctions_service import SanctionsService
+
+CLEAN = "12345678000190"
+SANCTIONED = "98765432000110"
+
+
+def _result(cnpj: str, sanctioned: bool = False, complete: bool = True) -> SanctionsResult:
+    sanctions = [
+        SanctionRecord(
+            source="CEIS", cnpj=cnpj, company_name="ACME LTDA", sanction_type="Impedimento",
+            start_date=date(2026, 1, 1), end_date=None, sanctioning_body="Prefeitura X",
+            legal_basis="", fine_amount=None, is_active=True,
+        ),
+    ] if sanctioned else []
+    return SanctionsResult(
+        cnpj=cnpj, is_sanctioned=sanctioned, sanctions=sanctions,
+        checked_at=datetime(2026, 10, 19, tzinfo=timezone.utc),
+        ceis_count=len(sanctions), cnep_count=0, complete=complete,
+    )
+
+
+def _redis(cached: dict | None = None) -> MagicMock:
+    cached = cached or {}
+    redis = MagicMock()
+    redis.mget = AsyncMock(side_effect=lambda keys: [cached.get(k) for k in keys])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline.return_value = pipe
+    return redis
+
+
+def _service(check) -> SanctionsService:
+    service = SanctionsService(api_key="k")
+    service._checker.check_sanctions = AsyncMock(side_effect=check)
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _no_mirror():
+    with patch("ingestion.config.SANCTIONS_MIRROR_ENABLED", False):
+        yield
+
+
+class TestCheckBatch:
+    @pytest.mark.asyncio
+    async def test_duplicates_checked_once(self):
+        service = _service(lambda cnpj: _result(cnpj))
+        with patch("redis_pool.get_redis_pool", AsyncMock(return_value=None)):
+            reports, stats = await service.check_batch([CLEAN, "12.345.678/0001-90", CLEAN, SANCTIONED])
+
+        assert set(reports) == {CLEAN, SANCTIONED}
+        assert service._checker.check_sanctions.await_count == 2
+        assert (stats.requested, stats.unique, stats.api_checks) == (4, 2, 2)
+        assert stats.hit_ratio == 0.0
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_skips_api(self):
+        key = svc._redis_key(SANCTIONED)
+        redis = _redis({key: svc._result_to_json(_result(SANCTIONED, sanctioned=True))})
+        service = _service(lambda cnpj: _result(cnpj))
+        with patch("redis_pool.get_redis_pool", AsyncMock(return_value=redis)):
+            reports, stats = await service.check_batch([SANCTIONED, CLEAN])
+
+        service._checker.check_sanctions.assert_awaited_once_with(CLEAN)
+        assert reports[SANCTIONED].status == "sanctioned"
+        assert reports[SANCTIONED].ceis_records[0].company_name == "ACME LTDA"
+        assert (stats.redis_hits, stats.api_checks, stats.hit_ratio) == (1, 1, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_api_results_cached_with_tier_ttl(self):
+        redis = _redis()
+        service = _service(lambda cnpj: _result(cnpj, sanctioned=cnpj == SANCTIONED))
+        with patch("redis_pool.get_redis_pool", AsyncMock(return_value=redis)):
+            await service.check_batch([CLEAN, SANCTIONED])
+
+        pipe = redis.pipeline.return_value
+        ttls = {c.args[0]: c.args[1] for c in pipe.setex.call_args_list}
+        assert ttls == {
+            svc._redis_key(CLEAN): SANCTIONS_NEGATIVE_CACHE_TTL_S,
+            svc._redis_key(SANCTIONED): SANCTIONS_CACHE_TTL_S,
+        }
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_incomplete_result_unavailable_and_not_cached(self):
+        redis = _redis()
+        service = _service(lambda cnpj: _result(cnpj, complete=False))
+        with patch("redis_pool.get_redis_pool", AsyncMock(return_value=redis)):
+            reports, stats = await service.check_batch([CLEAN])
+
+        assert reports[CLEAN].status == "unavailable"
+        assert stats.unavailable == 1
+        redis.pipeline.return_value.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_budget_exceeded_reported_unavailable(self):
+        async def check(cnpj):
+            if cnpj == SANCTIONED:
+                await asyncio.sleep(5)
+            return _result(cnpj)
+
+        service = _service(check)
+        with patch("redis_pool.get_redis_pool", AsyncMock(return_value=None)):
+            reports, stats = await service.check_batch([CLEAN, SANCTIONED], budget_s=0.05)
+
+        assert reports[CLEAN].status == "clean"
+        assert reports[SANCTIONED].status == "unavailable"
+        assert (stats.budget_exceeded, stats.unavailable) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_through_to_api(self):
+        redis = _redis()
+        redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        service = _service(lambda cnpj: _result(cnpj))
+        with patch("redis_pool.get_redis_pool", AsyncMock(return_value=redis)):
+            reports, _ = await service.check_batch([CLEAN])
+
+        assert reports[CLEAN].status == "clean"
+
+
+class TestCheckerCompleteness:
+    @pytest.mark.asyncio
+    async def test_failed_source_marks_result_incomplete_and_uncached(self):
+        checker = SanctionsChecker(api_key="k")
+        with patch.object(checker, "_query_source", AsyncMock(side_effect=[[], None])):
+            result = await checker.check_sanctions(CLEAN)
+
+        assert not result.complete and not result.is_sanctioned
+        assert checker.cache_size == 0
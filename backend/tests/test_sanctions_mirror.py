@@ -0,0 +1,191 @@
+"""Tests for the CEIS / CNEP sanctions mirror.
+
+Covers:
+  - ingestion/sanctions_mirror.py: CSV parsing (legal entities only, fines,
+    accented latin-1 headers) and the hash diff against the stored rows
+  - services/sanctions_mirror.py: CNPJ lookups, activity by end date,
+    freshness and reload on a newer sync
+  - SanctionsService: mirror first, API only when the mirror is stale
+"""
+
+import io
+import zipfile
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ingestion import sanctions_mirror as sync
+from services.sanctions_mirror import SanctionsMirror
+from services.sanctions_service import SanctionsService
+
+CNPJ = "12345678000190"
+
+_CEIS_HEADER = (
+    '"CADASTRO";"CÓDIGO DA SANÇÃO";"TIPO DE PESSOA";"CPF OU CNPJ DO SANCIONADO";'
+    '"NOME DO SANCIONADO";"RAZÃO SOCIAL - CADASTRO RECEITA";"CATEGORIA DA SANÇÃO";'
+    '"DATA INÍCIO SANÇÃO";"DATA FINAL SANÇÃO";"ÓRGÃO SANCIONADOR";"FUNDAMENTAÇÃO LEGAL"'
+)
+
+
+def _zip(csv_text: str, encoding: str = "latin-1") -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr("20261019_CEIS.csv", csv_text.encode(encoding))
+    return buf.getvalue()
+
+
+def _ceis_payload() -> bytes:
+    return _zip("\n".join([
+        _CEIS_HEADER,
+        '"CEIS";"1001";"J";"12.345.678/0001-90";"ACME";"ACME LTDA";"Impedimento";"01/01/2026";"31/12/2027";"Prefeitura X";"Lei 14.133/2021"',
+        '"CEIS";"1002";"F";"123.456.789-00";"Fulano";"";"Inidoneidade";"01/01/2026";"";"TCU";"Lei 8.443/1992"',
+        '"CEIS";"1003";"J";"98765432000199";"Beta";"";"Suspensão";"01/02/2026";"";"Estado Y";""',
+    ]))
+
+
+def _row(record_id: str, cnpj: str = CNPJ, source: str = "CEIS", end_date: str | None = None, **extra) -> dict:
+    return {"source": source, "record_id": record_id, "cnpj": cnpj, "company_name": "ACME LTDA",
+            "sanction_type": "Impedimento", "start_date": "2026-01-01", "end_date": end_date,
+            "sanctioning_body": "Prefeitura X", "legal_basis": "", "fine_amount": None, **extra}
+
+
+def _fresh_mirror(
+    rows: list[dict], age: timedelta = timedelta(hours=1), dataset_age_days: int = 1,
+) -> SanctionsMirror:
+    mirror = SanctionsMirror(max_age_hours=36, reload_s=300, max_dataset_age_days=2)
+    synced_at = datetime.now(timezone.utc) - age
+    dataset_date = synced_at.date() - timedelta(days=dataset_age_days)
+    mirror.load(rows, {"CEIS": synced_at, "CNEP": synced_at}, {"CEIS": dataset_date, "CNEP": dataset_date})
+    mirror._checked_at = float("inf")  # no state re-check in these tests
+    return mirror
+
+
+class TestParseDataset:
+    def test_legal_entities_keyed_by_sanction_code(self):
+        records = sync.parse_dataset("CEIS", _ceis_payload())
+
+        assert set(records) == {"1001", "1003"}  # CPF row dropped
+        acme = records["1001"]
+        assert acme["cnpj"] == CNPJ and acme["company_name"] == "ACME LTDA"
+        assert acme["start_date"] == "2026-01-01" and acme["end_date"] == "2027-12-31"
+        assert records["1003"]["company_name"] == "Beta"  # falls back to NOME DO SANCIONADO
+        assert records["1003"]["end_date"] is None
+
+    def test_cnep_fine_amount(self):
+        payload = _zip(
+            '"CÓDIGO DA SANÇÃO";"CPF OU CNPJ DO SANCIONADO";"VALOR DA MULTA"\n'
+            f'"7";"{CNPJ}";"1.234.567,89"',
+            encoding="utf-8",
+        )
+        assert sync.parse_dataset("CNEP", payload)["7"]["fine_amount"] == "1234567.89"
+
+    def test_missing_cnpj_column_raises(self):
+        with pytest.raises(ValueError):
+            sync.parse_dataset("CEIS", _zip('"NOME";"CATEGORIA"\n"x";"y"'))
+
+
+class TestSyncDiff:
+    @pytest.mark.asyncio
+    async def test_only_changed_rows_written(self):
+        records = sync.parse_dataset("CEIS", _ceis_payload())
+        existing = {"1001": records["1001"]["record_hash"], "1003": "stale-hash", "0999": "gone"}
+        upsert, delete, state = MagicMock(return_value=2), MagicMock(return_value=1), MagicMock()
+
+        with patch.object(sync, "_download_latest", AsyncMock(return_value=(date(2026, 10, 19), _ceis_payload()))), \
+             patch.object(sync, "_existing_hashes", return_value=existing), \
+             patch.object(sync, "_upsert_rows", upsert), \
+             patch.object(sync, "_delete_rows", delete), \
+             patch.object(sync, "_write_state", state):
+            result = await sync._sync_source(MagicMock(), "CEIS")
+
+        assert [r["record_id"] for r in upsert.call_args.args[0]] == ["1003"]
+        assert delete.call_args.args == ("CEIS", ["0999"])
+        assert result["status"] == "completed" and result["records"] == 2
+        assert state.call_args.args[:3] == ("CEIS", date(2026, 10, 19), 2)
+
+    @pytest.mark.asyncio
+    async def test_mass_delete_rejected(self):
+        existing = {str(i): "h" for i in range(10)}
+        state = MagicMock()
+        with patch.object(sync, "_download_latest", AsyncMock(return_value=(date(2026, 10, 19), _ceis_payload()))), \
+             patch.object(sync, "_existing_hashes", return_value=existing), \
+             patch.object(sync, "_upsert_rows") as upsert, \
+             patch.object(sync, "_write_state", state):
+            result = await sync._sync_source(MagicMock(), "CEIS")
+
+        assert result["status"] == "rejected"
+        upsert.assert_not_called()
+        state.assert_not_called()
+
+
+class TestMirrorIndex:
+    def test_lookup_by_any_cnpj_format(self):
+        mirror = _fresh_mirror([
+            _row("1"),
+            _row("2", source="CNEP", end_date="2026-03-01", fine_amount="1500.00"),
+        ])
+
+        result = mirror.lookup("12.345.678/0001-90", today=date(2026, 6, 1))
+        assert result.from_mirror and result.is_sanctioned
+        assert (result.ceis_count, result.cnep_count) == (1, 1)
+        cnep = next(s for s in result.sanctions if s.source == "CNEP")
+        assert cnep.fine_amount == Decimal("1500.00") and not cnep.is_active
+
+        assert not mirror.lookup("11111111000111").is_sanctioned
+
+    def test_expired_between_syncs_not_active(self):
+        mirror = _fresh_mirror([_row("1", end_date="2026-05-01")])
+        assert mirror.lookup(CNPJ, today=date(2026, 4, 30)).is_sanctioned
+        assert not mirror.lookup(CNPJ, today=date(2026, 5, 1)).is_sanctioned
+
+    def test_freshness(self):
+        assert _fresh_mirror([]).is_fresh()
+        assert not _fresh_mirror([], age=timedelta(hours=40)).is_fresh()
+        assert not SanctionsMirror(max_age_hours=36, reload_s=300).is_fresh()
+
+    def test_recent_resync_of_old_dataset_is_stale(self):
+        # Synced an hour ago, but today's file was not out: a 5-day-old dataset
+        assert not _fresh_mirror([], dataset_age_days=5).is_fresh()
+
+    @pytest.mark.asyncio
+    async def test_reloads_rows_only_on_newer_sync(self):
+        mirror = SanctionsMirror(max_age_hours=36, reload_s=0)
+        synced = {"CEIS": datetime.now(timezone.utc), "CNEP": datetime.now(timezone.utc)}
+        dataset_dates = {"CEIS": date.today(), "CNEP": date.today()}
+        with patch("services.sanctions_mirror._read_state", return_value=(synced, dataset_dates)), \
+             patch("services.sanctions_mirror._read_rows", return_value=[_row("1")]) as read_rows:
+            await mirror.refresh()
+            await mirror.refresh()
+
+        assert read_rows.call_count == 1
+        assert mirror.is_fresh() and mirror.lookup(CNPJ).is_sanctioned
+
+
+class TestServiceUsesMirror:
+    @pytest.mark.asyncio
+    async def test_fresh_mirror_skips_api(self):
+        service = SanctionsService(api_key="k", mirror=_fresh_mirror([_row("1")]))
+        service._checker.check_sanctions = AsyncMock()
+
+        report = await service.check_company(CNPJ)
+
+        assert report.status == "sanctioned" and report.company_name == "ACME LTDA"
+        service._checker.check_sanctions.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_mirror_falls_back_to_api(self):
+        service = SanctionsService(api_key="k", mirror=_fresh_mirror([_row("1")], age=timedelta(days=3)))
+        service._checker.check_sanctions = AsyncMock(side_effect=Exception("api down"))
+
+        report = await service.check_company(CNPJ)
+
+        service._checker.check_sanctions.assert_awaited_once()
+        assert report.status == "unavailable"
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        service = SanctionsService(api_key="k")
+        with patch("ingestion.config.SANCTIONS_MIRROR_ENABLED", False):
+            assert await service._check_mirror(CNPJ) is None
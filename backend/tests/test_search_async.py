@@ -57,6 +57,7 @@ def mock_busca_response():
         "total_raw": 100,
         "licitacoes": [],
     }
+    resp.model_dump_json.return_value = '{"total_filtrado":42,"total_raw":100,"licitacoes":[]}'
     return resp
 
 
@@ -174,8 +175,9 @@ class TestT2WorkerProcesses:
 
             assert result["status"] == "completed"
             assert result["total_results"] == 42
+            # Encoded once — the same JSON text is reused for Redis/Supabase
             mock_persist.assert_called_once_with(
-                "test-search-002", "search_result", mock_busca_response.model_dump()
+                "test-search-002", "search_result", mock_busca_response.model_dump_json()
             )
 
 
@@ -13,16 +13,6 @@ Run from backend/:
     python -m pytest tests/test_search_pipeline.py -v
 """
 
-import sys
-from unittest.mock import MagicMock as _MagicMock
-
-# Pre-mock heavy third-party modules that are imported at module level in the
-# search_pipeline import chain but are NOT needed for unit-testing stages 1-2.
-# This avoids requiring openai, stripe, etc. to be installed in the test env.
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = _MagicMock()
-
 import pytest
 from datetime import datetime, timezone
 from types import SimpleNamespace
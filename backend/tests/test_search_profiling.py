@@ -0,0 +1,143 @@
+"""Tests for opt-in search profiling (pipeline/profiling.py).
+
+Covers:
+  - phase_clock: shared no-op without a profile, laps recorded with one
+  - record_phases: filter phases collected outside a search (benchmarks)
+  - traced_stage: CPU / loop lag / allocation recorded and set on the span
+  - requested profiles dropped for non-admin users after pipeline.validate
+  - sampling via SEARCH_PROFILE_SAMPLE_RATE
+  - store / get round trip (in-memory fallback) and the admin trace section
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pipeline import profiling
+from pipeline.profiling import (
+    SearchProfile,
+    finish_profile,
+    get_search_profile,
+    phase_clock,
+    record_phases,
+    start_profile,
+)
+from pipeline.tracing import traced_stage
+from search_context import SearchContext
+
+
+def _ctx(profile: bool = False, search_id: str = "sid-prof", is_admin: bool = True) -> SearchContext:
+    request = SimpleNamespace(profile=profile, search_id=search_id)
+    ctx = SearchContext(request=request, user={"id": "u1"})
+    ctx.is_admin = is_admin
+    return ctx
+
+
+@pytest.fixture(autouse=True)
+def _no_redis():
+    profiling._memory_store.clear()
+    with patch("redis_pool.get_redis_pool", new_callable=AsyncMock, return_value=None):
+        yield
+    profiling._memory_store.clear()
+
+
+class TestPhaseClock:
+    def test_noop_without_profile(self):
+        assert phase_clock() is phase_clock()
+        phase_clock().lap("keywords")  # must not raise
+
+    def test_laps_recorded_for_current_profile(self):
+        ctx = _ctx(profile=True)
+        profile = start_profile(ctx)
+        try:
+            clock = phase_clock()
+            clock.lap("uf_status")
+            clock.lap("keywords")
+            assert [name for name, _, _ in profile.pending_phases] == ["uf_status", "keywords"]
+        finally:
+            profiling._current_profile.set(None)
+            profiling._tracemalloc_release()
+
+    def test_record_phases_outside_search(self):
+        from filter import aplicar_todos_filtros
+
+        bids = [{"uf": "SP", "objetoCompra": "Aquisição de uniformes escolares", "valorTotalEstimado": 50000.0}]
+        with record_phases("vestuario") as profile:  # no setor: no LLM / item inspection
+            aplicar_todos_filtros(bids, ufs_selecionadas={"SP"}, keywords={"uniforme", "uniformes"})
+
+        names = [name for name, _, _ in profile.pending_phases]
+        assert {"keywords", "proximity", "co_occurrence", "density"} <= set(names)
+        assert profile.reason == "benchmark" and profiling.current_profile() is None
+
+
+class TestTracedStage:
+    @pytest.mark.asyncio
+    async def test_stage_measurements_recorded(self):
+        ctx = _ctx(profile=True)
+        profile = start_profile(ctx)
+        span = MagicMock()
+
+        async def _filter(c):
+            clock = phase_clock()
+            _blob = [bytearray(64 * 1024) for _ in range(16)]
+            clock.lap("keywords")
+            time.sleep(0.12)  # blocks the loop: shows up as lag
+            await asyncio.sleep(0)
+
+        with patch("telemetry.optional_span") as optional_span:
+            optional_span.return_value.__enter__.return_value = span
+            await traced_stage(None, ctx, "pipeline.filter", _filter)
+        await finish_profile(ctx)
+
+        stage = profile.stages["pipeline.filter"]
+        assert stage["wall_ms"] >= 100 and stage["loop_lag_max_ms"] >= 50
+        assert stage["alloc_peak_kb"] >= 1024
+        assert "keywords" in stage["phases"]
+        attrs = {c.args[0] for c in span.set_attribute.call_args_list}
+        assert {"profile.cpu_ms", "profile.loop_lag_max_ms", "profile.phase.keywords_ms"} <= attrs
+
+    @pytest.mark.asyncio
+    async def test_unprofiled_stage_untouched(self):
+        ctx = _ctx()
+        assert start_profile(ctx) is None
+        await traced_stage(None, ctx, "pipeline.filter", AsyncMock())
+        assert ctx.profile is None
+
+    @pytest.mark.asyncio
+    async def test_request_profile_dropped_for_non_admin(self):
+        ctx = _ctx(profile=True, is_admin=False)
+        start_profile(ctx)
+        await traced_stage(None, ctx, "pipeline.validate", AsyncMock())
+
+        assert ctx.profile is None and profiling.current_profile() is None
+        assert await get_search_profile("sid-prof") is None
+
+
+class TestSamplingAndStorage:
+    def test_sampled_profile(self):
+        ctx = _ctx()
+        with patch("config.SEARCH_PROFILE_SAMPLE_RATE", 1.0):
+            profile = start_profile(ctx)
+        assert isinstance(profile, SearchProfile) and profile.reason == "sampled"
+        profiling._current_profile.set(None)
+        profiling._tracemalloc_release()
+
+    @pytest.mark.asyncio
+    async def test_finished_profile_in_admin_trace(self):
+        from routes.admin_trace import get_search_trace
+
+        ctx = _ctx(profile=True, search_id="sid-trace")
+        start_profile(ctx)
+        await traced_stage(None, ctx, "pipeline.prepare", AsyncMock())
+        await finish_profile(ctx)
+
+        with patch("progress.get_tracker", new_callable=AsyncMock, return_value=None), \
+             patch("job_queue.get_job_result", new_callable=AsyncMock, return_value=None):
+            trace = await get_search_trace("sid-trace", user={"id": "admin"})
+
+        assert trace["profile"]["reason"] == "request"
+        assert "pipeline.prepare" in trace["profile"]["stages"]
+        assert trace["profile"]["total_ms"] is not None
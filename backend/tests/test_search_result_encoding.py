@@ -0,0 +1,105 @@
+"""Tests for encode-once search result persistence.
+
+Covers:
+  - encode_search_response: BuscaResponse / bytes / str / dict inputs
+  - Redis and Supabase stores accept the pre-encoded payload
+  - get_stored_results_json: L1 hit defers to the model, L2 text returned as-is
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pipeline.helpers import _convert_to_licitacao_items, encode_search_response
+from schemas import BuscaResponse, ResumoLicitacoes
+
+
+def _response(n: int = 2) -> BuscaResponse:
+    bids = [
+        {
+            "codigoCompra": f"{i:08d}",
+            "objetoCompra": "Aquisição de uniformes — camisetas e calças",
+            "nomeOrgao": "Prefeitura Municipal de São Paulo",
+            "uf": "SP",
+            "valorTotalEstimado": 1500.0 + i,
+            "_source": "pncp",
+            "_value_source": "estimated",
+        }
+        for i in range(n)
+    ]
+    return BuscaResponse(
+        resumo=ResumoLicitacoes(
+            resumo_executivo="Resumo", total_oportunidades=n, valor_total=0.0, destaques=[],
+        ),
+        licitacoes=_convert_to_licitacao_items(bids),
+        excel_available=False, quota_used=1, quota_remaining=9,
+        total_raw=n, total_filtrado=n,
+    )
+
+
+class TestEncodeSearchResponse:
+    def test_model_matches_legacy_dump(self):
+        response = _response()
+        encoded = encode_search_response(response)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == response.model_dump(mode="json")
+        # Stored format keeps field names (not the _source alias)
+        assert json.loads(encoded)["licitacoes"][0]["source"] == "pncp"
+
+    def test_passthrough_and_dict(self):
+        assert encode_search_response(b'{"a":1}') == b'{"a":1}'
+        assert encode_search_response('{"a":1}') == b'{"a":1}'
+        assert json.loads(encode_search_response({"a": 1})) == {"a": 1}
+        assert encode_search_response(object()) is None
+
+
+class TestStoresReuseEncodedPayload:
+    @pytest.mark.asyncio
+    async def test_redis_stores_bytes_unchanged(self):
+        from routes.search_state import _persist_results_to_redis
+
+        redis = AsyncMock()
+        encoded = encode_search_response(_response())
+        with patch("routes.search_state.get_redis_pool", new_callable=AsyncMock, return_value=redis):
+            await _persist_results_to_redis("sid-enc", encoded)
+
+        assert redis.setex.call_args[0][2] is encoded
+
+    @pytest.mark.asyncio
+    async def test_supabase_decodes_once(self):
+        from routes.search_state import _persist_results_to_supabase
+
+        db = MagicMock()
+        encoded = encode_search_response(_response())
+        with patch("supabase_client.get_supabase", return_value=db), \
+             patch("supabase_client.sb_execute", new_callable=AsyncMock):
+            await _persist_results_to_supabase("sid-enc", "uid-1", encoded)
+
+        row = db.table.return_value.upsert.call_args[0][0]
+        assert row["results"] == json.loads(encoded)
+        assert row["search_id"] == "sid-enc"
+        assert row["total_filtered"] == 2
+
+
+class TestStoredResultsJson:
+    @pytest.mark.asyncio
+    async def test_l2_text_returned_as_is(self):
+        from routes.search_state import get_stored_results_json
+
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value='{"total_filtrado":7}')
+        with patch("routes.search_state.get_redis_pool", new_callable=AsyncMock, return_value=redis), \
+             patch("routes.search_state.get_background_results", return_value=None):
+            assert await get_stored_results_json("sid-l2") == '{"total_filtrado":7}'
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_defers_to_model(self):
+        from routes.search_state import get_stored_results_json
+
+        redis = AsyncMock()
+        with patch("routes.search_state.get_redis_pool", new_callable=AsyncMock, return_value=redis), \
+             patch("routes.search_state.get_background_results", return_value=_response()):
+            assert await get_stored_results_json("sid-l1") is None
+        redis.get.assert_not_called()
@@ -113,12 +113,44 @@ async def test_multiple_filtering_events_provide_granularity(mock_redis):
     while not tracker.queue.empty():
         events.append(tracker.queue.get_nowait())
 
-    assert len(events) == 5
+    # Burst is coalesced: first update goes out at once, intermediate ones are
+    # superseded and the final 200/200 is never held back.
+    assert [e.detail["processed"] for e in events] == [40, 200]
     # Progress should be monotonically increasing
     progresses = [e.progress for e in events]
     assert progresses == sorted(progresses)
 
 
+@pytest.mark.asyncio
+async def test_filtering_progress_coalesced_update_flushed_after_window(mock_redis):
+    """Latest pending update is emitted once the coalescing window closes."""
+    tracker = ProgressTracker("test-gran-002", uf_count=5)
+
+    with patch("progress.PROGRESS_COALESCE_WINDOW_MS", 20):
+        await tracker.emit_filtering_progress(processed=10, total=200)
+        await tracker.emit_filtering_progress(processed=20, total=200)
+        await tracker.emit_filtering_progress(processed=30, total=200)
+        assert tracker.queue.qsize() == 1
+        await asyncio.sleep(0.05)
+
+    events = []
+    while not tracker.queue.empty():
+        events.append(tracker.queue.get_nowait())
+    assert [e.detail["processed"] for e in events] == [10, 30]
+
+
+@pytest.mark.asyncio
+async def test_filtering_progress_not_coalesced_when_window_disabled(mock_redis):
+    """PROGRESS_COALESCE_WINDOW_MS=0 emits every update."""
+    tracker = ProgressTracker("test-gran-003", uf_count=5)
+
+    with patch("progress.PROGRESS_COALESCE_WINDOW_MS", 0):
+        for i in range(5):
+            await tracker.emit_filtering_progress(processed=(i + 1) * 40, total=200)
+
+    assert tracker.queue.qsize() == 5
+
+
 @pytest.mark.asyncio
 async def test_llm_classifying_then_filtering_sequence(mock_redis):
     """AC5+AC6: Both event types can be emitted in sequence."""
@@ -197,7 +197,7 @@ class TestMainLoopHeartbeat:
         mock_redis = AsyncMock()
         xread_count = 0
 
-        async def mock_xread(streams, count=None):
+        async def mock_xread(streams, count=None, block=None):
             nonlocal xread_count
             xread_count += 1
             if xread_count == 1:
@@ -17,6 +17,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from httpx import AsyncClient, ASGITransport
 
+from tests.helpers.mock_factories import mock_redis_pipeline
+
 from progress import (
     ProgressEvent,
     ProgressTracker,
@@ -189,54 +191,64 @@ class TestEventsHaveIdField:
 
 @pytest.mark.asyncio
 class TestEventsStoredInRedisList:
-    """AC2: Verify _store_replay_event calls RPUSH/LTRIM/EXPIRE on correct key."""
+    """AC2: Verify replay writes queue RPUSH/LTRIM/EXPIRE on the correct key."""
 
     async def test_store_replay_event_redis_operations(self):
-        """AC2: _store_replay_event performs RPUSH + LTRIM + EXPIRE."""
+        """AC2: replay write performs RPUSH + LTRIM + EXPIRE in one pipeline."""
         mock_redis = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis), \
              patch("progress.is_redis_available", new_callable=AsyncMock, return_value=False):
             tracker = ProgressTracker("redis-store-test", uf_count=1, use_redis=False)
+            event = ProgressEvent(stage="fetching", progress=30, message="test")
             event_dict = {"stage": "fetching", "progress": 30, "message": "test"}
 
-            await tracker._store_replay_event(1, event_dict)
+            await tracker._write_to_redis(event, 1, event_dict)
 
         # Check RPUSH was called with correct key and serialized data
         expected_key = f"{_REPLAY_KEY_PREFIX}redis-store-test"
-        mock_redis.rpush.assert_called_once()
-        call_args = mock_redis.rpush.call_args
+        pipe.rpush.assert_called_once()
+        call_args = pipe.rpush.call_args
         assert call_args[0][0] == expected_key
         entry = json.loads(call_args[0][1])
         assert entry["id"] == 1
         assert entry["data"] == event_dict
 
         # Check LTRIM (ring buffer trim)
-        mock_redis.ltrim.assert_called_once_with(expected_key, -_REPLAY_MAX_EVENTS, -1)
+        pipe.ltrim.assert_called_once_with(expected_key, -_REPLAY_MAX_EVENTS, -1)
 
         # Check EXPIRE (10 min TTL)
-        mock_redis.expire.assert_called_once_with(expected_key, _REPLAY_LIST_TTL)
+        pipe.expire.assert_called_once_with(expected_key, _REPLAY_LIST_TTL)
+
+        # Single round-trip, no stream write when use_redis=False
+        pipe.execute.assert_awaited_once()
+        pipe.xadd.assert_not_called()
 
     async def test_store_replay_event_no_redis(self):
-        """AC2: _store_replay_event silently skips when Redis is unavailable."""
+        """AC2: replay write silently skips when Redis is unavailable."""
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=None):
             tracker = ProgressTracker("no-redis-test", uf_count=1, use_redis=False)
+            event = ProgressEvent(stage="fetching", progress=0, message="")
             # Should not raise
-            await tracker._store_replay_event(1, {"stage": "fetching"})
+            await tracker._write_to_redis(event, 1, {"stage": "fetching"})
 
     async def test_store_replay_event_redis_failure(self):
-        """AC2: _store_replay_event logs warning on Redis failure, does not raise."""
+        """AC2: replay write logs warning on Redis failure, does not raise."""
         mock_redis = AsyncMock()
-        mock_redis.rpush.side_effect = ConnectionError("Redis down")
+        pipe = mock_redis_pipeline(mock_redis)
+        pipe.execute.side_effect = ConnectionError("Redis down")
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("fail-test", uf_count=1, use_redis=False)
+            event = ProgressEvent(stage="error", progress=-1, message="")
             # Should not raise
-            await tracker._store_replay_event(1, {"stage": "error"})
+            await tracker._write_to_redis(event, 1, {"stage": "error"})
 
     async def test_emit_stores_in_history_and_redis(self):
         """AC2: _emit_event stores event in both local history and Redis list."""
         mock_redis = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis), \
              patch("progress.is_redis_available", new_callable=AsyncMock, return_value=False):
@@ -248,7 +260,7 @@ class TestEventsStoredInRedisList:
         assert tracker._event_history[0][0] == 1  # id=1
 
         # Redis RPUSH was called
-        assert mock_redis.rpush.call_count == 1
+        assert pipe.rpush.call_count == 1
 
     async def test_replay_key_format(self):
         """AC2: Redis list key follows format 'sse_events:{search_id}'."""
@@ -530,12 +542,13 @@ class TestRingBufferMax1000:
     async def test_redis_ltrim_called_for_ring_buffer(self):
         """AC5: LTRIM enforces ring buffer in Redis list too."""
         mock_redis = AsyncMock()
+        pipe = mock_redis_pipeline(mock_redis)
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis):
             tracker = ProgressTracker("ltrim-test", uf_count=1, use_redis=False)
-            await tracker._store_replay_event(1, {"stage": "fetching"})
+            await tracker.emit("fetching", 10, "Event")
 
-        mock_redis.ltrim.assert_called_once_with(
+        pipe.ltrim.assert_called_once_with(
             f"{_REPLAY_KEY_PREFIX}ltrim-test",
             -_REPLAY_MAX_EVENTS,
             -1,
@@ -1116,3 +1129,57 @@ class TestReplayConstants:
             "shutdown",
         }
         assert set(_TERMINAL_STAGES) == expected
+
+
+# ============================================================================
+# Delta-encoded partial_data: snapshot on reconnect + on-demand full record
+# ============================================================================
+
+
+@pytest.mark.asyncio
+class TestPartialDataReplay:
+    async def test_reconnect_receives_partial_snapshot_without_id(self, mock_auth, mock_sse_limits):
+        from main import app
+
+        tracker = _make_tracker("partial-replay")
+        with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=None), \
+             patch("progress.is_redis_available", new_callable=AsyncMock, return_value=False):
+            await tracker.emit("connecting", 5, "Connecting...")                      # id=1
+            await tracker.emit_partial_data(
+                [{"pncp_id": "a", "objeto": "A"}], batch_index=1, ufs_completed=["SP"],
+            )                                                                          # id=2
+            await tracker.emit_partial_data(
+                [{"pncp_id": "b", "objeto": "B"}], batch_index=2, ufs_completed=["SP"],
+            )                                                                          # id=3
+            await tracker.emit_complete()                                              # id=4
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    "/v1/buscar-progress/partial-replay",
+                    headers={"Last-Event-ID": "3"},
+                )
+
+        events = _parse_sse_events(response.text)
+        snapshot = events[0]
+        assert "id" not in snapshot
+        assert snapshot["data"]["detail"]["snapshot"] is True
+        assert [c["pncp_id"] for c in snapshot["data"]["detail"]["licitacoes"]] == ["a", "b"]
+        assert events[-1]["data"]["stage"] == "complete"
+
+    async def test_item_endpoint_returns_full_record(self, mock_auth):
+        from main import app
+
+        tracker = _make_tracker("partial-item")
+        full = {"codigoCompra": "X/1", "objetoCompra": "Obj", "extra": "full"}
+        with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=None):
+            await tracker.emit_partial_data([full], batch_index=1, ufs_completed=["SP"])
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                found = await client.get("/v1/buscar-progress/partial-item/item", params={"id": "X/1"})
+                missing = await client.get("/v1/buscar-progress/partial-item/item", params={"id": "nope"})
+
+        assert found.status_code == 200
+        assert found.json()["item"] == full
+        assert missing.status_code == 404
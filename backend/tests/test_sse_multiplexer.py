@@ -0,0 +1,253 @@
+"""
+Testes para o multiplexador de streams SSE (sse_multiplexer).
+
+Cobertura:
+- Um único XREAD bloqueante cobre todas as streams inscritas no worker
+- Inscrito tardio recebe o histórico completo sem duplicar para os demais
+- Erro do XREAD compartilhado é propagado (após retentativas com backoff) até
+  a próxima leitura bem-sucedida; falha isolada não degrada os inscritos
+- Nova inscrição acorda o XREAD bloqueante via stream de wake, sem cancelá-lo
+- Reader é cancelado quando o último inscrito sai
+- Rota com SSE_MULTIPLEXER_ENABLED=false mantém o XREAD por conexão
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from sse_multiplexer import StreamMultiplexer
+
+
+def _entry(entry_id, stage="fetching"):
+    return (entry_id, {"stage": stage, "progress": "10", "message": stage, "detail_json": "{}"})
+
+
+class FakeStreamRedis:
+    """XREAD over in-memory streams; blocks (briefly) until an XADD when nothing is new."""
+
+    def __init__(self, streams=None, honor_block=False):
+        self.streams = streams or {}
+        self.calls = []
+        self.error = None
+        self.errors = []  # one-shot errors, raised before self.error
+        self.honor_block = honor_block
+        self.cancelled_reads = 0
+        self._added = asyncio.Event()
+
+    def _fresh(self, streams, count):
+        result = []
+        for key, last_id in streams.items():
+            cursor = tuple(int(p) for p in f"{last_id}-0".split("-")[:2])
+            fresh = [
+                e for e in self.streams.get(key, [])
+                if tuple(int(p) for p in e[0].split("-")) > cursor
+            ]
+            if fresh:
+                result.append([key, fresh[:count]])
+        return result
+
+    async def xread(self, streams, count=None, block=None):
+        self.calls.append((dict(streams), count, block))
+        if self.errors:
+            raise self.errors.pop(0)
+        if self.error:
+            raise self.error
+        result = self._fresh(streams, count)
+        if not result:
+            self._added.clear()
+            try:
+                await asyncio.wait_for(
+                    self._added.wait(), block / 1000 if self.honor_block and block else 0.01,
+                )
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                self.cancelled_reads += 1
+                raise
+            result = self._fresh(streams, count)
+        return result
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        entries = self.streams.setdefault(key, [])
+        last = int(entries[-1][0].split("-")[0]) if entries else 0
+        entries.append((f"{last + 1}-0", fields))
+        if maxlen:
+            del entries[:-maxlen]
+        self._added.set()
+
+    def pipeline(self):
+        pipe = MagicMock()
+        ops = []
+        pipe.xadd = lambda *a, **k: ops.append(lambda: self.xadd(*a, **k))
+        pipe.expire = lambda *a, **k: None
+
+        async def execute():
+            for op in ops:
+                op()
+
+        pipe.execute = execute
+        return pipe
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff():
+    with patch("sse_multiplexer._MUX_ERROR_BACKOFF_S", 0.001):
+        yield
+
+
+class TestStreamMultiplexer:
+    @pytest.mark.asyncio
+    async def test_single_blocking_read_covers_all_streams(self):
+        redis = FakeStreamRedis({"s:a": [_entry("1-0")], "s:b": [_entry("2-0")]})
+        mux = StreamMultiplexer(block_ms=50)
+        sub_a = mux.subscribe(redis, "s:a")
+        sub_b = mux.subscribe(redis, "s:b")
+        try:
+            got_a = await sub_a.read(timeout=1)
+            got_b = await sub_b.read(timeout=1)
+        finally:
+            mux.unsubscribe(sub_a)
+            mux.unsubscribe(sub_b)
+
+        assert got_a == [("s:a", [_entry("1-0")])]
+        assert got_b == [("s:b", [_entry("2-0")])]
+        streams, count, block = redis.calls[-1]
+        assert set(streams) == {"s:a", "s:b", mux._wake_key}
+        assert block == 50 and count == 100
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_history_without_duplicates(self):
+        redis = FakeStreamRedis({"s:a": [_entry("1-0"), _entry("2-0")]})
+        mux = StreamMultiplexer(block_ms=50)
+        first = mux.subscribe(redis, "s:a")
+        try:
+            assert len((await first.read(timeout=1))[0][1]) == 2
+            late = mux.subscribe(redis, "s:a")
+            redis.streams["s:a"].append(_entry("3-0", "complete"))
+
+            late_entries = (await late.read(timeout=1))[0][1]
+            while late_entries[-1][0] != "3-0":
+                late_entries += (await late.read(timeout=1))[0][1]
+            first_entries = (await first.read(timeout=1))[0][1]
+        finally:
+            mux.unsubscribe(first)
+            mux.unsubscribe(late)
+
+        assert [e[0] for e in late_entries] == ["1-0", "2-0", "3-0"]
+        assert [e[0] for e in first_entries] == ["3-0"]
+
+    @pytest.mark.asyncio
+    async def test_read_raises_while_shared_xread_fails(self):
+        redis = FakeStreamRedis()
+        redis.error = ConnectionError("down")
+        mux = StreamMultiplexer(block_ms=20)
+        sub = mux.subscribe(redis, "s:a")
+        try:
+            with pytest.raises(ConnectionError):
+                await sub.read(timeout=1)
+            # Still failing: the next read raises straight away
+            with pytest.raises(ConnectionError):
+                await sub.read(timeout=0.01)
+
+            redis.error = None
+            redis.streams["s:a"] = [_entry("1-0")]
+            result = []
+            for _ in range(200):
+                try:
+                    result = await sub.read(timeout=0.05)
+                except ConnectionError:
+                    await asyncio.sleep(0.01)
+                    continue
+                if result:
+                    break
+        finally:
+            mux.unsubscribe(sub)
+
+        assert result == [("s:a", [_entry("1-0")])]
+
+    @pytest.mark.asyncio
+    async def test_transient_xread_failure_is_retried_not_broadcast(self):
+        redis = FakeStreamRedis({"s:a": [_entry("1-0")]})
+        redis.errors = [TimeoutError("blip")]
+        mux = StreamMultiplexer(block_ms=20)
+        sub = mux.subscribe(redis, "s:a")
+        try:
+            result = await sub.read(timeout=1)
+        finally:
+            mux.unsubscribe(sub)
+
+        assert result == [("s:a", [_entry("1-0")])]
+        assert len(redis.calls) >= 2
+
+    @pytest.mark.asyncio
+    async def test_new_subscription_wakes_blocking_read_without_cancelling(self):
+        redis = FakeStreamRedis(honor_block=True)
+        mux = StreamMultiplexer(block_ms=5000)
+        idle = mux.subscribe(redis, "s:a")
+        await asyncio.sleep(0.02)  # reader now blocked on s:a only
+        redis.streams["s:b"] = [_entry("1-0")]
+        started = asyncio.get_running_loop().time()
+        sub = mux.subscribe(redis, "s:b")
+        try:
+            result = await sub.read(timeout=2)
+        finally:
+            mux.unsubscribe(idle)
+            mux.unsubscribe(sub)
+
+        assert result == [("s:b", [_entry("1-0")])]
+        assert asyncio.get_running_loop().time() - started < 1
+        assert redis.cancelled_reads == 0
+        assert len(redis.streams[mux._wake_key]) == 1
+
+    @pytest.mark.asyncio
+    async def test_last_unsubscribe_stops_reader(self):
+        redis = FakeStreamRedis()
+        mux = StreamMultiplexer(block_ms=20)
+        sub = mux.subscribe(redis, "s:a")
+        task = mux._task
+        await asyncio.sleep(0.05)
+        mux.unsubscribe(sub)
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert task.cancelled() or task.done()
+        assert mux.subscriber_count == 0 and mux._task is None
+
+
+class TestRoutePolledFallback:
+    @pytest.mark.asyncio
+    async def test_flag_off_uses_per_connection_xread(self):
+        stream_key = "smartlic:progress:mux-off:stream"
+        mock_redis = AsyncMock()
+        mock_redis.xread = AsyncMock(return_value=[[stream_key, [_entry("1-0", "complete")]]])
+
+        mock_tracker = MagicMock()
+        mock_tracker._use_redis = True
+        mock_tracker.queue = asyncio.Queue()
+
+        from main import app
+        from auth import require_auth
+        app.dependency_overrides[require_auth] = lambda: {"id": "test-user", "email": "t@t.com"}
+
+        try:
+            with patch("routes.search_sse.get_feature_flag", return_value=False), \
+                 patch("routes.search_sse.get_stream_multiplexer") as get_mux, \
+                 patch("routes.search_sse.get_tracker", new_callable=AsyncMock, return_value=mock_tracker), \
+                 patch("routes.search_sse.get_sse_redis_pool", new_callable=AsyncMock, return_value=mock_redis), \
+                 patch("routes.search_sse.acquire_sse_connection", new_callable=AsyncMock, return_value=True), \
+                 patch("routes.search_sse.release_sse_connection", new_callable=AsyncMock):
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.get("/v1/buscar-progress/mux-off")
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+
+        events = [
+            json.loads(line[len("data: "):]) for line in response.text.split("\n")
+            if line.startswith("data: ")
+        ]
+        assert events[-1]["stage"] == "complete"
+        get_mux.assert_not_called()
+        mock_redis.xread.assert_awaited_once_with({stream_key: "0"}, count=100)
@@ -0,0 +1,82 @@
+"""Tests for API worker cold-start cost (lazy SDK imports + startup diagnostics).
+
+Covers:
+  - utils.lazy_import: deferred import, attribute forwarding, patch compatibility
+  - startup.diagnostics.parse_importtime
+  - create_app() in a fresh interpreter: no deferred SDK imported, within budget
+    (STARTUP_COLD_START_BUDGET_S overrides the default for slow CI runners)
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from startup.diagnostics import DEFERRED_MODULES, measure_cold_start, parse_importtime
+from utils.lazy_import import lazy_attr, lazy_module
+
+COLD_START_BUDGET_S = float(os.getenv("STARTUP_COLD_START_BUDGET_S", "12"))
+
+
+class TestLazyImport:
+    def test_module_not_imported_until_first_attribute(self):
+        sys.modules.pop("colorsys", None)
+        proxy = lazy_module("colorsys")
+        assert "colorsys" not in sys.modules
+
+        assert proxy.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1.0)
+        assert "colorsys" in sys.modules
+
+    def test_attribute_writes_reach_real_module(self):
+        import json as real_json
+        proxy = lazy_module("json")
+        with patch.object(proxy, "dumps", return_value="patched"):
+            assert real_json.dumps({}) == "patched"
+        assert real_json.dumps({}) == "{}"
+
+    def test_lazy_attr_calls_and_forwards_attributes(self):
+        ordered = lazy_attr("collections", "OrderedDict")
+        assert ordered(a=1) == {"a": 1}
+        assert ordered.fromkeys(["x"]) == {"x": None}
+
+    def test_module_level_proxy_can_be_patched(self):
+        import llm
+        fake = MagicMock()
+        with patch("llm.OpenAI", fake):
+            assert llm.OpenAI is fake
+        assert repr(llm.OpenAI) == "<lazy openai.OpenAI>"
+
+
+class TestParseImporttime:
+    def test_parses_rows_and_skips_header(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      2500 |      40000 | stripe\n"
+            "unrelated warning line\n"
+        )
+        rows = parse_importtime(stderr)
+        assert [(r.module, r.self_us, r.cumulative_us) for r in rows] == [
+            ("_io", 120, 120),
+            ("stripe", 2500, 40000),
+        ]
+
+
+@pytest.mark.timeout(120)
+class TestColdStart:
+    @pytest.fixture(scope="class")
+    def cold_start(self):
+        return measure_cold_start()
+
+    def test_deferred_sdks_not_imported_at_boot(self, cold_start):
+        assert cold_start["deferred_loaded"] == [], (
+            f"{cold_start['deferred_loaded']} imported by create_app(); "
+            f"use utils.lazy_import for {', '.join(DEFERRED_MODULES)}"
+        )
+
+    def test_within_cold_start_budget(self, cold_start):
+        assert cold_start["total_s"] < COLD_START_BUDGET_S, (
+            f"cold start {cold_start['total_s']}s exceeds {COLD_START_BUDGET_S}s — "
+            "run `python -m startup.diagnostics` to see the heaviest imports"
+        )
@@ -0,0 +1,70 @@
+"""Tests for the pre-fork warm-up of sector/keyword data (startup/warmup.py).
+
+Covers:
+  - keyword_patterns: shared cache, accent-insensitive patterns, size cap
+  - prepare_for_fork in a fresh interpreter: no fork-unsafe imports, heap frozen
+  - gunicorn_conf.on_starting: GUNICORN_PREFORK_WARMUP switch
+"""
+
+import json
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import filter.keywords as kw
+from filter.keywords import keyword_patterns
+from startup.diagnostics import BACKEND_DIR
+
+
+class TestKeywordPatterns:
+    def test_patterns_are_cached_and_shared(self):
+        first = keyword_patterns({"jaleco cirúrgico"})
+        second = keyword_patterns({"jaleco cirúrgico", "avental"})
+
+        assert first["jaleco cirúrgico"] is second["jaleco cirúrgico"]
+        assert second["jaleco cirúrgico"].search("aquisicao de jaleco cirurgico descartavel")
+        assert not second["avental"].search("aventais")
+
+    def test_cache_is_capped(self):
+        with patch.object(kw, "_KEYWORD_PATTERNS", {}) as cache, \
+             patch.object(kw, "_KEYWORD_PATTERNS_MAX", 1):
+            patterns = keyword_patterns({"alpha", "beta"})
+
+        assert set(patterns) == {"alpha", "beta"}
+        assert len(cache) == 1
+
+
+class TestPrepareForFork:
+    def test_fresh_master_loads_no_fork_unsafe_modules(self):
+        snippet = (
+            "import json\n"
+            "from startup.warmup import prepare_for_fork\n"
+            "stats = prepare_for_fork()\n"
+            "print(json.dumps(stats))\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", snippet],
+            capture_output=True, text=True, cwd=BACKEND_DIR, timeout=60,
+        )
+        assert proc.returncode == 0, proc.stderr[-2000:]
+        stats = json.loads(proc.stdout.strip().splitlines()[-1])
+
+        assert stats["fork_unsafe_loaded"] == []
+        assert stats["sectors"] > 0
+        assert stats["keyword_patterns"] > 0
+        assert stats["frozen_objects"] > 0
+
+
+class TestGunicornOnStarting:
+    def test_disabled_by_env(self):
+        import gunicorn_conf
+        with patch.object(gunicorn_conf, "_prefork_warmup", False), \
+             patch("startup.warmup.prepare_for_fork") as prepare:
+            gunicorn_conf.on_starting(MagicMock())
+        prepare.assert_not_called()
+
+    def test_failure_does_not_block_arbiter(self):
+        import gunicorn_conf
+        with patch.object(gunicorn_conf, "_prefork_warmup", True), \
+             patch("startup.warmup.prepare_for_fork", side_effect=RuntimeError("yaml")):
+            gunicorn_conf.on_starting(MagicMock())
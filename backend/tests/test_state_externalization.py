@@ -21,12 +21,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Pre-mock heavy deps to avoid import-time errors
-import sys
-if "openai" not in sys.modules:
-    sys.modules["openai"] = MagicMock()
-if "stripe" not in sys.modules:
-    sys.modules["stripe"] = MagicMock()
+from tests.helpers.mock_factories import mock_redis_pipeline
 
 
 # ============================================================================
@@ -342,6 +337,7 @@ class TestProgressTrackerCrossWorker:
     @pytest.mark.asyncio
     async def test_tracker_events_published_to_redis_stream(self, mock_redis_async):
         """AC1: Events published to Redis Streams for cross-worker SSE."""
+        pipe = mock_redis_pipeline(mock_redis_async)
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis_async):
             from progress import ProgressTracker
 
@@ -349,8 +345,8 @@ class TestProgressTrackerCrossWorker:
             await tracker.emit("fetching", 30, "Buscando dados: 1/2 estados")
 
             # Event published to stream
-            mock_redis_async.xadd.assert_called_once()
-            call_args = mock_redis_async.xadd.call_args
+            pipe.xadd.assert_called_once()
+            call_args = pipe.xadd.call_args
             assert call_args[0][0] == "smartlic:progress:stream-001:stream"
             fields = call_args[0][1]
             assert fields["stage"] == "fetching"
@@ -359,6 +355,7 @@ class TestProgressTrackerCrossWorker:
     @pytest.mark.asyncio
     async def test_tracker_stream_expire_on_terminal(self, mock_redis_async):
         """AC8: Terminal events set EXPIRE on stream key."""
+        pipe = mock_redis_pipeline(mock_redis_async)
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis_async):
             from progress import ProgressTracker
 
@@ -368,7 +365,7 @@ class TestProgressTrackerCrossWorker:
             # EXPIRE called for stream key after terminal event
             # STORY-297: Also sets EXPIRE on replay list, so filter for stream key
             stream_expire_calls = [
-                c for c in mock_redis_async.expire.call_args_list
+                c for c in pipe.expire.call_args_list
                 if c[0][0] == "smartlic:progress:expire-001:stream"
             ]
             assert len(stream_expire_calls) == 1
@@ -377,7 +374,8 @@ class TestProgressTrackerCrossWorker:
     @pytest.mark.asyncio
     async def test_tracker_redis_error_increments_metric(self, mock_redis_async):
         """AC7: STATE_STORE_ERRORS incremented on tracker Redis failure."""
-        mock_redis_async.xadd = AsyncMock(side_effect=Exception("Redis stream error"))
+        pipe = mock_redis_pipeline(mock_redis_async)
+        pipe.execute = AsyncMock(side_effect=Exception("Redis stream error"))
 
         with patch("progress.get_redis_pool", new_callable=AsyncMock, return_value=mock_redis_async), \
              patch("metrics.STATE_STORE_ERRORS") as mock_metric:
@@ -22,12 +22,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-import sys
-if "openai" not in sys.modules:
-    sys.modules["openai"] = MagicMock()
-if "stripe" not in sys.modules:
-    sys.modules["stripe"] = MagicMock()
-
 
 # ============================================================================
 # Helpers
@@ -13,6 +13,7 @@ These tests run standalone (do not depend on the rest of the app) by patching
 """
 from __future__ import annotations
 
+import sys
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -54,6 +55,18 @@ def _patched_stripe(create_side_effect):
     return fake
 
 
+@pytest.fixture(autouse=True)
+def _restore_stripe_modules():
+    """Undo the fake stripe install so later tests import the real SDK."""
+    saved = {name: sys.modules.get(name) for name in ("stripe", "stripe.error")}
+    yield
+    for name, module in saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
 @pytest.fixture
 def fake_db():
     """Build an async-chained Supabase-like db mock."""
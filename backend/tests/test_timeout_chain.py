@@ -9,17 +9,11 @@ Validates:
 - Chain invariant: FE(480) > Pipeline(360) > Consolidation(300) > Per-Source(180) > Per-UF(90)
 """
 
-import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Pre-mock heavy third-party modules before importing pipeline
-for _mod_name in ("openai",):
-    if _mod_name not in sys.modules:
-        sys.modules[_mod_name] = MagicMock()
-
 
 # ---------------------------------------------------------------------------
 # Test 1 — Timeout Chain Invariant (AC20)
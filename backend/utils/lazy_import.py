@@ -0,0 +1,87 @@
+"""Deferred imports for heavy SDKs that only a few endpoints use.
+
+Every Gunicorn worker imports all routers before it can serve. Stripe,
+the OpenAI SDK, reportlab and the Google API clients add seconds to that
+cold start, but are only needed on billing, summary, PDF and Sheets calls.
+
+    stripe = lazy_module("stripe")                # instead of: import stripe
+    OpenAI = lazy_attr("openai", "OpenAI")        # instead of: from openai import OpenAI
+
+The real import happens on first attribute access / call. Module-level names
+stay in place, so ``@patch("webhooks.stripe.stripe")`` and
+``@patch("llm.OpenAI")`` keep working. A lazy module binds the module it
+resolved first, like ``import`` does: swapping ``sys.modules[name]`` later
+does not change what the stand-in points to.
+
+Caveats:
+  - lazy_attr stand-ins cannot be used in ``isinstance()`` or ``except``
+    clauses — use ``lazy_module(...).Name`` there (resolved at match time).
+  - Annotations that reference a lazy module (``event: stripe.Event``) are
+    evaluated at import unless the module uses ``from __future__ import annotations``.
+"""
+
+import importlib
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for ``import name``; imports the real module on first use.
+
+    Attribute writes (``stripe.api_key = ...``, ``patch.object``) go to the
+    real module so every importer sees the same state.
+    """
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__.get("_lazy_target")
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+class LazyAttr:
+    """Stand-in for ``from module import name``; resolved on first call or attribute access."""
+
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+
+    def _resolve(self) -> Any:
+        return getattr(importlib.import_module(self._module), self._name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}.{self._name}>"
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """Deferred ``import name``."""
+    return LazyModule(name)
+
+
+def lazy_attr(module: str, name: str) -> Any:
+    """Deferred ``from module import name`` for a callable or class used via attributes."""
+    return LazyAttr(module, name)
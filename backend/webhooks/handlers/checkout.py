@@ -7,11 +7,15 @@ Events:
 - checkout.session.async_payment_failed (Boleto/PIX — STORY-280)
 """
 
-import stripe
+from __future__ import annotations
+
 from datetime import datetime, timezone, timedelta
 
 from log_sanitizer import get_sanitized_logger
 from webhooks.handlers._shared import resolve_user_id, invalidate_user_caches
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = get_sanitized_logger(__name__)
 
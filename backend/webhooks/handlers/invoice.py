@@ -7,11 +7,15 @@ Events:
 - invoice.payment_action_required (3D Secure / SCA — STORY-309 AC10)
 """
 
-import stripe
+from __future__ import annotations
+
 from datetime import datetime, timezone, timedelta
 
 from log_sanitizer import get_sanitized_logger
 from webhooks.handlers._shared import invalidate_user_caches
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = get_sanitized_logger(__name__)
 
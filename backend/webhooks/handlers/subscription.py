@@ -8,10 +8,13 @@ Events:
 - customer.subscription.trial_will_end (STORY-CONV-003a AC4)
 """
 
-import stripe
+from __future__ import annotations
 
 from log_sanitizer import get_sanitized_logger
 from webhooks.handlers._shared import invalidate_user_caches
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = get_sanitized_logger(__name__)
 
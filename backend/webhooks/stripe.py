@@ -24,7 +24,6 @@ import asyncio
 import os
 from datetime import datetime, timezone, timedelta
 
-import stripe
 from fastapi import APIRouter, Request, HTTPException
 
 from supabase_client import get_supabase
@@ -62,6 +61,9 @@ from webhooks.handlers._shared import resolve_user_id as _resolve_user_id  # noq
 from webhooks.handlers.founding import (  # noqa: F401
     mark_founding_lead_abandoned as _handle_founding_checkout_expired_raw,
 )
+from utils.lazy_import import lazy_module
+
+stripe = lazy_module("stripe")
 
 logger = get_sanitized_logger(__name__)
 router = APIRouter()
@@ -149,6 +149,28 @@ describe("CRIT-071: Partial Data Progressive SSE", () => {
     ]);
   });
 
+  test("delta with a changed bid updates the existing card in place", async () => {
+    const params = makeParams();
+    const { result } = renderHook(() => useSearchSSEHandler(params as any));
+
+    await act(async () => {
+      await result.current.handleSseEvent(
+        makePartialDataEvent([{ pncp_id: "bid-1", objeto: "Obra A", valor: 10 }])
+      );
+    });
+    const afterFirst = params.setResult.mock.calls[0][0](null);
+
+    await act(async () => {
+      await result.current.handleSseEvent(
+        makePartialDataEvent([{ pncp_id: "bid-1", objeto: "Obra A", valor: 20 }])
+      );
+    });
+    const afterSecond = params.setResult.mock.calls[1][0](afterFirst);
+
+    expect(afterSecond.licitacoes).toHaveLength(1);
+    expect(afterSecond.licitacoes[0].valor).toBe(20);
+  });
+
   // -------------------------------------------------------------------------
   // 2. Truncated events are skipped
   // -------------------------------------------------------------------------
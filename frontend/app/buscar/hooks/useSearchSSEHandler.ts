@@ -190,15 +190,21 @@ export function useSearchSSEHandler(params: UseSearchSSEHandlerParams) {
         }
       }
     } else if (event.stage === 'partial_data' && !event.detail?.truncated) {
-      // CRIT-071: Progressive partial data — accumulate real bid data from SSE
+      // CRIT-071: Progressive partial data — accumulate real bid data from SSE.
+      // Events are deltas (new or changed bids as compact cards), so upsert by pncp_id.
       const newBids = event.detail?.licitacoes as BuscaResult['licitacoes'] | undefined;
       if (newBids?.length) {
         setResult(prev => {
           const existing = prev?.licitacoes || [];
-          const existingIds = new Set(existing.map(l => l.pncp_id));
-          const unique = newBids.filter((l) => l.pncp_id && !existingIds.has(l.pncp_id));
-          if (unique.length === 0) return prev;
-          const merged = [...existing, ...unique];
+          const incoming = new Map(newBids.filter((l) => l.pncp_id).map((l) => [l.pncp_id, l]));
+          if (incoming.size === 0) return prev;
+          const merged = existing.map((l) => {
+            const update = incoming.get(l.pncp_id);
+            if (!update) return l;
+            incoming.delete(l.pncp_id);
+            return { ...l, ...update };
+          });
+          merged.push(...incoming.values());
           return {
             ...(prev || {} as BuscaResult),
             licitacoes: merged,
@@ -0,0 +1,3 @@
+-- Rollback: drop the grouped new-bid count RPC used by the new-bids notifier
+
+DROP FUNCTION IF EXISTS public.count_new_bids_by_setor_uf(TIMESTAMPTZ, JSONB, TEXT[]);
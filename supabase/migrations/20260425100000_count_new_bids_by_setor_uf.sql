@@ -0,0 +1,62 @@
+-- STORY-445 follow-up: grouped new-bid counts for the daily notifier
+--
+-- jobs/cron/new_bids_notifier.py used to run one count="exact" query on
+-- pncp_raw_bids per active profile. Most users share a handful of
+-- (sector, uf) combinations, so the same scan was repeated thousands of
+-- times per run and grew linearly with signups.
+--
+-- pncp_raw_bids has no sector column: sector membership is the same
+-- full-text match search_datalake uses, i.e. the stored tsv against the
+-- sector keywords tsquery built by datalake_query._build_tsquery().
+-- p_sectors carries one {"setor_id", "tsquery"} object per sector.
+--
+-- count_new_bids_by_setor_uf returns one row per (setor_id, uf) for bids
+-- ingested since p_since; the job sums each user's UFs in memory. Each
+-- sector is matched within the ingested_at window (idx on ingested_at DESC),
+-- so the cost follows the number of new bids, not the table size.
+
+CREATE OR REPLACE FUNCTION public.count_new_bids_by_setor_uf(
+    p_since    TIMESTAMPTZ,
+    p_sectors  JSONB,
+    p_ufs      TEXT[]
+)
+RETURNS TABLE (setor_id TEXT, uf TEXT, bid_count BIGINT)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_sector   JSONB;
+    v_ts_query TSQUERY;
+BEGIN
+    FOR v_sector IN SELECT * FROM jsonb_array_elements(COALESCE(p_sectors, '[]'::JSONB))
+    LOOP
+        CONTINUE WHEN coalesce(trim(v_sector->>'tsquery'), '') = '';
+
+        -- Same parse fallback as search_datalake
+        BEGIN
+            v_ts_query := to_tsquery('public.portuguese_smartlic', v_sector->>'tsquery');
+        EXCEPTION WHEN OTHERS THEN
+            v_ts_query := plainto_tsquery('public.portuguese_smartlic', v_sector->>'tsquery');
+        END;
+
+        RETURN QUERY
+        SELECT (v_sector->>'setor_id')::TEXT, b.uf::TEXT, COUNT(*)::BIGINT
+        FROM public.pncp_raw_bids b
+        WHERE b.ingested_at >= p_since
+          AND b.is_active = true
+          AND b.uf = ANY(p_ufs)
+          AND b.tsv @@ v_ts_query
+        GROUP BY b.uf;
+    END LOOP;
+END;
+$$;
+
+COMMENT ON FUNCTION public.count_new_bids_by_setor_uf(TIMESTAMPTZ, JSONB, TEXT[]) IS
+    'Grouped count of active pncp_raw_bids ingested since p_since matching each '
+    'sector keywords tsquery, one row per (setor_id, uf). Used by the daily '
+    'new-bids notifier (STORY-445).';
+
+REVOKE EXECUTE ON FUNCTION public.count_new_bids_by_setor_uf(TIMESTAMPTZ, JSONB, TEXT[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.count_new_bids_by_setor_uf(TIMESTAMPTZ, JSONB, TEXT[]) TO service_role;
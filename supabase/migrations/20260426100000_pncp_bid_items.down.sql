@@ -0,0 +1,3 @@
+-- Rollback: drop the ingested item lists used by gray-zone item inspection
+
+DROP TABLE IF EXISTS public.pncp_bid_items;
@@ -0,0 +1,40 @@
+-- D-01 follow-up: ingested item lists for gray-zone inspection
+--
+-- item_inspector used to fetch /orgaos/{cnpj}/compras/{ano}/{seq}/itens live
+-- during every search, which added latency and spent MAX_ITEM_INSPECTIONS.
+-- ingestion/items_crawler.py now stores the item lists of newly ingested bids
+-- here after each incremental crawl; the filter reads them in one bulk query
+-- by pncp_id and only fetches live for misses.
+--
+-- Compact by design (Supabase FREE tier): only the five fields the majority
+-- rule reads are kept per item. Rows cascade with pncp_raw_bids purges.
+
+CREATE TABLE IF NOT EXISTS public.pncp_bid_items (
+    pncp_id     TEXT PRIMARY KEY
+                REFERENCES public.pncp_raw_bids (pncp_id) ON DELETE CASCADE,
+    items       JSONB NOT NULL DEFAULT '[]'::jsonb,
+    item_count  INTEGER NOT NULL DEFAULT 0,
+    fetched_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE public.pncp_bid_items IS
+    'PNCP item lists per bid (descricao, codigoNcm, unidadeMedida, quantidade, '
+    'valorUnitario). Written by the ingestion items crawler, read by item_inspector.';
+
+-- Bid data is public by law; same access model as pncp_raw_bids.
+ALTER TABLE public.pncp_bid_items ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "pncp_bid_items_select_authenticated" ON public.pncp_bid_items;
+CREATE POLICY "pncp_bid_items_select_authenticated"
+    ON public.pncp_bid_items
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
+DROP POLICY IF EXISTS "pncp_bid_items_write_service" ON public.pncp_bid_items;
+CREATE POLICY "pncp_bid_items_write_service"
+    ON public.pncp_bid_items
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
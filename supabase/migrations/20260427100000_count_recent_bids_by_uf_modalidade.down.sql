@@ -0,0 +1,3 @@
+-- Rollback: drop the per-(uf, modalidade) volume RPC used by the PNCP fetch planner
+
+DROP FUNCTION IF EXISTS public.count_recent_bids_by_uf_modalidade(TIMESTAMPTZ, TEXT[], INTEGER[]);
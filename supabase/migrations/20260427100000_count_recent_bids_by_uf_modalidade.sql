@@ -0,0 +1,41 @@
+-- PNCP fetch planner: per-(uf, modalidade) publication volume
+--
+-- clients/pncp/fetch_planner.py sizes the live PNCP fetch of each
+-- (UF, modalidade) before it starts: how many pages to allow and how long
+-- to wait. The PNCP API only reveals totalPaginas after page 1, so the
+-- planner uses the datalake's recent history instead.
+--
+-- count_recent_bids_by_uf_modalidade returns one row per (uf, modalidade_id)
+-- with the number of active bids published since p_since; the planner
+-- divides by the window length to get rows/day. Served by
+-- idx_pncp_raw_bids_uf_date (uf, data_publicacao DESC).
+
+CREATE OR REPLACE FUNCTION public.count_recent_bids_by_uf_modalidade(
+    p_since        TIMESTAMPTZ,
+    p_ufs          TEXT[],
+    p_modalidades  INTEGER[]
+)
+RETURNS TABLE (uf TEXT, modalidade_id INTEGER, bid_count BIGINT)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT b.uf::TEXT, b.modalidade_id::INTEGER, COUNT(*)::BIGINT
+    FROM public.pncp_raw_bids b
+    WHERE b.data_publicacao >= p_since
+      AND b.is_active = true
+      AND b.uf = ANY(p_ufs)
+      AND b.modalidade_id = ANY(p_modalidades)
+    GROUP BY b.uf, b.modalidade_id;
+END;
+$$;
+
+COMMENT ON FUNCTION public.count_recent_bids_by_uf_modalidade(TIMESTAMPTZ, TEXT[], INTEGER[]) IS
+    'Grouped count of active pncp_raw_bids published since p_since, one row per '
+    '(uf, modalidade_id). Used by the PNCP fetch planner to size page budgets.';
+
+REVOKE EXECUTE ON FUNCTION public.count_recent_bids_by_uf_modalidade(TIMESTAMPTZ, TEXT[], INTEGER[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.count_recent_bids_by_uf_modalidade(TIMESTAMPTZ, TEXT[], INTEGER[]) TO service_role;
@@ -0,0 +1,4 @@
+-- Rollback: drop the local CEIS / CNEP sanctions mirror
+
+DROP TABLE IF EXISTS public.sanctions_mirror_state;
+DROP TABLE IF EXISTS public.sanctions_mirror;
@@ -0,0 +1,65 @@
+-- Local mirror of the CEIS / CNEP sanctions datasets
+--
+-- SanctionsService used to query the Portal da Transparência API per CNPJ
+-- (CEIS + CNEP, paginated, 90 req/min quota). ingestion/sanctions_mirror.py
+-- now downloads the full published datasets once a day and applies the diff
+-- here (rows whose record_hash changed are upserted, rows gone from the
+-- dataset are deleted). API workers load the rows into an in-memory index
+-- keyed by CNPJ and only fall back to the API when the mirror is stale
+-- (sanctions_mirror_state.synced_at older than SANCTIONS_MIRROR_MAX_AGE_HOURS,
+-- or dataset_date older than SANCTIONS_MIRROR_MAX_DATASET_AGE_DAYS).
+--
+-- Only legal entities (14-digit CNPJ) are kept; CPF rows are dropped at sync.
+
+CREATE TABLE IF NOT EXISTS public.sanctions_mirror (
+    source            TEXT NOT NULL CHECK (source IN ('CEIS', 'CNEP')),
+    record_id         TEXT NOT NULL,
+    cnpj              TEXT NOT NULL,
+    company_name      TEXT NOT NULL DEFAULT '',
+    sanction_type     TEXT NOT NULL DEFAULT '',
+    start_date        DATE,
+    end_date          DATE,
+    sanctioning_body  TEXT NOT NULL DEFAULT '',
+    legal_basis       TEXT NOT NULL DEFAULT '',
+    fine_amount       NUMERIC(18, 2),
+    record_hash       TEXT NOT NULL,
+    synced_at         TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (source, record_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sanctions_mirror_cnpj
+    ON public.sanctions_mirror (cnpj);
+
+COMMENT ON TABLE public.sanctions_mirror IS
+    'CEIS / CNEP sanctions of legal entities, mirrored daily from the Portal da '
+    'Transparência downloads. Written by the ingestion sanctions sync, read by SanctionsService.';
+
+CREATE TABLE IF NOT EXISTS public.sanctions_mirror_state (
+    source        TEXT PRIMARY KEY CHECK (source IN ('CEIS', 'CNEP')),
+    dataset_date  DATE NOT NULL,
+    record_count  INTEGER NOT NULL DEFAULT 0,
+    synced_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE public.sanctions_mirror_state IS
+    'Last successful sanctions mirror sync per dataset (freshness check for SanctionsService).';
+
+-- Backend-only tables: service role reads and writes, no client access.
+ALTER TABLE public.sanctions_mirror ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.sanctions_mirror_state ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "sanctions_mirror_service" ON public.sanctions_mirror;
+CREATE POLICY "sanctions_mirror_service"
+    ON public.sanctions_mirror
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+DROP POLICY IF EXISTS "sanctions_mirror_state_service" ON public.sanctions_mirror_state;
+CREATE POLICY "sanctions_mirror_state_service"
+    ON public.sanctions_mirror_state
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
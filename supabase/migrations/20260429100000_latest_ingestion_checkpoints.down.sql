@@ -0,0 +1,3 @@
+-- Rollback: drop the latest-checkpoint RPC used by the hybrid datalake search
+
+DROP FUNCTION IF EXISTS public.latest_ingestion_checkpoints(TEXT, TEXT[], INTEGER[]);
@@ -0,0 +1,40 @@
+-- Hybrid datalake + live-delta search: latest checkpoint per (uf, modalidade)
+--
+-- ingestion.checkpoint.get_checkpoints runs on the search request path to
+-- decide which window each UF still needs live. ingestion_checkpoints keeps
+-- one row per crawl batch and only grows, so selecting the raw rows hits
+-- the PostgREST 1000-row cap and returns an arbitrary subset, which can
+-- miss the newest checkpoint of a (uf, modalidade).
+--
+-- latest_ingestion_checkpoints returns at most one row per
+-- (uf, modalidade_id): the max last_date among completed checkpoints.
+
+CREATE OR REPLACE FUNCTION public.latest_ingestion_checkpoints(
+    p_source       TEXT,
+    p_ufs          TEXT[],
+    p_modalidades  INTEGER[]
+)
+RETURNS TABLE (uf TEXT, modalidade_id INTEGER, last_date DATE)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT c.uf::TEXT, c.modalidade_id::INTEGER, MAX(c.last_date)::DATE
+    FROM public.ingestion_checkpoints c
+    WHERE c.source = p_source
+      AND c.status = 'completed'
+      AND c.uf = ANY(p_ufs)
+      AND c.modalidade_id = ANY(p_modalidades)
+    GROUP BY c.uf, c.modalidade_id;
+END;
+$$;
+
+COMMENT ON FUNCTION public.latest_ingestion_checkpoints(TEXT, TEXT[], INTEGER[]) IS
+    'Most recent completed checkpoint date per (uf, modalidade_id). Used by the '
+    'hybrid datalake + live-delta search to size the live window.';
+
+REVOKE EXECUTE ON FUNCTION public.latest_ingestion_checkpoints(TEXT, TEXT[], INTEGER[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.latest_ingestion_checkpoints(TEXT, TEXT[], INTEGER[]) TO service_role;